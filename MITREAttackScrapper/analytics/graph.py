@@ -0,0 +1,319 @@
+# MITREAttackScrapper/analytics/graph.py
+import asyncio
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Type
+
+from .similarity import techniques_used
+from .reverse_index import techniques_addressed
+from ..utils.id_registry import id_kind
+
+class Edge(NamedTuple):
+    """
+    A relationship between two MITRE ATT&CK objects, e.g. ``Edge("G0016", "uses", "S0154")``.
+
+    :param source: The ID of the object the relationship was read from.
+    :type source: str
+    :param relation: The kind of relationship: ``uses``, ``attributed-to``, ``mitigated-by``, ``used-by``, ``mitigates``
+                     or ``includes``.
+    :type relation: str
+    :param target: The ID of the related object.
+    :type target: str
+    """
+    source: str
+    relation: str
+    target: str
+
+def _ids(field: str) -> Callable[[Dict[str, Any]], List[str]]:
+    """
+    Get a function reading the IDs of the objects listed in a field of the result of ``get()``.
+    """
+    def read(data: Dict[str, Any]) -> List[str]:
+        return list(dict.fromkeys(item["id"] for item in data.get(field, []) if item.get("id")))
+    return read
+
+def _enterprise_techniques_addressed(data: Dict[str, Any]) -> List[str]:
+    # Only the Enterprise techniques can be fetched
+    enterprise = {technique["id"] for technique in data.get("techniques_addressed_by_mitigation", [])
+                  if technique["domain"] == "Enterprise"}
+    return [technique_id for technique_id in techniques_addressed(data) if technique_id in enterprise]
+
+# The relationships the traversal can follow, keyed by name: (kind of the source, relation, kind of the target,
+# function reading the IDs of the targets from the result of get() of the source)
+RELATIONS: Dict[str, Tuple[str, str, str, Callable[[Dict[str, Any]], List[str]]]] = {
+    "group-software": ("group", "uses", "software", _ids("software")),
+    "group-techniques": ("group", "uses", "technique", techniques_used),
+    "campaign-groups": ("campaign", "attributed-to", "group", _ids("groups")),
+    "campaign-software": ("campaign", "uses", "software", _ids("software")),
+    "campaign-techniques": ("campaign", "uses", "technique", techniques_used),
+    "software-techniques": ("software", "uses", "technique", techniques_used),
+    "technique-mitigations": ("technique", "mitigated-by", "mitigation", _ids("mitigations")),
+    # Relationships going back up the chain, not followed by default since they reach most of the corpus in a few hops
+    "software-groups": ("software", "used-by", "group", _ids("groups_that_use_this_software")),
+    "mitigation-techniques": ("mitigation", "mitigates", "technique", _enterprise_techniques_addressed),
+    "tactic-techniques": ("tactic", "includes", "technique", _ids("techniques")),
+}
+
+# Campaigns → groups → software → techniques → mitigations
+DEFAULT_RELATIONS: Tuple[str, ...] = ("group-software", "group-techniques", "campaign-groups", "campaign-software",
+                                      "campaign-techniques", "software-techniques", "technique-mitigations")
+
+def _scrapers() -> Dict[str, Type]:
+    """
+    Get the scraper class fetching each kind of ID.
+    """
+    from ..techniques.enterprise import MITREAttackEnterpriseTechniques
+    from ..tactics.enterprise import MITREAttackEnterpriseTactics
+    from ..mitigations.enterprise import MITREAttackEnterpriseMitigations
+    from ..cti.groups import MITREAttackCTIGroups
+    from ..cti.software import MITREAttackCTISoftware
+    from ..cti.campaigns import MITREAttackCampaign
+    return {"technique": MITREAttackEnterpriseTechniques, "tactic": MITREAttackEnterpriseTactics,
+            "mitigation": MITREAttackEnterpriseMitigations, "group": MITREAttackCTIGroups,
+            "software": MITREAttackCTISoftware, "campaign": MITREAttackCampaign}
+
+class MITREAttackGraph:
+    """
+    An in-memory graph of MITRE ATT&CK objects and their relationships, built by ``expand()``.
+
+    :ivar nodes: The result of ``get()`` of every fetched object, keyed by ID.
+    :ivar depths: The number of hops from the nearest root to every object reached, fetched or not.
+    :ivar edges: The relationships read from the fetched objects, without duplicates.
+    :ivar errors: The exception ``get()`` raised for the objects which could not be fetched, keyed by ID.
+    """
+
+    def __init__(self) -> None:
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self.depths: Dict[str, int] = {}
+        self.edges: List[Edge] = []
+        self.errors: Dict[str, BaseException] = {}
+        self._edge_set: Set[Edge] = set()
+        self._out: Dict[str, List[Edge]] = defaultdict(list)
+        self._in: Dict[str, List[Edge]] = defaultdict(list)
+
+    def add_edge(self, edge: Edge) -> None:
+        """
+        Add a relationship, unless the graph already has it.
+
+        :param edge: The relationship.
+        :type edge: Edge
+        """
+        if edge in self._edge_set:
+            return
+        self._edge_set.add(edge)
+        self.edges.append(edge)
+        self._out[edge.source].append(edge)
+        self._in[edge.target].append(edge)
+
+    def successors(self, id: str, relation: Optional[str] = None, kind: Optional[str] = None) -> List[str]:
+        """
+        Get the IDs of the objects an object is related to, e.g. the software used by a group.
+
+        :param id: The ID of the object.
+        :type id: str
+        :param relation: Only follow this kind of relationship, e.g. ``uses``.
+        :type relation: Optional[str]
+        :param kind: Only keep the objects of this kind, e.g. ``software``.
+        :type kind: Optional[str]
+        :return: The IDs, in the order the relationships were read.
+        :rtype: List[str]
+        """
+        return [edge.target for edge in self._out.get(id, ())
+                if (relation is None or edge.relation == relation) and (kind is None or id_kind(edge.target) == kind)]
+
+    def predecessors(self, id: str, relation: Optional[str] = None, kind: Optional[str] = None) -> List[str]:
+        """
+        Get the IDs of the objects related to an object, e.g. the groups and software using a technique.
+
+        :param id: The ID of the object.
+        :type id: str
+        :param relation: Only follow this kind of relationship, e.g. ``uses``.
+        :type relation: Optional[str]
+        :param kind: Only keep the objects of this kind, e.g. ``group``.
+        :type kind: Optional[str]
+        :return: The IDs, in the order the relationships were read.
+        :rtype: List[str]
+        """
+        return [edge.source for edge in self._in.get(id, ())
+                if (relation is None or edge.relation == relation) and (kind is None or id_kind(edge.source) == kind)]
+
+    def of_kind(self, kind: str) -> List[str]:
+        """
+        Get the IDs of the objects of a kind reached by the traversal, fetched or not.
+
+        :param kind: ``technique``, ``tactic``, ``mitigation``, ``group``, ``software`` or ``campaign``.
+        :type kind: str
+        :return: The sorted IDs.
+        :rtype: List[str]
+        """
+        return sorted(id for id in self.depths if id_kind(id) == kind)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the graph to plain data, e.g. for ``json.dumps()``.
+
+        :return: ``{"nodes": {id: {"depth": ..., "data": ...}}, "edges": [[source, relation, target], ...]}``;
+                 ``data`` is ``None`` for the objects which were not fetched.
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "nodes": {id: {"depth": depth, "data": self.nodes.get(id)} for id, depth in self.depths.items()},
+            "edges": [list(edge) for edge in self.edges],
+        }
+
+    def __contains__(self, id: object) -> bool:
+        return id in self.depths
+
+    def __len__(self) -> int:
+        return len(self.depths)
+
+def _prepare(ids: Iterable[str], depth: int, relations: Iterable[str]) -> Tuple[List[str], Dict[str, List[Tuple]]]:
+    """
+    Check the arguments of ``expand()``, and group the relationships to follow by the kind of their source.
+    """
+    if depth < 0:
+        raise ValueError("depth must not be negative")
+    roots = list(dict.fromkeys(ids))
+    for id in roots:
+        if id_kind(id) is None:
+            raise ValueError(f"Invalid MITRE ATT&CK ID {id!r}")
+    followed: Dict[str, List[Tuple]] = defaultdict(list)
+    for name in relations:
+        if name not in RELATIONS:
+            raise ValueError(f"Unknown relationship {name!r}, expected one of: {', '.join(RELATIONS)}")
+        source_kind, relation, target_kind, read = RELATIONS[name]
+        followed[source_kind].append((relation, target_kind, read))
+    return roots, followed
+
+def _next_frontier(graph: MITREAttackGraph, fetched: Dict[str, Dict[str, Any]], level: int,
+                   followed: Dict[str, List[Tuple]]) -> List[str]:
+    """
+    Add the relationships of the objects fetched at a level, and get the IDs they reach for the first time.
+    """
+    frontier: Dict[str, None] = {}
+    for id, data in fetched.items():
+        for relation, target_kind, read in followed.get(id_kind(id), ()):
+            for target in read(data):
+                if id_kind(target) != target_kind:
+                    continue
+                graph.add_edge(Edge(id, relation, target))
+                if target not in graph.depths:
+                    graph.depths[target] = level + 1
+                    frontier[target] = None
+    return list(frontier)
+
+def expand(ids: Iterable[str],
+           depth: int = 2,
+           relations: Iterable[str] = DEFAULT_RELATIONS,
+           max_workers: int = 8,
+           parse_workers: Optional[int] = 0) -> MITREAttackGraph:
+    """
+    Build the graph of the objects related to some MITRE ATT&CK objects, up to ``depth`` hops away,
+    e.g. a group, its software, their techniques and the mitigations of those techniques.
+
+    The traversal is breadth-first: the objects of each level are fetched as one concurrent batch, the kinds of objects
+    of a level in parallel (each with ``get_many()``), and an object reached again, from the same level or another one,
+    is fetched only once. The relationships of the objects at ``depth`` hops are not followed.
+    A failing object is recorded in ``errors`` and does not stop the traversal.
+
+    :param ids: The IDs of the roots, e.g. ``["G0016"]``.
+    :type ids: Iterable[str]
+    :param depth: The number of hops to follow from the roots. ``0`` only fetches the roots.
+    :type depth: int
+    :param relations: The names of the relationships to follow, keys of ``RELATIONS``.
+    :type relations: Iterable[str]
+    :param max_workers: The number of pages downloaded concurrently, per kind of object.
+    :type max_workers: int
+    :param parse_workers: The number of processes parsing pages, per kind of object (see ``get_many()``).
+                          By default, pages are parsed in the downloading threads.
+    :type parse_workers: Optional[int]
+    :return: The graph.
+    :rtype: MITREAttackGraph
+    :raises ValueError: If an ID is malformed, or a relationship unknown.
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.analytics.graph import expand
+
+        graph = expand(["G0016"], depth=3)    # APT29 → software and techniques → techniques → mitigations
+        for software_id in graph.successors("G0016", kind="software"):
+            print(graph.nodes[software_id]["name"], graph.successors(software_id, "uses"))
+        print(graph.of_kind("mitigation"))
+    """
+    roots, followed = _prepare(ids, depth, relations)
+    scrapers = _scrapers()
+    graph = MITREAttackGraph()
+    graph.depths.update((id, 0) for id in roots)
+    frontier = roots
+    for level in range(depth + 1):
+        by_kind: Dict[str, List[str]] = defaultdict(list)
+        for id in frontier:
+            by_kind[id_kind(id)].append(id)
+
+        def fetch(kind: str) -> list:
+            return list(scrapers[kind].get_many(by_kind[kind], max_workers=max_workers,
+                                                parse_workers=parse_workers, ordered=False))
+
+        fetched = {}
+        with ThreadPoolExecutor(max_workers=max(1, len(by_kind))) as executor:
+            for results in executor.map(fetch, list(by_kind)):
+                for result in results:
+                    if result.ok:
+                        fetched[result.id] = graph.nodes[result.id] = result.data
+                    else:
+                        graph.errors[result.id] = result.error
+        if level == depth:
+            break
+        frontier = _next_frontier(graph, fetched, level, followed)
+        if not frontier:
+            break
+    return graph
+
+async def aexpand(ids: Iterable[str],
+                  depth: int = 2,
+                  relations: Iterable[str] = DEFAULT_RELATIONS,
+                  max_concurrency: int = 16) -> MITREAttackGraph:
+    """
+    Asynchronous counterpart of ``expand()``, fetching every object of a level with ``aget()`` concurrently.
+
+    :param ids: The IDs of the roots, e.g. ``["G0016"]``.
+    :type ids: Iterable[str]
+    :param depth: The number of hops to follow from the roots. ``0`` only fetches the roots.
+    :type depth: int
+    :param relations: The names of the relationships to follow, keys of ``RELATIONS``.
+    :type relations: Iterable[str]
+    :param max_concurrency: The number of pages fetched concurrently.
+    :type max_concurrency: int
+    :return: The graph.
+    :rtype: MITREAttackGraph
+    :raises ValueError: If an ID is malformed, or a relationship unknown.
+    """
+    roots, followed = _prepare(ids, depth, relations)
+    scrapers = _scrapers()
+    graph = MITREAttackGraph()
+    graph.depths.update((id, 0) for id in roots)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(id: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await scrapers[id_kind(id)].aget(id)
+
+    frontier = roots
+    for level in range(depth + 1):
+        fetched = {}
+        results = await asyncio.gather(*(fetch(id) for id in frontier), return_exceptions=True)
+        for id, result in zip(frontier, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                graph.errors[id] = result
+            else:
+                fetched[id] = graph.nodes[id] = result
+        if level == depth:
+            break
+        frontier = _next_frontier(graph, fetched, level, followed)
+        if not frontier:
+            break
+    return graph
@@ -0,0 +1,310 @@
+# MITREAttackScrapper/analytics/reverse_index.py
+import os
+import time
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from .similarity import techniques_used
+
+KINDS = ("groups", "software", "campaigns", "mitigations")
+
+def techniques_addressed(data: Dict[str, Any]) -> List[str]:
+    """
+    Get the IDs of the techniques addressed by a mitigation, from the result of ``MITREAttackEnterpriseMitigations.get()``.
+
+    :param data: The result of ``MITREAttackEnterpriseMitigations.get()``.
+    :type data: Dict[str, Any]
+    :return: The IDs of the (sub-)techniques addressed, without duplicates, in the order of the page.
+    :rtype: List[str]
+    """
+    return list(dict.fromkeys(technique["id"] for technique in data.get("techniques_addressed_by_mitigation", [])))
+
+def _indexed_scrapers() -> Dict[Type, Tuple[str, Callable[[Dict[str, Any]], List[str]]]]:
+    """
+    Get the scraper classes covered by the reverse index, with the kind of their data and how to get its techniques.
+    """
+    from ..cti.groups import MITREAttackCTIGroups
+    from ..cti.software import MITREAttackCTISoftware
+    from ..cti.campaigns import MITREAttackCampaign
+    from ..mitigations.enterprise import MITREAttackEnterpriseMitigations
+
+    def used(data: Dict[str, Any]) -> List[str]:
+        return techniques_used(data, domain=None)
+
+    return {
+        MITREAttackCTIGroups: ("groups", used),
+        MITREAttackCTISoftware: ("software", used),
+        MITREAttackCampaign: ("campaigns", used),
+        MITREAttackEnterpriseMitigations: ("mitigations", techniques_addressed),
+    }
+
+class MITREAttackReverseIndex:
+    """
+    A reverse index from MITRE ATT&CK (sub-)techniques to the groups, software and campaigns that use them,
+    and the mitigations that address them, built from the results of their ``get()``.
+
+    The index is persisted in a SQLite database file and loaded in memory when opened,
+    so looking up a technique takes constant time. It is updated entity by entity: re-indexing one re-scraped group
+    only replaces the rows of that group, and ``apply()`` replays the changes found by ``sync()``.
+
+    :param path: Path of the database file. Created if it does not exist.
+    :type path: Union[str, os.PathLike]
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.analytics.reverse_index import MITREAttackReverseIndex
+
+        with MITREAttackReverseIndex("attack-index.sqlite3") as index:
+            if not len(index):
+                index.build(max_workers=16)
+            print(index.lookup("T1003.001"))
+            # {'groups': ['G0006', ...], 'software': ['S0002', ...], 'campaigns': [...], 'mitigations': ['M1043', ...]}
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        self.path: str = os.path.abspath(os.path.expanduser(os.fspath(path)))
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS entities (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                name TEXT,
+                last_modified TEXT,
+                indexed_at REAL NOT NULL
+            )
+        """)
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS uses (
+                technique_id TEXT NOT NULL,
+                entity_id TEXT NOT NULL,
+                PRIMARY KEY (entity_id, technique_id)
+            ) WITHOUT ROWID
+        """)
+
+        # In-memory copy of the index: entities by technique, techniques by entity, and sub-techniques by technique
+        self._kinds: Dict[str, str] = {}
+        self._users: Dict[str, Dict[str, None]] = {}
+        self._techniques: Dict[str, Tuple[str, ...]] = {}
+        self._sub_techniques: Dict[str, Dict[str, None]] = {}
+        for id, kind in self._connection.execute("SELECT id, kind FROM entities"):
+            self._kinds[id] = kind
+        techniques: Dict[str, List[str]] = {}
+        for entity_id, technique_id in self._connection.execute("SELECT entity_id, technique_id FROM uses"):
+            techniques.setdefault(entity_id, []).append(technique_id)
+        for entity_id, technique_ids in techniques.items():
+            self._add(entity_id, technique_ids)
+
+    def _add(self, entity_id: str, technique_ids: Iterable[str]) -> None:
+        """
+        Add the techniques of an entity to the in-memory index.
+        """
+        technique_ids = tuple(dict.fromkeys(technique_ids))
+        self._techniques[entity_id] = technique_ids
+        for technique_id in technique_ids:
+            self._users.setdefault(technique_id, {})[entity_id] = None
+            if "." in technique_id:
+                self._sub_techniques.setdefault(technique_id.split(".")[0], {})[technique_id] = None
+
+    def _discard(self, entity_id: str) -> None:
+        """
+        Remove the techniques of an entity from the in-memory index.
+        """
+        for technique_id in self._techniques.pop(entity_id, ()):
+            users = self._users[technique_id]
+            users.pop(entity_id, None)
+            if not users:
+                del self._users[technique_id]
+                if "." in technique_id:
+                    self._sub_techniques[technique_id.split(".")[0]].pop(technique_id, None)
+
+    def _put(self, entries: Iterable[Tuple[str, Dict[str, Any], List[str]]]) -> None:
+        """
+        Replace the rows of the given ``(kind, data, technique IDs)`` entities in one transaction.
+        """
+        entries = list(entries)
+        with self._lock:
+            self._connection.execute("BEGIN")
+            try:
+                for kind, data, technique_ids in entries:
+                    entity_id = data["id"]
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO entities (id, kind, name, last_modified, indexed_at) VALUES (?, ?, ?, ?, ?)",
+                        (entity_id, kind, data.get("name"), data.get("last_modified"), time.time()))
+                    self._connection.execute("DELETE FROM uses WHERE entity_id = ?", (entity_id,))
+                    self._connection.executemany("INSERT OR IGNORE INTO uses (technique_id, entity_id) VALUES (?, ?)",
+                                                 [(technique_id, entity_id) for technique_id in technique_ids])
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            for kind, data, technique_ids in entries:
+                self._discard(data["id"])
+                self._add(data["id"], technique_ids)
+                self._kinds[data["id"]] = kind
+
+    def update(self, scraper: Type, data: Dict[str, Any]) -> None:
+        """
+        Index, or re-index, one group, software, campaign or mitigation.
+        Its previous techniques are replaced, so this is also how a re-scraped entity is brought up to date.
+
+        :param scraper: The scraper class the data comes from, e.g. ``MITREAttackCTIGroups``.
+        :type scraper: Type[MITREAttackInformation]
+        :param data: The result of ``scraper.get()``.
+        :type data: Dict[str, Any]
+        :raises ValueError: If the scraper class is not covered by the reverse index.
+        """
+        kind, extract = self._extractor(scraper)
+        self._put([(kind, data, extract(data))])
+
+    def refresh(self, scraper: Type, id: str) -> None:
+        """
+        Scrape one group, software, campaign or mitigation again, bypassing its in-memory result, and re-index it.
+
+        :param scraper: The scraper class of the entity, e.g. ``MITREAttackCTIGroups``.
+        :type scraper: Type[MITREAttackInformation]
+        :param id: The ID of the entity.
+        :type id: str
+        :raises ValueError: If the scraper class is not covered by the reverse index, or the ID is not valid.
+        :raises RuntimeError: If the page cannot be fetched.
+        """
+        scraper.invalidate(id)
+        self.update(scraper, scraper.get(id))
+
+    def remove(self, id: str) -> None:
+        """
+        Drop one entity from the index, e.g. when it was removed from MITRE ATT&CK.
+
+        :param id: The ID of the entity.
+        :type id: str
+        """
+        with self._lock:
+            self._connection.execute("BEGIN")
+            try:
+                self._connection.execute("DELETE FROM uses WHERE entity_id = ?", (id,))
+                self._connection.execute("DELETE FROM entities WHERE id = ?", (id,))
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._discard(id)
+            self._kinds.pop(id, None)
+
+    def build(self, scrapers: Optional[Iterable[Type]] = None, max_workers: int = 8) -> None:
+        """
+        Index every group, software, campaign and mitigation, fetching their details with ``get_many()``.
+        The data comes from the configured source: the website, a STIX bundle or a snapshot.
+        Entities already indexed are re-indexed, and entities no longer listed are dropped.
+
+        :param scrapers: The scraper classes to index; groups, software, campaigns and mitigations by default.
+        :type scrapers: Optional[Iterable[Type]]
+        :param max_workers: The number of pages downloaded concurrently.
+        :type max_workers: int
+        :raises ValueError: If a scraper class is not covered by the reverse index.
+        :raises RuntimeError: If any detail could not be fetched. The other entities are indexed nonetheless.
+        """
+        failures = []
+        for scraper in (scrapers if scrapers is not None else _indexed_scrapers()):
+            kind, extract = self._extractor(scraper)
+            ids = list(scraper._list_entries(scraper.get_list()))
+            entries = []
+            for result in scraper.get_many(ids, max_workers=max_workers):
+                if result.ok:
+                    entries.append((kind, result.data, extract(result.data)))
+                else:
+                    failures.append(f"{scraper.__name__} {result.id}: {result.error}")
+            self._put(entries)
+            listed = set(ids)
+            for id in [id for id, indexed_kind in self._kinds.items() if indexed_kind == kind and id not in listed]:
+                self.remove(id)
+        if failures:
+            raise RuntimeError(f"Failed to fetch {len(failures)} page(s) for the reverse index:\n" + "\n".join(failures))
+
+    def apply(self, store: Any, report: Any) -> None:
+        """
+        Bring the index up to date with the changes found by ``sync()``, without scraping anything:
+        added and modified entities are re-indexed from the store, and removed ones are dropped.
+
+        :param store: The store passed to ``sync()``.
+        :type store: MITREAttackSyncStore
+        :param report: The report returned by ``sync()``.
+        :type report: SyncReport
+        """
+        for scraper, (kind, extract) in _indexed_scrapers().items():
+            entries = []
+            for id in report.added.get(scraper.__name__, []) + report.modified.get(scraper.__name__, []):
+                data = store.get(scraper, id)
+                if data is not None:
+                    entries.append((kind, data, extract(data)))
+            self._put(entries)
+            for id in report.removed.get(scraper.__name__, []):
+                self.remove(id)
+
+    @staticmethod
+    def _extractor(scraper: Type) -> Tuple[str, Callable[[Dict[str, Any]], List[str]]]:
+        """
+        Get the kind of the data of a scraper class, and how to get its techniques.
+        """
+        extractor = _indexed_scrapers().get(scraper)
+        if extractor is None:
+            raise ValueError(f"{scraper.__name__} is not covered by the reverse index")
+        return extractor
+
+    def lookup(self, technique_id: str, include_sub_techniques: bool = False) -> Dict[str, List[str]]:
+        """
+        Get everything that uses or addresses a technique.
+
+        :param technique_id: The ID of the (sub-)technique, e.g. ``T1003`` or ``T1003.001``.
+        :type technique_id: str
+        :param include_sub_techniques: Whether the entities of the sub-techniques of the technique are included.
+        :type include_sub_techniques: bool
+        :return: The IDs of the groups, software and campaigns using the technique, and of the mitigations addressing it,
+                 keyed by kind (``groups``, ``software``, ``campaigns`` and ``mitigations``).
+        :rtype: Dict[str, List[str]]
+        """
+        found: Dict[str, List[str]] = {kind: [] for kind in KINDS}
+        with self._lock:
+            entities = dict(self._users.get(technique_id, {}))
+            if include_sub_techniques:
+                for sub_technique_id in self._sub_techniques.get(technique_id, ()):
+                    entities.update(self._users[sub_technique_id])
+            for entity_id in entities:
+                found[self._kinds[entity_id]].append(entity_id)
+        return found
+
+    def techniques(self, id: str) -> List[str]:
+        """
+        Get the techniques indexed for one entity.
+
+        :param id: The ID of the entity.
+        :type id: str
+        :return: The IDs of the (sub-)techniques, empty if the entity is not indexed.
+        :rtype: List[str]
+        """
+        with self._lock:
+            return list(self._techniques.get(id, ()))
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def __contains__(self, technique_id: str) -> bool:
+        return technique_id in self._users
+
+    def __len__(self) -> int:
+        return len(self._kinds)
+
+    def __enter__(self) -> "MITREAttackReverseIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,499 @@
+# MITREAttackScrapper/analytics/search.py
+import os
+import re
+import json
+import math
+import zlib
+import struct
+import threading
+import numpy as np
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Type, Union
+
+SEGMENT_MAGIC = b"MATKSEG1"
+MANIFEST_NAME = "manifest.json"
+FIELDS = ("description", "procedure", "reference")
+
+# magic, number of documents, number of terms, length of the compressed metadata, length of the compressed arrays
+_SEGMENT_HEADER = struct.Struct("<8sIIII")
+_TOKEN = re.compile(r"[a-z0-9]+(?:\.[a-z0-9]+)*")
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split a text into lowercase terms. ATT&CK IDs stay whole, e.g. ``T1059.001`` gives ``t1059.001``.
+
+    :param text: The text to split.
+    :type text: str
+    :return: The terms of the text, in order.
+    :rtype: List[str]
+    """
+    return _TOKEN.findall(text.lower())
+
+def documents(data: Dict[str, Any]) -> Iterator[Tuple[str, str, str]]:
+    """
+    Get the searchable texts of a scraped MITRE ATT&CK object, i.e. the result of ``get()`` of any scraper class:
+    its description, its procedure examples (including the use of every technique by a group, software or campaign,
+    and the way a mitigation addresses every technique), and its references.
+
+    :param data: The result of ``get()``.
+    :type data: Dict[str, Any]
+    :return: An iterator of ``(field, context, text)``, where the field is one of ``FIELDS``, and the context is
+             the ID the procedure example is about (e.g. the technique used), or the number of the reference.
+    :rtype: Iterator[Tuple[str, str, str]]
+    """
+    if data.get("description"):
+        yield "description", "", data["description"]
+    for procedure in data.get("procedures", []):
+        yield "procedure", procedure.get("id", ""), procedure.get("description", "")
+    for technique in data.get("techniques_used", []):
+        yield "procedure", technique.get("sub_technique_id") or technique.get("main_technique_id", ""), technique.get("use", "")
+    for technique in data.get("techniques_addressed_by_mitigation", []):
+        yield "procedure", technique.get("id", ""), technique.get("use", "")
+    for number, reference in data.get("references", {}).items():
+        yield "reference", str(number), reference.get("text", "")
+
+def _searchable_scrapers() -> List[Type]:
+    """
+    Get the scraper classes whose details have searchable texts.
+    """
+    from ..techniques.enterprise import MITREAttackEnterpriseTechniques
+    from ..tactics.enterprise import MITREAttackEnterpriseTactics
+    from ..mitigations.enterprise import MITREAttackEnterpriseMitigations
+    from ..cti.groups import MITREAttackCTIGroups
+    from ..cti.software import MITREAttackCTISoftware
+    from ..cti.campaigns import MITREAttackCampaign
+    return [MITREAttackEnterpriseTechniques, MITREAttackEnterpriseTactics, MITREAttackEnterpriseMitigations,
+            MITREAttackCTIGroups, MITREAttackCTISoftware, MITREAttackCampaign]
+
+class SearchHit(NamedTuple):
+    """
+    A text matching a search.
+
+    :param id: The ID of the MITRE ATT&CK object the text belongs to.
+    :type id: str
+    :param field: ``description``, ``procedure`` or ``reference``.
+    :type field: str
+    :param context: The ID a procedure example is about, the number of a reference, or an empty string.
+    :type context: str
+    :param score: The BM25 score of the text.
+    :type score: float
+    """
+    id: str
+    field: str
+    context: str
+    score: float
+
+class _Segment:
+    """
+    An immutable part of the search index: a list of documents, and the postings of their terms.
+    A segment is written once, and its documents are only ever marked deleted, by the manifest.
+
+    On disk, a segment is a header followed by zlib-compressed JSON metadata (the documents and the sorted terms),
+    and zlib-compressed arrays: the document lengths, the offsets of the postings of every term,
+    the document numbers of the postings and their term frequencies.
+    """
+
+    def __init__(self,
+                 name: str,
+                 documents: List[List[str]],
+                 terms: List[str],
+                 lengths: np.ndarray,
+                 offsets: np.ndarray,
+                 postings: np.ndarray,
+                 frequencies: np.ndarray) -> None:
+        self.name = name
+        self.documents = documents
+        self.terms = {term: number for number, term in enumerate(terms)}
+        self.lengths = lengths
+        self.offsets = offsets
+        self.postings = postings
+        self.frequencies = frequencies
+        self.entities = {document[0] for document in documents}
+        self.deleted: set = set()
+
+    @classmethod
+    def build(cls, name: str, entries: Iterable[Tuple[List[str], Counter, int]]) -> "_Segment":
+        """
+        Build a segment from ``(document, term frequencies, length)`` entries,
+        where a document is ``[id, field, context]``.
+        """
+        documents = []
+        lengths = []
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        for number, (document, frequencies, length) in enumerate(entries):
+            documents.append(document)
+            lengths.append(length)
+            for term, frequency in frequencies.items():
+                postings.setdefault(term, []).append((number, frequency))
+
+        terms = sorted(postings)
+        offsets = np.zeros(len(terms) + 1, dtype=np.uint32)
+        offsets[1:] = np.cumsum([len(postings[term]) for term in terms], dtype=np.uint64)
+        flat = [posting for term in terms for posting in postings[term]]
+        return cls(name, documents, terms,
+                   np.array(lengths, dtype=np.uint32),
+                   offsets,
+                   np.array([number for number, _ in flat], dtype=np.uint32),
+                   np.minimum([frequency for _, frequency in flat], 0xFFFF).astype(np.uint16) if flat else np.zeros(0, dtype=np.uint16))
+
+    def write(self, path: str) -> None:
+        """
+        Write the segment to a file, atomically.
+        """
+        terms = sorted(self.terms, key=self.terms.get)
+        metadata = zlib.compress(json.dumps({"documents": self.documents, "terms": terms}, separators=(",", ":")).encode("utf-8"), 6)
+        arrays = zlib.compress(self.lengths.tobytes() + self.offsets.tobytes() + self.postings.tobytes() + self.frequencies.tobytes(), 6)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary_path, "wb") as file:
+                file.write(_SEGMENT_HEADER.pack(SEGMENT_MAGIC, len(self.documents), len(terms), len(metadata), len(arrays)))
+                file.write(metadata)
+                file.write(arrays)
+            os.replace(temporary_path, path)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    @classmethod
+    def read(cls, path: str) -> "_Segment":
+        """
+        Read a segment file.
+
+        :raises ValueError: If the file is not a segment of the search index.
+        """
+        with open(path, "rb") as file:
+            content = file.read()
+        magic, document_count, term_count, metadata_length, arrays_length = _SEGMENT_HEADER.unpack_from(content)
+        if magic != SEGMENT_MAGIC:
+            raise ValueError(f"{path} is not a segment of a MITRE ATT&CK search index")
+        metadata = json.loads(zlib.decompress(content[_SEGMENT_HEADER.size:_SEGMENT_HEADER.size + metadata_length]))
+        arrays = zlib.decompress(content[_SEGMENT_HEADER.size + metadata_length:_SEGMENT_HEADER.size + metadata_length + arrays_length])
+
+        position = 0
+        def take(dtype: Any, count: int) -> np.ndarray:
+            nonlocal position
+            array = np.frombuffer(arrays, dtype=dtype, count=count, offset=position)
+            position += array.nbytes
+            return array
+
+        lengths = take(np.uint32, document_count)
+        offsets = take(np.uint32, term_count + 1)
+        postings = take(np.uint32, int(offsets[-1]))
+        frequencies = take(np.uint16, int(offsets[-1]))
+        return cls(os.path.basename(path), metadata["documents"], metadata["terms"], lengths, offsets, postings, frequencies)
+
+    def term_postings(self, term: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Get the document numbers and term frequencies of a term, or ``None`` if no document of the segment has it.
+        """
+        number = self.terms.get(term)
+        if number is None:
+            return None
+        start, end = self.offsets[number], self.offsets[number + 1]
+        return self.postings[start:end], self.frequencies[start:end]
+
+class MITREAttackSearchIndex:
+    """
+    A local full-text search index over the descriptions, procedure examples and references of MITRE ATT&CK objects,
+    ranked with BM25.
+
+    Every text is a document of its own (see ``documents()``). The index is stored in a directory, as immutable,
+    compressed segment files listed by a manifest. Objects are added (or re-added, after they were scraped again)
+    in batches: ``add()`` buffers them, and ``commit()`` writes them to a new segment and marks their previous
+    documents deleted. Segments are merged once there are more than ``max_segments``.
+    The segments are loaded in memory when the index is opened, so a search only looks up the postings of
+    the terms of the query and scores them with array operations.
+
+    :param directory: The directory of the index. Created if it does not exist.
+    :type directory: Union[str, os.PathLike]
+    :param k1: The BM25 term frequency saturation parameter.
+    :type k1: float
+    :param b: The BM25 document length normalization parameter.
+    :type b: float
+    :param max_segments: The number of segments above which all segments are merged into one.
+    :type max_segments: int
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.analytics.search import MITREAttackSearchIndex
+
+        with MITREAttackSearchIndex("attack-search") as index:
+            if not len(index):
+                index.build(max_workers=16)
+            for hit in index.search("lsass memory dump", k=5):
+                print(hit.id, hit.field, hit.context, round(hit.score, 2))
+    """
+
+    def __init__(self,
+                 directory: Union[str, os.PathLike],
+                 k1: float = 1.2,
+                 b: float = 0.75,
+                 max_segments: int = 8) -> None:
+        self.directory: str = os.path.abspath(os.path.expanduser(os.fspath(directory)))
+        os.makedirs(self.directory, exist_ok=True)
+        self.k1 = k1
+        self.b = b
+        self.max_segments = max_segments
+
+        self._lock = threading.RLock()
+        self._pending: Dict[str, Optional[List[Tuple[List[str], Counter, int]]]] = {}
+        self._segments: List[_Segment] = []
+        self._next_segment = 1
+        manifest_path = os.path.join(self.directory, MANIFEST_NAME)
+        if os.path.exists(manifest_path):
+            with open(manifest_path, "r", encoding="utf-8") as file:
+                manifest = json.load(file)
+            self._next_segment = manifest["next_segment"]
+            for entry in manifest["segments"]:
+                segment = _Segment.read(os.path.join(self.directory, entry["name"]))
+                segment.deleted = set(entry["deleted"])
+                self._segments.append(segment)
+        self._load_state()
+
+    def _load_state(self) -> None:
+        """
+        Concatenate the documents of all the segments, for searching.
+        """
+        self._bases = np.cumsum([0] + [len(segment.documents) for segment in self._segments[:-1]], dtype=np.int64) \
+            if self._segments else np.zeros(0, dtype=np.int64)
+        self._documents: List[List[str]] = [document for segment in self._segments for document in segment.documents]
+        self._lengths = np.concatenate([segment.lengths for segment in self._segments]).astype(np.float32) \
+            if self._segments else np.zeros(0, dtype=np.float32)
+        self._fields = np.array([FIELDS.index(document[1]) for document in self._documents], dtype=np.uint8)
+        self._alive = np.array([document[0] not in segment.deleted
+                                for segment in self._segments for document in segment.documents], dtype=bool)
+        self._alive_count = int(self._alive.sum())
+        self._average_length = float(self._lengths[self._alive].mean()) if self._alive_count else 0.0
+        self._entities = {document[0] for document, alive in zip(self._documents, self._alive.tolist()) if alive}
+
+    def _write_manifest(self, segments: List[_Segment], next_segment: int) -> None:
+        """
+        Write the manifest, atomically.
+        """
+        path = os.path.join(self.directory, MANIFEST_NAME)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump({"version": 1, "next_segment": next_segment,
+                       "segments": [{"name": segment.name, "deleted": sorted(segment.deleted)} for segment in segments]}, file)
+        os.replace(temporary_path, path)
+
+    def add(self, id: str, data: Dict[str, Any]) -> None:
+        """
+        Add a scraped MITRE ATT&CK object to the index, replacing its previous version if it was already indexed.
+        The object is searchable once ``commit()`` is called.
+
+        :param id: The ID of the object, as passed to ``get()``.
+        :type id: str
+        :param data: The result of ``get()``.
+        :type data: Dict[str, Any]
+        """
+        entries = []
+        for field, context, text in documents(data):
+            terms = tokenize(text)
+            if terms:
+                entries.append(([id, field, context], Counter(terms), len(terms)))
+        with self._lock:
+            self._pending[id] = entries
+
+    def remove(self, id: str) -> None:
+        """
+        Remove a MITRE ATT&CK object from the index, once ``commit()`` is called.
+
+        :param id: The ID of the object.
+        :type id: str
+        """
+        with self._lock:
+            self._pending[id] = None
+
+    def commit(self) -> None:
+        """
+        Write the objects added or removed since the previous commit to a new segment, and make them searchable.
+        """
+        with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            segments = list(self._segments)
+            for segment in segments:
+                segment.deleted |= segment.entities & pending.keys()
+
+            entries = [entry for entity_entries in pending.values() if entity_entries for entry in entity_entries]
+            next_segment = self._next_segment
+            if entries:
+                segment = _Segment.build(f"segment-{next_segment:06d}.bin", entries)
+                segment.write(os.path.join(self.directory, segment.name))
+                segments.append(segment)
+                next_segment += 1
+            self._write_manifest(segments, next_segment)
+            self._segments, self._next_segment = segments, next_segment
+            self._load_state()
+
+            if len(self._segments) > self.max_segments:
+                self.merge()
+
+    def merge(self) -> None:
+        """
+        Merge all the segments into one, dropping the deleted documents.
+        """
+        with self._lock:
+            alive = self._alive
+            numbers = np.cumsum(alive, dtype=np.int64) - 1
+            postings: Dict[str, List[Tuple[np.ndarray, np.ndarray]]] = {}
+            for segment, base in zip(self._segments, self._bases.tolist()):
+                for term, number in segment.terms.items():
+                    start, end = segment.offsets[number], segment.offsets[number + 1]
+                    documents = segment.postings[start:end].astype(np.int64) + base
+                    keep = alive[documents]
+                    if keep.any():
+                        postings.setdefault(term, []).append((numbers[documents[keep]], segment.frequencies[start:end][keep]))
+
+            terms = sorted(postings)
+            offsets = np.zeros(len(terms) + 1, dtype=np.uint32)
+            offsets[1:] = np.cumsum([sum(len(part[0]) for part in postings[term]) for term in terms], dtype=np.uint64)
+            merged = _Segment(f"segment-{self._next_segment:06d}.bin",
+                              [document for document, keep in zip(self._documents, alive.tolist()) if keep],
+                              terms,
+                              self._lengths[alive].astype(np.uint32),
+                              offsets,
+                              np.concatenate([part[0] for term in terms for part in postings[term]]).astype(np.uint32)
+                              if terms else np.zeros(0, dtype=np.uint32),
+                              np.concatenate([part[1] for term in terms for part in postings[term]]).astype(np.uint16)
+                              if terms else np.zeros(0, dtype=np.uint16))
+            merged.write(os.path.join(self.directory, merged.name))
+            self._write_manifest([merged], self._next_segment + 1)
+
+            previous = self._segments
+            self._segments, self._next_segment = [merged], self._next_segment + 1
+            self._load_state()
+            for segment in previous:
+                os.remove(os.path.join(self.directory, segment.name))
+
+    def build(self, scrapers: Optional[Iterable[Type]] = None, max_workers: int = 8) -> None:
+        """
+        Index every MITRE ATT&CK object of the given scraper classes, fetching their details with ``get_many()``,
+        and commit. The data comes from the configured source: the website, a STIX bundle or a snapshot.
+        Objects no longer listed are removed.
+
+        :param scrapers: The scraper classes to index; techniques, tactics, mitigations, groups, software and campaigns by default.
+        :type scrapers: Optional[Iterable[Type]]
+        :param max_workers: The number of pages downloaded concurrently.
+        :type max_workers: int
+        :raises RuntimeError: If any detail could not be fetched. The other objects are indexed nonetheless.
+        """
+        failures = []
+        listed = set()
+        for scraper in (scrapers if scrapers is not None else _searchable_scrapers()):
+            ids = list(scraper._list_entries(scraper.get_list()))
+            listed.update(ids)
+            for result in scraper.get_many(ids, max_workers=max_workers):
+                if result.ok:
+                    self.add(result.id, result.data)
+                else:
+                    failures.append(f"{scraper.__name__} {result.id}: {result.error}")
+        if scrapers is None:
+            for id in self._entities - listed:
+                self.remove(id)
+        self.commit()
+        if failures:
+            raise RuntimeError(f"Failed to fetch {len(failures)} page(s) for the search index:\n" + "\n".join(failures))
+
+    def apply(self, store: Any, report: Any) -> None:
+        """
+        Bring the index up to date with the changes found by ``sync()``, without scraping anything,
+        and commit: added and modified objects are re-indexed from the store, and removed ones are dropped.
+
+        :param store: The store passed to ``sync()``.
+        :type store: MITREAttackSyncStore
+        :param report: The report returned by ``sync()``.
+        :type report: SyncReport
+        """
+        for scraper in _searchable_scrapers():
+            for id in report.added.get(scraper.__name__, []) + report.modified.get(scraper.__name__, []):
+                data = store.get(scraper, id)
+                if data is not None:
+                    self.add(id, data)
+            for id in report.removed.get(scraper.__name__, []):
+                self.remove(id)
+        self.commit()
+
+    def search(self, query: str, k: int = 10, fields: Optional[Iterable[str]] = None) -> List[SearchHit]:
+        """
+        Search the index, ranking the matching texts with BM25.
+
+        :param query: The terms to search for, e.g. ``"lsass memory dump"``. Every term adds to the score of a text;
+                      texts with none of the terms do not match.
+        :type query: str
+        :param k: The maximum number of hits.
+        :type k: int
+        :param fields: Only search these fields (``description``, ``procedure`` and/or ``reference``).
+        :type fields: Optional[Iterable[str]]
+        :return: The best matching texts, best first.
+        :rtype: List[SearchHit]
+        :raises ValueError: If a field is unknown.
+        """
+        field_codes = None
+        if fields is not None:
+            fields = list(fields)
+            for field in fields:
+                if field not in FIELDS:
+                    raise ValueError(f"Unknown field {field!r}, expected one of {', '.join(FIELDS)}")
+            field_codes = [FIELDS.index(field) for field in fields]
+
+        with self._lock:
+            segments, bases, alive, lengths = self._segments, self._bases, self._alive, self._lengths
+            document_count, average_length = self._alive_count, self._average_length
+            document_fields, documents = self._fields, self._documents
+        if not document_count or k <= 0:
+            return []
+
+        scores = np.zeros(len(alive), dtype=np.float32)
+        for term in dict.fromkeys(tokenize(query)):
+            term_documents = []
+            term_frequencies = []
+            for segment, base in zip(segments, bases.tolist()):
+                found = segment.term_postings(term)
+                if found is not None:
+                    term_documents.append(found[0].astype(np.int64) + base)
+                    term_frequencies.append(found[1])
+            if not term_documents:
+                continue
+            matched = np.concatenate(term_documents)
+            frequencies = np.concatenate(term_frequencies).astype(np.float32)
+            keep = alive[matched]
+            matched, frequencies = matched[keep], frequencies[keep]
+            if not len(matched):
+                continue
+
+            idf = math.log(1.0 + (document_count - len(matched) + 0.5) / (len(matched) + 0.5))
+            normalization = self.k1 * (1.0 - self.b + self.b * lengths[matched] / average_length)
+            # A document appears once in the postings of a term, so the indexed addition does not lose updates
+            scores[matched] += idf * frequencies * (self.k1 + 1.0) / (frequencies + normalization)
+
+        if field_codes is not None:
+            scores[~np.isin(document_fields, field_codes)] = 0.0
+        candidates = np.flatnonzero(scores > 0.0)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        candidates = candidates[np.lexsort((candidates, -scores[candidates]))]
+        return [SearchHit(documents[number][0], documents[number][1], documents[number][2], float(scores[number]))
+                for number in candidates.tolist()]
+
+    def close(self) -> None:
+        """
+        Commit the pending changes.
+        """
+        self.commit()
+
+    def __contains__(self, id: str) -> bool:
+        return id in self._entities
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def __enter__(self) -> "MITREAttackSearchIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,273 @@
+# MITREAttackScrapper/analytics/similarity.py
+import numpy as np
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Type
+
+METRICS = ("jaccard", "cosine")
+
+def _require_scipy_sparse() -> Any:
+    """
+    Import ``scipy.sparse``, which is only needed for sparse technique sets.
+    """
+    try:
+        import scipy.sparse
+    except ImportError as error:
+        raise ImportError("Sparse technique sets require scipy. "
+                          "Install it with `pip install MITREAttackScrapper[sparse]`.") from error
+    return scipy.sparse
+
+def techniques_used(data: Dict[str, Any], domain: Optional[str] = "Enterprise") -> List[str]:
+    """
+    Get the IDs of the techniques used by a group, a software or a campaign, from the result of its ``get()``.
+    A row of a sub-technique gives the ID of the sub-technique.
+
+    :param data: The result of ``MITREAttackCTIGroups.get()``, ``MITREAttackCTISoftware.get()`` or ``MITREAttackCampaign.get()``.
+    :type data: Dict[str, Any]
+    :param domain: Only keep the techniques of this domain (e.g. ``Enterprise``), or all of them if ``None``.
+    :type domain: Optional[str]
+    :return: The IDs of the (sub-)techniques used, without duplicates, in the order of the page.
+    :rtype: List[str]
+    """
+    technique_ids = {}
+    for technique in data.get("techniques_used", []):
+        if domain is None or technique["domain"] == domain:
+            technique_ids[technique["sub_technique_id"] or technique["main_technique_id"]] = None
+    return list(technique_ids)
+
+def _default_scrapers() -> List[Type]:
+    """
+    Get the scraper classes whose data has a "Techniques Used" table.
+    """
+    from ..cti.groups import MITREAttackCTIGroups
+    from ..cti.software import MITREAttackCTISoftware
+    from ..cti.campaigns import MITREAttackCampaign
+
+    return [MITREAttackCTIGroups, MITREAttackCTISoftware, MITREAttackCampaign]
+
+class MITREAttackTechniqueSets:
+    """
+    Technique sets of MITRE ATT&CK groups, software and campaigns, encoded as a binary matrix
+    (one row per set, one column per technique), to compare sets with one another or with an observed set at scale.
+
+    Similarities are computed for all the rows at once: the intersection sizes are a matrix product,
+    from which the Jaccard index ``|A ∩ B| / |A ∪ B|`` or the cosine similarity ``|A ∩ B| / sqrt(|A| |B|)`` follows.
+    Attributing an observed technique set against every group takes a single matrix-vector product.
+
+    :param technique_sets: The technique IDs of every set, keyed by the ID of the set (e.g. ``G0016``).
+    :type technique_sets: Mapping[str, Iterable[str]]
+    :param collapse_sub_techniques: Whether sub-techniques count as their parent technique (``T1059.001`` as ``T1059``),
+                                    for a coarser comparison.
+    :type collapse_sub_techniques: bool
+    :param sparse: Whether ``matrix`` is a ``scipy.sparse.csr_matrix`` instead of a dense ``numpy.ndarray``.
+                   Requires ``MITREAttackScrapper[sparse]``.
+    :type sparse: bool
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.analytics.similarity import MITREAttackTechniqueSets
+
+        technique_sets = MITREAttackTechniqueSets.from_scrapers(max_workers=16)
+        observed = ["T1566.001", "T1059.001", "T1105", "T1547.001"]
+        for group_id, score in technique_sets.top_k(observed, k=5, among="G"):
+            print(group_id, round(score, 3))
+    """
+
+    def __init__(self,
+                 technique_sets: Mapping[str, Iterable[str]],
+                 collapse_sub_techniques: bool = False,
+                 sparse: bool = False) -> None:
+        self.collapse_sub_techniques = collapse_sub_techniques
+        self.ids: Tuple[str, ...] = tuple(technique_sets)
+        self.rows: Dict[str, int] = {id: row for row, id in enumerate(self.ids)}
+
+        self.technique_columns: Dict[str, int] = {}
+        rows = []
+        columns = []
+        for row, technique_ids in enumerate(technique_sets.values()):
+            for technique_id in self._normalize(technique_ids):
+                rows.append(row)
+                columns.append(self.technique_columns.setdefault(technique_id, len(self.technique_columns)))
+        self.technique_ids: Tuple[str, ...] = tuple(self.technique_columns)
+
+        shape = (len(self.ids), len(self.technique_ids))
+        if sparse:
+            data = np.ones(len(rows), dtype=np.float32)
+            self.matrix = _require_scipy_sparse().csr_matrix((data, (rows, columns)), shape=shape)
+        else:
+            self.matrix = np.zeros(shape, dtype=np.float32)
+            self.matrix[rows, columns] = 1
+        self.sizes: np.ndarray = np.bincount(np.asarray(rows, dtype=np.int64), minlength=len(self.ids)).astype(np.float32)
+
+    @classmethod
+    def from_scrapers(cls,
+                      scrapers: Optional[Iterable[Type]] = None,
+                      domain: Optional[str] = "Enterprise",
+                      max_workers: int = 8,
+                      collapse_sub_techniques: bool = False,
+                      sparse: bool = False) -> "MITREAttackTechniqueSets":
+        """
+        Build the technique sets of every group, software and campaign, fetching their details with ``get_many()``.
+        The data comes from the configured source: the website, a STIX bundle or a snapshot.
+
+        :param scrapers: The scraper classes to take the sets from; groups, software and campaigns by default.
+        :type scrapers: Optional[Iterable[Type]]
+        :param domain: Only keep the techniques of this domain, or all of them if ``None``.
+        :type domain: Optional[str]
+        :param max_workers: The number of pages downloaded concurrently.
+        :type max_workers: int
+        :param collapse_sub_techniques: Refer to the class description.
+        :type collapse_sub_techniques: bool
+        :param sparse: Refer to the class description.
+        :type sparse: bool
+        :return: The technique sets.
+        :rtype: MITREAttackTechniqueSets
+        :raises RuntimeError: If any detail could not be fetched.
+        """
+        technique_sets = {}
+        failures = []
+        for scraper in (scrapers if scrapers is not None else _default_scrapers()):
+            ids = list(scraper._list_entries(scraper.get_list()))
+            for result in scraper.get_many(ids, max_workers=max_workers):
+                if result.ok:
+                    technique_sets[result.id] = techniques_used(result.data, domain)
+                else:
+                    failures.append(f"{scraper.__name__} {result.id}: {result.error}")
+        if failures:
+            raise RuntimeError(f"Failed to fetch {len(failures)} page(s) for the technique sets:\n" + "\n".join(failures))
+        return cls(technique_sets, collapse_sub_techniques=collapse_sub_techniques, sparse=sparse)
+
+    def _normalize(self, technique_ids: Iterable[str]) -> Dict[str, None]:
+        """
+        Deduplicate the given technique IDs, collapsing sub-techniques if configured, keeping their order.
+        """
+        if self.collapse_sub_techniques:
+            return dict.fromkeys(technique_id.split(".")[0] for technique_id in technique_ids)
+        return dict.fromkeys(technique_ids)
+
+    def encode(self, queries: Sequence[Iterable[str]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Encode technique sets on the columns of the matrix.
+
+        :param queries: The technique sets to encode.
+        :type queries: Sequence[Iterable[str]]
+        :return: The encoded sets, of shape ``(queries, techniques)``, and the size of every set.
+                 Techniques used by none of the rows have no column, but still count in the size of the set.
+        :rtype: Tuple[np.ndarray, np.ndarray]
+        """
+        encoded = np.zeros((len(queries), len(self.technique_ids)), dtype=np.float32)
+        sizes = np.zeros(len(queries), dtype=np.float32)
+        for row, technique_ids in enumerate(queries):
+            technique_ids = self._normalize(technique_ids)
+            sizes[row] = len(technique_ids)
+            columns = [self.technique_columns[technique_id] for technique_id in technique_ids if technique_id in self.technique_columns]
+            encoded[row, columns] = 1
+        return encoded, sizes
+
+    def _scores(self, intersections: np.ndarray, query_sizes: np.ndarray, metric: str) -> np.ndarray:
+        """
+        Turn the intersection sizes of the queries (rows) with the sets (columns) into similarities.
+        """
+        if metric == "jaccard":
+            denominators = query_sizes[:, None] + self.sizes[None, :] - intersections
+        elif metric == "cosine":
+            denominators = np.sqrt(query_sizes[:, None] * self.sizes[None, :])
+        else:
+            raise ValueError(f"Unknown metric {metric!r}, expected one of {', '.join(METRICS)}")
+        return np.divide(intersections, denominators, out=np.zeros_like(intersections), where=denominators > 0)
+
+    def similarity(self, queries: Sequence[Iterable[str]], metric: str = "jaccard") -> np.ndarray:
+        """
+        Compute the similarity of every query with every set.
+
+        :param queries: The technique sets to compare.
+        :type queries: Sequence[Iterable[str]]
+        :param metric: ``jaccard`` or ``cosine``.
+        :type metric: str
+        :return: The similarities, of shape ``(queries, sets)``, between 0 and 1.
+        :rtype: np.ndarray
+        :raises ValueError: If the metric is unknown.
+        """
+        encoded, query_sizes = self.encode(queries)
+        intersections = np.asarray(self.matrix @ encoded.T, dtype=np.float32).T
+        return self._scores(intersections, query_sizes, metric)
+
+    def _top_k(self, scores: np.ndarray, k: int, among: Optional[str], exclude: Optional[np.ndarray] = None) -> List[List[Tuple[str, float]]]:
+        """
+        Get the ``k`` highest scores of every row, as ``(set ID, score)`` pairs.
+        Ties are broken by the order of the sets.
+        """
+        if among is not None:
+            scores[:, np.array([not id.startswith(among) for id in self.ids], dtype=bool)] = -np.inf
+        if exclude is not None:
+            scores[np.arange(len(exclude)), exclude] = -np.inf
+        k = min(k, scores.shape[1])
+        if k <= 0:
+            return [[] for _ in range(scores.shape[0])]
+
+        candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        neighbors = []
+        for row, columns in zip(scores, candidates):
+            columns = columns[np.lexsort((columns, -row[columns]))]
+            neighbors.append([(self.ids[column], float(row[column])) for column in columns if row[column] != -np.inf])
+        return neighbors
+
+    def top_k(self, techniques: Iterable[str], k: int = 10, metric: str = "jaccard", among: Optional[str] = None) -> List[Tuple[str, float]]:
+        """
+        Get the sets most similar to an observed technique set, e.g. to attribute an incident to a group.
+
+        :param techniques: The observed technique IDs.
+        :type techniques: Iterable[str]
+        :param k: The number of sets to return.
+        :type k: int
+        :param metric: ``jaccard`` or ``cosine``.
+        :type metric: str
+        :param among: Only rank the sets whose ID starts with this prefix, e.g. ``G`` for groups.
+        :type among: Optional[str]
+        :return: The ``(set ID, similarity)`` pairs, most similar first.
+        :rtype: List[Tuple[str, float]]
+        :raises ValueError: If the metric is unknown.
+        """
+        return self.top_k_batch([techniques], k, metric, among)[0]
+
+    def top_k_batch(self,
+                    queries: Sequence[Iterable[str]],
+                    k: int = 10,
+                    metric: str = "jaccard",
+                    among: Optional[str] = None) -> List[List[Tuple[str, float]]]:
+        """
+        Batched counterpart of ``top_k()``, computing the similarities of all the queries at once.
+
+        :param queries: The observed technique sets.
+        :type queries: Sequence[Iterable[str]]
+        :return: The ``(set ID, similarity)`` pairs of every query, most similar first.
+        :rtype: List[List[Tuple[str, float]]]
+        :raises ValueError: If the metric is unknown.
+        """
+        return self._top_k(self.similarity(queries, metric), k, among)
+
+    def nearest_neighbors(self, k: int = 10, metric: str = "jaccard", among: Optional[str] = None) -> Dict[str, List[Tuple[str, float]]]:
+        """
+        Get the ``k`` sets most similar to every set, excluding itself.
+
+        :param k: The number of neighbors of every set.
+        :type k: int
+        :param metric: ``jaccard`` or ``cosine``.
+        :type metric: str
+        :param among: Only rank the sets whose ID starts with this prefix, e.g. ``G`` for groups.
+        :type among: Optional[str]
+        :return: The ``(set ID, similarity)`` pairs of every set, most similar first, keyed by set ID.
+        :rtype: Dict[str, List[Tuple[str, float]]]
+        :raises ValueError: If the metric is unknown.
+        """
+        intersections = self.matrix @ self.matrix.T
+        intersections = np.asarray(intersections.toarray() if hasattr(intersections, "toarray") else intersections, dtype=np.float32)
+        scores = self._scores(intersections, self.sizes, metric)
+        neighbors = self._top_k(scores, k, among, exclude=np.arange(len(self.ids)))
+        return dict(zip(self.ids, neighbors))
+
+    def __contains__(self, id: str) -> bool:
+        return id in self.rows
+
+    def __len__(self) -> int:
+        return len(self.ids)
@@ -1,19 +1,33 @@
 # MITREAttackScrapper/cti/campaigns.py
 
-import httpx
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 from typing import List, Dict, Any, Union
 from datetime import datetime
 
 from ..superclass import MITREAttackInformation
+from ..stix.bundle import MITREAttackSTIXBundle, CitationRenderer, summary, stix_date, techniques_used
+from ..utils.html_parser import make_soup, scope_html
+from ..utils.records import Campaign, ListEntry
 from ..utils.mitre_id_validator import validate_mitre_campaign_id
-from ..utils.scrapping_helper import get_text_after_span
+from ..utils.scrapping_helper import SectionIndex, get_text_after_span
+from ..utils.table_extractor import TECHNIQUES_USED_TABLE, Column, TableSpec, with_url
+
+_CAMPAIGN_ROW = TableSpec({3: [Column("id", 0, "raw"), Column("name", 1, "raw"), Column("description", 2, "raw")]},
+                          build=with_url("campaigns"))
+_GROUPS_TABLE = TableSpec({3: [Column("id", 0, "link_text"), Column("name", 1, "link_text"), Column("description", 2)]},
+                          build=with_url("groups"))
+_SOFTWARE_TABLE = TableSpec({3: [Column("id", 0, "link_text"), Column("name", 1, "link_text"), Column("description", 2)]},
+                            build=with_url("software"))
 
 class MITREAttackCampaign(MITREAttackInformation):
     """
     A class to represent the MITRE ATT&CK campaign.
     """
 
+    _list_url = "https://attack.mitre.org/campaigns/"
+    _list_record_type = ListEntry
+    _record_type = Campaign
+
     @staticmethod
     def get_list() -> List[Dict[str, Any]]:
         """
@@ -40,32 +54,20 @@ class MITREAttackCampaign(MITREAttackInformation):
             ]
         
         """
+        return MITREAttackCampaign._fetch_list()
 
-        target_url = "https://attack.mitre.org/campaigns/"
-        response = httpx.get(target_url)
-        if response.status_code != 200:
-            raise RuntimeError("Failed to fetch data from MITRE ATT&CK website.")
-        campagin_list_data = []
+    @staticmethod
+    async def aget_list() -> List[Dict[str, Any]]:
+        """
+        Asynchronously get the list of all MITRE ATT&CK campaigns.
+        Refer to the `get_list()` method for the structure of the returned data.
+
+        :return: The list of MITRE ATT&CK campaigns.
+        :rtype: List[Dict[str, Any]]
+        :raises RuntimeError: If the data fetch from the MITRE ATT&CK website fails.
+        """
+        return await MITREAttackCampaign._afetch_list()
 
-        # Extract the <table> element containing the campagin information
-        soup = BeautifulSoup(response.text, "html.parser")
-        table = soup.find("table")
-        rows = table.find_all("tr")
-        for row in rows:
-            cells = row.find_all("td")
-            if len(cells) == 3:
-                campagin_id = cells[0].text.strip()
-                campagin_name = cells[1].text.strip()
-                campagin_description = cells[2].text.strip()
-                campagin_list_data.append({
-                    "id": campagin_id,
-                    "name": campagin_name,
-                    "description": campagin_description,
-                    "url": f"https://attack.mitre.org/campaigns/{campagin_id}/",
-                })
-
-        return campagin_list_data
-    
     @staticmethod
     @validate_mitre_campaign_id
     def get(campagin_id: str) -> Dict[str, Any]:
@@ -137,13 +139,98 @@ class MITREAttackCampaign(MITREAttackInformation):
                 }
             }
         """
+        return MITREAttackCampaign._fetch_detail(campagin_id)
+
+    @staticmethod
+    @validate_mitre_campaign_id
+    async def aget(campagin_id: str) -> Dict[str, Any]:
+        """
+        Asynchronously get the details of a specific MITRE ATT&CK campaign.
+        Refer to the `get()` method for the structure of the returned data.
+
+        :param campagin_id: The MITRE ATT&CK campaign ID.
+        :type campagin_id: str
+        :return: The details of the MITRE ATT&CK campaign.
+        :rtype: Dict[str, Any]
+        :raises ValueError: If the provided campaign ID format is invalid.
+        :raises RuntimeError: If the data fetch from the MITRE ATT&CK website fails.
+        """
+        return await MITREAttackCampaign._afetch_detail(campagin_id)
+
+    @staticmethod
+    @validate_mitre_campaign_id
+    def _validate_id(campagin_id: str) -> None:
+        pass
+
+    @staticmethod
+    def _detail_url(campagin_id: str) -> str:
+        return f"https://attack.mitre.org/campaigns/{campagin_id}/"
+
+    @staticmethod
+    def _stix_list(bundle: MITREAttackSTIXBundle) -> List[Dict[str, Any]]:
+        return [{
+            "id": bundle.attack_id(campagin),
+            "name": campagin["name"],
+            "description": summary(campagin.get("description")),
+            "url": f"https://attack.mitre.org/campaigns/{bundle.attack_id(campagin)}/",
+        } for campagin in bundle.objects_of_type("campaign")]
+
+    @staticmethod
+    def _stix_detail(campagin_id: str, bundle: MITREAttackSTIXBundle) -> Union[Dict[str, Any], None]:
+        campagin = bundle.attack_object(campagin_id, "campaign")
+        if campagin is None:
+            return None
+
+        # References are numbered in the order they are cited on the page
+        citations = CitationRenderer()
+        description = citations.text(campagin.get("description"), campagin)
+        groups = [{
+            "id": bundle.attack_id(pair["object"]),
+            "name": pair["object"]["name"],
+            "description": citations.text(pair["relationship"].get("description"), pair["relationship"]),
+            "url": f"https://attack.mitre.org/groups/{bundle.attack_id(pair['object'])}/"
+        } for pair in bundle.related(campagin, "attributed-to", ["intrusion-set"])]
+        campagin_techniques = techniques_used(bundle, campagin, citations)
+        software = [{
+            "id": bundle.attack_id(pair["object"]),
+            "name": pair["object"]["name"],
+            "description": citations.text(pair["relationship"].get("description"), pair["relationship"]),
+            "url": f"https://attack.mitre.org/software/{bundle.attack_id(pair['object'])}/"
+        } for pair in bundle.related(campagin, "uses", ["malware", "tool"])]
+
+        return {
+            "id": campagin_id,
+            "name": campagin["name"],
+            "first_seen": stix_date(campagin.get("first_seen"), length=7),
+            "last_seen": stix_date(campagin.get("last_seen"), length=7),
+            "version": campagin.get("x_mitre_version"),
+            "created": stix_date(campagin.get("created")),
+            "last_modified": stix_date(campagin.get("modified")),
+            "description": description,
+            "url": MITREAttackCampaign._detail_url(campagin_id),
+            "groups": groups,
+            "techniques_used": campagin_techniques,
+            "software": software,
+            "references": citations.references()
+        }
+
+    @staticmethod
+    def _parse_list(html: str) -> List[Dict[str, Any]]:
+        # Extract the <table> element containing the campagin information
+        soup = make_soup(scope_html(html, "table"))
+        table = soup.find("table")
+        return list(MITREAttackCampaign._parse_rows(table.find_all("tr")))
 
-        target_url = f"https://attack.mitre.org/campaigns/{campagin_id}/"
-        response = httpx.get(target_url)
-        if response.status_code != 200:
-            raise RuntimeError(f"Failed to fetch data from {target_url}")
+    @staticmethod
+    def _parse_row(row: Tag, previous: Union[Dict[str, Any], None]) -> Union[Dict[str, Any], None]:
+        return _CAMPAIGN_ROW.extract_row(row)
+
+    @staticmethod
+    def _parse_detail(campagin_id: str, html: str) -> Dict[str, Any]:
+        target_url = MITREAttackCampaign._detail_url(campagin_id)
         
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = make_soup(scope_html(html, "div", "v-attckmatrix"))
+        sections = SectionIndex(soup)
         campagin_data = {
             "id": campagin_id,
             "name": None,
@@ -182,108 +269,16 @@ class MITREAttackCampaign(MITREAttackInformation):
         campagin_data["description"] = description_tag.text.strip() if description_tag else None
 
         # Extract the groups associated with the campaign
-        associated_groups = []
-        groups_table: Union[Tag, None] = soup.find("h2", string="Groups").find_next("table") if soup.find("h2", string="Groups") else None
-        if groups_table:
-            for row in groups_table.find("tbody").find_all("tr"):
-                cells = row.find_all("td")
-                if len(cells) == 3:
-                    group_id = cells[0].find("a").get_text(strip=True)
-                    group_name = cells[1].find("a").get_text(strip=True)
-                    description = cells[2].get_text(strip=True)
-
-                    associated_groups.append({
-                        "id": group_id,
-                        "name": group_name,
-                        "description": description,
-                        "url": f"https://attack.mitre.org/groups/{group_id}/"
-                    })
-        campagin_data["groups"] = associated_groups
+        campagin_data["groups"] = _GROUPS_TABLE.extract(sections.following("Groups", "table"))
 
         # Extract the techniques used
-        techniques_used = []
-        techniques_table: Union[Tag, None] = soup.find("h2", string="Techniques Used").find_next("table") if soup.find("h2", string="Techniques Used") else None
-        if techniques_table:
-            latest_domain = None
-            latest_main_technique_id = None
-            for row in techniques_table.find("tbody").find_all("tr"):
-                cells = row.find_all("td")
-                if len(cells) == 4:
-                    # In case of main-techniques, the domain is repeated
-                    domain = cells[0].get_text(strip=True) if cells[0].get_text(strip=True) else latest_domain
-                    latest_domain = domain
-
-                    main_technique_id = cells[1].find("a").get_text(strip=True) if cells[1].find("a") else latest_main_technique_id
-                    latest_main_technique_id = main_technique_id
-
-                    main_technique_name = cells[2].find("a").get_text(strip=True)
-                    use = cells[3].get_text(" ", strip=True)
-
-                    techniques_used.append({
-                        "domain": domain,
-                        "main_technique_id": main_technique_id,
-                        "main_technique_name": main_technique_name,
-                        "main_technique_url": f"https://attack.mitre.org/techniques/{main_technique_id}/",
-                        "sub_technique_id": None,
-                        "sub_technique_name": None,
-                        "sub_technique_url": None,
-                        "use": use
-                    })
-
-                elif len(cells) == 5:
-                    # In case of sub-techniques, the main technique ID is repeated
-                    domain = cells[0].get_text(strip=True) if cells[0].get_text(strip=True) else latest_domain
-                    latest_domain = domain
-
-                    main_technique_id = cells[1].find("a").get_text(strip=True) if cells[1].find("a") else latest_main_technique_id
-                    latest_main_technique_id = main_technique_id
-                    sub_technique_id = cells[2].find("a").get_text(strip=True) if cells[2].find("a") else None
-                    if sub_technique_id:
-                        sub_technique_id = sub_technique_id.replace('.', '')
-                        sub_technique_full_id = f"{main_technique_id}.{sub_technique_id}"
-                        sub_technique_url = f"https://attack.mitre.org/techniques/{main_technique_id}/{sub_technique_id}/"
-                    else:
-                        sub_technique_id = None
-                        sub_technique_url = None
-
-                    main_technique_name = cells[3].find("a").get_text(strip=True)
-                    sub_technique_name = cells[3].find_all("a")[1].get_text(strip=True) if len(cells[3].find_all("a")) > 1 else None
-                    use = cells[4].get_text(" ", strip=True)
-
-                    techniques_used.append({
-                        "domain": domain,
-                        "main_technique_id": main_technique_id,
-                        "main_technique_name": main_technique_name,
-                        "main_technique_url": f"https://attack.mitre.org/techniques/{main_technique_id}/",
-                        "sub_technique_id": sub_technique_full_id,
-                        "sub_technique_name": sub_technique_name,
-                        "sub_technique_url": sub_technique_url,
-                        "use": use
-                    })
-
-        campagin_data["techniques_used"] = techniques_used
+        campagin_data["techniques_used"] = TECHNIQUES_USED_TABLE.extract(sections.following("Techniques Used", "table"))
 
         # Extract the software used by the campaign
-        software = []
-        software_table: Union[Tag, None] = soup.find("h2", string="Software").find_next("table") if soup.find("h2", string="Software") else None
-        if software_table:
-            for row in software_table.find_all("tr"):
-                cells: List[Tag] = row.find_all("td")
-                if len(cells) == 3:
-                    software_id = cells[0].find("a").get_text(strip=True)
-                    software_name = cells[1].find("a").get_text(strip=True)
-                    description = cells[2].get_text(strip=True)
-
-                    software.append({
-                        "id": software_id,
-                        "name": software_name,
-                        "description": description,
-                        "url": f"https://attack.mitre.org/software/{software_id}/"
-                    })
-        campagin_data["software"] = software
+        campagin_data["software"] = _SOFTWARE_TABLE.extract(sections.following("Software", "table"))
 
         # Extract references
-        references_div: Union[Tag, None] = soup.find("h2", string="References").find_next("div") if soup.find("h2", string="References") else None
+        references_div: Union[Tag, None] = sections.following("References", "div")
         reference_number: int = 1
         if references_div:
             for li in references_div.find_all("li"):
@@ -298,4 +293,4 @@ class MITREAttackCampaign(MITREAttackInformation):
                     }
                     reference_number += 1
 
-        return campagin_data
\ No newline at end of file
+        return campagin_data
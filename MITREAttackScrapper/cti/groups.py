@@ -1,19 +1,39 @@
 # MITREAttackScrapper/cti/groups.py
 
-import httpx
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 from typing import List, Dict, Any, Union
 from datetime import datetime
 
 from ..superclass import MITREAttackInformation
+from ..stix.bundle import MITREAttackSTIXBundle, CitationRenderer, summary, stix_date, technique_url, techniques_used
+from ..utils.html_parser import make_soup, scope_html
+from ..utils.records import Group, ListEntry
 from ..utils.mitre_id_validator import validate_mitre_group_id
-from ..utils.scrapping_helper import get_text_after_span
+from ..utils.scrapping_helper import SectionIndex, get_text_after_span
+from ..utils.table_extractor import TECHNIQUES_USED_TABLE, BASE_URL, Column, TableSpec
+
+def _software(values: Dict[str, Any]) -> Dict[str, Any]:
+    techniques = values.pop("technique_names"), values.pop("technique_urls")
+    values["techniques"] = [{"name": name, "url": f"{BASE_URL}{url}"} for name, url in zip(*techniques)]
+    return values
+
+_GROUP_ROW = TableSpec({4: [Column("id", 0, "raw"), Column("name", 1, "raw"), Column("associated_groups", 2, "raw"),
+                            Column("description", 3, "raw"), Column("url", 0, "href")]})
+_ASSOCIATED_GROUPS_TABLE = TableSpec({2: [Column("name", 0, "raw"), Column("description", 1, "raw")]})
+_SOFTWARE_TABLE = TableSpec({4: [Column("id", 0, "link_text"), Column("name", 1, "link_text"), Column("url", 1, "href"),
+                                 Column("references", 2, "hrefs"), Column("technique_names", 3, "link_texts"),
+                                 Column("technique_urls", 3, "hrefs")]},
+                            build=_software)
 
 class MITREAttackCTIGroups(MITREAttackInformation):
     """
     A class containing methods to parse MITRE ATT&CK Groups.
     """
 
+    _list_url = "https://attack.mitre.org/groups/"
+    _list_record_type = ListEntry
+    _record_type = Group
+
     @staticmethod
     def get_list() -> List[Dict[str, Any]]:
         """
@@ -40,35 +60,19 @@ class MITREAttackCTIGroups(MITREAttackInformation):
                 # ... more group entries
             ]
         """
+        return MITREAttackCTIGroups._fetch_list()
 
-        target_url = "https://attack.mitre.org/groups/"
-        response = httpx.get(target_url)
-        if response.status_code != 200:
-            raise RuntimeError(f"Failed to fetch data from {target_url}")
-        data = []
-
-        # Extract the <table> element containing the groups
-        soup = BeautifulSoup(response.text, "html.parser")
-        table = soup.find("table")
-        rows = table.find_all("tr")
-        for row in rows:
-            cells = row.find_all("td")
-            if len(cells) == 4:
-                group_id = cells[0].text.strip()
-                group_name = cells[1].text.strip()
-                associated_groups = cells[2].text.strip()
-                description = cells[3].text.strip()
-                group_url = cells[0].find("a")["href"]
-                data.append({
-                    "id": group_id,
-                    "name": group_name,
-                    "associated_groups": associated_groups,
-                    "description": description,
-                    "url": group_url,
-                })
+    @staticmethod
+    async def aget_list() -> List[Dict[str, Any]]:
+        """
+        Asynchronously get the list of all MITRE ATT&CK Groups.
+        Refer to the `get_list()` method for the structure of the returned data.
 
-        return data
-    
+        :return: A list of dictionaries containing information about each MITRE ATT&CK Group.
+        :rtype: List[Dict[str, Any]]
+        :raises RuntimeError: If the data fetch from the MITRE ATT&CK website fails.
+        """
+        return await MITREAttackCTIGroups._afetch_list()
 
     @staticmethod
     @validate_mitre_group_id
@@ -146,14 +150,115 @@ class MITREAttackCTIGroups(MITREAttackInformation):
                     # ... more references
                 }
             }
-        """ 
-        
-        target_url = f"https://attack.mitre.org/groups/{group_id}/"
-        response = httpx.get(target_url)
-        if response.status_code != 200:
-            raise RuntimeError(f"Failed to fetch data from {target_url}")
-    
-        soup = BeautifulSoup(response.text, "html.parser")
+        """
+        return MITREAttackCTIGroups._fetch_detail(group_id)
+
+    @staticmethod
+    @validate_mitre_group_id
+    async def aget(group_id: str) -> Dict[str, Any]:
+        """
+        Asynchronously get the details of a specific MITRE ATT&CK Group.
+        Refer to the `get()` method for the structure of the returned data.
+
+        :param group_id: The ID of the MITRE ATT&CK Group.
+        :type group_id: str
+        :return: A dictionary containing information about the specific MITRE ATT&CK Group.
+        :rtype: Dict[str, Any]
+        :raises ValueError: If the provided group ID format is invalid.
+        :raises RuntimeError: If the data fetch from the MITRE ATT&CK website fails.
+        """
+        return await MITREAttackCTIGroups._afetch_detail(group_id)
+
+    @staticmethod
+    @validate_mitre_group_id
+    def _validate_id(group_id: str) -> None:
+        pass
+
+    @staticmethod
+    def _detail_url(group_id: str) -> str:
+        return f"https://attack.mitre.org/groups/{group_id}/"
+
+    @staticmethod
+    def _stix_list(bundle: MITREAttackSTIXBundle) -> List[Dict[str, Any]]:
+        data = []
+        for group in bundle.objects_of_type("intrusion-set"):
+            group_id = bundle.attack_id(group)
+            data.append({
+                "id": group_id,
+                "name": group["name"],
+                "associated_groups": ", ".join(alias for alias in group.get("aliases", []) if alias != group["name"]),
+                "description": summary(group.get("description")),
+                "url": f"/groups/{group_id}",
+            })
+        return data
+
+    @staticmethod
+    def _stix_detail(group_id: str, bundle: MITREAttackSTIXBundle) -> Union[Dict[str, Any], None]:
+        group = bundle.attack_object(group_id, "intrusion-set")
+        if group is None:
+            return None
+
+        # References are numbered in the order they are cited on the page
+        citations = CitationRenderer()
+        description = citations.paragraphs(group.get("description"), group)
+
+        # The descriptions of the associated groups are the external references named after the aliases
+        aliases = [alias for alias in group.get("aliases", []) if alias != group["name"]]
+        associated_group_descriptions = []
+        for reference in group.get("external_references", []):
+            if reference.get("source_name") in aliases and reference.get("description"):
+                associated_group_descriptions.append({
+                    "name": reference["source_name"],
+                    "description": citations.text(reference["description"], group)
+                })
+
+        group_techniques = techniques_used(bundle, group, citations)
+
+        software = []
+        for pair in bundle.related(group, "uses", ["malware", "tool"]):
+            software_id = bundle.attack_id(pair["object"])
+            software.append({
+                "id": software_id,
+                "name": pair["object"]["name"],
+                "url": f"/software/{software_id}",
+                "references": [f"#scite-{number}" for number in citations.cited(pair["relationship"].get("description"), pair["relationship"])],
+                "techniques": [{
+                    "name": bundle.technique_name(technique["object"]),
+                    "url": technique_url(bundle.attack_id(technique["object"]))
+                } for technique in bundle.related(pair["object"], "uses", ["attack-pattern"])]
+            })
+
+        return {
+            "id": group_id,
+            "name": group["name"],
+            "contributors": group.get("x_mitre_contributors", []),
+            "version": group.get("x_mitre_version"),
+            "created": stix_date(group.get("created")),
+            "last_modified": stix_date(group.get("modified")),
+            "description": description[0] if description else None,
+            "url": MITREAttackCTIGroups._detail_url(group_id),
+            "associated_group_descriptions": associated_group_descriptions,
+            "techniques_used": group_techniques,
+            "software": software,
+            "references": citations.references()
+        }
+
+    @staticmethod
+    def _parse_list(html: str) -> List[Dict[str, Any]]:
+        # Extract the <table> element containing the groups
+        soup = make_soup(scope_html(html, "table"))
+        table = soup.find("table")
+        return list(MITREAttackCTIGroups._parse_rows(table.find_all("tr")))
+
+    @staticmethod
+    def _parse_row(row: Tag, previous: Union[Dict[str, Any], None]) -> Union[Dict[str, Any], None]:
+        return _GROUP_ROW.extract_row(row)
+
+    @staticmethod
+    def _parse_detail(group_id: str, html: str) -> Dict[str, Any]:
+        target_url = MITREAttackCTIGroups._detail_url(group_id)
+        soup = make_soup(scope_html(html, "div", "v-attckmatrix"))
+        sections = SectionIndex(soup)
         group_data = {
             "id": group_id,
             "name": None,
@@ -193,107 +298,18 @@ class MITREAttackCTIGroups(MITREAttackInformation):
         group_data["last_modified"] = datetime.strptime(group_data["last_modified"], "%d %B %Y").strftime("%Y-%m-%d")
 
         # Extract associated group descriptions
-        associated_group_descriptions = []
-        associated_group_table = soup.find("table", class_="table table-bordered table-alternate mt-2") if soup.find("table", class_="table table-bordered table-alternate mt-2") else None
-        if associated_group_table:
-            for row in associated_group_table.find_all("tr")[1:]:
-                cells = row.find_all("td")
-                if len(cells) == 2:
-                    group_name = cells[0].text.strip()
-                    description = cells[1].text.strip()
-                    associated_group_descriptions.append({"name": group_name, 
-                                                          "description": description})
-        group_data["associated_group_descriptions"] = associated_group_descriptions
+        associated_group_table = soup.find("table", class_="table table-bordered table-alternate mt-2")
+        group_data["associated_group_descriptions"] = _ASSOCIATED_GROUPS_TABLE.extract(associated_group_table)
 
         # Extract techniques used (if any, as an example)
-        techniques_used = []
-        techniques_table: Union[Tag, None] = soup.find("h2", string="Techniques Used").find_next("table") if soup.find("h2", string="Techniques Used") else None
-        if techniques_table:
-            latest_domain = None
-            latest_main_technique_id = None
-            for row in techniques_table.find("tbody").find_all("tr"):
-                cells = row.find_all("td")
-                if len(cells) == 4:
-                    # In case of main-techniques, the domain is repeated
-                    domain = cells[0].get_text(strip=True) if cells[0].get_text(strip=True) else latest_domain
-                    latest_domain = domain
-
-                    main_technique_id = cells[1].find("a").get_text(strip=True) if cells[1].find("a") else latest_main_technique_id
-                    latest_main_technique_id = main_technique_id
-
-                    main_technique_name = cells[2].find("a").get_text(strip=True)
-                    use = cells[3].get_text(" ", strip=True)
-
-                    techniques_used.append({
-                        "domain": domain,
-                        "main_technique_id": main_technique_id,
-                        "main_technique_name": main_technique_name,
-                        "main_technique_url": f"https://attack.mitre.org/techniques/{main_technique_id}/",
-                        "sub_technique_id": None,
-                        "sub_technique_name": None,
-                        "sub_technique_url": None,
-                        "use": use
-                    })
-
-                elif len(cells) == 5:
-                    # In case of sub-techniques, the main technique ID is repeated
-                    domain = cells[0].get_text(strip=True) if cells[0].get_text(strip=True) else latest_domain
-                    latest_domain = domain
-
-                    main_technique_id = cells[1].find("a").get_text(strip=True) if cells[1].find("a") else latest_main_technique_id
-                    latest_main_technique_id = main_technique_id
-                    sub_technique_id = cells[2].find("a").get_text(strip=True) if cells[2].find("a") else None
-                    if sub_technique_id:
-                        sub_technique_id = sub_technique_id.replace('.', '')
-                        sub_technique_full_id = f"{main_technique_id}.{sub_technique_id}"
-                        sub_technique_url = f"https://attack.mitre.org/techniques/{main_technique_id}/{sub_technique_id}/"
-                    else:
-                        sub_technique_id = None
-                        sub_technique_url = None
-
-                    main_technique_name = cells[3].find("a").get_text(strip=True)
-                    sub_technique_name = cells[3].find_all("a")[1].get_text(strip=True) if len(cells[3].find_all("a")) > 1 else None
-                    use = cells[4].get_text(" ", strip=True)
-
-                    techniques_used.append({
-                        "domain": domain,
-                        "main_technique_id": main_technique_id,
-                        "main_technique_name": main_technique_name,
-                        "main_technique_url": f"https://attack.mitre.org/techniques/{main_technique_id}/",
-                        "sub_technique_id": sub_technique_full_id,
-                        "sub_technique_name": sub_technique_name,
-                        "sub_technique_url": sub_technique_url,
-                        "use": use
-                    })
-
-        group_data["techniques_used"] = techniques_used
+        group_data["techniques_used"] = TECHNIQUES_USED_TABLE.extract(sections.following("Techniques Used", "table"))
 
         # Extract software used (if any, as an example)
         # This section depends on the structure of the page, adjust selectors as needed
-        software_used = []
-        software_table = soup.find("h2", string="Software").find_next("table") if soup.find("h2", string="Software") else None
-        if software_table:
-            for row in software_table.find_all("tr"):
-                cells: List[Tag] = row.find_all("td")
-                if len(cells) == 4:
-                    software_id = cells[0].find("a").get_text(strip=True)
-                    software_name = cells[1].find("a").get_text(strip=True)
-                    software_url = cells[1].find("a")["href"]
-                    references = [a_tag["href"] for a_tag in cells[2].find_all("a")]
-                    techniques_name = [a_tag.get_text(strip=True) for a_tag in cells[3].find_all("a")]
-                    techniques_url = [a_tag["href"] for a_tag in cells[3].find_all("a")]
-                    software_used.append({
-                        "id": software_id,
-                        "name": software_name,
-                        "url": software_url,
-                        "references": references,
-                        "techniques": [{"name": name, "url": f"https://attack.mitre.org{url}"} for name, url in zip(techniques_name, techniques_url)]
-                    })
-                    
-        group_data["software"] = software_used
+        group_data["software"] = _SOFTWARE_TABLE.extract(sections.following("Software", "table"))
 
         # Extract references
-        references_div: Union[Tag, None] = soup.find("h2", string="References").find_next("div") if soup.find("h2", string="References") else None
+        references_div: Union[Tag, None] = sections.following("References", "div")
         reference_number: int = 1
         if references_div:
             for li in references_div.find_all("li"):
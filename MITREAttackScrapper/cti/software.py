@@ -1,19 +1,67 @@
 # MITREAttackScrapper/cti/software.py
 
-import httpx
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 from typing import List, Dict, Any, Union
 from datetime import datetime
 
 from ..superclass import MITREAttackInformation
+from ..stix.bundle import MITREAttackSTIXBundle, CitationRenderer, summary, stix_date, techniques_used
+from ..utils.html_parser import make_soup, scope_html
+from ..utils.records import ListEntry, Software
 from ..utils.mitre_id_validator import validate_mitre_software_id
-from ..utils.scrapping_helper import get_text_after_span
+from ..utils.scrapping_helper import SectionIndex, get_text_after_span
+from ..utils.table_extractor import BASE_URL, Column, TableSpec
+
+def _software(values: Dict[str, Any]) -> Dict[str, Any]:
+    associated_software = values["associated_software"]
+    values["associated_software"] = associated_software.split(",") if associated_software else None
+    return values
+
+def _technique_use(values: Dict[str, Any]) -> Dict[str, Any]:
+    # Unlike the pages of the groups and campaigns, the IDs are not links, and the name of a sub-technique
+    # is given as "Main technique: Sub-technique" in the same cell
+    main_technique_id = values["main_technique_id"]
+    sub_technique_id = values.get("sub_technique_id")
+    if sub_technique_id is None:
+        main_technique_name, sub_technique_name = values["technique_name"], None
+        sub_technique_url = None
+    else:
+        sub_technique_id = sub_technique_id.replace(".", "")
+        technique_name = values["technique_name"]
+        main_technique_name = technique_name.split(":")[0].strip()
+        sub_technique_name = technique_name.split(":")[1].strip() if ":" in technique_name else None
+        sub_technique_url = f"{BASE_URL}/techniques/{main_technique_id}/{sub_technique_id}/"
+    return {
+        "domain": values["domain"],
+        "main_technique_id": main_technique_id,
+        "main_technique_name": main_technique_name,
+        "main_technique_url": f"{BASE_URL}/techniques/{main_technique_id}/",
+        "sub_technique_id": f"{main_technique_id}.{sub_technique_id}" if sub_technique_id else None,
+        "sub_technique_name": sub_technique_name,
+        "sub_technique_url": sub_technique_url,
+        "use": values["use"],
+    }
+
+_SOFTWARE_ROW = TableSpec({4: [Column("id", 0, "raw"), Column("name", 1, "raw"), Column("associated_software", 2, "raw"),
+                               Column("description", 3, "raw")]},
+                          build=_software)
+_TECHNIQUES_USED_TABLE = TableSpec({
+    4: [Column("domain", 0, "raw", carry=True), Column("main_technique_id", 1, "raw", carry=True),
+        Column("technique_name", 2, "raw"), Column("use", 3, "raw")],
+    5: [Column("domain", 0, "raw", carry=True), Column("main_technique_id", 1, "raw", carry=True),
+        Column("sub_technique_id", 2, "raw"), Column("technique_name", 3, "raw"), Column("use", 4, "raw")],
+}, build=_technique_use)
+_GROUPS_TABLE = TableSpec({3: [Column("id", 0, "raw"), Column("name", 1, "raw"), Column("reference", 2, "href")]})
 
 class MITREAttackCTISoftware(MITREAttackInformation):
     """
     A class containing methods to scrap MITRE ATT&CK Softwares.
     """
 
+    _list_url = "https://attack.mitre.org/software/"
+    _list_record_type = ListEntry
+    _record_type = Software
+
     @staticmethod
     def get_list() -> List[Dict[str, Any]]:
         """
@@ -42,33 +90,20 @@ class MITREAttackCTISoftware(MITREAttackInformation):
                 # ... more software
             ]
         """
+        return MITREAttackCTISoftware._fetch_list()
 
-        target_url = "https://attack.mitre.org/software/"
-        response = httpx.get(target_url)
-        if response.status_code != 200:
-            raise RuntimeError(f"Failed to fetch data from {target_url}")
-        data = []
+    @staticmethod
+    async def aget_list() -> List[Dict[str, Any]]:
+        """
+        Asynchronously get the list of all MITRE ATT&CK Softwares.
+        Refer to the `get_list()` method for the structure of the returned data.
+
+        :return: A list of dictionaries containing the software's name, id, and description.
+        :rtype: List[Dict[str, Any]]
+        :raises RuntimeError: If the data fetch from the MITRE ATT&CK website fails.
+        """
+        return await MITREAttackCTISoftware._afetch_list()
 
-        # Extract the <table> element containing the groups
-        soup = BeautifulSoup(response.text, "html.parser")
-        table = soup.find("table")
-        rows = table.find_all("tr")
-        for row in rows:
-            cells = row.find_all("td")
-            if len(cells) == 4:
-                software_id: str = cells[0].text.strip()
-                software_name: str = cells[1].text.strip()
-                software_associated_software: Union[List[str], None] = cells[2].text.strip().split(',') if cells[2].text.strip() else None
-                software_description: str = cells[3].text.strip()
-                data.append({
-                    "id": software_id,
-                    "name": software_name,
-                    "associated_software": software_associated_software,
-                    "description": software_description
-                })
-        
-        return data
-    
     @staticmethod
     @validate_mitre_software_id
     def get(software_id: str) -> Dict[str, Any]:
@@ -130,13 +165,96 @@ class MITREAttackCTISoftware(MITREAttackInformation):
                 }
             }
         """
+        return MITREAttackCTISoftware._fetch_detail(software_id)
+
+    @staticmethod
+    @validate_mitre_software_id
+    async def aget(software_id: str) -> Dict[str, Any]:
+        """
+        Asynchronously get the details of a specific MITRE ATT&CK Software.
+        Refer to the `get()` method for the structure of the returned data.
 
-        target_url = f"https://attack.mitre.org/software/{software_id}/"
-        response = httpx.get(target_url)
-        if response.status_code != 200:
-            raise RuntimeError(f"Failed to fetch data from {target_url}")
+        :param software_id: The ID of the software.
+        :type software_id: str
+        :return: A dictionary containing information about the specific MITRE ATT&CK Software.
+        :rtype: Dict[str, Any]
+        :raises ValueError: If the provided software ID format is invalid.
+        :raises RuntimeError: If the data fetch from the MITRE ATT&CK website fails.
+        """
+        return await MITREAttackCTISoftware._afetch_detail(software_id)
 
-        soup = BeautifulSoup(response.text, "html.parser")
+    @staticmethod
+    @validate_mitre_software_id
+    def _validate_id(software_id: str) -> None:
+        pass
+
+    @staticmethod
+    def _detail_url(software_id: str) -> str:
+        return f"https://attack.mitre.org/software/{software_id}/"
+
+    @staticmethod
+    def _stix_list(bundle: MITREAttackSTIXBundle) -> List[Dict[str, Any]]:
+        data = []
+        for software in bundle.objects_of_type("malware", "tool"):
+            aliases = [alias for alias in software.get("x_mitre_aliases", []) if alias != software["name"]]
+            data.append({
+                "id": bundle.attack_id(software),
+                "name": software["name"],
+                # Split the same way as the comma separated list of the website
+                "associated_software": ", ".join(aliases).split(",") if aliases else None,
+                "description": summary(software.get("description"))
+            })
+        return data
+
+    @staticmethod
+    def _stix_detail(software_id: str, bundle: MITREAttackSTIXBundle) -> Union[Dict[str, Any], None]:
+        software = bundle.attack_object(software_id, "malware", "tool")
+        if software is None:
+            return None
+
+        # References are numbered in the order they are cited on the page
+        citations = CitationRenderer()
+        description = citations.paragraphs(software.get("description"), software)
+        software_techniques = techniques_used(bundle, software, citations)
+
+        groups_that_use_this_software = []
+        for pair in bundle.related(software, "uses", ["intrusion-set"], reverse=True):
+            numbers = citations.cited(pair["relationship"].get("description"), pair["relationship"])
+            groups_that_use_this_software.append({
+                "id": bundle.attack_id(pair["object"]),
+                "name": pair["object"]["name"],
+                "reference": f"#scite-{numbers[0]}" if numbers else None
+            })
+
+        return {
+            "id": software_id,
+            "name": software["name"],
+            "type": software["type"].upper(),
+            "platforms": software.get("x_mitre_platforms", []),
+            "version": software.get("x_mitre_version"),
+            "created": stix_date(software.get("created")),
+            "last_modified": stix_date(software.get("modified")),
+            "description": description[0] if description else None,
+            "techniques_used": software_techniques,
+            "groups_that_use_this_software": groups_that_use_this_software,
+            "references": citations.references()
+        }
+
+    @staticmethod
+    def _parse_list(html: str) -> List[Dict[str, Any]]:
+        # Extract the <table> element containing the groups
+        soup = make_soup(scope_html(html, "table"))
+        table = soup.find("table")
+        return list(MITREAttackCTISoftware._parse_rows(table.find_all("tr")))
+
+    @staticmethod
+    def _parse_row(row: Tag, previous: Union[Dict[str, Any], None]) -> Union[Dict[str, Any], None]:
+        return _SOFTWARE_ROW.extract_row(row)
+
+    @staticmethod
+    def _parse_detail(software_id: str, html: str) -> Dict[str, Any]:
+        soup = make_soup(scope_html(html, "div", "v-attckmatrix"))
+        sections = SectionIndex(soup)
         software_data = {
             "id": software_id,
             "name": None,
@@ -170,86 +288,15 @@ class MITREAttackCTISoftware(MITREAttackInformation):
         software_data["description"] = description_tag.text.strip() if description_tag else None
 
         # Extract the techniques used
-        techniques_used = []
         techniques_used_table = soup.find("table", class_="table techniques-used background table-bordered")
-        if techniques_used_table:
-            latest_technique_domain = None
-            latest_main_technique_id = None
-            for row in techniques_used_table.find_all("tr")[1:]:
-                cells = row.find_all("td")
-                if len(cells) == 4:
-                    # Extract the main technique information
-                    technique_domain = cells[0].text.strip() if cells[0].text.strip() else latest_technique_domain
-                    latest_technique_domain = technique_domain
-
-                    main_technique_id = cells[1].text.strip() if cells[1].text.strip() else latest_main_technique_id
-                    latest_main_technique_id = main_technique_id
-
-                    main_technique_name = cells[2].text.strip()
-                    main_technique_url = f"https://attack.mitre.org/techniques/{main_technique_id}/"
-
-                    main_technique_use = cells[3].text.strip()
-                    techniques_used.append({
-                        "domain": technique_domain,
-                        "main_technique_id": main_technique_id,
-                        "main_technique_name": main_technique_name,
-                        "main_technique_url": main_technique_url,
-                        "sub_technique_id": None,
-                        "sub_technique_name": None,
-                        "sub_technique_url": None,
-                        "use": main_technique_use
-                    })
-
-                elif len(cells) == 5:
-                    # Extract the sub-technique information
-                    technique_domain = cells[0].text.strip() if cells[0].text.strip() else latest_technique_domain
-                    latest_technique_domain = technique_domain
-
-                    main_technique_id = cells[1].text.strip() if cells[1].text.strip() else latest_main_technique_id
-                    latest_main_technique_id = main_technique_id
-                    main_technique_url = f"https://attack.mitre.org/techniques/{main_technique_id}/"
-
-                    sub_technique_id = cells[2].text.strip().replace(".", "")
-                    sub_technique_url = f"https://attack.mitre.org/techniques/{main_technique_id}/{sub_technique_id}/"
-                    full_sub_technique_id = f"{main_technique_id}.{sub_technique_id}" if sub_technique_id else None
-
-                    technique_name: str = cells[3].text.strip()
-                    main_technique_name = technique_name.split(":")[0].strip()
-                    sub_technique_name = technique_name.split(":")[1].strip() if ":" in technique_name else None
-
-                    technique_use = cells[4].text.strip()
-
-                    techniques_used.append({
-                        "domain": technique_domain,
-                        "main_technique_id": main_technique_id,
-                        "main_technique_name": main_technique_name,
-                        "main_technique_url": main_technique_url,
-                        "sub_technique_id": full_sub_technique_id,
-                        "sub_technique_name": sub_technique_name,
-                        "sub_technique_url": sub_technique_url,
-                        "use": technique_use
-                    })
-        software_data["techniques_used"] = techniques_used
+        software_data["techniques_used"] = _TECHNIQUES_USED_TABLE.extract(techniques_used_table)
 
         # Extract the groups that use this software
-        groups_that_use_this_software = []
-        software_table = soup.find("table", class_="table table-bordered table-alternate mt-2")
-        if software_table:
-            for row in software_table.find_all("tr"):
-                cells: List[Tag] = row.find_all("td")
-                if len(cells) == 3:
-                    group_id = cells[0].text.strip()
-                    group_name = cells[1].text.strip()
-                    group_reference = cells[2].find("a")["href"] if cells[2].find("a") else None
-                    groups_that_use_this_software.append({
-                        "id": group_id,
-                        "name": group_name,
-                        "reference": group_reference
-                    })
-        software_data["groups_that_use_this_software"] = groups_that_use_this_software
+        groups_table = soup.find("table", class_="table table-bordered table-alternate mt-2")
+        software_data["groups_that_use_this_software"] = _GROUPS_TABLE.extract(groups_table)
 
         # Extract the references
-        references_div: Union[Tag, None] = soup.find("h2", string="References").find_next("div") if soup.find("h2", string="References") else None
+        references_div: Union[Tag, None] = sections.following("References", "div")
         reference_number: int = 1
         if references_div:
             for li in references_div.find_all("li"):
@@ -272,8 +319,10 @@ if __name__ == "__main__":
     import json
 
     # Get the list of all MITRE ATT&CK Softwares
-    # And then iterate over each software to get the detailed information, for brevity, only get len(json.dumps(detail))
+    # And then fetch the detailed information of every software concurrently, for brevity, only get len(json.dumps(detail))
     software_list = MITREAttackCTISoftware.get_list()
-    for software in software_list:
-        detail = MITREAttackCTISoftware.get(software["id"])
-        print(f"Software ID: {software['id']}, Detail Length: {len(json.dumps(detail))}")
\ No newline at end of file
+    for result in MITREAttackCTISoftware.get_many([software["id"] for software in software_list], max_workers=16):
+        if result.ok:
+            print(f"Software ID: {result.id}, Detail Length: {len(json.dumps(result.data))}")
+        else:
+            print(f"Software ID: {result.id}, Error: {result.error}")
\ No newline at end of file
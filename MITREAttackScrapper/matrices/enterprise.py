@@ -2,10 +2,16 @@
 
 import httpx
 import pandas as pd
-from bs4 import BeautifulSoup, Tag
-from typing import List, Dict, Any, Union
+from bs4 import Tag
+from typing import Any, AsyncIterator, Dict, Iterator, List, Union
 
 from ..superclass import MITREAttackInformation
+from ..stix.bundle import MITREAttackSTIXBundle, technique_url
+from ..utils.html_parser import make_soup, scope_html
+from ..utils.instrumentation import count
+from ..utils.records import MatrixTactic, Technique
+from .index import MITREAttackMatrixIndex
+from .incidence import MITREAttackMatrixIncidence
 from ..techniques.enterprise import MITREAttackEnterpriseTechniques
 from ..utils.mitre_id_validator import validate_mitre_technique_id
 
@@ -14,6 +20,10 @@ class MITREAttackEnterpriseMatrix(MITREAttackInformation):
     A class containing methods to parse MITRE ATT&CK Enterprise Matrices.
     """
 
+    _list_url = "https://attack.mitre.org/matrices/enterprise/"
+    _list_record_type = MatrixTactic
+    _record_type = Technique
+
     @staticmethod
     def get_list() -> Dict[str, Any]:
         """
@@ -60,14 +70,251 @@ class MITREAttackEnterpriseMatrix(MITREAttackInformation):
                 }
             }
         """
-        target_url = "https://attack.mitre.org/matrices/enterprise/"
-        response = httpx.get(target_url)
-        if response.status_code != 200:
-            raise RuntimeError(f"Failed to fetch data from {target_url}")
+        return MITREAttackEnterpriseMatrix._fetch_list()
+
+    @staticmethod
+    async def aget_list() -> Dict[str, Any]:
+        """
+        Asynchronously get the list of all MITRE ATT&CK matrices information for Enterprise.
+        Refer to the `get_list()` method for the structure of the returned data.
+
+        :return: A dictionary containing MITRE ATT&CK matrices data.
+        :rtype: Dict[str, Any]
+        :raises RuntimeError: If there's a failure in fetching data from the MITRE ATT&CK website.
+        """
+        return await MITREAttackEnterpriseMatrix._afetch_list()
+
+    @staticmethod
+    def get_index() -> MITREAttackMatrixIndex:
+        """
+        Get the MITRE ATT&CK Enterprise Matrix as an indexed object, answering in constant time
+        which tactics contain a technique, which techniques a tactic contains, and which sub-techniques a technique has.
+        Refer to ``MITREAttackMatrixIndex`` for the available lookups.
+
+        The index is built in a single pass over the result of ``get_list()``; keep it for as long as it is needed,
+        rather than calling this method for every lookup.
+
+        :return: The indexed matrix.
+        :rtype: MITREAttackMatrixIndex
+        :raises RuntimeError: If there's a failure in fetching data from the MITRE ATT&CK website.
+
+        :Example:
+
+        .. code-block:: python
+
+            from MITREAttackScrapper.matrices.enterprise import MITREAttackEnterpriseMatrix
+
+            matrix = MITREAttackEnterpriseMatrix.get_index()
+            for tactic_id in matrix.tactics_of("T1059"):
+                print(matrix.tactic(tactic_id)["name"])
+        """
+        return MITREAttackMatrixIndex(MITREAttackEnterpriseMatrix.get_list())
+
+    @staticmethod
+    async def aget_index() -> MITREAttackMatrixIndex:
+        """
+        Asynchronously get the MITRE ATT&CK Enterprise Matrix as an indexed object.
+        Refer to the `get_index()` method for more information.
+
+        :return: The indexed matrix.
+        :rtype: MITREAttackMatrixIndex
+        :raises RuntimeError: If there's a failure in fetching data from the MITRE ATT&CK website.
+        """
+        return MITREAttackMatrixIndex(await MITREAttackEnterpriseMatrix.aget_list())
+
+    @staticmethod
+    def get_incidence(include_sub_techniques: bool = True, sparse: bool = False) -> MITREAttackMatrixIncidence:
+        """
+        Get the MITRE ATT&CK Enterprise Matrix as a numeric tactic x technique incidence matrix,
+        with maps from tactic IDs to rows and from (sub-)technique IDs to columns.
+        Unlike ``get_matrix_dataframe()``, sub-techniques are included, as a second level of the technique axis.
+        Refer to ``MITREAttackMatrixIncidence`` for the structure and the vectorized coverage helpers.
+
+        :param include_sub_techniques: Whether sub-techniques get columns of their own.
+        :type include_sub_techniques: bool
+        :param sparse: Whether the matrix is a ``scipy.sparse.csr_matrix`` instead of a dense ``numpy.ndarray``.
+                       Requires ``MITREAttackScrapper[sparse]``.
+        :type sparse: bool
+        :return: The incidence matrix.
+        :rtype: MITREAttackMatrixIncidence
+        :raises RuntimeError: If there's a failure in fetching data from the MITRE ATT&CK website.
+
+        :Example:
+
+        .. code-block:: python
+
+            from MITREAttackScrapper.matrices.enterprise import MITREAttackEnterpriseMatrix
+
+            incidence = MITREAttackEnterpriseMatrix.get_incidence()
+            execution = incidence.matrix[incidence.tactic_rows["TA0002"]]
+            print([incidence.technique_ids[column] for column in execution.nonzero()[0]])
+        """
+        return MITREAttackMatrixIncidence(MITREAttackEnterpriseMatrix.get_index(), include_sub_techniques, sparse)
+
+    @classmethod
+    def _iter_list(cls) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the columns of the matrix, refer to ``iter_list()``.
+
+        The matrix is a single table of tactics, whose columns are only complete at the end of the page,
+        so it is parsed whole with ``get_list()`` and then yielded column by column, each with its tactic name:
+        ``{"name": "Reconnaissance", "id": "TA0043", "url": ..., "main_technique": [...]}``.
+        """
+        for name, column in MITREAttackEnterpriseMatrix.get_list().items():
+            yield {"name": name, **column}
+
+    @classmethod
+    async def _aiter_list(cls) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Asynchronously iterate over the columns of the matrix, refer to ``_iter_list()``.
+        """
+        for name, column in (await MITREAttackEnterpriseMatrix.aget_list()).items():
+            yield {"name": name, **column}
+    
+    @staticmethod
+    def get_matrix_dataframe() -> pd.DataFrame:
+        """
+        Get the MITRE ATT&CK Enterprise Matrix data in the form of a pandas DataFrame.
+        The columns will be the tactic names, and the rows will be the techniques under each tactic.
+
+        Due to the limitation of the dimension of the DataFrame, the sub-techniques will not be included in the DataFrame.
+
+        Example
+        -------
+        The generated DataFrame will look like the following:
+
+        .. code-block:: text
+
+            Collection        Command and Control        ...
+            T1234 Technique   T1235 Technique            ...
+            T1236 Technique   T1237 Technique            ...
+            ...               ...                        ...
+
+        Note that the Pandas DataFrame will be rectangular, with the maximum number of techniques under any tactic.
+        Thus, the Pandas DataFrame will be padded with `None` values where necessary.
+
+        :return: A pandas DataFrame containing MITRE ATT&CK Enterprise Matrix data.
+        :rtype: pd.DataFrame
+        """
+        matrix_data: Dict[str, Any] = MITREAttackEnterpriseMatrix.get_list()
+        matrix_columns: List[str] = list(matrix_data.keys())
+        tactics_techniques = {tactic: [] for tactic in matrix_columns}          # Create a dictionary to hold the techniques aligned with tactics
+
+        # Populate the tactics_techniques dictionary with techniques
+        for tactic_name in matrix_data:
+            for technique in matrix_data[tactic_name]["main_technique"]:
+                tactics_techniques[tactic_name].append(technique["name"])
+
+        # Find the maximum number of techniques under any tactic and fill the rest with None to get a rectangular matrix
+        max_techniques = max(len(techniques) for techniques in tactics_techniques.values())
+        for tactic in tactics_techniques:
+            tactics_techniques[tactic] += [None] * (max_techniques - len(tactics_techniques[tactic]))
+
+        matrix_dataframe = pd.DataFrame(tactics_techniques)
+        return matrix_dataframe
+    
+    @staticmethod
+    @validate_mitre_technique_id
+    def get(technique_id: str) -> Dict[str, Any]:
+        """
+        Get the details of a specific MITRE ATT&CK technique for Enterprise.
+        Since the MITRE ATT&CK Enterprise matrix contains MITRE ATT&CK techniques in hierarchical order,
+        it's just the same as getting the details of a technique.
+
+        Refer to the `MITREAttackEnterpriseTechniques.get()` method for more information.
+
+        :param technique_id: The ID of the specific MITRE ATT&CK technique.
+        :type technique_id: str
+        :return: A dictionary containing the details of the specified MITRE ATT&CK technique.
+        :rtype: Dict[str, Any]
+        :raises ValueError: If the `technique_id` is not a valid MITRE ATT&CK ID.
+        """
+        return MITREAttackEnterpriseTechniques.get(technique_id)
+
+    @staticmethod
+    @validate_mitre_technique_id
+    async def aget(technique_id: str) -> Dict[str, Any]:
+        """
+        Asynchronously get the details of a specific MITRE ATT&CK technique for Enterprise.
+        Refer to the `MITREAttackEnterpriseTechniques.get()` method for more information.
+
+        :param technique_id: The ID of the specific MITRE ATT&CK technique.
+        :type technique_id: str
+        :return: A dictionary containing the details of the specified MITRE ATT&CK technique.
+        :rtype: Dict[str, Any]
+        :raises ValueError: If the `technique_id` is not a valid MITRE ATT&CK ID.
+        """
+        return await MITREAttackEnterpriseTechniques.aget(technique_id)
+
+    @staticmethod
+    @validate_mitre_technique_id
+    def _validate_id(technique_id: str) -> None:
+        pass
+
+    @staticmethod
+    def _detail_url(technique_id: str) -> str:
+        return MITREAttackEnterpriseTechniques._detail_url(technique_id)
+
+    @staticmethod
+    def _not_found(technique_id: str) -> ValueError:
+        return MITREAttackEnterpriseTechniques._not_found(technique_id)
+
+    @staticmethod
+    def _check_response(response: httpx.Response, url: str, technique_id: Union[str, None] = None) -> None:
+        MITREAttackEnterpriseTechniques._check_response(response, url, technique_id)
+
+    @staticmethod
+    def _list_entries(data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        # The details of the matrix are the pages of the techniques, already covered by MITREAttackEnterpriseTechniques
+        return {}
+
+    @staticmethod
+    def _stix_list(bundle: MITREAttackSTIXBundle) -> Dict[str, Any]:
+        matrix_data = {}
+        for tactic in bundle.tactics():
+            tactic_id = bundle.attack_id(tactic)
+            tactic_techniques = bundle.techniques_by_tactic[tactic["x_mitre_shortname"]]
+            tactic_technique_ids = {technique["id"] for technique in tactic_techniques}
+
+            # Like on the website, techniques and their sub-techniques are ordered by name within a tactic
+            main_techniques = []
+            for technique in sorted(tactic_techniques, key=lambda technique: technique["name"]):
+                if technique["id"] in bundle.parent_technique:
+                    continue
+                sub_techniques = [sub_technique for sub_technique in bundle.sub_techniques[technique["id"]]
+                                  if sub_technique["id"] in tactic_technique_ids]
+                main_techniques.append({
+                    "id": bundle.attack_id(technique),
+                    "name": technique["name"],
+                    "url": technique_url(bundle.attack_id(technique)),
+                    "mitre_tactic_uuid4": tactic["id"].split("--")[1],
+                    "mitre_attack_pattern_uuid4": technique["id"].split("--")[1],
+                    "sub_technique": [{
+                        "id": bundle.attack_id(sub_technique),
+                        "name": sub_technique["name"],
+                        "url": technique_url(bundle.attack_id(sub_technique)),
+                        "mitre_tactic_uuid4": tactic["id"].split("--")[1],
+                        "mitre_attack_pattern_uuid4": sub_technique["id"].split("--")[1]
+                    } for sub_technique in sorted(sub_techniques, key=lambda sub_technique: sub_technique["name"])]
+                })
+
+            matrix_data[tactic["name"]] = {
+                "id": tactic_id,
+                "url": f"https://attack.mitre.org/tactics/{tactic_id}/",
+                "main_technique": main_techniques
+            }
+        return matrix_data
+
+    @staticmethod
+    def _stix_detail(technique_id: str, bundle: MITREAttackSTIXBundle) -> Union[Dict[str, Any], None]:
+        return MITREAttackEnterpriseTechniques._stix_detail(technique_id, bundle)
+
+    @staticmethod
+    def _parse_list(html: str) -> Dict[str, Any]:
         matrix_data = {}
 
         # Extract the <table> element containing the matrices
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = make_soup(scope_html(html, "div", "layouts-content"))
 
         # Extract the encompassing MITRE ATT&CK tactics
         tactics_data_chunk_location: Union[Tag, None] = soup.select_one("#layouts-content > div.matrix-type.side > div > div > div.overflow-x-auto.matrix-scroll-box.pb-3 > table > thead > tr:nth-child(1)")
@@ -88,7 +335,10 @@ class MITREAttackEnterpriseMatrix(MITREAttackInformation):
         main_technique_table: Union[Tag, None] = soup.select_one("#layouts-content > div.matrix-type.side > div > div > div.overflow-x-auto.matrix-scroll-box.pb-3 > table > tbody > tr")
         main_technique_table_list: List[Tag] = main_technique_table.find_all("td", class_="tactic")
 
-        for main_technique_table in main_technique_table_list:
+        # The columns of the table are the tactics, in the order of the header
+        tactic_names: List[str] = list(matrix_data.keys())
+        for tactic_index, main_technique_table in enumerate(main_technique_table_list):
+            main_techniques: List[Dict[str, Any]] = matrix_data[tactic_names[tactic_index]]["main_technique"]
             for main_technique_row in main_technique_table.find_all("tr", class_="technique-row"):
                 technique = main_technique_row.find("div", class_="supertechniquecell")
                 if not technique:
@@ -123,10 +373,7 @@ class MITREAttackEnterpriseMatrix(MITREAttackInformation):
                             "mitre_attack_pattern_uuid4": sub_technique_mitre_attack_pattern_uuid4
                         })
 
-                # Determine which tactic this technique belongs to
-                tactic_index = main_technique_table_list.index(main_technique_table)
-                tactic_name = list(matrix_data.keys())[tactic_index]
-                matrix_data[tactic_name]["main_technique"].append({
+                main_techniques.append({
                     "id": technique_id,
                     "name": technique_name,
                     "url": technique_url,
@@ -134,65 +381,10 @@ class MITREAttackEnterpriseMatrix(MITREAttackInformation):
                     "mitre_attack_pattern_uuid4": main_technique_mitre_attack_pattern_uuid4,
                     "sub_technique": sub_techniques
                 })
+            count("rows", len(main_techniques))
 
         return matrix_data
-    
-    @staticmethod
-    def get_matrix_dataframe() -> pd.DataFrame:
-        """
-        Get the MITRE ATT&CK Enterprise Matrix data in the form of a pandas DataFrame.
-        The columns will be the tactic names, and the rows will be the techniques under each tactic.
-
-        Due to the limitation of the dimension of the DataFrame, the sub-techniques will not be included in the DataFrame.
 
-        Example
-        -------
-        The generated DataFrame will look like the following:
-
-        .. code-block:: text
-
-            Collection        Command and Control        ...
-            T1234 Technique   T1235 Technique            ...
-            T1236 Technique   T1237 Technique            ...
-            ...               ...                        ...
-
-        Note that the Pandas DataFrame will be rectangular, with the maximum number of techniques under any tactic.
-        Thus, the Pandas DataFrame will be padded with `None` values where necessary.
-
-        :return: A pandas DataFrame containing MITRE ATT&CK Enterprise Matrix data.
-        :rtype: pd.DataFrame
-        """
-        matrix_data: Dict[str, Any] = MITREAttackEnterpriseMatrix.get_list()
-        matrix_columns: List[str] = list(matrix_data.keys())
-        tactics_techniques = {tactic: [] for tactic in matrix_columns}          # Create a dictionary to hold the techniques aligned with tactics
-
-        # Populate the tactics_techniques dictionary with techniques
-        for tactic_name in matrix_data:
-            for technique in matrix_data[tactic_name]["main_technique"]:
-                tactics_techniques[tactic_name].append(technique["name"])
-
-        # Find the maximum number of techniques under any tactic and fill the rest with None to get a rectangular matrix
-        max_techniques = max(len(techniques) for techniques in tactics_techniques.values())
-        for tactic in tactics_techniques:
-            tactics_techniques[tactic] += [None] * (max_techniques - len(tactics_techniques[tactic]))
-
-        matrix_dataframe = pd.DataFrame(tactics_techniques)
-        return matrix_dataframe
-    
     @staticmethod
-    @validate_mitre_technique_id
-    def get(technique_id: str) -> Dict[str, Any]:
-        """
-        Get the details of a specific MITRE ATT&CK technique for Enterprise.
-        Since the MITRE ATT&CK Enterprise matrix contains MITRE ATT&CK techniques in hierarchical order,
-        it's just the same as getting the details of a technique.
-
-        Refer to the `MITREAttackEnterpriseTechniques.get()` method for more information.
-
-        :param technique_id: The ID of the specific MITRE ATT&CK technique.
-        :type technique_id: str
-        :return: A dictionary containing the details of the specified MITRE ATT&CK technique.
-        :rtype: Dict[str, Any]
-        :raises ValueError: If the `technique_id` is not a valid MITRE ATT&CK ID.
-        """
-        return MITREAttackEnterpriseTechniques.get(technique_id)
\ No newline at end of file
+    def _parse_detail(technique_id: str, html: str) -> Dict[str, Any]:
+        return MITREAttackEnterpriseTechniques._parse_detail(technique_id, html)
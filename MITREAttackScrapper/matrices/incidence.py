@@ -0,0 +1,184 @@
+# MITREAttackScrapper/matrices/incidence.py
+import numpy as np
+from typing import Any, Dict, Iterable, Mapping, Tuple
+
+from .index import MITREAttackMatrixIndex
+
+def _require_scipy_sparse() -> Any:
+    """
+    Import ``scipy.sparse``, which is only needed for sparse incidence matrices.
+    """
+    try:
+        import scipy.sparse
+    except ImportError as error:
+        raise ImportError("Sparse incidence matrices require scipy. "
+                          "Install it with `pip install MITREAttackScrapper[sparse]`.") from error
+    return scipy.sparse
+
+class MITREAttackMatrixIncidence:
+    """
+    A numeric tactic x technique incidence matrix of the MITRE ATT&CK Enterprise Matrix.
+
+    ``matrix[row, column]`` is 1 if the technique of the column is listed under the tactic of the row, 0 otherwise.
+    The rows are the tactics, in the order of the matrix columns. The columns are the techniques in the order
+    of the matrix, each followed by its sub-techniques, which form the second level of a hierarchical axis:
+    ``parents[column]`` is the column of the parent technique of a sub-technique, or -1 for a technique.
+
+    Coverage layers (e.g. scores of ATT&CK Navigator layers) can be turned into a ``layers x columns`` array
+    with ``layer_matrix()``, so computations over many layers are vectorized instead of walking dictionaries.
+
+    :param index: The indexed matrix, e.g. ``MITREAttackEnterpriseMatrix.get_index()``.
+    :type index: MITREAttackMatrixIndex
+    :param include_sub_techniques: Whether sub-techniques get columns of their own.
+    :type include_sub_techniques: bool
+    :param sparse: Whether ``matrix`` is a ``scipy.sparse.csr_matrix`` instead of a dense ``numpy.ndarray``.
+                   Requires ``MITREAttackScrapper[sparse]``.
+    :type sparse: bool
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.matrices.enterprise import MITREAttackEnterpriseMatrix
+
+        incidence = MITREAttackEnterpriseMatrix.get_incidence()
+        print(incidence.matrix.shape)                               # (14, 794)
+        print(incidence.matrix[incidence.tactic_rows["TA0002"]].sum())
+
+        layers = [{"T1059": 1.0, "T1059.001": 3.0}, {"T1566": 2.0}]
+        scores = incidence.layer_matrix(layers)                     # (2, 794)
+        print(incidence.tactic_coverage(scores))                    # (2, 14), share of techniques scored per tactic
+    """
+
+    def __init__(self, index: MITREAttackMatrixIndex, include_sub_techniques: bool = True, sparse: bool = False) -> None:
+        self.tactic_ids: Tuple[str, ...] = tuple(index.tactics)
+        self.tactic_rows: Dict[str, int] = {tactic_id: row for row, tactic_id in enumerate(self.tactic_ids)}
+
+        # The techniques in the order of the matrix, first seen under the leftmost tactic, each followed by its sub-techniques
+        technique_ids = []
+        parents = []
+        seen = set()
+        for tactic_id in self.tactic_ids:
+            for technique_id in index.techniques_of(tactic_id):
+                if technique_id not in seen:
+                    seen.add(technique_id)
+                    parent_column = len(technique_ids)
+                    technique_ids.append(technique_id)
+                    parents.append(-1)
+                    if include_sub_techniques:
+                        for sub_technique_id in index.sub_techniques_of(technique_id):
+                            technique_ids.append(sub_technique_id)
+                            parents.append(parent_column)
+        self.technique_ids: Tuple[str, ...] = tuple(technique_ids)
+        self.technique_columns: Dict[str, int] = {technique_id: column for column, technique_id in enumerate(self.technique_ids)}
+        self.parents: np.ndarray = np.array(parents, dtype=np.int32)
+
+        rows = []
+        columns = []
+        for column, technique_id in enumerate(self.technique_ids):
+            for tactic_id in index.tactics_of(technique_id):
+                rows.append(self.tactic_rows[tactic_id])
+                columns.append(column)
+        shape = (len(self.tactic_ids), len(self.technique_ids))
+        if sparse:
+            data = np.ones(len(rows), dtype=np.uint8)
+            self.matrix = _require_scipy_sparse().csr_matrix((data, (rows, columns)), shape=shape, dtype=np.uint8)
+        else:
+            self.matrix = np.zeros(shape, dtype=np.uint8)
+            self.matrix[rows, columns] = 1
+
+    @property
+    def is_sub_technique(self) -> np.ndarray:
+        """
+        A boolean mask of the columns that are sub-techniques.
+
+        :return: The mask, one value per column.
+        :rtype: np.ndarray
+        """
+        return self.parents >= 0
+
+    def layer_vector(self, scores: Mapping[str, float]) -> np.ndarray:
+        """
+        Turn a coverage layer into a vector with one score per column.
+        IDs that are not columns of the matrix (e.g. revoked techniques) are ignored.
+
+        :param scores: The scores of the layer, keyed by (sub-)technique ID. For an ATT&CK Navigator layer,
+                       use ``{technique["techniqueID"]: technique.get("score", 1) for technique in layer["techniques"]}``.
+        :type scores: Mapping[str, float]
+        :return: The scores, 0 for the techniques missing from the layer.
+        :rtype: np.ndarray
+        """
+        vector = np.zeros(len(self.technique_ids), dtype=np.float32)
+        for technique_id, score in scores.items():
+            column = self.technique_columns.get(technique_id)
+            if column is not None:
+                vector[column] = score
+        return vector
+
+    def layer_matrix(self, layers: Iterable[Mapping[str, float]]) -> np.ndarray:
+        """
+        Turn coverage layers into an array with one row per layer and one score per column.
+        Refer to ``layer_vector()`` for the format of a layer.
+
+        :param layers: The layers.
+        :type layers: Iterable[Mapping[str, float]]
+        :return: The scores, of shape ``(layers, columns)``.
+        :rtype: np.ndarray
+        """
+        layers = list(layers)
+        array = np.zeros((len(layers), len(self.technique_ids)), dtype=np.float32)
+        for row, scores in enumerate(layers):
+            array[row] = self.layer_vector(scores)
+        return array
+
+    def roll_up(self, scores: np.ndarray) -> np.ndarray:
+        """
+        Raise the score of every technique to the highest score of its sub-techniques,
+        e.g. to color a technique that is only covered through its sub-techniques.
+
+        :param scores: Scores of shape ``(columns,)`` or ``(layers, columns)``.
+        :type scores: np.ndarray
+        :return: A copy of the scores with the techniques rolled up.
+        :rtype: np.ndarray
+        """
+        rolled = np.array(scores, dtype=np.float32, copy=True)
+        sub_columns = np.flatnonzero(self.is_sub_technique)
+        # Transposed, the columns are the first axis for both shapes; the view writes through to the copy
+        np.maximum.at(rolled.T, self.parents[sub_columns], rolled.T[sub_columns])
+        return rolled
+
+    def tactic_coverage(self, scores: np.ndarray, threshold: float = 0.0) -> np.ndarray:
+        """
+        Get the share of the columns of every tactic whose score is above the threshold.
+
+        :param scores: Scores of shape ``(columns,)`` or ``(layers, columns)``.
+        :type scores: np.ndarray
+        :param threshold: The score a (sub-)technique must exceed to count as covered.
+        :type threshold: float
+        :return: The coverage of every tactic, between 0 and 1, of shape ``(tactics,)`` or ``(layers, tactics)``.
+        :rtype: np.ndarray
+        """
+        covered = (np.asarray(scores) > threshold).astype(np.float32)
+        counts = np.asarray(self.matrix.sum(axis=1), dtype=np.float32).ravel()
+        per_tactic = np.asarray(self.matrix @ covered.T, dtype=np.float32).T
+        return np.divide(per_tactic, counts, out=np.zeros_like(per_tactic), where=counts > 0)
+
+    def to_dataframe(self) -> Any:
+        """
+        Get the incidence matrix as a pandas DataFrame, with the tactic IDs as index
+        and a (technique ID, sub-technique ID) MultiIndex as columns; the sub-technique ID is empty for techniques.
+
+        :return: The incidence matrix.
+        :rtype: pd.DataFrame
+        """
+        import pandas as pd
+
+        matrix = self.matrix.toarray() if hasattr(self.matrix, "toarray") else self.matrix
+        columns = pd.MultiIndex.from_tuples(
+            [(self.technique_ids[parent], technique_id) if parent >= 0 else (technique_id, "")
+             for technique_id, parent in zip(self.technique_ids, self.parents.tolist())],
+            names=["technique", "sub_technique"])
+        return pd.DataFrame(matrix, index=pd.Index(self.tactic_ids, name="tactic"), columns=columns)
+
+    def __len__(self) -> int:
+        return len(self.technique_ids)
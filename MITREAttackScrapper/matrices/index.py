@@ -0,0 +1,173 @@
+# MITREAttackScrapper/matrices/index.py
+from typing import Any, Dict, List, Optional, Tuple
+
+class MITREAttackMatrixIndex:
+    """
+    An indexed view of the MITRE ATT&CK Enterprise Matrix, as returned by ``MITREAttackEnterpriseMatrix.get_list()``.
+
+    The matrix is indexed once, in a single pass over its tactics, techniques and sub-techniques:
+    tactics by ID and by name, techniques and sub-techniques by ID, the tactics of every technique,
+    the techniques of every tactic, the sub-techniques of every technique, and every tactic and technique
+    by the UUID of its STIX object. All the lookups take constant time.
+
+    A (sub-)technique listed under several tactics is indexed once, with the tactics in the order of the matrix columns.
+    The returned records and tuples are shared by all lookups and should not be modified.
+
+    :param matrix_data: The matrix, as returned by ``MITREAttackEnterpriseMatrix.get_list()``.
+    :type matrix_data: Dict[str, Any]
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.matrices.enterprise import MITREAttackEnterpriseMatrix
+
+        matrix = MITREAttackEnterpriseMatrix.get_index()
+        print(matrix.tactics_of("T1059"))                # ('TA0002',)
+        print(matrix.techniques_of("Execution")[:3])     # ('T1651', 'T1059', 'T1609')
+        print(matrix.sub_techniques_of("T1059")[:2])     # ('T1059.001', 'T1059.002')
+        print(matrix.parent_of("T1059.001"))             # 'T1059'
+    """
+
+    def __init__(self, matrix_data: Dict[str, Any]) -> None:
+        self.tactics: Dict[str, Dict[str, Any]] = {}
+        self.tactic_ids_by_name: Dict[str, str] = {}
+        self.techniques: Dict[str, Dict[str, Any]] = {}
+        self.tactics_by_technique: Dict[str, Tuple[str, ...]] = {}
+        self.techniques_by_tactic: Dict[str, Tuple[str, ...]] = {}
+        self.sub_techniques: Dict[str, Tuple[str, ...]] = {}
+        self.parent_technique: Dict[str, str] = {}
+        self.by_uuid: Dict[str, str] = {}
+
+        tactics_by_technique: Dict[str, List[str]] = {}
+        sub_techniques: Dict[str, Dict[str, None]] = {}
+        for tactic_name, tactic in matrix_data.items():
+            tactic_id = tactic["id"]
+            self.tactics[tactic_id] = {"id": tactic_id, "name": tactic_name, "url": tactic["url"]}
+            self.tactic_ids_by_name[tactic_name] = tactic_id
+
+            main_technique_ids = []
+            for technique in tactic["main_technique"]:
+                main_technique_ids.append(technique["id"])
+                self._add_technique(technique, tactic_id, tactics_by_technique)
+                children = sub_techniques.setdefault(technique["id"], {})
+                for sub_technique in technique["sub_technique"]:
+                    self._add_technique(sub_technique, tactic_id, tactics_by_technique)
+                    self.parent_technique[sub_technique["id"]] = technique["id"]
+                    children[sub_technique["id"]] = None
+            self.techniques_by_tactic[tactic_id] = tuple(main_technique_ids)
+
+        self.tactics_by_technique = {technique_id: tuple(tactic_ids) for technique_id, tactic_ids in tactics_by_technique.items()}
+        self.sub_techniques = {technique_id: tuple(children) for technique_id, children in sub_techniques.items()}
+
+    def _add_technique(self, technique: Dict[str, Any], tactic_id: str, tactics_by_technique: Dict[str, List[str]]) -> None:
+        """
+        Index a (sub-)technique listed under the given tactic.
+        """
+        technique_id = technique["id"]
+        if technique_id not in self.techniques:
+            self.techniques[technique_id] = {
+                "id": technique_id,
+                "name": technique["name"],
+                "url": technique["url"],
+                "mitre_attack_pattern_uuid4": technique["mitre_attack_pattern_uuid4"],
+            }
+            tactics_by_technique[technique_id] = []
+        self.by_uuid.setdefault(technique["mitre_attack_pattern_uuid4"], technique_id)
+        tactic_ids = tactics_by_technique[technique_id]
+        if tactic_id not in tactic_ids:
+            tactic_ids.append(tactic_id)
+        # The tactic columns of the matrix carry no UUID of their own, only their techniques do
+        self.tactics[tactic_id].setdefault("mitre_tactic_uuid4", technique["mitre_tactic_uuid4"])
+        self.by_uuid.setdefault(technique["mitre_tactic_uuid4"], tactic_id)
+
+    def _tactic_id(self, tactic: str) -> str:
+        """
+        Get the ID of a tactic given by ID or by name.
+        """
+        return self.tactic_ids_by_name.get(tactic, tactic)
+
+    def tactic(self, tactic: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a tactic of the matrix.
+
+        :param tactic: The ID (e.g. ``TA0002``) or the name (e.g. ``Execution``) of the tactic.
+        :type tactic: str
+        :return: The ``id``, ``name``, ``url`` and ``mitre_tactic_uuid4`` of the tactic, or ``None`` if it is not in the matrix.
+        :rtype: Optional[Dict[str, Any]]
+        """
+        return self.tactics.get(self._tactic_id(tactic))
+
+    def technique(self, technique_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a technique or sub-technique of the matrix.
+
+        :param technique_id: The ID of the (sub-)technique, e.g. ``T1059`` or ``T1059.001``.
+        :type technique_id: str
+        :return: The ``id``, ``name``, ``url`` and ``mitre_attack_pattern_uuid4`` of the (sub-)technique,
+                 or ``None`` if it is not in the matrix.
+        :rtype: Optional[Dict[str, Any]]
+        """
+        return self.techniques.get(technique_id)
+
+    def tactics_of(self, technique_id: str) -> Tuple[str, ...]:
+        """
+        Get the IDs of the tactics a technique or sub-technique is listed under, in the order of the matrix columns.
+
+        :param technique_id: The ID of the (sub-)technique.
+        :type technique_id: str
+        :return: The IDs of the tactics, empty if the (sub-)technique is not in the matrix.
+        :rtype: Tuple[str, ...]
+        """
+        return self.tactics_by_technique.get(technique_id, ())
+
+    def techniques_of(self, tactic: str) -> Tuple[str, ...]:
+        """
+        Get the IDs of the techniques (without sub-techniques) listed under a tactic, in the order of the matrix.
+
+        :param tactic: The ID or the name of the tactic.
+        :type tactic: str
+        :return: The IDs of the techniques, empty if the tactic is not in the matrix.
+        :rtype: Tuple[str, ...]
+        """
+        return self.techniques_by_tactic.get(self._tactic_id(tactic), ())
+
+    def sub_techniques_of(self, technique_id: str) -> Tuple[str, ...]:
+        """
+        Get the IDs of the sub-techniques of a technique.
+
+        :param technique_id: The ID of the technique.
+        :type technique_id: str
+        :return: The IDs of the sub-techniques, empty if the technique has none or is not in the matrix.
+        :rtype: Tuple[str, ...]
+        """
+        return self.sub_techniques.get(technique_id, ())
+
+    def parent_of(self, sub_technique_id: str) -> Optional[str]:
+        """
+        Get the ID of the technique a sub-technique belongs to.
+
+        :param sub_technique_id: The ID of the sub-technique.
+        :type sub_technique_id: str
+        :return: The ID of the parent technique, or ``None`` if the sub-technique is not in the matrix.
+        :rtype: Optional[str]
+        """
+        return self.parent_technique.get(sub_technique_id)
+
+    def resolve_uuid(self, uuid: str) -> Optional[str]:
+        """
+        Get the ATT&CK ID of a tactic or (sub-)technique from the UUID of its STIX object,
+        i.e. the ``mitre_tactic_uuid4`` or ``mitre_attack_pattern_uuid4`` of the matrix data.
+
+        :param uuid: The UUID, with or without the STIX type prefix (e.g. ``attack-pattern--``).
+        :type uuid: str
+        :return: The ATT&CK ID, or ``None`` if the UUID is not in the matrix.
+        :rtype: Optional[str]
+        """
+        return self.by_uuid.get(uuid.rpartition("--")[2])
+
+    def __contains__(self, id: str) -> bool:
+        return id in self.techniques or self._tactic_id(id) in self.tactics
+
+    def __len__(self) -> int:
+        return len(self.techniques)
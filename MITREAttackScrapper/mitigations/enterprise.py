@@ -1,17 +1,46 @@
 # MITREAttackScrapper/mitigations/enterprise.py
 
-import httpx
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 from typing import List, Dict, Any, Union
 from datetime import datetime
 
 from ..superclass import MITREAttackInformation
-from ..utils.scrapping_helper import get_text_after_span
+from ..stix.bundle import MITREAttackSTIXBundle, CitationRenderer, summary, stix_date, technique_url
+from ..utils.html_parser import make_soup, scope_html
+from ..utils.records import ListEntry, Mitigation
+from ..utils.scrapping_helper import SectionIndex, get_text_after_span
+from ..utils.table_extractor import BASE_URL, Column, TableSpec
+
+def _technique_addressed(values: Dict[str, Any]) -> Dict[str, Any]:
+    main_technique_id = values["main_technique_id"]
+    sub_technique_id = values["sub_technique_id"]    # ".XXX"
+    main_technique_name = values["main_technique_name"]
+    sub_technique_name = values["sub_technique_name"]
+    return {
+        "domain": values["domain"],
+        "id": f"{main_technique_id}{sub_technique_id}" if sub_technique_id else main_technique_id,
+        "name": f"{main_technique_name} ({sub_technique_name})" if sub_technique_name else main_technique_name,
+        "use": values["use"],
+        "url": f"{BASE_URL}/techniques/{main_technique_id}/{sub_technique_id.replace('.', '')}/" if sub_technique_id
+               else f"{BASE_URL}/techniques/{main_technique_id}/",
+    }
+
+_MITIGATION_ROW = TableSpec({3: [Column("id", 0, "raw"), Column("name", 1, "raw"), Column("description", 2, "raw"),
+                                 Column("url", 0, "url")]})
+_TECHNIQUES_ADDRESSED_TABLE = TableSpec({
+    5: [Column("domain", 0, carry=True), Column("main_technique_id", 1, "link_text", carry=True),
+        Column("sub_technique_id", 2, "link_text"), Column("main_technique_name", 3, "link_text"),
+        Column("sub_technique_name", 3, "link_text", link=1), Column("use", 4, "spaced")],
+}, build=_technique_addressed)
 from ..utils.mitre_id_validator import validate_mitre_mitigation_id
 
 class MITREAttackEnterpriseMitigations(MITREAttackInformation):
     """A class containing methods to parse MITRE ATT&CK Enterprise Mitigations."""
 
+    _list_url = "https://attack.mitre.org/mitigations/enterprise/"
+    _list_record_type = ListEntry
+    _record_type = Mitigation
+
     @staticmethod
     def get_list() -> List[Dict[str, Any]]:
         """
@@ -35,32 +64,20 @@ class MITREAttackEnterpriseMitigations(MITREAttackInformation):
                 # ... more mitigation entries
             ]
         """
-        target_url = "https://attack.mitre.org/mitigations/enterprise/"
-        response = httpx.get(target_url)
-        if response.status_code != 200:
-            raise RuntimeError(f"Failed to fetch data from {target_url}")
-        data = []
+        return MITREAttackEnterpriseMitigations._fetch_list()
+
+    @staticmethod
+    async def aget_list() -> List[Dict[str, Any]]:
+        """
+        Asynchronously get the list of all MITRE ATT&CK mitigations for Enterprise.
+        Refer to the `get_list()` method for the structure of the returned data.
+
+        :return: A list of dictionaries containing MITRE ATT&CK mitigations data.
+        :rtype: List[Dict[str, Any]]
+        :raises RuntimeError: If there's a failure in fetching data from the MITRE ATT&CK website.
+        """
+        return await MITREAttackEnterpriseMitigations._afetch_list()
 
-        # Extract the <table> element containing the mitigations
-        soup = BeautifulSoup(response.text, "html.parser")
-        table = soup.find("table")
-        rows = table.find_all("tr")
-        for row in rows:
-            cells = row.find_all("td")
-            if len(cells) == 3:
-                id = cells[0].text.strip()
-                name = cells[1].text.strip()
-                description = cells[2].text.strip()
-                url = f"https://attack.mitre.org{cells[0].find('a')['href']}"
-                data.append({
-                    "id": id,
-                    "name": name,
-                    "description": description,
-                    "url": url
-                })
-        
-        return data
-    
     @staticmethod
     @validate_mitre_mitigation_id
     def get(mitigation_id: str) -> Dict[str, Any]:
@@ -107,12 +124,91 @@ class MITREAttackEnterpriseMitigations(MITREAttackInformation):
                 }
             }
         """
-        target_url = f"https://attack.mitre.org/mitigations/{mitigation_id}/"
-        response = httpx.get(target_url)
-        if response.status_code != 200:
-            raise RuntimeError(f"Failed to fetch data from {target_url}")
+        return MITREAttackEnterpriseMitigations._fetch_detail(mitigation_id)
+
+    @staticmethod
+    @validate_mitre_mitigation_id
+    async def aget(mitigation_id: str) -> Dict[str, Any]:
+        """
+        Asynchronously get the details of a specific MITRE ATT&CK mitigation for Enterprise.
+        Refer to the `get()` method for the structure of the returned data.
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        :param mitigation_id: The ID of the specific MITRE ATT&CK mitigation.
+        :type mitigation_id: str
+        :return: A dictionary containing the details of the specified MITRE ATT&CK mitigation.
+        :rtype: Dict[str, Any]
+        :raises ValueError: If the mitigation ID format is invalid.
+        :raises RuntimeError: If the data fetch from the MITRE ATT&CK website fails.
+        """
+        return await MITREAttackEnterpriseMitigations._afetch_detail(mitigation_id)
+
+    @staticmethod
+    @validate_mitre_mitigation_id
+    def _validate_id(mitigation_id: str) -> None:
+        pass
+
+    @staticmethod
+    def _detail_url(mitigation_id: str) -> str:
+        return f"https://attack.mitre.org/mitigations/{mitigation_id}/"
+
+    @staticmethod
+    def _stix_list(bundle: MITREAttackSTIXBundle) -> List[Dict[str, Any]]:
+        return [{
+            "id": bundle.attack_id(mitigation),
+            "name": mitigation["name"],
+            "description": summary(mitigation.get("description")),
+            "url": f"https://attack.mitre.org/mitigations/{bundle.attack_id(mitigation)}"
+        } for mitigation in bundle.objects_of_type("course-of-action")]
+
+    @staticmethod
+    def _stix_detail(mitigation_id: str, bundle: MITREAttackSTIXBundle) -> Union[Dict[str, Any], None]:
+        mitigation = bundle.attack_object(mitigation_id, "course-of-action")
+        if mitigation is None:
+            return None
+
+        citations = CitationRenderer()
+        description = citations.text(mitigation.get("description"), mitigation)
+        techniques = []
+        for pair in bundle.related(mitigation, "mitigates", ["attack-pattern"]):
+            technique = pair["object"]
+            technique_id = bundle.attack_id(technique)
+            main_technique = bundle.parent_technique.get(technique["id"])
+            techniques.append({
+                "domain": bundle.domain(technique),
+                "id": technique_id,
+                "name": f"{main_technique['name']} ({technique['name']})" if main_technique else technique["name"],
+                "use": citations.text(pair["relationship"].get("description"), pair["relationship"]),
+                "url": technique_url(technique_id, trailing_slash=True)
+            })
+
+        return {
+            "id": mitigation_id,
+            "name": mitigation["name"],
+            "version": mitigation.get("x_mitre_version", ""),
+            "created": stix_date(mitigation.get("created")),
+            "last_modified": stix_date(mitigation.get("modified")),
+            "url": MITREAttackEnterpriseMitigations._detail_url(mitigation_id),
+            "description": description,
+            "techniques_addressed_by_mitigation": techniques,
+            "references": citations.references()
+        }
+
+    @staticmethod
+    def _parse_list(html: str) -> List[Dict[str, Any]]:
+        # Extract the <table> element containing the mitigations
+        soup = make_soup(scope_html(html, "table"))
+        table = soup.find("table")
+        return list(MITREAttackEnterpriseMitigations._parse_rows(table.find_all("tr")))
+
+    @staticmethod
+    def _parse_row(row: Tag, previous: Union[Dict[str, Any], None]) -> Union[Dict[str, Any], None]:
+        return _MITIGATION_ROW.extract_row(row)
+
+    @staticmethod
+    def _parse_detail(mitigation_id: str, html: str) -> Dict[str, Any]:
+        target_url = MITREAttackEnterpriseMitigations._detail_url(mitigation_id)
+        soup = make_soup(scope_html(html, "div", "v-attckmatrix"))
+        sections = SectionIndex(soup)
 
         # Extract the card body containing basic information
         card_body: Union[Tag, None] = soup.select_one("div.card > div.card-body")
@@ -148,45 +244,11 @@ class MITREAttackEnterpriseMitigations(MITREAttackInformation):
             mitigation_data["description"] = description_div.get_text(" ", strip=True)
 
         # Parse techniques addressed by mitigation
-        techniques_table: Union[Tag, None] = soup.find("h2", string="Techniques Addressed by Mitigation").find_next("table")
-        if techniques_table:
-            latest_domain = None
-            latest_main_technique_id = None
-            for row in techniques_table.find("tbody").find_all("tr"):
-                cells = row.find_all("td")
-                if len(cells) == 5:
-                    domain = cells[0].get_text(strip=True) if cells[0].get_text(strip=True) else latest_domain
-                    latest_domain = domain
-
-                    main_technique_id = cells[1].find("a").get_text(strip=True) if cells[1].find("a") else latest_main_technique_id
-                    latest_main_technique_id = main_technique_id
-                    sub_technique_id = cells[2].find("a").get_text(strip=True) if cells[2].find("a") else None
-                    if sub_technique_id:
-                        technique_id = f"{main_technique_id}{sub_technique_id}"
-                        technique_url = f"https://attack.mitre.org/techniques/{main_technique_id}/{sub_technique_id.replace('.', '')}/"
-                    else:
-                        technique_id = main_technique_id
-                        technique_url = f"https://attack.mitre.org/techniques/{main_technique_id}/"
-
-                    main_technique_name = cells[3].find("a").get_text(strip=True)
-                    sub_technique_name = cells[3].find_all("a")[1].get_text(strip=True) if len(cells[3].find_all("a")) > 1 else None
-                    if sub_technique_name:
-                        technique_name = f"{main_technique_name} ({sub_technique_name})" 
-                    else:
-                        technique_name = main_technique_name
-
-                    technique_use = cells[4].get_text(" ", strip=True)
-                    
-                    mitigation_data["techniques_addressed_by_mitigation"].append({
-                        "domain": domain,
-                        "id": technique_id,
-                        "name": technique_name,
-                        "use": technique_use,
-                        "url": technique_url
-                    })
+        techniques_table: Union[Tag, None] = sections.following("Techniques Addressed by Mitigation", "table")
+        mitigation_data["techniques_addressed_by_mitigation"] = _TECHNIQUES_ADDRESSED_TABLE.extract(techniques_table)
 
         # Parse references
-        references_div: Union[Tag, None] = soup.find("h2", string="References").find_next("div") if soup.find("h2", string="References") else None
+        references_div: Union[Tag, None] = sections.following("References", "div")
         reference_number: int = 1
         if references_div:
             for li in references_div.find_all("li"):
@@ -201,4 +263,4 @@ class MITREAttackEnterpriseMitigations(MITREAttackInformation):
                     }
                     reference_number += 1
 
-        return mitigation_data
\ No newline at end of file
+        return mitigation_data
@@ -0,0 +1,353 @@
+# MITREAttackScrapper/stix/bundle.py
+import os
+import re
+import json
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+ATTACK_SOURCE_NAMES = ("mitre-attack", "mitre-mobile-attack", "mitre-ics-attack")
+DOMAIN_NAMES = {"enterprise-attack": "Enterprise", "mobile-attack": "Mobile", "ics-attack": "ICS"}
+
+_CITATION = re.compile(r"\(Citation: ([^)]+)\)")
+_MARKDOWN_LINK = re.compile(r"\[([^\]]*)\]\([^)\s]+\)")
+_HTML_TAG = re.compile(r"</?[a-zA-Z][^>]*>")
+_WHITESPACE = re.compile(r"\s+")
+
+class MITREAttackSTIXBundle:
+    """
+    An indexed, in-memory view of a MITRE ATT&CK STIX 2.1 bundle (e.g. ``enterprise-attack.json``
+    from https://github.com/mitre-attack/attack-stix-data), used as an offline data source by every scraper class.
+
+    The bundle is indexed once when loaded: objects by STIX ID and by ATT&CK ID, relationships by source
+    and target, techniques by tactic and sub-techniques by parent. Revoked and deprecated objects are left out,
+    like on the MITRE ATT&CK website.
+
+    :param bundle: The parsed STIX bundle, i.e. a dictionary with an ``objects`` list.
+    :type bundle: Dict[str, Any]
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.stix.bundle import MITREAttackSTIXBundle
+
+        bundle = MITREAttackSTIXBundle.load("enterprise-attack.json")
+        print(bundle.attack_object("T1059")["name"])
+    """
+
+    def __init__(self, bundle: Dict[str, Any]) -> None:
+        self.objects: Dict[str, Dict[str, Any]] = {}
+        self.by_attack_id: Dict[str, Dict[str, Any]] = {}
+        self.by_type: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.relationships_from: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.relationships_to: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.tactics_by_shortname: Dict[str, Dict[str, Any]] = {}
+        self.techniques_by_tactic: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.sub_techniques: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.parent_technique: Dict[str, Dict[str, Any]] = {}
+        self.matrix: Optional[Dict[str, Any]] = None
+
+        relationships = []
+        for stix_object in bundle.get("objects", []):
+            if stix_object.get("revoked") or stix_object.get("x_mitre_deprecated"):
+                continue
+            if stix_object["type"] == "relationship":
+                relationships.append(stix_object)
+                continue
+            self.objects[stix_object["id"]] = stix_object
+            self.by_type[stix_object["type"]].append(stix_object)
+            attack_id = self.attack_id(stix_object)
+            if attack_id:
+                self.by_attack_id[attack_id] = stix_object
+
+        # Only keep the relationships between objects that are still active
+        for relationship in relationships:
+            source, target = relationship["source_ref"], relationship["target_ref"]
+            if source not in self.objects or target not in self.objects:
+                continue
+            self.relationships_from[source].append(relationship)
+            self.relationships_to[target].append(relationship)
+            if relationship["relationship_type"] == "subtechnique-of":
+                self.sub_techniques[target].append(self.objects[source])
+                self.parent_technique[source] = self.objects[target]
+
+        for tactic in self.by_type["x-mitre-tactic"]:
+            self.tactics_by_shortname[tactic["x_mitre_shortname"]] = tactic
+        for technique in self.by_type["attack-pattern"]:
+            for phase in technique.get("kill_chain_phases", []):
+                if phase.get("kill_chain_name") in ATTACK_SOURCE_NAMES:
+                    self.techniques_by_tactic[phase["phase_name"]].append(technique)
+
+        for objects in list(self.by_type.values()) + list(self.techniques_by_tactic.values()) + list(self.sub_techniques.values()):
+            objects.sort(key=lambda stix_object: self.attack_id(stix_object) or "")
+
+        matrices = self.by_type["x-mitre-matrix"]
+        if matrices:
+            self.matrix = next((matrix for matrix in matrices if self.attack_id(matrix) == "enterprise-attack"), matrices[0])
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> "MITREAttackSTIXBundle":
+        """
+        Load and index a STIX bundle file.
+
+        :param path: Path of the STIX 2.1 bundle JSON file.
+        :type path: Union[str, os.PathLike]
+        :return: The indexed bundle.
+        :rtype: MITREAttackSTIXBundle
+        """
+        with open(os.path.expanduser(os.fspath(path)), "r", encoding="utf-8") as file:
+            return cls(json.load(file))
+
+    @staticmethod
+    def attack_id(stix_object: Dict[str, Any]) -> Optional[str]:
+        """
+        Get the ATT&CK ID (e.g. ``T1059.001``) of a STIX object, if it has one.
+        """
+        for reference in stix_object.get("external_references", []):
+            if reference.get("source_name") in ATTACK_SOURCE_NAMES:
+                return reference.get("external_id")
+        return None
+
+    def attack_object(self, attack_id: str, *types: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the active STIX object with the given ATT&CK ID, optionally restricted to the given STIX types.
+
+        :param attack_id: The ATT&CK ID of the object.
+        :type attack_id: str
+        :return: The STIX object, or ``None`` if the bundle has no such active object.
+        :rtype: Optional[Dict[str, Any]]
+        """
+        stix_object = self.by_attack_id.get(attack_id)
+        if stix_object is None or (types and stix_object["type"] not in types):
+            return None
+        return stix_object
+
+    def objects_of_type(self, *types: str) -> List[Dict[str, Any]]:
+        """
+        Get the active STIX objects of the given types, ordered by ATT&CK ID.
+        """
+        if len(types) == 1:
+            return self.by_type[types[0]]
+        return sorted((stix_object for stix_type in types for stix_object in self.by_type[stix_type]),
+                      key=lambda stix_object: self.attack_id(stix_object) or "")
+
+    def related(self,
+                stix_object: Dict[str, Any],
+                relationship_type: str,
+                types: Iterable[str],
+                reverse: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get the relationships of the given type from (or, if ``reverse``, to) the given object,
+        whose other end is one of the given STIX types, ordered by the ATT&CK ID of the other end.
+
+        :return: A list of ``{"relationship": ..., "object": ...}`` dictionaries.
+        :rtype: List[Dict[str, Any]]
+        """
+        types = set(types)
+        index = self.relationships_to if reverse else self.relationships_from
+        found = []
+        for relationship in index.get(stix_object["id"], []):
+            if relationship["relationship_type"] != relationship_type:
+                continue
+            other = self.objects[relationship["source_ref"] if reverse else relationship["target_ref"]]
+            if other["type"] in types:
+                found.append({"relationship": relationship, "object": other})
+        found.sort(key=lambda pair: self.attack_id(pair["object"]) or "")
+        return found
+
+    def tactics(self) -> List[Dict[str, Any]]:
+        """
+        Get the tactics in the order of the matrix, or ordered by ATT&CK ID if the bundle has no matrix.
+        """
+        if self.matrix is not None:
+            return [self.objects[ref] for ref in self.matrix.get("tactic_refs", []) if ref in self.objects]
+        return self.by_type["x-mitre-tactic"]
+
+    def technique_tactics(self, technique: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Get the tactics a technique belongs to.
+        """
+        return [self.tactics_by_shortname[phase["phase_name"]]
+                for phase in technique.get("kill_chain_phases", [])
+                if phase["phase_name"] in self.tactics_by_shortname]
+
+    def technique_name(self, technique: Dict[str, Any]) -> str:
+        """
+        Get the display name of a technique, i.e. ``Parent: Sub-technique`` for sub-techniques.
+        """
+        parent = self.parent_technique.get(technique["id"])
+        if parent is None:
+            return technique["name"]
+        return f"{parent['name']}: {technique['name']}"
+
+    @staticmethod
+    def domain(stix_object: Dict[str, Any]) -> str:
+        """
+        Get the display name of the ATT&CK domain of an object, e.g. ``Enterprise``.
+        """
+        domains = stix_object.get("x_mitre_domains") or ["enterprise-attack"]
+        return DOMAIN_NAMES.get(domains[0], domains[0])
+
+class CitationRenderer:
+    """
+    Render the Markdown descriptions of the objects of one page as plain text, numbering their citations
+    in order of first appearance, the way the MITRE ATT&CK website numbers the references of a page.
+
+    :Example:
+
+    .. code-block:: python
+
+        citations = CitationRenderer()
+        description = citations.text(technique["description"], technique)
+        references = citations.references()    # {1: {"text": ..., "url": ...}, ...}
+    """
+
+    def __init__(self) -> None:
+        self._numbers: Dict[str, int] = {}
+        self._references: Dict[int, Dict[str, str]] = {}
+
+    def cite(self, source_name: str, stix_object: Dict[str, Any]) -> Optional[int]:
+        """
+        Get the reference number of a citation, numbering it if it is cited for the first time.
+        Citations without a URL are not numbered, since they are not listed as links on the website either.
+        """
+        if source_name in self._numbers:
+            return self._numbers[source_name]
+        for reference in stix_object.get("external_references", []):
+            if reference.get("source_name") == source_name and reference.get("url"):
+                number = len(self._numbers) + 1
+                self._numbers[source_name] = number
+                self._references[number] = {"text": reference.get("description", source_name), "url": reference["url"]}
+                return number
+        return None
+
+    def paragraphs(self, markdown: Optional[str], stix_object: Dict[str, Any]) -> List[str]:
+        """
+        Render a Markdown description as a list of plain text paragraphs, with citations as ``[n]``.
+        """
+        rendered = []
+        for paragraph in (markdown or "").split("\n"):
+            def citation(match: "re.Match") -> str:
+                number = self.cite(match.group(1).strip(), stix_object)
+                return f"[{number}]" if number else ""
+            paragraph = _CITATION.sub(citation, paragraph)
+            paragraph = _MARKDOWN_LINK.sub(r"\1", paragraph)
+            paragraph = _HTML_TAG.sub("", paragraph)
+            paragraph = _WHITESPACE.sub(" ", paragraph).strip()
+            if paragraph:
+                rendered.append(paragraph)
+        return rendered
+
+    def text(self, markdown: Optional[str], stix_object: Dict[str, Any]) -> str:
+        """
+        Render a Markdown description as a single line of plain text, with citations as ``[n]``.
+        """
+        return " ".join(self.paragraphs(markdown, stix_object))
+
+    def summary(self, markdown: Optional[str], stix_object: Dict[str, Any]) -> str:
+        """
+        Render the first paragraph of a Markdown description, as shown in the lists of the website.
+        """
+        paragraphs = self.paragraphs(markdown, stix_object)
+        return paragraphs[0] if paragraphs else ""
+
+    def cited(self, markdown: Optional[str], stix_object: Dict[str, Any]) -> List[int]:
+        """
+        Get the reference numbers of the citations of a Markdown description, numbering the new ones.
+        """
+        numbers = [self.cite(source_name.strip(), stix_object) for source_name in _CITATION.findall(markdown or "")]
+        return [number for number in numbers if number]
+
+    def references(self) -> Dict[int, Dict[str, str]]:
+        """
+        Get the references cited so far, keyed by their number.
+        """
+        return dict(self._references)
+
+def summary(markdown: Optional[str]) -> str:
+    """
+    Render the first paragraph of a Markdown description as plain text, without citations.
+    """
+    return CitationRenderer().summary(markdown, {})
+
+def stix_date(timestamp: Optional[str], length: int = 10) -> Optional[str]:
+    """
+    Shorten a STIX timestamp (e.g. ``2020-02-11T18:23:26.059Z``) to ``YYYY-MM-DD``, or ``YYYY-MM`` if ``length`` is 7.
+    """
+    return timestamp[:length] if timestamp else None
+
+def technique_url(attack_id: str, trailing_slash: bool = False) -> str:
+    """
+    Build the MITRE ATT&CK website URL of a (sub-)technique.
+    """
+    url = "https://attack.mitre.org/techniques/" + attack_id.replace(".", "/")
+    return url + "/" if trailing_slash else url
+
+def techniques_used(bundle: MITREAttackSTIXBundle,
+                    stix_object: Dict[str, Any],
+                    citations: CitationRenderer) -> List[Dict[str, Any]]:
+    """
+    Build the "Techniques Used" entries of a group, software or campaign page from its ``uses`` relationships.
+    """
+    techniques = []
+    for pair in bundle.related(stix_object, "uses", ["attack-pattern"]):
+        technique = pair["object"]
+        parent = bundle.parent_technique.get(technique["id"])
+        main_technique = parent if parent is not None else technique
+        main_technique_id = bundle.attack_id(main_technique)
+        sub_technique_id = bundle.attack_id(technique) if parent is not None else None
+        techniques.append({
+            "domain": bundle.domain(technique),
+            "main_technique_id": main_technique_id,
+            "main_technique_name": main_technique["name"],
+            "main_technique_url": technique_url(main_technique_id, trailing_slash=True),
+            "sub_technique_id": sub_technique_id,
+            "sub_technique_name": technique["name"] if parent is not None else None,
+            "sub_technique_url": technique_url(sub_technique_id, trailing_slash=True) if sub_technique_id else None,
+            "use": citations.text(pair["relationship"].get("description"), pair["relationship"])
+        })
+    return techniques
+
+_stix_bundle: Optional[MITREAttackSTIXBundle] = None
+_stix_bundle_lock = threading.Lock()
+
+def set_stix_bundle(bundle: Union[None, str, os.PathLike, MITREAttackSTIXBundle]) -> Optional[MITREAttackSTIXBundle]:
+    """
+    Answer every ``get_list()``/``get()`` call from a local STIX bundle instead of scraping the website.
+    Pass ``None`` to go back to scraping.
+
+    The returned dictionaries have the same structure as the scraped ones, so no network access is needed
+    at all, e.g. on air-gapped machines.
+
+    :param bundle: An indexed bundle, the path of a STIX bundle JSON file, or ``None``.
+    :type bundle: Union[None, str, os.PathLike, MITREAttackSTIXBundle]
+    :return: The bundle now in use, or ``None``.
+    :rtype: Optional[MITREAttackSTIXBundle]
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.stix.bundle import set_stix_bundle
+        from MITREAttackScrapper.cti.groups import MITREAttackCTIGroups
+
+        set_stix_bundle("enterprise-attack.json")
+        groups = MITREAttackCTIGroups.get_list()     # no HTTP request
+        apt29 = MITREAttackCTIGroups.get("G0016")
+    """
+    global _stix_bundle
+    if bundle is not None and not isinstance(bundle, MITREAttackSTIXBundle):
+        bundle = MITREAttackSTIXBundle.load(bundle)
+    with _stix_bundle_lock:
+        _stix_bundle = bundle
+    return bundle
+
+def get_stix_bundle() -> Optional[MITREAttackSTIXBundle]:
+    """
+    Get the STIX bundle answering the ``get_list()``/``get()`` calls, if any.
+
+    :return: The bundle in use, or ``None`` if the data is scraped from the website.
+    :rtype: Optional[MITREAttackSTIXBundle]
+    """
+    return _stix_bundle
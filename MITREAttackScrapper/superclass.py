@@ -1,7 +1,18 @@
 # MITREAttackScrapper/superclass.py
-from typing import List, Dict, Any
+import httpx
+from bs4 import Tag
+from typing import List, Dict, Any, Union, Iterable, Iterator, AsyncIterator, Optional, Tuple, Type
 from abc import abstractmethod
 
+from .utils.http_client import fetch, afetch, fetch_stream, afetch_stream
+from .utils.html_parser import TableRowSplitter, iter_table_rows
+from .utils.bulk import BulkResult, get_many
+from .utils.memo import MemoCache, MemoStats
+from .utils.instrumentation import Span, atraced_iter, count, current_span, phase, span, traced_iter
+from .utils.records import Record, to_records
+from .utils.snapshot import get_snapshot
+from .stix.bundle import MITREAttackSTIXBundle, get_stix_bundle
+
 class MITREAttackInformation:
     """
     An abstract base class for MITRE ATT&CK data scraping.
@@ -10,17 +21,47 @@ class MITREAttackInformation:
     -------
     get_list() -> List[Dict[str, Any]]:
         Abstract method to get the list of all MITRE ATT&CK data.
-    
+
     get(id: str) -> Dict[str, Any]:
         Abstract method to get the details of a specific MITRE ATT&CK data.
 
+    aget_list() -> List[Dict[str, Any]]:
+        Asynchronous counterpart of ``get_list()``.
+
+    aget(id: str) -> Dict[str, Any]:
+        Asynchronous counterpart of ``get()``.
+
+    iter_list() -> Iterator[Dict[str, Any]]:
+        Iterate over the list of all MITRE ATT&CK data, yielding each entry as soon as its row is parsed.
+
+    aiter_list() -> AsyncIterator[Dict[str, Any]]:
+        Asynchronous counterpart of ``iter_list()``.
+
+    get_many(ids: Iterable[str], max_workers: int = 8, parse_workers: Optional[int] = None, ordered: bool = True) -> Iterator[BulkResult]:
+        Get the details of many MITRE ATT&CK data concurrently.
+
+    configure_memo(max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024, ttl: Optional[float] = 3600.0) -> MemoCache:
+        Keep parsed results in memory, so repeated lookups of the same IDs skip fetching and parsing.
+
+    invalidate(id: Optional[str] = None) -> None:
+        Drop the in-memory result of one ID, or all of them.
+
+    memo_stats() -> MemoStats:
+        Get the hit/miss counters of the in-memory results.
+
+    get_record(id: str) -> Record:
+        Get the details of a specific MITRE ATT&CK data as a compact, typed record instead of nested dictionaries.
+
+    get_list_records() -> Union[List[Record], Dict[str, Record]]:
+        Get the list of all MITRE ATT&CK data as records.
+
     Examples
     --------
     The following example demonstrates how to use the superclass. It prints the list of all MITRE ATT&CK data and the details of the first data.
     Since all the classes using this superclass have the same structure, the same code can be used for all of them.
 
     .. code-block:: python
-    
+
         from pprint import pprint
         from MITREAttackScrapper.techniques.enterprise import MITREAttackEnterpriseTechniques
         from MITREAttackScrapper.tactics.enterprise import MITREAttackEnterpriseTactics
@@ -37,8 +78,94 @@ class MITREAttackInformation:
             render(MITREAttackEnterpriseTactics)
             render(MITREAttackEnterpriseMitigations)
             print("Done!")
+
+    The asynchronous methods can be used to fetch many pages concurrently.
+    The number of requests in flight is bounded by the ``max_concurrency`` option of the shared HTTP client.
+
+    .. code-block:: python
+
+        import asyncio
+        from MITREAttackScrapper.cti.groups import MITREAttackCTIGroups
+
+        async def main():
+            groups = await MITREAttackCTIGroups.aget_list()
+            return await asyncio.gather(*(MITREAttackCTIGroups.aget(group["id"]) for group in groups))
+
+        details = asyncio.run(main())
+
+    ``iter_list()`` yields the entries of the list while the page is still being downloaded,
+    without building the whole list in memory first.
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.techniques.enterprise import MITREAttackEnterpriseTechniques
+
+        for technique in MITREAttackEnterpriseTechniques.iter_list():
+            print(technique["id"], technique["name"], len(technique["sub_techniques"]))
+
+    ``get_many()`` downloads pages with a thread pool and parses them with a process pool.
+    Each ID yields a ``BulkResult``, so one failing ID does not abort the whole batch.
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.cti.software import MITREAttackCTISoftware
+
+        software_ids = [software["id"] for software in MITREAttackCTISoftware.get_list()]
+        for result in MITREAttackCTISoftware.get_many(software_ids, max_workers=16):
+            if result.ok:
+                print(result.id, result.data["name"])
+            else:
+                print(result.id, "failed:", result.error)
+
+    Parsed results can be kept in memory per class, so hot IDs are answered without fetching or parsing the page again.
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.techniques.enterprise import MITREAttackEnterpriseTechniques
+
+        MITREAttackEnterpriseTechniques.configure_memo(max_entries=2048, ttl=3600)
+        MITREAttackEnterpriseTechniques.get("T1059.001")    # fetched and parsed
+        MITREAttackEnterpriseTechniques.get("T1059.001")    # answered from memory
+        print(MITREAttackEnterpriseTechniques.memo_stats())  # MemoStats(hits=1, misses=1, ...)
+
+    On machines without network access, the same calls can be answered from a local ATT&CK STIX 2.1 bundle.
+    The returned data has the same structure as the scraped data.
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.stix.bundle import set_stix_bundle
+        from MITREAttackScrapper.cti.groups import MITREAttackCTIGroups
+
+        set_stix_bundle("enterprise-attack.json")
+        print(MITREAttackCTIGroups.get("G0016")["name"])
+
+    A full crawl can be exported to a compact snapshot file once, and later processes answered from it,
+    so they start warm without scraping the website again.
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.utils.snapshot import export_snapshot, set_snapshot
+        from MITREAttackScrapper.cti.groups import MITREAttackCTIGroups
+
+        export_snapshot("attack.snapshot")              # once, e.g. at build time
+        set_snapshot("attack.snapshot", fallback=False)  # in every worker
+        print(MITREAttackCTIGroups.get("G0016")["name"])
     """
 
+    # URL of the page listing all the data, used by get_list() and aget_list()
+    _list_url: str = ""
+
+    # Key of the result of get_list() in the in-memory results
+    _LIST_MEMO_KEY: str = "__list__"
+
+    # Whether a row of the list page can add to the entry of a previous row (e.g. sub-techniques),
+    # so that an entry is only complete once the next one starts
+    _list_rows_extend: bool = False
+
+    # Record types of the entries of get_list() and of the result of get(), used by get_list_records() and get_record()
+    _list_record_type: Type[Record] = Record
+    _record_type: Type[Record] = Record
+
     @abstractmethod
     def get_list() -> List[Dict[str, Any]]:
         """
@@ -67,3 +194,537 @@ class MITREAttackInformation:
             A dictionary containing the details of the specified MITRE ATT&CK data.
         """
         pass
+
+    @abstractmethod
+    async def aget_list() -> List[Dict[str, Any]]:
+        """
+        Asynchronously get the list of all MITRE ATT&CK data.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            A list of dictionaries containing MITRE ATT&CK data.
+        """
+        pass
+
+    @abstractmethod
+    async def aget(id: str) -> Dict[str, Any]:
+        """
+        Asynchronously get the details of a specific MITRE ATT&CK data.
+
+        Parameters
+        ----------
+        id : str
+            The ID of the specific MITRE ATT&CK data.
+
+        Returns
+        -------
+        Dict[str, Any]
+            A dictionary containing the details of the specified MITRE ATT&CK data.
+        """
+        pass
+
+    @classmethod
+    def get_many(cls,
+                 ids: Iterable[str],
+                 max_workers: int = 8,
+                 parse_workers: Optional[int] = None,
+                 ordered: bool = True) -> Iterator[BulkResult]:
+        """
+        Get the details of many MITRE ATT&CK data concurrently.
+        Pages are downloaded by a thread pool and parsed by a process pool, so network I/O and parsing overlap.
+
+        :param ids: The IDs of the MITRE ATT&CK data.
+        :type ids: Iterable[str]
+        :param max_workers: Number of threads downloading pages concurrently.
+        :type max_workers: int
+        :param parse_workers: Number of processes parsing pages. Defaults to the number of CPUs,
+                              and never more than the number of pages to download.
+                              If ``0``, the pages are parsed in the downloading threads instead.
+        :type parse_workers: Optional[int]
+        :param ordered: If ``True``, results are yielded in the order of ``ids``; otherwise as soon as they complete.
+        :type ordered: bool
+        :return: An iterator of ``BulkResult(id, data, error)``, one per ID. ``data`` is what ``get(id)`` returns,
+                 and ``error`` is the exception ``get(id)`` would have raised instead.
+        :rtype: Iterator[BulkResult]
+        """
+        return get_many(cls, ids, max_workers=max_workers, parse_workers=parse_workers, ordered=ordered)
+
+    @classmethod
+    def get_record(cls, id: str) -> Record:
+        """
+        Get the details of a specific MITRE ATT&CK data as a record, which holds the same data as ``get(id)``
+        in far less memory, and can still be read like the dictionary (see ``Record``).
+
+        :param id: The ID of the specific MITRE ATT&CK data.
+        :type id: str
+        :return: The details, e.g. a ``Technique`` for the techniques.
+        :rtype: Record
+        """
+        return cls._record_type.from_dict(cls.get(id))
+
+    @classmethod
+    async def aget_record(cls, id: str) -> Record:
+        """
+        Asynchronous counterpart of ``get_record()``.
+        """
+        return cls._record_type.from_dict(await cls.aget(id))
+
+    @classmethod
+    def get_list_records(cls) -> Union[List[Record], Dict[str, Record]]:
+        """
+        Get the list of all MITRE ATT&CK data as records, in the same structure as ``get_list()``.
+
+        :return: The entries of ``get_list()``, e.g. ``ListEntry`` records, or ``MatrixTactic`` records for the matrix.
+        :rtype: Union[List[Record], Dict[str, Record]]
+        """
+        return to_records(cls._list_record_type, cls.get_list())
+
+    @classmethod
+    async def aget_list_records(cls) -> Union[List[Record], Dict[str, Record]]:
+        """
+        Asynchronous counterpart of ``get_list_records()``.
+        """
+        return to_records(cls._list_record_type, await cls.aget_list())
+
+    @classmethod
+    def iter_list(cls) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the list of all MITRE ATT&CK data, in the same order and structure as ``get_list()``.
+        Each entry is yielded as soon as its row of the list page is parsed, while the rest of the page is still
+        being downloaded, and the entries are not kept in memory (nor in the in-memory results).
+
+        :return: An iterator of the entries of the list.
+        :rtype: Iterator[Dict[str, Any]]
+        :raises RuntimeError: If the list page cannot be fetched.
+
+        :Example:
+
+        .. code-block:: python
+
+            from MITREAttackScrapper.cti.groups import MITREAttackCTIGroups
+
+            for group in MITREAttackCTIGroups.iter_list():
+                if "APT" in group["name"]:
+                    print(group["id"], group["name"])
+        """
+        return traced_iter(cls._span("iter_list"), cls._iter_list())
+
+    @classmethod
+    def _iter_list(cls) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the list of all MITRE ATT&CK data, refer to ``iter_list()``.
+        """
+        data = cls._stored_list(current_span())
+        if data is not None:
+            yield from data
+            return
+
+        # The page is parsed while it is downloaded, so the call has no separate fetch and extract phases
+        with fetch_stream(cls._list_url) as response:
+            cls._check_response(response, cls._list_url)
+            pending = None
+            for row in iter_table_rows(response.iter_text()):
+                complete, pending = cls._add_row(row, pending)
+                if complete is not None:
+                    yield complete
+            count("bytes", response.num_bytes_downloaded)
+        if pending is not None:
+            yield pending
+
+    @classmethod
+    def aiter_list(cls) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Asynchronous counterpart of ``iter_list()``.
+
+        :return: An asynchronous iterator of the entries of the list.
+        :rtype: AsyncIterator[Dict[str, Any]]
+        :raises RuntimeError: If the list page cannot be fetched.
+
+        :Example:
+
+        .. code-block:: python
+
+            import asyncio
+            from MITREAttackScrapper.cti.software import MITREAttackCTISoftware
+
+            async def main():
+                async for software in MITREAttackCTISoftware.aiter_list():
+                    print(software["id"], software["name"])
+
+            asyncio.run(main())
+        """
+        return atraced_iter(cls._span("aiter_list"), cls._aiter_list())
+
+    @classmethod
+    async def _aiter_list(cls) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Asynchronously iterate over the list of all MITRE ATT&CK data, refer to ``aiter_list()``.
+        """
+        data = cls._stored_list(current_span())
+        if data is not None:
+            for item in data:
+                yield item
+            return
+
+        async with afetch_stream(cls._list_url) as response:
+            cls._check_response(response, cls._list_url)
+            splitter = TableRowSplitter()
+            pending = None
+            async for chunk in response.aiter_text():
+                for row in splitter.feed(chunk):
+                    complete, pending = cls._add_row(row, pending)
+                    if complete is not None:
+                        yield complete
+                if splitter.done:
+                    break
+            count("bytes", response.num_bytes_downloaded)
+        if pending is not None:
+            yield pending
+
+    @classmethod
+    def memo(cls) -> MemoCache:
+        """
+        Get the in-memory cache of parsed results of this class. It is disabled until ``configure_memo()`` is called.
+
+        :return: The in-memory cache of this class.
+        :rtype: MemoCache
+        """
+        # Looked up in the class' own namespace, so that subclasses never share their parent's cache
+        if "_memo" not in cls.__dict__:
+            cls._memo = MemoCache()
+        return cls.__dict__["_memo"]
+
+    @classmethod
+    def configure_memo(cls,
+                       max_entries: int = 1024,
+                       max_bytes: int = 64 * 1024 * 1024,
+                       ttl: Optional[float] = 3600.0) -> MemoCache:
+        """
+        Keep the parsed results of ``get()`` and ``get_list()`` of this class in memory,
+        so repeated lookups of the same IDs skip both fetching and parsing. Previously cached results are dropped.
+
+        :param max_entries: Maximum number of cached results. ``0`` disables the cache.
+        :type max_entries: int
+        :param max_bytes: Maximum total size in bytes of the cached results.
+        :type max_bytes: int
+        :param ttl: Seconds a cached result stays valid, or ``None`` to keep results until they are evicted.
+        :type ttl: Optional[float]
+        :return: The new in-memory cache of this class.
+        :rtype: MemoCache
+        """
+        cls._memo = MemoCache(max_entries=max_entries, max_bytes=max_bytes, ttl=ttl)
+        return cls._memo
+
+    @classmethod
+    def invalidate(cls, id: Optional[str] = None) -> None:
+        """
+        Drop the in-memory result of the given ID, or every in-memory result of this class if no ID is given.
+
+        :param id: The ID of the MITRE ATT&CK data to drop.
+        :type id: Optional[str]
+        """
+        cls.memo().invalidate(id)
+
+    @classmethod
+    def memo_stats(cls) -> MemoStats:
+        """
+        Get the hit/miss/eviction counters of the in-memory results of this class.
+
+        :return: The counters of the in-memory cache.
+        :rtype: MemoStats
+        """
+        return cls.memo().stats()
+
+    @staticmethod
+    def _validate_id(id: str) -> None:
+        """
+        Raise a ValueError if the given ID is not in the valid format.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def _detail_url(id: str) -> str:
+        """
+        Build the URL of the page describing the given MITRE ATT&CK data.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def _parse_list(html: str) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Parse the page listing all the MITRE ATT&CK data.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def _parse_row(row: Tag, previous: Union[Dict[str, Any], None]) -> Union[Dict[str, Any], None]:
+        """
+        Parse a row of the table of the page listing all the MITRE ATT&CK data, given the entry of the previous rows.
+        Returns the entry of the row, or ``None`` if the row is not an entry of its own.
+        """
+        pass
+
+    @classmethod
+    def _parse_rows(cls, rows: Iterable[Tag]) -> Iterator[Dict[str, Any]]:
+        """
+        Parse the rows of the table of the page listing all the MITRE ATT&CK data, yielding each complete entry.
+        """
+        pending = None
+        entries = 0
+        for row in rows:
+            complete, pending = cls._add_row(row, pending)
+            if complete is not None:
+                entries += 1
+                yield complete
+        if pending is not None:
+            entries += 1
+            yield pending
+        count("rows", entries)
+
+    @classmethod
+    def _add_row(cls,
+                 row: Tag,
+                 pending: Union[Dict[str, Any], None]) -> Tuple[Union[Dict[str, Any], None], Union[Dict[str, Any], None]]:
+        """
+        Parse the next row of the list page, given the entry still open.
+        Returns the entry completed by the row, if any, and the entry left open.
+        """
+        record = cls._parse_row(row, pending)
+        if record is None:
+            return None, pending
+        if not cls._list_rows_extend:
+            return record, None
+        return pending, record
+
+    @classmethod
+    def _stored_list(cls, call: Span) -> Union[List[Dict[str, Any]], Dict[str, Any], None]:
+        """
+        Get the list of all the MITRE ATT&CK data without scraping it, i.e. from the STIX bundle or the snapshot in use,
+        or from the in-memory results, and record where it comes from on the span of the call.
+        Returns ``None`` if the list page must be scraped.
+        """
+        bundle = get_stix_bundle()
+        if bundle is not None:
+            call.set("source", "stix")
+            return cls._stix_list(bundle)
+        return cls._stored_result(call, cls._snapshot_lookup(cls._list_url), cls._LIST_MEMO_KEY)
+
+    @classmethod
+    def _stored_detail(cls, id: str, call: Span) -> Optional[Dict[str, Any]]:
+        """
+        Get the details of the given MITRE ATT&CK data without scraping them, refer to ``_stored_list()``.
+        Returns ``None`` if the page of the data must be scraped.
+        """
+        bundle = get_stix_bundle()
+        if bundle is not None:
+            call.set("source", "stix")
+            return cls._stix_fetch_detail(id, bundle)
+        return cls._stored_result(call, cls._snapshot_lookup(cls._detail_url(id), id), id)
+
+    @classmethod
+    def _stored_result(cls, call: Span, snapshot_data: Optional[Any], key: str) -> Optional[Any]:
+        """
+        Get a result from the snapshot, if found there, or else from the in-memory results,
+        and record where it comes from on the span of the call. Returns ``None`` if the page must be scraped.
+        """
+        if snapshot_data is not None:
+            call.set("source", "snapshot")
+            call.add("cache_hits")
+            return snapshot_data
+        data = cls.memo().get(key)
+        if data is None:
+            call.set("source", "website")
+        else:
+            call.set("source", "memo")
+            call.add("cache_hits")
+        return data
+
+    @classmethod
+    def _remember(cls, key: str, data: Any) -> Any:
+        """
+        Keep a freshly scraped result in the in-memory results, and return it.
+        """
+        cls.memo().put(key, data)
+        return data
+
+    @staticmethod
+    @abstractmethod
+    def _parse_detail(id: str, html: str) -> Dict[str, Any]:
+        """
+        Parse the page describing the given MITRE ATT&CK data.
+        """
+        pass
+
+    @staticmethod
+    def _list_entries(data: Union[List[Dict[str, Any]], Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the entries of the result of ``get_list()``, keyed by the IDs whose details can be fetched with ``get()``.
+        """
+        return {item["id"]: item for item in data}
+
+    @staticmethod
+    @abstractmethod
+    def _stix_list(bundle: MITREAttackSTIXBundle) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Build the list of all the MITRE ATT&CK data from a STIX bundle, in the same structure as ``_parse_list()``.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def _stix_detail(id: str, bundle: MITREAttackSTIXBundle) -> Union[Dict[str, Any], None]:
+        """
+        Build the details of the given MITRE ATT&CK data from a STIX bundle, in the same structure as ``_parse_detail()``.
+        Returns ``None`` if the bundle does not contain the data.
+        """
+        pass
+
+    @classmethod
+    def _stix_fetch_detail(cls, id: str, bundle: MITREAttackSTIXBundle) -> Dict[str, Any]:
+        """
+        Get the details of the given MITRE ATT&CK data from a STIX bundle.
+        """
+        data = cls._stix_detail(id, bundle)
+        if data is None:
+            raise cls._not_found(id)
+        return data
+
+    @staticmethod
+    def _not_found(id: str) -> ValueError:
+        """
+        Build the error of an ID of no MITRE ATT&CK data, e.g. missing from the STIX bundle or the snapshot in use.
+        """
+        return ValueError(f"{id} does not exist in the MITRE ATT&CK framework")
+
+    @staticmethod
+    def _check_response(response: httpx.Response, url: str, id: Union[str, None] = None) -> None:
+        """
+        Raise an error if the response does not carry the requested page.
+
+        :raises RuntimeError: If the status code of the response is not 200.
+        """
+        if response.status_code != 200:
+            raise RuntimeError(f"Failed to fetch data from {url}. Status code: {response.status_code}")
+
+    @classmethod
+    def _snapshot_lookup(cls, url: str, id: Union[str, None] = None) -> Optional[Any]:
+        """
+        Get the result scraped from the given page out of the snapshot in use.
+        Returns ``None`` if no snapshot is in use, or if the page must be scraped from the website instead.
+        """
+        snapshot = get_snapshot()
+        if snapshot is None:
+            return None
+        data = snapshot.get(url)
+        if data is None and not snapshot.fallback:
+            if id is not None:
+                raise cls._not_found(id)
+            raise RuntimeError(f"The page {url} is not in the snapshot in use")
+        return data
+
+    @classmethod
+    def _span(cls, method: str, id: Union[str, None] = None) -> Span:
+        """
+        Get the span of a call of the given method of this class (see ``MITREAttackScrapper.utils.instrumentation``).
+        """
+        return span(f"{cls.__name__}.{method}", scraper=cls.__name__, method=method, id=id)
+
+    @staticmethod
+    def _decode(response: httpx.Response) -> str:
+        """
+        Decode the body of a fetched page.
+        """
+        with phase("decode", encoding=response.encoding):
+            return response.text
+
+    @classmethod
+    def _extract_list(cls, html: str) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Parse the page listing all the MITRE ATT&CK data, in the extract phase of the current call.
+        """
+        with phase("extract"):
+            return cls._parse_list(html)
+
+    @classmethod
+    def _extract_detail(cls, id: str, html: str) -> Dict[str, Any]:
+        """
+        Parse the page describing the given MITRE ATT&CK data, in the extract phase of the current call.
+        """
+        with phase("extract"):
+            return cls._parse_detail(id, html)
+
+    @classmethod
+    def _fetch_list(cls) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Fetch and parse the page listing all the MITRE ATT&CK data.
+        """
+        with cls._span("get_list") as call:
+            data = cls._stored_list(call)
+            if data is None:
+                html = cls._page_text(fetch(cls._list_url), cls._list_url)
+                data = cls._remember(cls._LIST_MEMO_KEY, cls._extract_list(html))
+            return data
+
+    @classmethod
+    async def _afetch_list(cls) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Asynchronously fetch and parse the page listing all the MITRE ATT&CK data.
+        """
+        with cls._span("aget_list") as call:
+            data = cls._stored_list(call)
+            if data is None:
+                html = cls._page_text(await afetch(cls._list_url), cls._list_url)
+                data = cls._remember(cls._LIST_MEMO_KEY, cls._extract_list(html))
+            return data
+
+    @classmethod
+    def _page_text(cls, response: httpx.Response, url: str, id: Union[str, None] = None) -> str:
+        """
+        Check that the response carries the requested page, and decode its body.
+        """
+        cls._check_response(response, url, id)
+        return cls._decode(response)
+
+    @classmethod
+    def _download_detail(cls, id: str) -> str:
+        """
+        Validate the given ID and fetch the page describing the given MITRE ATT&CK data, without parsing it.
+        """
+        cls._validate_id(id)
+        target_url = cls._detail_url(id)
+        return cls._page_text(fetch(target_url), target_url, id)
+
+    @classmethod
+    async def _adownload_detail(cls, id: str) -> str:
+        """
+        Asynchronous counterpart of ``_download_detail()``.
+        """
+        cls._validate_id(id)
+        target_url = cls._detail_url(id)
+        return cls._page_text(await afetch(target_url), target_url, id)
+
+    @classmethod
+    def _fetch_detail(cls, id: str) -> Dict[str, Any]:
+        """
+        Fetch and parse the page describing the given MITRE ATT&CK data.
+        """
+        with cls._span("get", id) as call:
+            data = cls._stored_detail(id, call)
+            if data is None:
+                data = cls._remember(id, cls._extract_detail(id, cls._download_detail(id)))
+            return data
+
+    @classmethod
+    async def _afetch_detail(cls, id: str) -> Dict[str, Any]:
+        """
+        Asynchronously fetch and parse the page describing the given MITRE ATT&CK data.
+        """
+        with cls._span("aget", id) as call:
+            data = cls._stored_detail(id, call)
+            if data is None:
+                data = cls._remember(id, cls._extract_detail(id, await cls._adownload_detail(id)))
+            return data
@@ -1,17 +1,46 @@
 # MITREAttackScrapper/tactics/enterprise.py
 
-import httpx
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 from typing import List, Dict, Any, Union
 from datetime import datetime
 
 from ..superclass import MITREAttackInformation
-from ..utils.scrapping_helper import get_text_after_span 
+from ..stix.bundle import MITREAttackSTIXBundle, CitationRenderer, summary, stix_date, technique_url
+from ..utils.html_parser import make_soup, scope_html
+from ..utils.records import ListEntry, Tactic
+from ..utils.scrapping_helper import SectionIndex, get_text_after_span 
+from ..utils.table_extractor import Column, TableSpec
+
+def _technique_row_kind(row: Tag, cells: List[Tag]) -> Union[str, None]:
+    row_class = row.get("class", [])
+    if row_class[:1] == ["technique"]:
+        return "technique"
+    if row_class[:1] == ["sub"] and "technique" in row_class:
+        return "sub"
+    return None
+
+def _technique(values: Dict[str, Any]) -> Dict[str, Any]:
+    # The ID cell of a sub-technique only holds its ".XXX" suffix, after the main technique carried from the rows above
+    technique_id = values.pop("main_technique_id") + values.pop("sub_technique_id", "")
+    return {"id": technique_id, **values}
+
+_TACTIC_ROW = TableSpec({3: [Column("id", 0, "raw"), Column("name", 1, "raw"), Column("description", 2, "raw"),
+                             Column("url", 0, "url")]})
+_TECHNIQUES_TABLE = TableSpec({
+    "technique": [Column("main_technique_id", 0, "link_raw", carry=True), Column("name", 1, "link_raw"),
+                  Column("url", 1, "url"), Column("description", 2)],
+    "sub": [Column("main_technique_id", 0, "link_raw", carry=True), Column("sub_technique_id", 1, "link_raw"),
+            Column("name", 2, "link_raw"), Column("url", 2, "url"), Column("description", 3)],
+}, build=_technique, layout=_technique_row_kind)
 from ..utils.mitre_id_validator import validate_mitre_tactic_id
 
 class MITREAttackEnterpriseTactics(MITREAttackInformation):
     """A class containing methods to parse MITRE ATT&CK Enterprise Tactics."""
 
+    _list_url = "https://attack.mitre.org/tactics/enterprise/"
+    _list_record_type = ListEntry
+    _record_type = Tactic
+
     @staticmethod
     def get_list() -> List[Dict[str, Any]]:
         """
@@ -35,32 +64,20 @@ class MITREAttackEnterpriseTactics(MITREAttackInformation):
                 # ... more tactic entries
             ]
         """
-        target_url = "https://attack.mitre.org/tactics/enterprise/"
-        response = httpx.get(target_url)
-        if response.status_code != 200:
-            raise RuntimeError(f"Failed to fetch data from {target_url}")
-        data = []
+        return MITREAttackEnterpriseTactics._fetch_list()
+
+    @staticmethod
+    async def aget_list() -> List[Dict[str, Any]]:
+        """
+        Asynchronously get the list of all MITRE ATT&CK tactics for Enterprise.
+        Refer to the `get_list()` method for the structure of the returned data.
+
+        :return: A list of dictionaries containing tactic information.
+        :rtype: List[Dict[str, Any]]
+        :raises RuntimeError: If there's a failure in fetching data from the MITRE ATT&CK website.
+        """
+        return await MITREAttackEnterpriseTactics._afetch_list()
 
-        # Extract the <table> element containing the tactics
-        soup = BeautifulSoup(response.text, "html.parser")
-        table = soup.find("table")
-        rows = table.find_all("tr")
-        for row in rows:
-            cells = row.find_all("td")
-            if len(cells) == 3:
-                id = cells[0].text.strip()
-                name = cells[1].text.strip()
-                description = cells[2].text.strip()
-                url = f"https://attack.mitre.org{cells[0].find('a')['href']}"
-                data.append({
-                    "id": id,
-                    "name": name,
-                    "description": description,
-                    "url": url
-                })
-
-        return data
-    
     @staticmethod
     @validate_mitre_tactic_id
     def get(tactic_id: str) -> Dict[str, Any]:
@@ -95,12 +112,84 @@ class MITREAttackEnterpriseTactics(MITREAttackInformation):
                 ]
             }
         """
-        target_url = f"https://attack.mitre.org/tactics/{tactic_id}/"
-        response = httpx.get(target_url)
-        if response.status_code != 200:
-            raise RuntimeError(f"Failed to fetch data from {target_url}")
+        return MITREAttackEnterpriseTactics._fetch_detail(tactic_id)
 
-        soup = BeautifulSoup(response.text, "html.parser")
+    @staticmethod
+    @validate_mitre_tactic_id
+    async def aget(tactic_id: str) -> Dict[str, Any]:
+        """
+        Asynchronously get the details of a specific MITRE ATT&CK tactic for Enterprise.
+        Refer to the `get()` method for the structure of the returned data.
+
+        :param tactic_id: The ID of the specific MITRE ATT&CK tactic.
+        :type tactic_id: str
+        :return: A dictionary containing the details of the specified MITRE ATT&CK tactic.
+        :rtype: Dict[str, Any]
+        :raises ValueError: If the provided tactic ID is invalid.
+        :raises RuntimeError: If the data fetch from the MITRE ATT&CK website fails.
+        """
+        return await MITREAttackEnterpriseTactics._afetch_detail(tactic_id)
+
+    @staticmethod
+    @validate_mitre_tactic_id
+    def _validate_id(tactic_id: str) -> None:
+        pass
+
+    @staticmethod
+    def _detail_url(tactic_id: str) -> str:
+        return f"https://attack.mitre.org/tactics/{tactic_id}/"
+
+    @staticmethod
+    def _stix_list(bundle: MITREAttackSTIXBundle) -> List[Dict[str, Any]]:
+        return [{
+            "id": bundle.attack_id(tactic),
+            "name": tactic["name"],
+            "description": summary(tactic.get("description")),
+            "url": f"https://attack.mitre.org/tactics/{bundle.attack_id(tactic)}"
+        } for tactic in bundle.tactics()]
+
+    @staticmethod
+    def _stix_detail(tactic_id: str, bundle: MITREAttackSTIXBundle) -> Union[Dict[str, Any], None]:
+        tactic = bundle.attack_object(tactic_id, "x-mitre-tactic")
+        if tactic is None:
+            return None
+
+        # Sorted by ATT&CK ID, every sub-technique directly follows its main technique
+        techniques = []
+        for technique in bundle.techniques_by_tactic[tactic["x_mitre_shortname"]]:
+            techniques.append({
+                "id": bundle.attack_id(technique),
+                "name": technique["name"],
+                "url": technique_url(bundle.attack_id(technique)),
+                "description": summary(technique.get("description"))
+            })
+
+        return {
+            "id": tactic_id,
+            "name": tactic["name"],
+            "created": stix_date(tactic.get("created")),
+            "last_modified": stix_date(tactic.get("modified")),
+            "url": MITREAttackEnterpriseTactics._detail_url(tactic_id),
+            "description": CitationRenderer().text(tactic.get("description"), tactic),
+            "techniques": techniques
+        }
+
+    @staticmethod
+    def _parse_list(html: str) -> List[Dict[str, Any]]:
+        # Extract the <table> element containing the tactics
+        soup = make_soup(scope_html(html, "table"))
+        table = soup.find("table")
+        return list(MITREAttackEnterpriseTactics._parse_rows(table.find_all("tr")))
+
+    @staticmethod
+    def _parse_row(row: Tag, previous: Union[Dict[str, Any], None]) -> Union[Dict[str, Any], None]:
+        return _TACTIC_ROW.extract_row(row)
+
+    @staticmethod
+    def _parse_detail(tactic_id: str, html: str) -> Dict[str, Any]:
+        target_url = MITREAttackEnterpriseTactics._detail_url(tactic_id)
+        soup = make_soup(scope_html(html, "div", "v-attckmatrix"))
+        sections = SectionIndex(soup)
         
         tactic_data = {
             "id": tactic_id,
@@ -136,35 +225,6 @@ class MITREAttackEnterpriseTactics(MITREAttackInformation):
                 tactic_data["last_modified"] = datetime.strptime(last_modified_text, "%d %B %Y").strftime("%Y-%m-%d")
 
         # Parse techniques
-        techniques_table: Union[Tag, None] = soup.find("h2", string="Techniques").find_next("table")
-        if techniques_table:
-            latest_main_technique_id = None
-            for row in techniques_table.find("tbody").find_all("tr"):
-                cells = row.find_all("td")
-                if "technique" == row["class"][0]:
-                    # parsing main technique
-                    main_technique_id: str = cells[0].find("a").text.strip()
-                    latest_main_technique_id = main_technique_id
-                    technique_name: str = cells[1].find("a").text.strip()
-                    technique_url = f"https://attack.mitre.org{cells[1].find('a')['href']}"
-                    technique_description = cells[2].get_text(strip=True)
-                    tactic_data["techniques"].append({
-                        "id": main_technique_id,
-                        "name": technique_name,
-                        "url": technique_url,
-                        "description": technique_description
-                    })
-
-                elif "sub" == row["class"][0] and "technique" in row["class"]:
-                    # parsing sub-technique
-                    sub_technique_id: str = f"{latest_main_technique_id}{cells[1].find('a').text.strip()}"
-                    technique_name: str = cells[2].find("a").text.strip()
-                    technique_url = f"https://attack.mitre.org{cells[2].find('a')['href']}"
-                    technique_description = cells[3].get_text(strip=True)
-                    tactic_data["techniques"].append({
-                        "id": sub_technique_id,
-                        "name": technique_name,
-                        "url": technique_url,
-                        "description": technique_description
-                    })
-        return tactic_data
\ No newline at end of file
+        techniques_table: Union[Tag, None] = sections.following("Techniques", "table")
+        tactic_data["techniques"] = _TECHNIQUES_TABLE.extract(techniques_table)
+        return tactic_data
@@ -5,14 +5,38 @@ from typing import Dict, Any, List, Union
 from datetime import datetime
 
 from ..superclass import MITREAttackInformation
-from ..utils.scrapping_helper import get_text_after_span, get_links_after_span
+from ..stix.bundle import MITREAttackSTIXBundle, CitationRenderer, summary, stix_date, technique_url
+from ..utils.html_parser import make_soup, scope_html
+from ..utils.records import ListEntry, Technique
+from ..utils.scrapping_helper import SectionIndex, get_text_after_span, get_links_after_span
+from ..utils.table_extractor import Column, TableSpec
+from ..utils.id_registry import ID_PATTERNS
 from ..utils.mitre_id_validator import validate_mitre_technique_id
 
+# Rows of the technique list: a technique, and one of its sub-techniques (whose ID is only the ".XXX" suffix)
+_TECHNIQUE_ROW = TableSpec({3: [Column("id", 0, "link_text"), Column("name", 1), Column("description", 2), Column("url", 0, "url")]})
+_SUB_TECHNIQUE_ROW = TableSpec({4: [Column("id", 1, "link_text"), Column("name", 2), Column("description", 3), Column("url", 1, "url")]})
+
+_PROCEDURES_TABLE = TableSpec({3: [Column("id", 0), Column("name", 1), Column("description", 2)]})
+_MITIGATIONS_TABLE = TableSpec({3: [Column("id", 0), Column("name", 1), Column("description", 2)]})
+
+# The data source of the rows after the first component of a data source is left empty;
+# the page of a sub-technique is read as is, the page of a technique fills them in
+_DETECTION_COLUMNS = ("id", "data_source", "data_component", "detects")
+_SUB_TECHNIQUE_DETECTION_TABLE = TableSpec({4: [Column(field, index) for index, field in enumerate(_DETECTION_COLUMNS)]})
+_DETECTION_TABLE = TableSpec({4: [Column(field, index, carry=field in ("id", "data_source"))
+                                  for index, field in enumerate(_DETECTION_COLUMNS)]})
+
 class MITREAttackEnterpriseTechniques(MITREAttackInformation):
     """
     A class containing methods to parse MITRE ATT&CK Enterprise techniques.
     """
 
+    _list_url = "https://attack.mitre.org/techniques/enterprise/"
+    _list_record_type = ListEntry
+    _record_type = Technique
+    _list_rows_extend = True
+
     @staticmethod
     def get_list() -> List[Dict[str, Any]]:
         """
@@ -45,52 +69,19 @@ class MITREAttackEnterpriseTechniques(MITREAttackInformation):
                 ...
             ]
         """
-        target_url = "https://attack.mitre.org/techniques/enterprise/"
-        response = httpx.get(target_url)
-        if response.status_code != 200:
-            raise RuntimeError(f"Failed to fetch data from {target_url}. Status code: {response.status_code}")
-        data = []
-
-        # Extract the <table> element from the response
-        soup = BeautifulSoup(response.text, "html.parser")
-        table = soup.find("table")
+        return MITREAttackEnterpriseTechniques._fetch_list()
 
-        rows = table.find_all("tr", class_=["technique", "sub technique"])
-        for row in rows:
-            if "technique" == row["class"][0]:
-                # Parse the main MITRE ATT&CK technique
-                technique_link = row.find("a", href=True)
-                technique_id = technique_link.get_text(strip=True)
-                technique_url = "https://attack.mitre.org" + technique_link['href']
-
-                cells = row.find_all("td")
-                technique_name = cells[1].get_text(strip=True)
-                technique_description = cells[2].get_text(strip=True)
-                data.append({
-                    "id": technique_id,
-                    "name": technique_name,
-                    "description": technique_description,
-                    "url": technique_url,
-                    "sub_techniques": []
-                })
-
-            elif "sub" == row["class"][0] and "technique" == row["class"][1]:
-                # Parse the associated sub-techniques for the main MITRE ATT&CK technique
-                sub_technique_link = row.find("a", href=True)
-                sub_technique_id = data[-1]["id"] + sub_technique_link.get_text(strip=True)
-                sub_technique_url = "https://attack.mitre.org" + sub_technique_link['href']
-
-                cells = row.find_all("td")
-                sub_technique_name = cells[2].get_text(strip=True)
-                sub_technique_description = cells[3].get_text(strip=True)
-                data[-1]["sub_techniques"].append({
-                    "id": sub_technique_id,
-                    "name": sub_technique_name,
-                    "description": sub_technique_description,
-                    "url": sub_technique_url
-                })
+    @staticmethod
+    async def aget_list() -> List[Dict[str, Any]]:
+        """
+        Asynchronously get the list of all MITRE ATT&CK techniques for Enterprise.
+        Refer to the `get_list()` method for the structure of the returned data.
 
-        return data
+        :return: A list of dictionaries containing technique information.
+        :rtype: List[Dict[str, Any]]
+        :raises RuntimeError: If there's a failure in fetching data from the MITRE ATT&CK website.
+        """
+        return await MITREAttackEnterpriseTechniques._afetch_list()
     
     @staticmethod
     @validate_mitre_technique_id
@@ -168,6 +159,29 @@ class MITREAttackEnterpriseTechniques(MITREAttackInformation):
             # Main technique
             return MITREAttackEnterpriseTechniques.get_main_technique(technique_id=technique_id)
 
+    @staticmethod
+    @validate_mitre_technique_id
+    async def aget(technique_id: str) -> Dict[str, Any]:
+        """
+        Asynchronously get the details of a specific MITRE ATT&CK technique for Enterprise.
+        Refer to the `get()` method for the structure of the returned data.
+
+        :param technique_id: The MITRE ATT&CK technique ID (e.g., T1548 or T1548.001).
+        :type technique_id: str
+        :return: A dictionary containing technique information.
+        :rtype: Dict[str, Any]
+        :raises ValueError: If the technique ID format is invalid.
+        :raises RuntimeError: If the data fetch from the MITRE ATT&CK website fails.
+        """
+        if "." in technique_id:
+            # Sub technique
+            main_technique_id, sub_technique_id = technique_id.split(".")
+            return await MITREAttackEnterpriseTechniques.aget_sub_technique(main_technique_id=main_technique_id,
+                                                                            sub_technique_id=sub_technique_id)
+        else:
+            # Main technique
+            return await MITREAttackEnterpriseTechniques.aget_main_technique(technique_id=technique_id)
+
     @staticmethod
     def get_sub_technique(main_technique_id: str, sub_technique_id: str) -> Dict[str, Any]:
         """
@@ -237,15 +251,304 @@ class MITREAttackEnterpriseTechniques(MITREAttackInformation):
                 }
             }
         """
+        technique_id = MITREAttackEnterpriseTechniques._sub_technique_id(main_technique_id, sub_technique_id)
+        return MITREAttackEnterpriseTechniques._fetch_detail(technique_id)
+
+    @staticmethod
+    async def aget_sub_technique(main_technique_id: str, sub_technique_id: str) -> Dict[str, Any]:
+        """
+        Asynchronously get the sub technique information, given a main and sub technique ID.
+        Refer to the `get_sub_technique()` method for the structure of the returned data.
+
+        :param main_technique_id: The main MITRE ATT&CK technique ID (e.g., T1548).
+        :type main_technique_id: str
+        :param sub_technique_id: The sub MITRE ATT&CK technique ID (e.g., T1548.001).
+        :type sub_technique_id: str
+        :return: A dictionary containing the sub technique information.
+        :rtype: Dict[str, Any]
+        :raises ValueError: If the provided main and sub technique IDs are invalid or do not exist in the MITRE ATT&CK framework.
+        :raises RuntimeError: If there's a failure in fetching data from the MITRE ATT&CK website.
+        """
+        technique_id = MITREAttackEnterpriseTechniques._sub_technique_id(main_technique_id, sub_technique_id)
+        return await MITREAttackEnterpriseTechniques._afetch_detail(technique_id)
+
+    @staticmethod
+    def get_main_technique(technique_id: str) -> Dict[str, Any]:
+        """
+        Given a main technique ID, return the main technique information.
+
+        :param technique_id: The main MITRE ATT&CK technique ID (e.g., T1548).
+        :type technique_id: str
+        :return: A dictionary containing the main technique information.
+        :rtype: Dict[str, Any]
+        :raises ValueError: If the main technique ID is invalid or does not exist in the MITRE ATT&CK framework.
+        :raises RuntimeError: If there's a failure in fetching data from the MITRE ATT&CK website.
+
+        :Example:
+
+        .. code-block:: python
+        
+            {
+                "id": "T0001",
+                "name": "Technique Name",
+                "tactics": [
+                    {
+                        "name": "Tactic Name",
+                        "url": "https://attack.mitre.org/tactics/Tactic Name/"
+                    },
+                    ...
+                ],
+                "platforms": ["Platform1", "Platform2", ...],
+                "permission_required": ["Permission1", "Permission2", ...],
+                "version": "Version",
+                "created": "Created Date",
+                "last_modified": "Last Modified Date",
+                "sub_techniques": [
+                    {
+                        "id": "T0001.001",
+                        "name": "Sub-Technique Name",
+                        "url": "https://attack.mitre.org/techniques/T0001/001/",
+                        "description": "Sub-Technique Description"
+                    },
+                    ...
+                ],
+                "mitigations": [
+                    {
+                        "id": "Mitigation ID",
+                        "name": "Mitigation Name",
+                        "description": "Mitigation Description"
+                    },
+                    ...
+                ],
+                "detection": [
+                    {
+                        "id": "Detection ID",
+                        "data_source": "Data Source",
+                        "data_component": "Data Component",
+                        "detects": "Detects"
+                    },
+                    ...
+                ],
+                "description": "Technique Description",
+                "references": {
+                    1 : {
+                        "text": "Reference Text",
+                        "url": "Reference URL"
+                    },
+                    ...
+                },
+            }
+        """
+        # Parameter existence check
+        if not technique_id:
+            raise ValueError("Technique ID is required")
+        if "." in technique_id:
+            raise ValueError(f"The technique {technique_id} is a sub-technique, not a main technique")
+
+        return MITREAttackEnterpriseTechniques._fetch_detail(technique_id)
+
+    @staticmethod
+    async def aget_main_technique(technique_id: str) -> Dict[str, Any]:
+        """
+        Asynchronously get the main technique information, given a main technique ID.
+        Refer to the `get_main_technique()` method for the structure of the returned data.
+
+        :param technique_id: The main MITRE ATT&CK technique ID (e.g., T1548).
+        :type technique_id: str
+        :return: A dictionary containing the main technique information.
+        :rtype: Dict[str, Any]
+        :raises ValueError: If the main technique ID is invalid or does not exist in the MITRE ATT&CK framework.
+        :raises RuntimeError: If there's a failure in fetching data from the MITRE ATT&CK website.
+        """
+        # Parameter existence check
+        if not technique_id:
+            raise ValueError("Technique ID is required")
+        if "." in technique_id:
+            raise ValueError(f"The technique {technique_id} is a sub-technique, not a main technique")
+
+        return await MITREAttackEnterpriseTechniques._afetch_detail(technique_id)
+
+    @staticmethod
+    def _sub_technique_id(main_technique_id: str, sub_technique_id: str) -> str:
+        """
+        Check the arguments of ``get_sub_technique()`` and build the full sub-technique ID from them.
+        The sub technique ID may be given in full (T1548.001) or as its own digits (001).
+
+        :raises ValueError: If an ID is missing, or the IDs do not form a sub-technique ID.
+        """
         # Parameter existence check
         if not main_technique_id or not sub_technique_id:
             raise ValueError("Main and sub technique IDs are required")
+        if "." in main_technique_id:
+            raise ValueError(f"The technique {main_technique_id} is a sub-technique, not a main technique")
+
+        main_part, _, sub_part = sub_technique_id.rpartition(".")
+        if main_part and main_part != main_technique_id:
+            raise ValueError(f"The sub-technique {sub_technique_id} is not part of the technique {main_technique_id}")
+        technique_id = f"{main_technique_id}.{sub_part}"
+        if not ID_PATTERNS["technique"].fullmatch(technique_id):
+            raise ValueError(f"Invalid MITRE ATT&CK sub-technique ID {technique_id}, should be in the format of TXXXX.YYY")
+        return technique_id
 
-        request_url = f"https://attack.mitre.org/techniques/{main_technique_id}/{sub_technique_id}/"
-        response: httpx.Response = httpx.get(request_url)
-        if response.status_code != 200:
-            raise RuntimeError(f"Failed to fetch data from {request_url}")
-        soup: BeautifulSoup = BeautifulSoup(response.text, "html.parser")
+    @staticmethod
+    @validate_mitre_technique_id
+    def _validate_id(technique_id: str) -> None:
+        pass
+
+    @staticmethod
+    def _detail_url(technique_id: str) -> str:
+        if "." in technique_id:
+            main_technique_id, sub_technique_id = technique_id.split(".")
+            return f"https://attack.mitre.org/techniques/{main_technique_id}/{sub_technique_id}/"
+        return f"https://attack.mitre.org/techniques/{technique_id}/"
+
+    @staticmethod
+    def _not_found(technique_id: str) -> ValueError:
+        return ValueError(f"The technique {technique_id} does not exist in the MITRE ATT&CK framework")
+
+    @staticmethod
+    def _check_response(response: httpx.Response, url: str, technique_id: Union[str, None] = None) -> None:
+        if response.status_code == 404 and technique_id:
+            raise MITREAttackEnterpriseTechniques._not_found(technique_id)
+        MITREAttackInformation._check_response(response, url, technique_id)
+
+    @staticmethod
+    def _list_entries(data: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        entries = {}
+        for technique in data:
+            entries[technique["id"]] = {key: value for key, value in technique.items() if key != "sub_techniques"}
+            for sub_technique in technique["sub_techniques"]:
+                entries[sub_technique["id"]] = sub_technique
+        return entries
+
+    @staticmethod
+    def _stix_list(bundle: MITREAttackSTIXBundle) -> List[Dict[str, Any]]:
+        data = []
+        for technique in bundle.objects_of_type("attack-pattern"):
+            if technique["id"] in bundle.parent_technique:
+                continue
+            technique_id = bundle.attack_id(technique)
+            data.append({
+                "id": technique_id,
+                "name": technique["name"],
+                "description": summary(technique.get("description")),
+                "url": technique_url(technique_id),
+                "sub_techniques": [{
+                    "id": bundle.attack_id(sub_technique),
+                    "name": sub_technique["name"],
+                    "description": summary(sub_technique.get("description")),
+                    "url": technique_url(bundle.attack_id(sub_technique))
+                } for sub_technique in bundle.sub_techniques[technique["id"]]]
+            })
+        return data
+
+    @staticmethod
+    def _stix_detail(technique_id: str, bundle: MITREAttackSTIXBundle) -> Union[Dict[str, Any], None]:
+        technique = bundle.attack_object(technique_id, "attack-pattern")
+        if technique is None:
+            return None
+
+        # References are numbered in the order they are cited on the page
+        citations = CitationRenderer()
+        description = citations.text(technique.get("description"), technique)
+        # Main technique pages list procedures too, so they are rendered for the references even if not returned
+        procedures = [{
+            "id": bundle.attack_id(pair["object"]),
+            "name": pair["object"]["name"],
+            "description": citations.text(pair["relationship"].get("description"), pair["relationship"])
+        } for pair in bundle.related(technique, "uses", ["intrusion-set", "malware", "tool", "campaign"], reverse=True)]
+        mitigations = [{
+            "id": bundle.attack_id(pair["object"]),
+            "name": pair["object"]["name"],
+            "description": citations.text(pair["relationship"].get("description"), pair["relationship"])
+        } for pair in bundle.related(technique, "mitigates", ["course-of-action"], reverse=True)]
+
+        detection = []
+        for pair in bundle.related(technique, "detects", ["x-mitre-data-component"], reverse=True):
+            data_source = bundle.objects.get(pair["object"].get("x_mitre_data_source_ref"), {})
+            detection.append({
+                "id": bundle.attack_id(data_source) or "",
+                "data_source": data_source.get("name", ""),
+                "data_component": pair["object"]["name"],
+                "detects": citations.text(pair["relationship"].get("description"), pair["relationship"])
+            })
+        detection.sort(key=lambda row: (row["id"], row["data_component"]))
+
+        technique_data: Dict[str, Any] = {
+            "name": bundle.technique_name(technique),
+            "tactics": [{
+                "name": tactic["name"],
+                "url": f"https://attack.mitre.org/tactics/{bundle.attack_id(tactic)}"
+            } for tactic in bundle.technique_tactics(technique)],
+            "platforms": technique.get("x_mitre_platforms", []),
+            "permission_required": technique.get("x_mitre_permissions_required", []),
+            "version": technique.get("x_mitre_version", ""),
+            "created": stix_date(technique.get("created")),
+            "last_modified": stix_date(technique.get("modified")),
+        }
+        if "." in technique_id:
+            main_technique_id, sub_technique_id = technique_id.split(".")
+            return {
+                "id": sub_technique_id,
+                "main_technique_id": main_technique_id,
+                **technique_data,
+                "procedures": procedures,
+                "mitigations": mitigations,
+                "detection": detection,
+                "description": description,
+                "references": citations.references(),
+            }
+        return {
+            "id": technique_id,
+            "sub_techniques": [{
+                "name": bundle.attack_id(sub_technique),
+                "url": technique_url(bundle.attack_id(sub_technique))
+            } for sub_technique in bundle.sub_techniques[technique["id"]]],
+            **technique_data,
+            "mitigations": mitigations,
+            "detection": detection,
+            "description": description,
+            "references": citations.references(),
+        }
+
+    @staticmethod
+    def _parse_list(html: str) -> List[Dict[str, Any]]:
+        # Extract the <table> element from the response
+        soup = make_soup(scope_html(html, "table"))
+        table = soup.find("table")
+
+        rows = table.find_all("tr", class_=["technique", "sub technique"])
+        return list(MITREAttackEnterpriseTechniques._parse_rows(rows))
+
+    @staticmethod
+    def _parse_row(row: Tag, previous: Union[Dict[str, Any], None]) -> Union[Dict[str, Any], None]:
+        row_class = row.get("class", [])
+        if row_class[:1] == ["technique"]:
+            # Parse the main MITRE ATT&CK technique
+            technique = _TECHNIQUE_ROW.extract_row(row)
+            if technique is not None:
+                technique["sub_techniques"] = []
+            return technique
+
+        if row_class[:2] == ["sub", "technique"] and previous is not None:
+            # Parse the associated sub-techniques for the main MITRE ATT&CK technique
+            sub_technique = _SUB_TECHNIQUE_ROW.extract_row(row)
+            if sub_technique is not None:
+                sub_technique["id"] = previous["id"] + sub_technique["id"]
+                previous["sub_techniques"].append(sub_technique)
+        return None
+
+    @staticmethod
+    def _parse_detail(technique_id: str, html: str) -> Dict[str, Any]:
+        if "." in technique_id:
+            main_technique_id, sub_technique_id = technique_id.split(".")
+            return MITREAttackEnterpriseTechniques._parse_sub_technique(main_technique_id, sub_technique_id, html)
+        return MITREAttackEnterpriseTechniques._parse_main_technique(technique_id, html)
+
+    @staticmethod
+    def _parse_sub_technique(main_technique_id: str, sub_technique_id: str, html: str) -> Dict[str, Any]:
+        soup: BeautifulSoup = make_soup(scope_html(html, "div", "v-attckmatrix"))
+        sections = SectionIndex(soup)
 
         # Get the data card body
         card_body: Union[Tag, None] = soup.select_one("#v-attckmatrix > div.row > div > div > div > div:nth-child(2) > div.col-md-4 > div.card > div.card-body")
@@ -304,51 +607,15 @@ class MITREAttackEnterpriseTechniques(MITREAttackInformation):
 
         # Parse procedures (assumed to be the sub-techniques table)
         # Next object(div)'s <table> tag after a h2 tag whose inner text is "Procedure Examples"
-        procedures_table: Union[Tag, None] = soup.find("h2", string="Procedure Examples").find_next("table")
-        if procedures_table:
-            for row in procedures_table.find("tbody").find_all("tr"):
-                cells = row.find_all("td")
-                procedure_id = cells[0].get_text(strip=True)
-                procedure_name = cells[1].get_text(strip=True)
-                description = cells[2].get_text(strip=True)
-                technique_data["procedures"].append({
-                    "id": procedure_id,
-                    "name": procedure_name,
-                    "description": description
-                })
+        technique_data["procedures"] = _PROCEDURES_TABLE.extract(sections.following("Procedure Examples", "table"))
 
         # Parse mitigations
         # Next object(div)'s <table> tag after a h2 tag whose inner text is "Mitigations"
-        mitigation_table: Union[Tag, None] = soup.find("h2", string="Mitigations").find_next("table")
-        if mitigation_table:
-            for row in mitigation_table.find("tbody").find_all("tr"):
-                cells = row.find_all("td")
-                mitigation_id = cells[0].get_text(strip=True)
-                mitigation_name = cells[1].get_text(strip=True)
-                mitigation_description = cells[2].get_text(strip=True)
-                technique_data["mitigations"].append({
-                    "id": mitigation_id,
-                    "name": mitigation_name,
-                    "description": mitigation_description
-                })
+        technique_data["mitigations"] = _MITIGATIONS_TABLE.extract(sections.following("Mitigations", "table"))
 
         # Parse detection
         # Next object(div)'s <table> tag after a h2 tag whose inner text is "Detection"
-        detection_table: Union[Tag, None] = soup.find("h2", string="Detection").find_next("table")
-        if detection_table:
-            for row in detection_table.find("tbody").find_all("tr"):
-                cells = row.find_all("td")
-                if len(cells) == 4:
-                    detection_id = cells[0].get_text(strip=True)
-                    data_source = cells[1].get_text(strip=True)
-                    data_component = cells[2].get_text(strip=True)
-                    detects = cells[3].get_text(strip=True)
-                    technique_data["detection"].append({
-                        "id": detection_id,
-                        "data_source": data_source,
-                        "data_component": data_component,
-                        "detects": detects
-                    })
+        technique_data["detection"] = _SUB_TECHNIQUE_DETECTION_TABLE.extract(sections.following("Detection", "table"))
 
         # Parse description
         description_div: Union[Tag, None] = soup.select_one("#v-attckmatrix > div.row > div > div > div > div:nth-child(2) > div.col-md-8 > div.description-body")
@@ -359,7 +626,8 @@ class MITREAttackEnterpriseTechniques(MITREAttackInformation):
 
         # Parse references
         # Next object of "h2" tag with "References" inner text
-        references_div: Union[Tag, None] = soup.find("h2", string="References").find_next_sibling("div")
+        references_heading: Union[Tag, None] = sections.heading("References")
+        references_div: Union[Tag, None] = references_heading.find_next_sibling("div") if references_heading else None
         references_number: int = 1
         if references_div:
             references = {}
@@ -379,83 +647,9 @@ class MITREAttackEnterpriseTechniques(MITREAttackInformation):
         return technique_data
 
     @staticmethod
-    def get_main_technique(technique_id: str) -> Dict[str, Any]:
-        """
-        Given a main technique ID, return the main technique information.
-
-        :param technique_id: The main MITRE ATT&CK technique ID (e.g., T1548).
-        :type technique_id: str
-        :return: A dictionary containing the main technique information.
-        :rtype: Dict[str, Any]
-        :raises ValueError: If the main technique ID is invalid or does not exist in the MITRE ATT&CK framework.
-        :raises RuntimeError: If there's a failure in fetching data from the MITRE ATT&CK website.
-
-        :Example:
-
-        .. code-block:: python
-        
-            {
-                "id": "T0001",
-                "name": "Technique Name",
-                "tactics": [
-                    {
-                        "name": "Tactic Name",
-                        "url": "https://attack.mitre.org/tactics/Tactic Name/"
-                    },
-                    ...
-                ],
-                "platforms": ["Platform1", "Platform2", ...],
-                "permission_required": ["Permission1", "Permission2", ...],
-                "version": "Version",
-                "created": "Created Date",
-                "last_modified": "Last Modified Date",
-                "sub_techniques": [
-                    {
-                        "id": "T0001.001",
-                        "name": "Sub-Technique Name",
-                        "url": "https://attack.mitre.org/techniques/T0001/001/",
-                        "description": "Sub-Technique Description"
-                    },
-                    ...
-                ],
-                "mitigations": [
-                    {
-                        "id": "Mitigation ID",
-                        "name": "Mitigation Name",
-                        "description": "Mitigation Description"
-                    },
-                    ...
-                ],
-                "detection": [
-                    {
-                        "id": "Detection ID",
-                        "data_source": "Data Source",
-                        "data_component": "Data Component",
-                        "detects": "Detects"
-                    },
-                    ...
-                ],
-                "description": "Technique Description",
-                "references": {
-                    1 : {
-                        "text": "Reference Text",
-                        "url": "Reference URL"
-                    },
-                    ...
-                },
-            }
-        """
-        # Parameter existence check
-        if not technique_id:
-            raise ValueError("Technique ID is required")
-
-        request_url = f"https://attack.mitre.org/techniques/{technique_id}/"
-        response: httpx.Response = httpx.get(request_url)
-        if response.status_code != 200:
-            if response.status_code == 404:
-                raise ValueError(f"The technique {technique_id} does not exist in the MITRE ATT&CK framework")
-            raise RuntimeError(f"Failed to fetch data from {request_url}. Status code: {response.status_code}")
-        soup: BeautifulSoup = BeautifulSoup(response.text, "html.parser")
+    def _parse_main_technique(technique_id: str, html: str) -> Dict[str, Any]:
+        soup: BeautifulSoup = make_soup(scope_html(html, "div", "v-attckmatrix"))
+        sections = SectionIndex(soup)
 
         # Get the data card body
         card_body: Union[Tag, None] = soup.select_one("#v-attckmatrix > div.row > div > div > div > div:nth-child(2) > div.col-md-4 > div.card > div.card-body")
@@ -515,40 +709,12 @@ class MITREAttackEnterpriseTechniques(MITREAttackInformation):
             technique_data["last_modified"] = datetime.strptime(last_modified_text, "%d %B %Y").strftime("%Y-%m-%d")
 
         # Parse mitigations
-        mitigation_table: Union[Tag, None] = soup.find("h2", string="Mitigations").find_next("table")
-        if mitigation_table:
-            for row in mitigation_table.find("tbody").find_all("tr"):
-                cells = row.find_all("td")
-                mitigation_id = cells[0].get_text(strip=True)
-                mitigation_name = cells[1].get_text(strip=True)
-                mitigation_description = cells[2].get_text(strip=True)
-                technique_data["mitigations"].append({
-                    "id": mitigation_id,
-                    "name": mitigation_name,
-                    "description": mitigation_description
-                })
+        technique_data["mitigations"] = _MITIGATIONS_TABLE.extract(sections.following("Mitigations", "table"))
 
         # Parse detection
         # Next object(div)'s <table> tag after a h2 tag whose inner text is "Detection"
-        detection_table: Union[Tag, None] = soup.find("h2", string="Detection").find_next("table")
-        if detection_table:
-            latest_detection_id = None              # To store the latest detection ID to fill in the missing detection IDs
-            latest_detection_data_source = None     # To store the latest detection data source to fill in the missing detection data sources
-            for row in detection_table.find("tbody").find_all("tr"):
-                cells = row.find_all("td")
-                if len(cells) == 4:
-                    detection_id = cells[0].get_text(strip=True) if cells[0].get_text(strip=True) else latest_detection_id
-                    data_source = cells[1].get_text(strip=True) if cells[1].get_text(strip=True) else latest_detection_data_source
-                    data_component = cells[2].get_text(strip=True)
-                    latest_detection_id = detection_id  
-                    latest_detection_data_source = data_source
-                    detects = cells[3].get_text(strip=True)
-                    technique_data["detection"].append({
-                        "id": detection_id,
-                        "data_source": data_source,
-                        "data_component": data_component,
-                        "detects": detects
-                    })
+        # (the detection IDs and data sources left empty are filled in from the rows above)
+        technique_data["detection"] = _DETECTION_TABLE.extract(sections.following("Detection", "table"))
 
         # Parse description
         description_div: Union[Tag, None] = soup.select_one("#v-attckmatrix > div.row > div > div > div > div:nth-child(2) > div.col-md-8 > div.description-body")
@@ -559,7 +725,8 @@ class MITREAttackEnterpriseTechniques(MITREAttackInformation):
 
         # Parse references
         # Next object of "h2" tag with "References" inner text
-        references_div: Union[Tag, None] = soup.find("h2", string="References").find_next_sibling("div")
+        references_heading: Union[Tag, None] = sections.heading("References")
+        references_div: Union[Tag, None] = references_heading.find_next_sibling("div") if references_heading else None
         reference_number: int = 1
         if references_div:
             references = {}
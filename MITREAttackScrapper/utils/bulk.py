@@ -0,0 +1,207 @@
+# MITREAttackScrapper/utils/bulk.py
+import os
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Type
+
+from ..stix.bundle import get_stix_bundle
+from .html_parser import get_parser_backend, get_scoped_parsing, set_parser_backend, set_scoped_parsing
+from .instrumentation import current_span, traced_iter
+
+class BulkResult(NamedTuple):
+    """
+    The outcome of fetching one ID with ``get_many()``.
+    Exactly one of ``data`` and ``error`` is set.
+
+    :param id: The requested ID.
+    :type id: str
+    :param data: The same dictionary ``get(id)`` would have returned, or ``None`` if fetching or parsing failed.
+    :type data: Optional[Dict[str, Any]]
+    :param error: The exception ``get(id)`` would have raised, or ``None`` on success.
+    :type error: Optional[BaseException]
+    """
+    id: str
+    data: Optional[Dict[str, Any]]
+    error: Optional[BaseException]
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the ID was fetched and parsed successfully.
+        """
+        return self.error is None
+
+def _download(scraper: Type, id: str) -> str:
+    """
+    Fetch a page in the calling thread, to be parsed by a parsing process.
+    """
+    with scraper._span("get", id) as call:
+        call.set("source", "website")
+        return scraper._download_detail(id)
+
+def _download_and_parse(scraper: Type, id: str) -> Dict[str, Any]:
+    """
+    Fetch and parse a page in the calling thread, used when no parsing process is requested.
+    """
+    with scraper._span("get", id) as call:
+        call.set("source", "website")
+        return scraper._extract_detail(id, scraper._download_detail(id))
+
+def _configure_parse_worker(backend: str, scoped_parsing: bool) -> None:
+    """
+    Apply the parsing settings of the calling process in a parsing process, which does not inherit them
+    if it is spawned rather than forked (the default on macOS and Windows).
+    """
+    set_parser_backend(backend)
+    set_scoped_parsing(scoped_parsing)
+
+def _start_parse_worker() -> None:
+    """
+    Do nothing: submitted once per parsing process, so all of them are started before any download.
+    """
+
+def _start_parse_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Start a pool of parsing processes from the calling thread, with its parsing settings.
+    """
+    parse_pool = ProcessPoolExecutor(max_workers=workers, initializer=_configure_parse_worker,
+                                     initargs=(get_parser_backend(), get_scoped_parsing()))
+    # The processes are started by submit(), so they are forked here and not later from a downloading thread,
+    # which may hold locks (of the HTTP client, of logging, ...) the forked process would never see released
+    for _ in range(workers):
+        parse_pool.submit(_start_parse_worker)
+    return parse_pool
+
+def _answer_from_bundle(scraper: Type, ids: List[str]) -> Iterator[BulkResult]:
+    """
+    Answer every ID from the STIX bundle in use, which needs neither fetching nor parsing.
+    """
+    for id in ids:
+        try:
+            scraper._validate_id(id)
+            yield BulkResult(id, scraper._fetch_detail(id), None)
+        except Exception as error:
+            yield BulkResult(id, None, error)
+
+def get_many(scraper: Type,
+             ids: Iterable[str],
+             max_workers: int = 8,
+             parse_workers: Optional[int] = None,
+             ordered: bool = True) -> Iterator[BulkResult]:
+    """
+    Fetch and parse the details of many IDs of the given scraper class concurrently.
+
+    Pages are downloaded by a pool of ``max_workers`` threads through the shared HTTP client,
+    and each downloaded page is handed to a pool of ``parse_workers`` processes for parsing,
+    so BeautifulSoup parsing is not serialized on the GIL while the next pages are downloaded.
+    IDs found in the snapshot in use (see ``set_snapshot()``) or in the in-memory results of the class
+    (see ``configure_memo()``) are answered without fetching, and the newly parsed results are added to the latter. If a STIX bundle is in use (see ``set_stix_bundle()``),
+    every ID is answered from the bundle in the calling thread instead.
+
+    :param scraper: The scraper class (a ``MITREAttackInformation`` subclass) to fetch the IDs with.
+    :type scraper: Type[MITREAttackInformation]
+    :param ids: The IDs to fetch.
+    :type ids: Iterable[str]
+    :param max_workers: Number of threads downloading pages concurrently.
+    :type max_workers: int
+    :param parse_workers: Number of processes parsing pages. Defaults to the number of CPUs.
+                          There are never more processes than pages to download, and none if every ID is answered
+                          without downloading. If ``0``, the pages are parsed in the downloading threads instead.
+                          The processes use the parser backend and scoped parsing setting of the calling process.
+    :type parse_workers: Optional[int]
+    :param ordered: If ``True``, results are yielded in the order of ``ids``; otherwise as soon as they complete.
+    :type ordered: bool
+    :return: An iterator of ``BulkResult``, one per ID. A failing ID does not abort the others.
+                 With instrumentation, the pages parsed by the processes have no ``extract`` and ``parse`` spans.
+    :rtype: Iterator[BulkResult]
+    """
+    return traced_iter(scraper._span("get_many"), _get_many(scraper, ids, max_workers, parse_workers, ordered))
+
+def _get_many(scraper: Type,
+              ids: Iterable[str],
+              max_workers: int,
+              parse_workers: Optional[int],
+              ordered: bool) -> Iterator[BulkResult]:
+    """
+    Fetch and parse the details of many IDs, refer to ``get_many()``.
+    """
+    ids = list(ids)
+    if not ids:
+        return
+    if get_stix_bundle() is not None:
+        yield from _answer_from_bundle(scraper, ids)
+        return
+
+    # One future per ID, resolved once its page has been both downloaded and parsed
+    outcomes: List[Future] = [Future() for _ in ids]
+    memo = scraper.memo()
+    memoized = set()
+
+    # Answer the IDs found in the snapshot or the in-memory results first, to know how many pages to download
+    downloads = []
+    for index, id in enumerate(ids):
+        try:
+            scraper._validate_id(id)
+            data = scraper._snapshot_lookup(scraper._detail_url(id), id)
+        except Exception as error:
+            outcomes[index].set_exception(error)
+            continue
+        if data is None:
+            data = memo.get(id)
+        if data is not None:
+            outcomes[index].set_result(data)
+            memoized.add(index)
+            current_span().add("cache_hits")
+        else:
+            downloads.append((index, id))
+
+    if parse_workers is None:
+        parse_workers = os.cpu_count() or 1
+    parse_workers = min(parse_workers, len(downloads))
+    fetch_pool = ThreadPoolExecutor(max_workers=max_workers)
+    parse_pool = _start_parse_pool(parse_workers) if parse_workers > 0 else None
+
+    def relay(source: Future, outcome: Future) -> None:
+        if source.cancelled():
+            outcome.cancel()
+        elif source.exception() is not None:
+            outcome.set_exception(source.exception())
+        else:
+            outcome.set_result(source.result())
+
+    def on_downloaded(index: int, download: Future) -> None:
+        if download.cancelled() or download.exception() is not None:
+            relay(download, outcomes[index])
+            return
+        try:
+            parse = parse_pool.submit(scraper._parse_detail, ids[index], download.result())
+        except Exception as error:
+            # The pool was shut down because the consumer stopped iterating
+            outcomes[index].set_exception(error)
+            return
+        parse.add_done_callback(lambda parse: relay(parse, outcomes[index]))
+
+    try:
+        for index, id in downloads:
+            if parse_pool is None:
+                # Run in a copy of the context, so that the span of the download is a child of the span of get_many()
+                download = fetch_pool.submit(contextvars.copy_context().run, _download_and_parse, scraper, id)
+                download.add_done_callback(lambda download, index=index: relay(download, outcomes[index]))
+            else:
+                download = fetch_pool.submit(contextvars.copy_context().run, _download, scraper, id)
+                download.add_done_callback(lambda download, index=index: on_downloaded(index, download))
+
+        indexes = {outcome: index for index, outcome in enumerate(outcomes)}
+        for outcome in (outcomes if ordered else as_completed(outcomes)):
+            index = indexes[outcome]
+            error = outcome.exception()
+            if error is not None:
+                yield BulkResult(ids[index], None, error)
+                continue
+            if index not in memoized:
+                memo.put(ids[index], outcome.result())
+            yield BulkResult(ids[index], outcome.result(), None)
+    finally:
+        fetch_pool.shutdown(wait=True, cancel_futures=True)
+        if parse_pool is not None:
+            parse_pool.shutdown(wait=True, cancel_futures=True)
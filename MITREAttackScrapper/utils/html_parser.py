@@ -0,0 +1,369 @@
+# MITREAttackScrapper/utils/html_parser.py
+import re
+import functools
+import importlib.util
+from bs4 import BeautifulSoup, Comment, Tag
+from bs4.builder import HTMLTreeBuilder
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .instrumentation import phase
+
+# Parser backends, and the package providing each of them
+PARSER_BACKENDS: Dict[str, Optional[str]] = {
+    "html.parser": None,
+    "lxml": "lxml",
+    "selectolax": "selectolax",
+}
+
+_parser_backend: str = "html.parser"
+_scoped_parsing: bool = True
+
+# The attributes of a tag, whose quoted values may contain "<" and ">"
+_ATTRIBUTES = r"""(?:[^>"']|"[^"]*"|'[^']*')*"""
+# A start tag
+_START_TAG = re.compile(rf"<[a-zA-Z]{_ATTRIBUTES}>")
+# What follows the "<" of markup whose content is not markup: a comment, or a <script> or <style> element
+_SKIPPED_MARKUP = r"!--.*?-->|(?P<raw>script|style)\b[^>]*>.*?</(?P=raw)\s*>"
+
+class LexborTreeBuilder(HTMLTreeBuilder):
+    """
+    A BeautifulSoup tree builder parsing HTML with the lexbor engine of ``selectolax``.
+
+    The document is parsed by lexbor in C, and its node tree is then replayed into BeautifulSoup,
+    so the scrapers keep using the usual BeautifulSoup API on the resulting soup.
+    """
+    NAME = "selectolax"
+    ALTERNATE_NAMES = ["lexbor"]
+    features = [NAME, "html", "fast"]
+    is_xml = False
+
+    def prepare_markup(self, markup, user_specified_encoding=None, document_declared_encoding=None,
+                       exclude_encodings=None):
+        if isinstance(markup, bytes):
+            markup = markup.decode(user_specified_encoding or "utf-8", errors="replace")
+        yield (markup, None, None, False)
+
+    def feed(self, markup: str) -> None:
+        from selectolax.lexbor import LexborHTMLParser
+
+        soup = self.soup
+        root = LexborHTMLParser(markup).root
+        if root is None:
+            return
+
+        # Iterative pre-order walk, emitting start/end tag events the way bs4's own builders do.
+        # A stack entry is either a node to visit, or the name of an element to close.
+        stack: List = [root]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                soup.endData()
+                soup.handle_endtag(node)
+                continue
+
+            tag = node.tag
+            if tag == "-text":
+                soup.handle_data(node.text_content)
+            elif tag in ("-comment", "_comment"):
+                soup.endData()
+                soup.handle_data(node.comment_content or "")
+                soup.endData(Comment)
+            elif tag.startswith("-") or tag.startswith("!"):
+                # Doctype and other non-element nodes carry nothing the scrapers use
+                continue
+            else:
+                attributes = {name: "" if value is None else value for name, value in node.attributes.items()}
+                soup.endData()
+                soup.handle_starttag(tag, None, None, attributes)
+                stack.append(tag)
+                children = []
+                child = node.child
+                while child is not None:
+                    children.append(child)
+                    child = child.next
+                stack.extend(reversed(children))
+
+    def test_fragment_to_document(self, fragment: str) -> str:
+        return fragment
+
+def set_parser_backend(backend: str) -> None:
+    """
+    Select the HTML parser used by every scraper class.
+
+    - ``html.parser``: Python's built-in parser (default, no extra dependency).
+    - ``lxml``: libxml2 through ``lxml``, installed with ``pip install MITREAttackScrapper[lxml]``.
+    - ``selectolax``: the lexbor engine through ``selectolax``, installed with ``pip install MITREAttackScrapper[selectolax]``.
+
+    All backends produce the same scraped data; only the parsing speed and memory use differ.
+
+    :param backend: The name of the parser backend.
+    :type backend: str
+    :raises ValueError: If the backend is unknown.
+    :raises ImportError: If the package providing the backend is not installed.
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.utils.html_parser import set_parser_backend
+        from MITREAttackScrapper.cti.groups import MITREAttackCTIGroups
+
+        set_parser_backend("lxml")
+        MITREAttackCTIGroups.get("G0016")
+    """
+    global _parser_backend
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend {backend!r}, should be one of {', '.join(PARSER_BACKENDS)}")
+    package = PARSER_BACKENDS[backend]
+    if package is not None and importlib.util.find_spec(package) is None:
+        raise ImportError(f"The {backend!r} parser backend requires the {package!r} package. "
+                          f"Install it with `pip install MITREAttackScrapper[{backend}]`")
+    _parser_backend = backend
+
+def get_parser_backend() -> str:
+    """
+    Get the name of the HTML parser used by every scraper class.
+
+    :return: The name of the parser backend.
+    :rtype: str
+    """
+    return _parser_backend
+
+def available_parser_backends() -> List[str]:
+    """
+    Get the names of the parser backends whose package is installed.
+
+    :return: The names of the usable parser backends.
+    :rtype: List[str]
+    """
+    return [backend for backend, package in PARSER_BACKENDS.items()
+            if package is None or importlib.util.find_spec(package) is not None]
+
+def set_scoped_parsing(enabled: bool) -> None:
+    """
+    Enable or disable scoped parsing (enabled by default).
+
+    When enabled, each parser cuts the region it reads out of the page before parsing it (see ``scope_html()``),
+    e.g. the first table of a list page, or the content block of a detail page, so no tree is built
+    for the navigation, header and footer around it. Disabling it parses whole pages again,
+    in case the layout of the website changes in a way the scoping does not expect.
+
+    :param enabled: Whether parsers only parse the region of the page they read.
+    :type enabled: bool
+    """
+    global _scoped_parsing
+    _scoped_parsing = enabled
+
+def get_scoped_parsing() -> bool:
+    """
+    Get whether scoped parsing is enabled (see ``set_scoped_parsing()``).
+
+    :return: Whether parsers only parse the region of the page they read.
+    :rtype: bool
+    """
+    return _scoped_parsing
+
+def scope_html(html: str, tag: str, id: Optional[str] = None) -> str:
+    """
+    Cut the first element with the given tag name (and ``id``, if given) out of an HTML page, tags included,
+    so only that region is handed to the parser. Nested elements of the same tag name are balanced; tags within
+    comments, ``<script>``/``<style>`` elements and attribute values are not counted.
+
+    :param html: The HTML page.
+    :type html: str
+    :param tag: The tag name of the element, e.g. ``table``.
+    :type tag: str
+    :param id: The ``id`` attribute of the element.
+    :type id: Optional[str]
+    :return: The markup of the element, or the whole page if scoped parsing is disabled.
+    :rtype: str
+    :raises RuntimeError: If the page has no such element, e.g. after a change of the layout of the website.
+
+    :Example:
+
+    .. code-block:: python
+
+        soup = make_soup(scope_html(html, "div", "v-attckmatrix"))
+    """
+    if not _scoped_parsing:
+        return html
+    opening_pattern, balancing_pattern = _scope_patterns(tag.lower(), id)
+    opening = next(_iter_markup(opening_pattern, html, 0, "opening"), None)
+    if opening is None:
+        raise RuntimeError(f"Failed to find the <{tag}{f' id={id!r}' if id else ''}> element of the page, "
+                           "the layout of the website may have changed (see set_scoped_parsing())")
+
+    start = opening.start()
+    depth = 0
+    for match in _iter_markup(balancing_pattern, html, start, "closing"):
+        depth += -1 if match.group("closing") else 1
+        if depth == 0:
+            return html[start:match.end()]
+    # Unclosed element: the parser closes it at the end of the page anyway
+    return html[start:]
+
+@functools.lru_cache(maxsize=None)
+def _scope_patterns(tag: str, id: Optional[str]) -> Tuple["re.Pattern", "re.Pattern"]:
+    """
+    Compile the patterns of ``scope_html()``: the opening tag of the element, and then the start and end tags
+    of its name, both also matching comments, ``<script>`` and ``<style>`` elements so that their content is skipped.
+    """
+    # Every alternative after the common "<", which the regular expression engine then searches for quickly
+    opening = rf"{re.escape(tag)}(?=[\s/>])"
+    if id is not None:
+        opening += rf"""(?:[^>"']|"[^"]*"|'[^']*')*?\sid\s*=\s*(?P<quote>["']?){re.escape(id)}(?P=quote)(?=[\s/>])"""
+    flags = re.IGNORECASE | re.DOTALL
+    return (re.compile(rf"<(?:{_SKIPPED_MARKUP}|(?P<opening>{opening}))", flags),
+            re.compile(rf"<(?:{_SKIPPED_MARKUP}|(?P<closing>/?){re.escape(tag)}(?=[\s/>])[^>]*>)", flags))
+
+def _iter_markup(pattern: "re.Pattern", html: str, position: int, group: str) -> Iterator["re.Match"]:
+    """
+    Iterate over the matches of a pattern of ``scope_html()`` from a position of an HTML page, skipping the matches
+    in attribute values and yielding those where the given group matched, i.e. tags rather than skipped content.
+    """
+    while True:
+        match = pattern.search(html, position)
+        if match is None:
+            return
+        if _in_tag(html, match.start()):
+            # Text of an attribute value of another tag, not markup
+            position = match.start() + 1
+            continue
+        position = match.end()
+        if match.group(group) is not None:
+            yield match
+
+def _in_tag(html: str, position: int) -> bool:
+    """
+    Whether a position of an HTML page is within a tag, i.e. in one of its attribute values.
+    """
+    opening = html.rfind("<", 0, position)
+    if opening == -1:
+        return False
+    tag = _START_TAG.match(html, opening)
+    return tag is not None and tag.end() > position
+
+class TableRowSplitter:
+    """
+    Split the rows of the first table of an HTML page out of its markup, as the page arrives chunk by chunk.
+
+    Every row (``<tr>``) of the table is parsed on its own as soon as its markup is complete,
+    so rows can be processed while the rest of the page is still being downloaded, and only the markup
+    of the current row is kept in memory. Rows of tables nested in a row belong to that row. Like in
+    ``scope_html()``, tags within comments, ``<script>``/``<style>`` elements and attribute values are not counted,
+    and markup cut by the end of a chunk is only read once the next chunks complete it.
+
+    :Example:
+
+    .. code-block:: python
+
+        splitter = TableRowSplitter()
+        for chunk in response.iter_text():
+            for row in splitter.feed(chunk):
+                print(row.find_all("td"))
+            if splitter.done:
+                break
+    """
+
+    # Every "<" of the page: skipped markup, a table or row tag, any other tag (so that its attribute values are
+    # skipped with it), or else the start of markup cut by the end of the chunks received so far
+    _TOKEN = re.compile(rf"<(?:{_SKIPPED_MARKUP}|(?P<closing>/?)(?P<name>table|tr)(?=[\s/>]){_ATTRIBUTES}>"
+                        rf"|(?!!--|(?:script|style)\b)[a-zA-Z/!?]{_ATTRIBUTES}>|(?P<cut>(?=[a-zA-Z/!?]|\Z)))",
+                        re.IGNORECASE | re.DOTALL)
+
+    def __init__(self) -> None:
+        self.done: bool = False
+        self._buffer: str = ""
+        self._position: int = 0
+        self._table_depth: int = 0
+        self._row_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> List[Tag]:
+        """
+        Add the next chunk of the page.
+
+        :param chunk: The next chunk of the page markup.
+        :type chunk: str
+        :return: The rows completed by this chunk, parsed.
+        :rtype: List[Tag]
+        """
+        if self.done:
+            return []
+        self._buffer += chunk
+        rows = []
+        for match in self._TOKEN.finditer(self._buffer, self._position):
+            if match.group("cut") is not None:
+                # Wait for the next chunks to read it
+                break
+            self._position = match.end()
+            closing, name = match.group("closing"), match.group("name")
+            if name is None:
+                continue
+            if name.lower() == "table":
+                if closing and self._table_depth == 1:
+                    # End of the first table; a row left open ends with it
+                    if self._row_start is not None:
+                        rows.append(self._row(match.start()))
+                    self.done = True
+                    self._buffer = ""
+                    return rows
+                self._table_depth = max(self._table_depth - 1, 0) if closing else self._table_depth + 1
+            elif self._table_depth == 1:
+                if closing:
+                    if self._row_start is not None:
+                        rows.append(self._row(match.end()))
+                    continue
+                if self._row_start is not None:
+                    # A row whose end tag was omitted ends where the next one starts
+                    rows.append(self._row(match.start()))
+                self._row_start = match.start()
+
+        # Drop the markup already handled, but keep the current row and the markup cut by the end of the chunk
+        keep = self._row_start if self._row_start is not None else self._position
+        self._buffer = self._buffer[keep:]
+        self._position -= keep
+        if self._row_start is not None:
+            self._row_start -= keep
+        return rows
+
+    def _row(self, end: int) -> Tag:
+        """
+        Parse the markup of the current row, up to the given offset of the buffer.
+        """
+        markup = self._buffer[self._row_start:end]
+        self._row_start = None
+        return make_soup(f"<table>{markup}</table>").find("tr")
+
+def iter_table_rows(chunks: Iterable[str]) -> Iterator[Tag]:
+    """
+    Parse the rows of the first table of an HTML page, given as an iterable of chunks, one row at a time.
+    See ``TableRowSplitter``.
+
+    :param chunks: The chunks of the page markup, e.g. ``response.iter_text()``.
+    :type chunks: Iterable[str]
+    :return: An iterator of the parsed rows.
+    :rtype: Iterator[Tag]
+    """
+    splitter = TableRowSplitter()
+    for chunk in chunks:
+        yield from splitter.feed(chunk)
+        if splitter.done:
+            return
+
+def make_soup(html: str, backend: Optional[str] = None) -> BeautifulSoup:
+    """
+    Parse an HTML page with the selected parser backend.
+
+    :param html: The HTML page.
+    :type html: str
+    :param backend: The parser backend to use instead of the selected one.
+    :type backend: Optional[str]
+    :return: The parsed page.
+    :rtype: BeautifulSoup
+    """
+    backend = backend or _parser_backend
+    with phase("parse", backend=backend) as parsing:
+        parsing.add("characters", len(html))
+        if backend == "selectolax":
+            return BeautifulSoup(html, builder=LexborTreeBuilder)
+        return BeautifulSoup(html, backend)
@@ -0,0 +1,228 @@
+# MITREAttackScrapper/utils/http_cache.py
+import os
+import time
+import sqlite3
+import threading
+import httpx
+from typing import Dict, NamedTuple, Optional, Union
+
+class CachedResponse(NamedTuple):
+    """
+    A page stored in the HTTP cache.
+
+    :param url: The URL the page was fetched from.
+    :type url: str
+    :param body: The raw body of the page.
+    :type body: bytes
+    :param content_type: The ``Content-Type`` header of the page, if any.
+    :type content_type: Optional[str]
+    :param etag: The ``ETag`` header of the page, if any.
+    :type etag: Optional[str]
+    :param last_modified: The ``Last-Modified`` header of the page, if any.
+    :type last_modified: Optional[str]
+    :param stored_at: UNIX time the page was last downloaded or revalidated.
+    :type stored_at: float
+    """
+    url: str
+    body: bytes
+    content_type: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+    def is_fresh(self, ttl: float) -> bool:
+        """
+        Whether the page can be served without asking the server, i.e. it was stored less than ``ttl`` seconds ago.
+        """
+        return time.time() - self.stored_at < ttl
+
+    def validators(self) -> Dict[str, str]:
+        """
+        The conditional request headers used to revalidate the page.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        """
+        Rebuild an ``httpx.Response`` carrying the cached page.
+        """
+        headers = {"X-Cache": "HIT"}
+        if self.content_type:
+            headers["Content-Type"] = self.content_type
+        if self.etag:
+            headers["ETag"] = self.etag
+        if self.last_modified:
+            headers["Last-Modified"] = self.last_modified
+        return httpx.Response(200, content=self.body, headers=headers, request=request)
+
+class MITREAttackHTTPCache:
+    """
+    An on-disk cache of MITRE ATT&CK pages, keyed by URL, used by ``MITREAttackHTTPClient`` when enabled.
+
+    ATT&CK pages change only at release boundaries, so a page downloaded once is served again from disk:
+
+    - Within ``ttl`` seconds after it was stored, the page is served without contacting the server at all.
+    - After that, the page is revalidated with ``If-None-Match``/``If-Modified-Since``.
+      A ``304 Not Modified`` answer reuses the stored body, so the page is not downloaded again.
+    - When the stored bodies exceed ``max_size`` bytes, the least recently used pages are evicted.
+
+    All entries live in a single SQLite database file in ``directory``, which may be shared between processes.
+
+    :param directory: Directory holding the cache database. Created if it does not exist.
+    :type directory: Union[str, os.PathLike]
+    :param ttl: Seconds a stored page is served without revalidation. ``0`` revalidates on every request.
+    :type ttl: float
+    :param max_size: Maximum total size in bytes of the stored bodies.
+    :type max_size: int
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.utils.http_client import configure_http_client
+        from MITREAttackScrapper.techniques.enterprise import MITREAttackEnterpriseTechniques
+
+        # Serve pages from ~/.cache/mitreattack for a day, then revalidate them
+        configure_http_client(cache="~/.cache/mitreattack", cache_ttl=86400)
+        MITREAttackEnterpriseTechniques.get("T1548")    # downloaded
+        MITREAttackEnterpriseTechniques.get("T1548")    # served from disk
+    """
+
+    DATABASE_NAME = "http_cache.sqlite3"
+
+    def __init__(self,
+                 directory: Union[str, os.PathLike],
+                 ttl: float = 86400.0,
+                 max_size: int = 256 * 1024 * 1024) -> None:
+        self.directory: str = os.path.abspath(os.path.expanduser(os.fspath(directory)))
+        self.ttl: float = ttl
+        self.max_size: int = max_size
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(os.path.join(self.directory, self.DATABASE_NAME),
+                                           check_same_thread=False,
+                                           isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                content_type TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+        self._connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+
+    def lookup(self, url: str) -> Optional[CachedResponse]:
+        """
+        Get the stored page of the given URL, marking it as recently used.
+
+        :param url: The URL of the page.
+        :type url: str
+        :return: The stored page, or ``None`` if the URL is not cached.
+        :rtype: Optional[CachedResponse]
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT url, body, content_type, etag, last_modified, stored_at FROM responses WHERE url = ?",
+                (url,)).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (time.time(), url))
+        return CachedResponse(*row)
+
+    def store(self, url: str, response: httpx.Response) -> None:
+        """
+        Store a successfully downloaded page, evicting the least recently used pages if the cache grows too large.
+
+        :param url: The URL of the page.
+        :type url: str
+        :param response: The ``200 OK`` response carrying the page.
+        :type response: httpx.Response
+        """
+        body = response.content
+        if len(body) > self.max_size:
+            return
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, body, response.headers.get("Content-Type"), response.headers.get("ETag"),
+                 response.headers.get("Last-Modified"), now, now, len(body)))
+            self._evict()
+
+    def refresh(self, url: str, response: httpx.Response) -> None:
+        """
+        Mark the stored page as revalidated after a ``304 Not Modified`` answer, restarting its TTL.
+
+        :param url: The URL of the page.
+        :type url: str
+        :param response: The ``304 Not Modified`` response, whose validators replace the stored ones if present.
+        :type response: httpx.Response
+        """
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ?, "
+                "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) WHERE url = ?",
+                (now, now, response.headers.get("ETag"), response.headers.get("Last-Modified"), url))
+
+    def invalidate(self, url: Optional[str] = None) -> None:
+        """
+        Remove the stored page of the given URL, or every stored page if no URL is given.
+
+        :param url: The URL of the page to remove.
+        :type url: Optional[str]
+        """
+        with self._lock:
+            if url is None:
+                self._connection.execute("DELETE FROM responses")
+            else:
+                self._connection.execute("DELETE FROM responses WHERE url = ?", (url,))
+
+    @property
+    def size(self) -> int:
+        """
+        The total size in bytes of the stored bodies.
+
+        :return: The size of the cache.
+        :rtype: int
+        """
+        with self._lock:
+            return self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def _evict(self) -> None:
+        """
+        Delete the least recently used pages until the stored bodies fit in ``max_size``. The lock must be held.
+        """
+        total = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_size:
+            return
+        victims = []
+        for url, size in self._connection.execute("SELECT url, size FROM responses ORDER BY accessed_at").fetchall():
+            if total <= self.max_size:
+                break
+            victims.append((url,))
+            total -= size
+        self._connection.executemany("DELETE FROM responses WHERE url = ?", victims)
+
+    def close(self) -> None:
+        """
+        Close the cache database.
+        """
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,643 @@
+# MITREAttackScrapper/utils/http_client.py
+import os
+import time
+import asyncio
+import threading
+import importlib.util
+import weakref
+import contextlib
+import httpx
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
+
+from .. import __version__
+from .http_cache import CachedResponse, MITREAttackHTTPCache
+from .rate_limit import THROTTLE_STATUS_CODES, MITREAttackRateLimiter
+from .retry import RetryPolicy, current_deadline
+from .instrumentation import Span, phase
+
+ATTACK_BASE_URL = "https://attack.mitre.org"
+
+class MITREAttackHTTPClient:
+    """
+    A shared HTTP transport used by every MITRE ATT&CK scraper class.
+
+    Instead of opening a new TCP+TLS connection for each page via ``httpx.get``,
+    all requests are sent through one ``httpx.Client`` that keeps connections alive
+    in a pool, and negotiates HTTP/2 when the optional ``h2`` package is installed.
+
+    The client can be pointed at a different host (e.g. a local stand-in server for tests)
+    with ``base_url``; every URL starting with ``https://attack.mitre.org`` is then rewritten
+    to that host. A pre-built ``httpx.Client`` or a custom ``transport`` can also be injected.
+
+    :param base_url: Replacement for ``https://attack.mitre.org`` in every requested URL.
+    :type base_url: Optional[str]
+    :param http2: Whether to enable HTTP/2. Defaults to ``True`` if the ``h2`` package is installed.
+    :type http2: Optional[bool]
+    :param max_connections: Maximum number of concurrent connections in the pool.
+    :type max_connections: int
+    :param max_keepalive_connections: Maximum number of idle connections kept alive in the pool.
+    :type max_keepalive_connections: int
+    :param keepalive_expiry: Seconds an idle connection is kept alive.
+    :type keepalive_expiry: float
+    :param timeout: Timeout in seconds (or an ``httpx.Timeout``) applied to each request.
+    :type timeout: Union[float, httpx.Timeout]
+    :param headers: Extra headers sent with every request.
+    :type headers: Optional[Dict[str, str]]
+    :param transport: A custom ``httpx.BaseTransport`` (e.g. ``httpx.MockTransport``) to send requests through.
+    :type transport: Optional[httpx.BaseTransport]
+    :param client: A pre-built ``httpx.Client`` to use as-is. The other pool options are ignored if given.
+    :type client: Optional[httpx.Client]
+    :param max_concurrency: Maximum number of asynchronous requests in flight at once, per event loop.
+    :type max_concurrency: int
+    :param async_transport: A custom ``httpx.AsyncBaseTransport`` to send asynchronous requests through.
+    :type async_transport: Optional[httpx.AsyncBaseTransport]
+    :param async_client: A pre-built ``httpx.AsyncClient`` to use as-is for asynchronous requests.
+    :type async_client: Optional[httpx.AsyncClient]
+    :param cache: An on-disk response cache, or the directory to keep one in. Disabled by default.
+                  Refer to ``MITREAttackHTTPCache`` for how cached pages are served and revalidated.
+    :type cache: Optional[Union[str, os.PathLike, MITREAttackHTTPCache]]
+    :param cache_ttl: Seconds a cached page is served without revalidation, if ``cache`` is a directory.
+    :type cache_ttl: float
+    :param cache_max_size: Maximum total size in bytes of the cached pages, if ``cache`` is a directory.
+    :type cache_max_size: int
+    :param rate_limiter: Paces the requests and adapts their concurrency to throttling (``429``/``503``) by the server,
+                         sending throttled requests again after their ``Retry-After``. Disabled by default.
+    :type rate_limiter: Optional[MITREAttackRateLimiter]
+    :param retry: Retries failed requests with backoff, bounds them with deadlines, and hedges slow ones.
+                  Requests are sent once by default. Streamed requests (``stream()``) are not retried nor hedged,
+                  only the rate limiter sends them again if throttled.
+    :type retry: Optional[RetryPolicy]
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.utils.http_client import configure_http_client
+        from MITREAttackScrapper.techniques.enterprise import MITREAttackEnterpriseTechniques
+
+        # Allow up to 50 pooled connections and a 30 second timeout for a bulk sync
+        configure_http_client(max_connections=50, max_keepalive_connections=50, timeout=30.0)
+        for technique in MITREAttackEnterpriseTechniques.get_list():
+            MITREAttackEnterpriseTechniques.get(technique["id"])
+    """
+
+    def __init__(self,
+                 base_url: Optional[str] = None,
+                 http2: Optional[bool] = None,
+                 max_connections: int = 20,
+                 max_keepalive_connections: int = 10,
+                 keepalive_expiry: float = 30.0,
+                 timeout: Union[float, httpx.Timeout] = 10.0,
+                 headers: Optional[Dict[str, str]] = None,
+                 transport: Optional[httpx.BaseTransport] = None,
+                 client: Optional[httpx.Client] = None,
+                 max_concurrency: int = 50,
+                 async_transport: Optional[httpx.AsyncBaseTransport] = None,
+                 async_client: Optional[httpx.AsyncClient] = None,
+                 cache: Optional[Union[str, os.PathLike, MITREAttackHTTPCache]] = None,
+                 cache_ttl: float = 86400.0,
+                 cache_max_size: int = 256 * 1024 * 1024,
+                 rate_limiter: Optional[MITREAttackRateLimiter] = None,
+                 retry: Optional[RetryPolicy] = None) -> None:
+        if http2 is None:
+            http2 = importlib.util.find_spec("h2") is not None
+
+        self.base_url: Optional[str] = base_url.rstrip("/") if base_url else None
+        self.http2: bool = http2
+        self.limits: httpx.Limits = httpx.Limits(max_connections=max_connections,
+                                                 max_keepalive_connections=max_keepalive_connections,
+                                                 keepalive_expiry=keepalive_expiry)
+        self.timeout: httpx.Timeout = timeout if isinstance(timeout, httpx.Timeout) else httpx.Timeout(timeout)
+        self.headers: Dict[str, str] = {"User-Agent": f"MITREAttackScrapper/{__version__}"}
+        self.headers.update(headers or {})
+        self.transport: Optional[httpx.BaseTransport] = transport
+
+        self.max_concurrency: int = max_concurrency
+        self.async_transport: Optional[httpx.AsyncBaseTransport] = async_transport
+
+        if cache is not None and not isinstance(cache, MITREAttackHTTPCache):
+            cache = MITREAttackHTTPCache(cache, ttl=cache_ttl, max_size=cache_max_size)
+        self.cache: Optional[MITREAttackHTTPCache] = cache
+        self.rate_limiter: Optional[MITREAttackRateLimiter] = rate_limiter
+        self.retry: Optional[RetryPolicy] = retry
+
+        self._client: Optional[httpx.Client] = client
+        self._async_client: Optional[httpx.AsyncClient] = async_client
+        self._lock = threading.Lock()
+
+        # httpx.AsyncClient and asyncio.Semaphore are bound to the event loop they are first used in,
+        # so one pair is kept per running event loop.
+        self._async_states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[httpx.AsyncClient, asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+
+    @property
+    def client(self) -> httpx.Client:
+        """
+        The underlying pooled ``httpx.Client``, created lazily on first use.
+
+        :return: The pooled ``httpx.Client``.
+        :rtype: httpx.Client
+        """
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = httpx.Client(http2=self.http2,
+                                                limits=self.limits,
+                                                timeout=self.timeout,
+                                                headers=self.headers,
+                                                transport=self.transport)
+        return self._client
+
+    def _async_state(self) -> Tuple[httpx.AsyncClient, asyncio.Semaphore]:
+        """
+        Get the pooled ``httpx.AsyncClient`` and the concurrency semaphore of the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        state = self._async_states.get(loop)
+        if state is None:
+            client = self._async_client or httpx.AsyncClient(http2=self.http2,
+                                                             limits=self.limits,
+                                                             timeout=self.timeout,
+                                                             headers=self.headers,
+                                                             transport=self.async_transport)
+            state = (client, asyncio.Semaphore(self.max_concurrency))
+            self._async_states[loop] = state
+        return state
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        The pooled ``httpx.AsyncClient`` of the running event loop, created lazily on first use.
+
+        :return: The pooled ``httpx.AsyncClient``.
+        :rtype: httpx.AsyncClient
+        """
+        return self._async_state()[0]
+
+    def resolve_url(self, url: str) -> str:
+        """
+        Rewrite a MITRE ATT&CK URL to the configured ``base_url``, if any.
+
+        :param url: The URL to resolve.
+        :type url: str
+        :return: The URL the request will actually be sent to.
+        :rtype: str
+        """
+        if self.base_url and url.startswith(ATTACK_BASE_URL):
+            return self.base_url + url[len(ATTACK_BASE_URL):]
+        return url
+
+    def _retry_policy(self) -> Optional[RetryPolicy]:
+        """
+        Get the retry policy of a request starting now: the configured one, or a single attempt
+        bounded by the enclosing ``deadline()`` block, if any.
+        """
+        if self.retry is None and current_deadline() is not None:
+            return _SINGLE_ATTEMPT
+        return self.retry
+
+    def _retry_status_codes(self, policy: RetryPolicy) -> frozenset:
+        """
+        Get the status codes the retry policy sends again: the throttling ones are left to the rate limiter, if any,
+        so that a throttled request is not retried by both.
+        """
+        if self.rate_limiter is None:
+            return policy.retry_status_codes
+        return policy.retry_status_codes - THROTTLE_STATUS_CODES
+
+    @staticmethod
+    def _send_deadline(timeout: Optional[float]) -> Optional[float]:
+        """
+        Get the ``time.monotonic()`` value by which an attempt must be sent: the earliest of the enclosing
+        ``deadline()`` block and the time left to the attempt, if any.
+        """
+        deadlines = [at for at in (current_deadline(), None if timeout is None else time.monotonic() + timeout)
+                     if at is not None]
+        return min(deadlines) if deadlines else None
+
+    @staticmethod
+    def _limiter_timeout(url: str) -> httpx.TimeoutException:
+        """
+        Build the error of a request the rate limiter could not send before its deadline.
+        """
+        return httpx.TimeoutException(f"Deadline exceeded while waiting for the rate limiter to send {url}",
+                                      request=httpx.Request("GET", url))
+
+    def _request(self, url: str, headers: Optional[Dict[str, str]]) -> httpx.Response:
+        """
+        Send a GET request through the pooled client, with the retry policy if any.
+        """
+        policy = self._retry_policy()
+        if policy is None:
+            return self._send(url, headers)
+        return policy.call(lambda timeout: self._send(url, headers, timeout), url, self._retry_status_codes(policy))
+
+    async def _arequest(self, url: str, headers: Optional[Dict[str, str]]) -> httpx.Response:
+        """
+        Asynchronous counterpart of ``_request()``.
+        """
+        policy = self._retry_policy()
+        if policy is None:
+            return await self._asend(url, headers)
+        return await policy.acall(lambda timeout: self._asend(url, headers, timeout), url,
+                                  self._retry_status_codes(policy))
+
+    def _send(self, url: str, headers: Optional[Dict[str, str]], timeout: Optional[float] = None) -> httpx.Response:
+        """
+        Send a GET request through the pooled client, paced by the rate limiter if any,
+        which also sends throttled requests again, as long as the deadline of the attempt allows.
+        """
+        request_timeout = httpx.USE_CLIENT_DEFAULT if timeout is None else max(timeout, 0.001)
+        limiter = self.rate_limiter
+        if limiter is None:
+            return self.client.get(url, headers=headers, timeout=request_timeout)
+        deadline = self._send_deadline(timeout)
+        response = None
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                permit = limiter.acquire(deadline)
+            except TimeoutError:
+                # The last throttled response, if any, is the best answer left
+                if response is None:
+                    raise self._limiter_timeout(url) from None
+                return response
+            if deadline is not None:
+                request_timeout = max(deadline - time.monotonic(), 0.001)
+            try:
+                response = self.client.get(url, headers=headers, timeout=request_timeout)
+            except BaseException:
+                limiter.release(permit)
+                raise
+            limiter.release(permit, response.status_code, response.headers.get("Retry-After"))
+            if not limiter.should_retry(response.status_code, attempt):
+                return response
+
+    async def _asend(self, url: str, headers: Optional[Dict[str, str]], timeout: Optional[float] = None) -> httpx.Response:
+        """
+        Asynchronous counterpart of ``_send()``, through the pooled asynchronous client of the running event loop.
+        """
+        request_timeout = httpx.USE_CLIENT_DEFAULT if timeout is None else max(timeout, 0.001)
+        client, semaphore = self._async_state()
+        limiter = self.rate_limiter
+        deadline = self._send_deadline(timeout)
+        async with semaphore:
+            if limiter is None:
+                return await client.get(url, headers=headers, timeout=request_timeout)
+            response = None
+            attempt = 0
+            while True:
+                attempt += 1
+                try:
+                    permit = await limiter.aacquire(deadline)
+                except TimeoutError:
+                    if response is None:
+                        raise self._limiter_timeout(url) from None
+                    return response
+                if deadline is not None:
+                    request_timeout = max(deadline - time.monotonic(), 0.001)
+                try:
+                    response = await client.get(url, headers=headers, timeout=request_timeout)
+                except BaseException:
+                    limiter.release(permit)
+                    raise
+                limiter.release(permit, response.status_code, response.headers.get("Retry-After"))
+                if not limiter.should_retry(response.status_code, attempt):
+                    return response
+
+    def _use_cache(self, url: str, cached: Optional[CachedResponse], response: httpx.Response) -> httpx.Response:
+        """
+        Answer a (possibly conditional) request from the cache on ``304 Not Modified``, or store the downloaded page.
+        """
+        if cached is not None and response.status_code == 304:
+            self.cache.refresh(url, response)
+            return cached.to_response(response.request)
+        if response.status_code == 200:
+            self.cache.store(url, response)
+        return response
+
+    @staticmethod
+    def _traced(fetching: Span,
+                response: httpx.Response,
+                downloaded: Optional[httpx.Response],
+                cache: Optional[str] = None) -> httpx.Response:
+        """
+        Record on the fetch span of a request the status of the returned response, the bytes of the response
+        downloaded (``None`` if the page came from the cache), and the outcome of the cache (``fresh``, ``revalidated``
+        or ``miss``, ``None`` if the cache was not used).
+        """
+        fetching.set("status", response.status_code)
+        if cache is not None:
+            fetching.set("cache", cache)
+            if cache != "miss":
+                fetching.add("cache_hits")
+        if downloaded is not None:
+            fetching.add("bytes", len(downloaded.content))
+        return response
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """
+        Send a GET request through the pooled client.
+        If a cache is enabled, a fresh cached page is returned without a request,
+        and a stale one is revalidated with a conditional request.
+
+        :param url: The URL to fetch.
+        :type url: str
+        :param headers: Extra request headers, e.g. the caller's own ``If-None-Match``.
+                        Requests with extra headers bypass the cache, so a ``304`` answer reaches the caller.
+        :type headers: Optional[Dict[str, str]]
+        :return: The HTTP response.
+        :rtype: httpx.Response
+        """
+        url = self.resolve_url(url)
+        with phase("fetch", url=url) as fetching:
+            if self.cache is None or headers:
+                response = self._request(url, headers)
+                return self._traced(fetching, response, response)
+
+            cached = self.cache.lookup(url)
+            if cached is not None and cached.is_fresh(self.cache.ttl):
+                return self._traced(fetching, cached.to_response(httpx.Request("GET", url)), None, "fresh")
+            response = self._request(url, cached.validators() if cached is not None else None)
+            return self._traced(fetching, self._use_cache(url, cached, response), response,
+                                "revalidated" if response.status_code == 304 else "miss")
+
+    async def aget(self, url: str, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """
+        Send a GET request through the pooled asynchronous client of the running event loop.
+        At most ``max_concurrency`` requests are in flight at once; the others wait for a free slot.
+
+        :param url: The URL to fetch.
+        :type url: str
+        :param headers: Extra request headers. Requests with extra headers bypass the cache, like ``get()``.
+        :type headers: Optional[Dict[str, str]]
+        :return: The HTTP response.
+        :rtype: httpx.Response
+        """
+        url = self.resolve_url(url)
+        with phase("fetch", url=url) as fetching:
+            cached = None
+            if self.cache is not None and not headers:
+                cached = self.cache.lookup(url)
+                if cached is not None and cached.is_fresh(self.cache.ttl):
+                    return self._traced(fetching, cached.to_response(httpx.Request("GET", url)), None, "fresh")
+
+            response = await self._arequest(url, headers or (cached.validators() if cached is not None else None))
+            if self.cache is None or headers:
+                return self._traced(fetching, response, response)
+            return self._traced(fetching, self._use_cache(url, cached, response), response,
+                                "revalidated" if response.status_code == 304 else "miss")
+
+    @contextlib.contextmanager
+    def stream(self, url: str) -> Iterator[httpx.Response]:
+        """
+        Send a GET request through the pooled client without reading the body up front,
+        so it can be consumed chunk by chunk with ``response.iter_text()`` while it is downloaded.
+        If a cache is enabled, the page goes through ``get()`` instead, so it is answered from or stored in the cache,
+        and the body is read in full.
+
+        The retry policy does not apply, since the caller consumes the body as it is downloaded: the request is sent
+        once, and only the rate limiter, if any, sends it again while it is throttled (before its body is read).
+        The deadline of a ``deadline()`` block only bounds the wait for the rate limiter.
+
+        :param url: The URL to fetch.
+        :type url: str
+        :return: A context manager of the HTTP response, closing the response on exit.
+        :rtype: Iterator[httpx.Response]
+        """
+        if self.cache is not None:
+            yield self.get(url)
+            return
+        limiter = self.rate_limiter
+        if limiter is None:
+            with self.client.stream("GET", self.resolve_url(url)) as response:
+                yield response
+            return
+
+        deadline = current_deadline()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                permit = limiter.acquire(deadline)
+            except TimeoutError:
+                raise self._limiter_timeout(url) from None
+            stack = contextlib.ExitStack()
+            try:
+                response = stack.enter_context(self.client.stream("GET", self.resolve_url(url)))
+            except BaseException:
+                limiter.release(permit)
+                raise
+            if not limiter.should_retry(response.status_code, attempt):
+                break
+            stack.close()
+            limiter.release(permit, response.status_code, response.headers.get("Retry-After"))
+        # The slot is held until the body is consumed
+        try:
+            with stack:
+                yield response
+        finally:
+            limiter.release(permit, response.status_code, response.headers.get("Retry-After"))
+
+    @contextlib.asynccontextmanager
+    async def astream(self, url: str) -> AsyncIterator[httpx.Response]:
+        """
+        Asynchronous counterpart of ``stream()``, consumed with ``response.aiter_text()``.
+        The request holds one of the ``max_concurrency`` slots until the response is closed.
+        Like ``stream()``, it is not retried nor hedged by the retry policy, only by the rate limiter if throttled.
+
+        :param url: The URL to fetch.
+        :type url: str
+        :return: An asynchronous context manager of the HTTP response, closing the response on exit.
+        :rtype: AsyncIterator[httpx.Response]
+        """
+        if self.cache is not None:
+            yield await self.aget(url)
+            return
+        client, semaphore = self._async_state()
+        limiter = self.rate_limiter
+        async with semaphore:
+            if limiter is None:
+                async with client.stream("GET", self.resolve_url(url)) as response:
+                    yield response
+                return
+
+            deadline = current_deadline()
+            attempt = 0
+            while True:
+                attempt += 1
+                try:
+                    permit = await limiter.aacquire(deadline)
+                except TimeoutError:
+                    raise self._limiter_timeout(url) from None
+                stack = contextlib.AsyncExitStack()
+                try:
+                    response = await stack.enter_async_context(client.stream("GET", self.resolve_url(url)))
+                except BaseException:
+                    limiter.release(permit)
+                    raise
+                if not limiter.should_retry(response.status_code, attempt):
+                    break
+                await stack.aclose()
+                limiter.release(permit, response.status_code, response.headers.get("Retry-After"))
+            try:
+                async with stack:
+                    yield response
+            finally:
+                limiter.release(permit, response.status_code, response.headers.get("Retry-After"))
+
+    def close(self) -> None:
+        """
+        Close the pooled connections, of the synchronous client and of the asynchronous client of every event loop.
+        An asynchronous client is closed by a task of its event loop if the loop is running, and dropped with its
+        connections if the loop is already closed. The clients are re-created on the next request.
+        """
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+        for loop, client in self._pop_async_clients():
+            _close_in_loop(client, loop)
+
+    async def aclose(self) -> None:
+        """
+        Close the pooled asynchronous connections: those of the running event loop before returning,
+        and those of the other event loops as ``close()`` does. The asynchronous clients are re-created on the next request.
+        """
+        running_loop = asyncio.get_running_loop()
+        for loop, client in self._pop_async_clients():
+            if loop is running_loop:
+                await client.aclose()
+            else:
+                _close_in_loop(client, loop)
+
+    def _pop_async_clients(self) -> List[Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]]:
+        """
+        Forget the asynchronous clients of every event loop, and return those this client created
+        (not an ``async_client`` given by the caller, who owns it) with their event loop.
+        """
+        with self._lock:
+            states = list(self._async_states.items())
+            self._async_states.clear()
+        return [(loop, client) for loop, (client, _) in states if client is not self._async_client]
+
+    def __enter__(self) -> "MITREAttackHTTPClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _close_in_loop(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Close an asynchronous client from any thread, in the event loop its connections are bound to.
+    """
+    if loop.is_closed():
+        # Its connections cannot be closed gracefully anymore, they are closed when garbage collected
+        return
+    if not loop.is_running():
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop runs in this thread, so the idle loop of the client can be run here
+            loop.run_until_complete(client.aclose())
+            return
+    # Closed by a task of the loop, as soon as it runs
+    asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+# Bounds the requests sent within a deadline() block when no retry policy is configured
+_SINGLE_ATTEMPT = RetryPolicy(max_attempts=1)
+
+_default_client: Optional[MITREAttackHTTPClient] = None
+_default_client_lock = threading.Lock()
+
+def get_http_client() -> MITREAttackHTTPClient:
+    """
+    Get the shared HTTP client used by all scraper classes, creating it with default settings if needed.
+
+    :return: The shared HTTP client.
+    :rtype: MITREAttackHTTPClient
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = MITREAttackHTTPClient()
+    return _default_client
+
+def set_http_client(client: MITREAttackHTTPClient) -> None:
+    """
+    Replace the shared HTTP client used by all scraper classes.
+    The previous client is not closed, since its owner may still be using it.
+
+    :param client: The HTTP client to use from now on.
+    :type client: MITREAttackHTTPClient
+    """
+    global _default_client
+    with _default_client_lock:
+        _default_client = client
+
+def configure_http_client(**options) -> MITREAttackHTTPClient:
+    """
+    Close the shared HTTP client and replace it with a new one built from the given options.
+    Like ``MITREAttackHTTPClient.close()``, this also closes the asynchronous clients of every event loop.
+    Refer to ``MITREAttackHTTPClient`` for the accepted options.
+
+    :return: The newly configured shared HTTP client.
+    :rtype: MITREAttackHTTPClient
+    """
+    global _default_client
+    client = MITREAttackHTTPClient(**options)
+    with _default_client_lock:
+        previous, _default_client = _default_client, client
+    if previous is not None:
+        previous.close()
+    return client
+
+def fetch(url: str, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+    """
+    Fetch the given URL through the shared HTTP client.
+
+    :param url: The URL to fetch.
+    :type url: str
+    :param headers: Extra request headers (see ``MITREAttackHTTPClient.get()``).
+    :type headers: Optional[Dict[str, str]]
+    :return: The HTTP response.
+    :rtype: httpx.Response
+    """
+    return get_http_client().get(url, headers=headers)
+
+async def afetch(url: str, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+    """
+    Asynchronously fetch the given URL through the shared HTTP client.
+
+    :param url: The URL to fetch.
+    :type url: str
+    :param headers: Extra request headers (see ``MITREAttackHTTPClient.get()``).
+    :type headers: Optional[Dict[str, str]]
+    :return: The HTTP response.
+    :rtype: httpx.Response
+    """
+    return await get_http_client().aget(url, headers=headers)
+
+def fetch_stream(url: str) -> contextlib.AbstractContextManager:
+    """
+    Fetch the given URL through the shared HTTP client, streaming the body (see ``MITREAttackHTTPClient.stream()``).
+
+    :param url: The URL to fetch.
+    :type url: str
+    :return: A context manager of the HTTP response.
+    :rtype: contextlib.AbstractContextManager
+    """
+    return get_http_client().stream(url)
+
+def afetch_stream(url: str) -> contextlib.AbstractAsyncContextManager:
+    """
+    Asynchronously fetch the given URL through the shared HTTP client, streaming the body (see ``MITREAttackHTTPClient.astream()``).
+
+    :param url: The URL to fetch.
+    :type url: str
+    :return: An asynchronous context manager of the HTTP response.
+    :rtype: contextlib.AbstractAsyncContextManager
+    """
+    return get_http_client().astream(url)
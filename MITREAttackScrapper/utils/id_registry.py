@@ -0,0 +1,473 @@
+# MITREAttackScrapper/utils/id_registry.py
+import os
+import re
+import json
+import threading
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Type, Union
+
+# The kinds of MITRE ATT&CK IDs, with their compiled formats and the formats shown in error messages
+ID_PATTERNS: Dict[str, "re.Pattern"] = {
+    "technique": re.compile(r"T\d{4}(?:\.\d{3})?"),
+    "tactic": re.compile(r"TA\d{4}"),
+    "mitigation": re.compile(r"M\d{4}"),
+    "group": re.compile(r"G\d{4}"),
+    "software": re.compile(r"S\d{4}"),
+    "campaign": re.compile(r"C\d{4}"),
+}
+ID_FORMATS: Dict[str, str] = {
+    "technique": "TXXXX[.YYY]",
+    "tactic": "TAXXXX",
+    "mitigation": "MXXXX",
+    "group": "GXXXX",
+    "software": "SXXXX",
+    "campaign": "CXXXX",
+}
+
+# One pattern for every kind, the name of the matching group being the kind of the ID
+_ID_KIND = re.compile("|".join(f"(?P<{kind}>{pattern.pattern})" for kind, pattern in ID_PATTERNS.items()))
+
+# Loosely written IDs: any case, surrounding spaces, "/" or "_" instead of "." before the sub-technique number
+_LOOSE_ID = re.compile(r"\s*(TA|[TMGSC])\s*(\d{4})(?:\s*[./_]\s*(\d{3}))?\s*", re.IGNORECASE)
+
+ACTIVE = "active"
+DEPRECATED = "deprecated"
+REVOKED = "revoked"
+
+REGISTRY_VERSION = 1
+
+def id_kind(attack_id: str) -> Optional[str]:
+    """
+    Get the kind of a MITRE ATT&CK ID from its format.
+
+    :param attack_id: The ID, e.g. ``"T1059.001"``.
+    :type attack_id: str
+    :return: ``"technique"``, ``"tactic"``, ``"mitigation"``, ``"group"``, ``"software"`` or ``"campaign"``,
+             or ``None`` if the ID is malformed.
+    :rtype: Optional[str]
+    """
+    match = _ID_KIND.fullmatch(attack_id)
+    return match.lastgroup if match else None
+
+def normalize_id(attack_id: str) -> Optional[str]:
+    """
+    Rewrite a loosely written MITRE ATT&CK ID in its canonical form, e.g. ``" t1059/001 "`` to ``"T1059.001"``.
+
+    :param attack_id: The ID.
+    :type attack_id: str
+    :return: The canonical ID, or ``None`` if it cannot be read as an ID.
+    :rtype: Optional[str]
+    """
+    match = _LOOSE_ID.fullmatch(attack_id)
+    if not match:
+        return None
+    prefix, number, sub_number = match.groups()
+    prefix = prefix.upper()
+    if sub_number is not None:
+        if prefix != "T":
+            return None
+        return f"T{number}.{sub_number}"
+    return prefix + number
+
+class IDValidation(NamedTuple):
+    """
+    The result of ``MITREAttackIDRegistry.validate()``. Each list keeps the order of the validated IDs.
+
+    :param valid: IDs of existing objects, deprecated ones included.
+    :type valid: List[str]
+    :param malformed: IDs not in the format of any kind of MITRE ATT&CK ID.
+    :type malformed: List[str]
+    :param unknown: Well-formed IDs of no known object.
+    :type unknown: List[str]
+    :param revoked: IDs of revoked objects, mapped to the ID of the object replacing them (or ``None``).
+    :type revoked: Dict[str, Optional[str]]
+    :param deprecated: IDs of deprecated objects (also in ``valid``).
+    :type deprecated: List[str]
+    """
+    valid: List[str]
+    malformed: List[str]
+    unknown: List[str]
+    revoked: Dict[str, Optional[str]]
+    deprecated: List[str]
+
+class MITREAttackIDRegistry:
+    """
+    A registry of the IDs of existing MITRE ATT&CK objects, so nonexistent IDs are rejected without a network call.
+
+    The registry maps every known ID to its status (``ACTIVE``, ``DEPRECATED`` or ``REVOKED``), and revoked IDs to the ID
+    of the object replacing them. It is built once from the list pages (``from_scrapers()``), a snapshot
+    (``from_snapshot()``) or a STIX bundle (``from_stix_bundle()``, the only source of revoked and deprecated objects),
+    and can be saved and loaded as JSON. Lookups are dictionary lookups.
+
+    Installed with ``set_id_registry()``, the registry is consulted by the ID validators of ``get()``, ``aget()``
+    and ``get_many()``, after the format check: an unknown or revoked ID raises a ``ValueError`` instead of being fetched.
+    Only the kinds of IDs the registry was built with are checked, e.g. a registry built from the groups only
+    does not reject any technique ID.
+
+    :param kinds: The kinds of IDs the registry knows all of, e.g. ``{"technique", "group"}``.
+    :type kinds: Iterable[str]
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.utils.id_registry import MITREAttackIDRegistry, set_id_registry
+        from MITREAttackScrapper.cti.groups import MITREAttackCTIGroups
+
+        registry = set_id_registry(MITREAttackIDRegistry.from_stix_bundle("enterprise-attack.json"))
+        print("G0016" in registry, registry.status("T1086"), registry.replaced_by("T1086"))
+        print(registry.normalize([" g0016", "t1059/001", "G0016"]))    # ['G0016', 'T1059.001']
+        MITREAttackCTIGroups.get("G9999")    # ValueError: Unknown MITRE ATT&CK group ID G9999, without any request
+    """
+
+    def __init__(self, kinds: Iterable[str] = ()) -> None:
+        self.kinds: Set[str] = set(kinds)
+        unsupported = self.kinds - set(ID_PATTERNS)
+        if unsupported:
+            raise ValueError(f"Unsupported kinds of IDs: {', '.join(sorted(unsupported))}")
+        self._status: Dict[str, str] = {}
+        self._replaced_by: Dict[str, str] = {}
+
+    def add(self, attack_id: str, status: str = ACTIVE, replaced_by: Optional[str] = None) -> None:
+        """
+        Register an ID, and the kind of the ID as known.
+
+        :param attack_id: The ID, in its canonical form.
+        :type attack_id: str
+        :param status: ``ACTIVE``, ``DEPRECATED`` or ``REVOKED``.
+        :type status: str
+        :param replaced_by: For a revoked ID, the ID of the object replacing it.
+        :type replaced_by: Optional[str]
+        :raises ValueError: If the ID is malformed or the status unknown.
+        """
+        kind = id_kind(attack_id)
+        if kind is None:
+            raise ValueError(f"Invalid MITRE ATT&CK ID {attack_id!r}")
+        if status not in (ACTIVE, DEPRECATED, REVOKED):
+            raise ValueError(f"Unknown status {status!r}")
+        self.kinds.add(kind)
+        self._status[attack_id] = status
+        if replaced_by is not None:
+            self._replaced_by[attack_id] = replaced_by
+
+    def status(self, attack_id: str) -> Optional[str]:
+        """
+        Get the status of an ID.
+
+        :param attack_id: The ID.
+        :type attack_id: str
+        :return: ``ACTIVE``, ``DEPRECATED``, ``REVOKED``, or ``None`` if the ID is unknown.
+        :rtype: Optional[str]
+        """
+        return self._status.get(attack_id)
+
+    def replaced_by(self, attack_id: str) -> Optional[str]:
+        """
+        Get the ID of the object replacing a revoked one, following chains of revocations.
+
+        :param attack_id: The revoked ID.
+        :type attack_id: str
+        :return: The ID of the replacing object, or ``None`` if it is unknown or the ID is not revoked.
+        :rtype: Optional[str]
+        """
+        seen = {attack_id}
+        replacement = self._replaced_by.get(attack_id)
+        while replacement is not None and self._status.get(replacement) == REVOKED and replacement not in seen:
+            seen.add(replacement)
+            replacement = self._replaced_by.get(replacement, replacement)
+        return replacement
+
+    def ids(self, kind: Optional[str] = None, status: Optional[str] = ACTIVE) -> List[str]:
+        """
+        Get the known IDs.
+
+        :param kind: Only the IDs of this kind, e.g. ``"group"``, or ``None`` for all of them.
+        :type kind: Optional[str]
+        :param status: Only the IDs with this status, or ``None`` for all of them.
+        :type status: Optional[str]
+        :return: The sorted IDs.
+        :rtype: List[str]
+        """
+        return sorted(attack_id for attack_id, attack_status in self._status.items()
+                      if (status is None or attack_status == status) and (kind is None or id_kind(attack_id) == kind))
+
+    def check(self, attack_id: str, kind: Optional[str] = None) -> None:
+        """
+        Check that an ID is well-formed and, if its kind is known to the registry, that it exists and is not revoked.
+
+        :param attack_id: The ID.
+        :type attack_id: str
+        :param kind: The expected kind of the ID, or ``None`` to accept any kind.
+        :type kind: Optional[str]
+        :raises ValueError: If the ID is malformed, of another kind, unknown or revoked.
+        """
+        actual_kind = id_kind(attack_id) if kind is None or ID_PATTERNS[kind].fullmatch(attack_id) else None
+        if actual_kind is None:
+            if kind is None:
+                raise ValueError(f"Invalid MITRE ATT&CK ID {attack_id!r}")
+            raise ValueError(f"Invalid MITRE ATT&CK {kind} ID, should be in the format of {ID_FORMATS[kind]}")
+        self.check_known(attack_id, kind or actual_kind)
+
+    def check_known(self, attack_id: str, kind: str) -> None:
+        """
+        The existence part of ``check()``, for an ID already known to be well-formed, e.g. by the ID validators.
+
+        :param attack_id: The well-formed ID.
+        :type attack_id: str
+        :param kind: The kind of the ID.
+        :type kind: str
+        :raises ValueError: If the kind is known to the registry, and the ID unknown or revoked.
+        """
+        if kind not in self.kinds:
+            return
+        status = self._status.get(attack_id)
+        if status is None:
+            raise ValueError(f"Unknown MITRE ATT&CK {kind} ID {attack_id}")
+        if status == REVOKED:
+            replacement = self.replaced_by(attack_id)
+            raise ValueError(f"MITRE ATT&CK {kind} ID {attack_id} was revoked"
+                             + (f", use {replacement} instead" if replacement else ""))
+
+    def validate(self, attack_ids: Iterable[str]) -> IDValidation:
+        """
+        Sort a batch of IDs by whether they are malformed, unknown, revoked, deprecated or valid.
+        IDs of kinds the registry does not know are only checked for their format.
+
+        :param attack_ids: The IDs, e.g. from a report or a detection rule set. Duplicates are reported once.
+        :type attack_ids: Iterable[str]
+        :return: The IDs, by outcome.
+        :rtype: IDValidation
+        """
+        validation = IDValidation([], [], [], {}, [])
+        for attack_id in dict.fromkeys(attack_ids):
+            kind = id_kind(attack_id)
+            if kind is None:
+                validation.malformed.append(attack_id)
+                continue
+            if kind not in self.kinds:
+                validation.valid.append(attack_id)
+                continue
+            status = self._status.get(attack_id)
+            if status is None:
+                validation.unknown.append(attack_id)
+            elif status == REVOKED:
+                validation.revoked[attack_id] = self.replaced_by(attack_id)
+            else:
+                validation.valid.append(attack_id)
+                if status == DEPRECATED:
+                    validation.deprecated.append(attack_id)
+        return validation
+
+    def normalize(self, attack_ids: Iterable[str], follow_revoked: bool = True, strict: bool = False) -> List[str]:
+        """
+        Normalize a batch of loosely written IDs: rewrite them in their canonical form (see ``normalize_id()``),
+        replace revoked IDs by their replacement and drop duplicates, keeping the order of the first occurrences.
+
+        :param attack_ids: The IDs.
+        :type attack_ids: Iterable[str]
+        :param follow_revoked: Whether revoked IDs are replaced by the ID of the object replacing them.
+                               Revoked IDs without a known replacement are dropped.
+        :type follow_revoked: bool
+        :param strict: If ``True``, raise on IDs which are malformed or unknown, instead of dropping them.
+        :type strict: bool
+        :return: The canonical IDs of known (or unchecked) objects.
+        :rtype: List[str]
+        :raises ValueError: If ``strict`` is ``True`` and an ID is malformed or unknown.
+        """
+        normalized: Dict[str, None] = {}
+        for attack_id in attack_ids:
+            canonical = normalize_id(attack_id)
+            if canonical is None:
+                if strict:
+                    raise ValueError(f"Invalid MITRE ATT&CK ID {attack_id!r}")
+                continue
+            kind = id_kind(canonical)
+            status = self._status.get(canonical)
+            if kind in self.kinds:
+                if status is None:
+                    if strict:
+                        raise ValueError(f"Unknown MITRE ATT&CK {kind} ID {canonical}")
+                    continue
+                if status == REVOKED and follow_revoked:
+                    canonical = self.replaced_by(canonical)
+                    if canonical is None:
+                        continue
+            normalized[canonical] = None
+        return list(normalized)
+
+    def __contains__(self, attack_id: object) -> bool:
+        return attack_id in self._status
+
+    def __len__(self) -> int:
+        return len(self._status)
+
+    @classmethod
+    def from_scrapers(cls, scrapers: Optional[Iterable[Type]] = None) -> "MITREAttackIDRegistry":
+        """
+        Build a registry from the list pages, i.e. ``get_list()`` of the scraper classes. The list pages
+        (or the snapshot, STIX bundle or memo answering them) only hold active objects, sub-techniques included.
+
+        :param scrapers: The scraper classes, by default every scraper class of the package.
+        :type scrapers: Optional[Iterable[Type]]
+        :return: The registry.
+        :rtype: MITREAttackIDRegistry
+        """
+        registry = cls()
+        for scraper in _default_scrapers() if scrapers is None else scrapers:
+            for attack_id in scraper._list_entries(scraper.get_list()):
+                registry.add(attack_id)
+        return registry
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Any, scrapers: Optional[Iterable[Type]] = None) -> "MITREAttackIDRegistry":
+        """
+        Build a registry from the list pages held by a snapshot, without installing the snapshot.
+
+        :param snapshot: An opened ``MITREAttackSnapshot``, or the path of a snapshot file.
+        :type snapshot: Union[MITREAttackSnapshot, str, os.PathLike]
+        :param scrapers: The scraper classes, by default every scraper class of the package.
+        :type scrapers: Optional[Iterable[Type]]
+        :return: The registry.
+        :rtype: MITREAttackIDRegistry
+        :raises ValueError: If the snapshot does not hold the list page of one of the scrapers.
+        """
+        from .snapshot import MITREAttackSnapshot
+        if not isinstance(snapshot, MITREAttackSnapshot):
+            snapshot = MITREAttackSnapshot(snapshot)
+        registry = cls()
+        for scraper in _default_scrapers() if scrapers is None else scrapers:
+            data = snapshot.get(scraper._list_url)
+            if data is None:
+                raise ValueError(f"The snapshot does not hold {scraper._list_url}")
+            for attack_id in scraper._list_entries(data):
+                registry.add(attack_id)
+        return registry
+
+    @classmethod
+    def from_stix_bundle(cls, bundle: Union[str, os.PathLike, Dict[str, Any]]) -> "MITREAttackIDRegistry":
+        """
+        Build a registry from a STIX bundle, with the deprecated and revoked objects
+        and the replacements given by its ``revoked-by`` relationships.
+
+        :param bundle: The path of a STIX bundle JSON file, or the parsed bundle.
+        :type bundle: Union[str, os.PathLike, Dict[str, Any]]
+        :return: The registry.
+        :rtype: MITREAttackIDRegistry
+        """
+        from ..stix.bundle import MITREAttackSTIXBundle
+        if not isinstance(bundle, dict):
+            with open(bundle, "r", encoding="utf-8") as file:
+                bundle = json.load(file)
+        attack_ids: Dict[str, str] = {}
+        statuses: Dict[str, str] = {}
+        revoked_by: Dict[str, str] = {}
+        for stix_object in bundle.get("objects", []):
+            if stix_object.get("type") == "relationship":
+                if stix_object.get("relationship_type") == "revoked-by":
+                    revoked_by[stix_object["source_ref"]] = stix_object["target_ref"]
+                continue
+            attack_id = MITREAttackSTIXBundle.attack_id(stix_object)
+            if not attack_id or id_kind(attack_id) is None:
+                continue
+            attack_ids[stix_object["id"]] = attack_id
+            if stix_object.get("revoked"):
+                statuses[attack_id] = REVOKED
+            elif stix_object.get("x_mitre_deprecated"):
+                # An ID may be reused by an active object, which then wins
+                statuses.setdefault(attack_id, DEPRECATED)
+            else:
+                statuses[attack_id] = ACTIVE
+
+        replacements = {attack_ids[source]: attack_ids[target] for source, target in revoked_by.items()
+                        if source in attack_ids and target in attack_ids}
+        registry = cls()
+        for attack_id, status in statuses.items():
+            registry.add(attack_id, status, replacements.get(attack_id))
+        return registry
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Save the registry as JSON, to be loaded with ``load()``.
+
+        :param path: Path of the file.
+        :type path: Union[str, os.PathLike]
+        """
+        path = os.fspath(path)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump({"version": REGISTRY_VERSION, "kinds": sorted(self.kinds),
+                       "status": self._status, "replaced_by": self._replaced_by}, file)
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> "MITREAttackIDRegistry":
+        """
+        Load a registry saved with ``save()``.
+
+        :param path: Path of the file.
+        :type path: Union[str, os.PathLike]
+        :return: The registry.
+        :rtype: MITREAttackIDRegistry
+        :raises ValueError: If the file was written by an unsupported version, or is not a valid registry.
+        """
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        if not isinstance(data, dict):
+            raise ValueError(f"Invalid ID registry file {path}: not a JSON object")
+        if data.get("version") != REGISTRY_VERSION:
+            raise ValueError(f"Unsupported ID registry version: {data.get('version')}")
+        kinds, statuses, replaced_by = data.get("kinds"), data.get("status"), data.get("replaced_by")
+        if (not isinstance(kinds, list) or not isinstance(statuses, dict) or not isinstance(replaced_by, dict)
+                or not all(isinstance(replacement, str) for replacement in replaced_by.values())):
+            raise ValueError(f"Invalid ID registry file {path}: expected the kinds, status and replaced_by of save()")
+        unknown = set(replaced_by) - set(statuses)
+        if unknown:
+            raise ValueError(f"Invalid ID registry file {path}: replacements of unknown IDs {', '.join(sorted(unknown))}")
+
+        # add() checks the format of every ID and status
+        registry = cls(kinds)
+        for attack_id, status in statuses.items():
+            registry.add(attack_id, status, replaced_by.get(attack_id))
+        return registry
+
+def _default_scrapers() -> List[Type]:
+    """
+    Get the scraper classes with a list page of IDs.
+    """
+    # Imported here, since the scraper classes themselves depend on this module
+    from ..techniques.enterprise import MITREAttackEnterpriseTechniques
+    from ..tactics.enterprise import MITREAttackEnterpriseTactics
+    from ..mitigations.enterprise import MITREAttackEnterpriseMitigations
+    from ..cti.groups import MITREAttackCTIGroups
+    from ..cti.software import MITREAttackCTISoftware
+    from ..cti.campaigns import MITREAttackCampaign
+    return [MITREAttackEnterpriseTechniques, MITREAttackEnterpriseTactics, MITREAttackEnterpriseMitigations,
+            MITREAttackCTIGroups, MITREAttackCTISoftware, MITREAttackCampaign]
+
+_id_registry: Optional[MITREAttackIDRegistry] = None
+_id_registry_lock = threading.Lock()
+
+def set_id_registry(registry: Union[None, str, os.PathLike, MITREAttackIDRegistry]) -> Optional[MITREAttackIDRegistry]:
+    """
+    Reject unknown and revoked IDs in ``get()``, ``aget()`` and ``get_many()`` before any network call.
+    Pass ``None`` to only check the format of the IDs again.
+
+    :param registry: A registry, the path of a registry saved with ``save()``, or ``None``.
+    :type registry: Union[None, str, os.PathLike, MITREAttackIDRegistry]
+    :return: The registry now in use, or ``None``.
+    :rtype: Optional[MITREAttackIDRegistry]
+    """
+    global _id_registry
+    if registry is not None and not isinstance(registry, MITREAttackIDRegistry):
+        registry = MITREAttackIDRegistry.load(registry)
+    with _id_registry_lock:
+        _id_registry = registry
+    return registry
+
+def get_id_registry() -> Optional[MITREAttackIDRegistry]:
+    """
+    Get the registry checking the IDs, if any.
+
+    :return: The registry in use, or ``None``.
+    :rtype: Optional[MITREAttackIDRegistry]
+    """
+    return _id_registry
@@ -0,0 +1,529 @@
+# MITREAttackScrapper/utils/instrumentation.py
+import time
+import logging
+import threading
+import contextvars
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+# The phases of a scraper call, in the order they happen
+PHASES = ("fetch", "decode", "parse", "extract")
+
+class Span:
+    """
+    A timed step of a scraper call: the call itself (e.g. ``MITREAttackCTIGroups.get``), or one of its phases.
+
+    - ``fetch``: the HTTP request of a page, up to its whole body (including retries and the response cache)
+    - ``decode``: the decoding of the body into text
+    - ``parse``: the construction of the parse tree (``BeautifulSoup``) of a page or a region of it
+    - ``extract``: the reading of the data out of the page, which contains the ``parse`` of the page
+
+    Spans are created by the scrapers, and handed to the consumers added with ``add_span_consumer()``
+    when they start and when they end. Spans only exist while a consumer is added.
+
+    :param name: The name of the span, ``<scraper class>.<method>`` for a call, or the name of the phase.
+    :type name: str
+    :param attributes: Labels of the span, e.g. ``scraper``, ``method``, ``id``, ``url``, ``status``, ``source``.
+    :type attributes: Dict[str, Any]
+    :param counters: Amounts counted during the span and its children, e.g. ``bytes`` downloaded, ``characters``
+                     parsed, ``rows`` read from tables and lists, ``cache_hits`` (in-memory results, snapshot,
+                     fresh or revalidated cached pages).
+    :type counters: Dict[str, int]
+    :param parent: The span this span was started in, or ``None`` for a call started outside of any span.
+    :type parent: Optional[Span]
+    :param phases: The time in seconds spent in each phase started within the span, excluding the phases within that
+                   phase (e.g. the ``extract`` time excludes the ``parse`` time). For a call, the rest of ``duration`` was
+                   spent in the call itself (validation, in-memory lookups, ...).
+    :type phases: Dict[str, float]
+    :param duration: The duration in seconds, once the span has ended.
+    :type duration: Optional[float]
+    :param error: The name of the exception that ended the span, or ``None``.
+    :type error: Optional[str]
+    """
+    __slots__ = ("name", "attributes", "counters", "parent", "phases",
+                 "start_time", "start_time_ns", "duration", "error", "_child_time", "_token")
+
+    def __init__(self, name: str, attributes: Dict[str, Any]) -> None:
+        self.name = name
+        self.attributes = attributes
+        self.counters: Dict[str, int] = {}
+        self.parent: Optional[Span] = None
+        self.phases: Dict[str, float] = {}
+        self.start_time = 0.0
+        self.start_time_ns = 0
+        self.duration: Optional[float] = None
+        self.error: Optional[str] = None
+        self._child_time = 0.0
+        self._token = None
+
+    @property
+    def end_time_ns(self) -> Optional[int]:
+        """
+        The wall-clock end time of the span in nanoseconds since the epoch, once the span has ended.
+        """
+        return None if self.duration is None else self.start_time_ns + int(self.duration * 1e9)
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Set an attribute of the span.
+        """
+        self.attributes[key] = value
+
+    def add(self, key: str, amount: int = 1) -> None:
+        """
+        Add to a counter of the span. Counters are added to the parent span when the span ends.
+        """
+        self.counters[key] = self.counters.get(key, 0) + amount
+
+    def _start(self) -> None:
+        self.parent = _current_span.get()
+        self.start_time_ns = time.time_ns()
+        self.start_time = time.perf_counter()
+        for on_start, _ in _consumers:
+            if on_start is not None:
+                on_start(self)
+
+    def _end(self, error: Optional[BaseException] = None) -> None:
+        self.duration = time.perf_counter() - self.start_time
+        if error is not None:
+            self.error = type(error).__name__
+        parent = self.parent
+        if parent is not None:
+            # Children of one span may end in several threads, e.g. the downloads of get_many()
+            with _rollup_lock:
+                parent._child_time += self.duration
+                for key, amount in self.counters.items():
+                    parent.counters[key] = parent.counters.get(key, 0) + amount
+                if self.name in PHASES:
+                    exclusive = self.duration - self._child_time
+                    ancestor = parent
+                    while ancestor is not None:
+                        ancestor.phases[self.name] = ancestor.phases.get(self.name, 0.0) + exclusive
+                        ancestor = ancestor.parent
+        for _, on_end in _consumers:
+            on_end(self)
+
+    def __enter__(self) -> "Span":
+        self._start()
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        _current_span.reset(self._token)
+        self._end(exc_value)
+
+    def __repr__(self) -> str:
+        duration = "running" if self.duration is None else f"{self.duration * 1000:.1f} ms"
+        return f"Span({self.name!r}, {duration}, attributes={self.attributes!r}, counters={self.counters!r})"
+
+class _NullSpan:
+    """
+    The span handed out while no consumer is added, doing nothing.
+    """
+    __slots__ = ()
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    def add(self, key: str, amount: int = 1) -> None:
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        pass
+
+NULL_SPAN = _NullSpan()
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar("mitre_attack_span", default=None)
+_rollup_lock = threading.Lock()
+
+# (on_start or None, on_end) of every consumer, replaced as a whole so that spans read it without locking
+_consumers: Tuple[Tuple[Optional[Callable[[Span], None]], Callable[[Span], None]], ...] = ()
+_consumer_objects: List[Any] = []
+_consumers_lock = threading.Lock()
+
+class SpanConsumer:
+    """
+    Base class of the consumers of spans. Subclasses override ``on_start()`` and/or ``on_end()``.
+    """
+
+    def on_start(self, span: Span) -> None:
+        """
+        Called when a span starts, in the thread (and task) running it.
+        """
+
+    def on_end(self, span: Span) -> None:
+        """
+        Called when a span ends, in the thread (and task) running it. Its ``duration`` is set.
+        """
+
+def add_span_consumer(consumer: Union[SpanConsumer, Callable[[Span], None]]) -> None:
+    """
+    Hand the spans of every scraper call to the given consumer, in addition to the consumers already added.
+
+    :param consumer: A ``SpanConsumer``, or a function called with each span when it ends.
+    :type consumer: Union[SpanConsumer, Callable[[Span], None]]
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.utils.instrumentation import add_span_consumer
+        from MITREAttackScrapper.cti.groups import MITREAttackCTIGroups
+
+        add_span_consumer(lambda span: span.parent is None and print(span.name, span.duration, span.phases))
+        MITREAttackCTIGroups.get("G0016")
+    """
+    global _consumers
+    if isinstance(consumer, SpanConsumer):
+        # Only call on_start() of the consumers overriding it
+        on_start = consumer.on_start if type(consumer).on_start is not SpanConsumer.on_start else None
+        hooks = (on_start, consumer.on_end)
+    else:
+        hooks = (None, consumer)
+    with _consumers_lock:
+        _consumer_objects.append(consumer)
+        _consumers = _consumers + (hooks,)
+
+def remove_span_consumer(consumer: Union[SpanConsumer, Callable[[Span], None]]) -> None:
+    """
+    Stop handing spans to the given consumer.
+
+    :param consumer: A consumer added with ``add_span_consumer()``.
+    :type consumer: Union[SpanConsumer, Callable[[Span], None]]
+    :raises ValueError: If the consumer was not added.
+    """
+    global _consumers
+    with _consumers_lock:
+        index = next((index for index, added in enumerate(_consumer_objects) if added is consumer), None)
+        if index is None:
+            raise ValueError(f"{consumer!r} is not a span consumer")
+        del _consumer_objects[index]
+        _consumers = _consumers[:index] + _consumers[index + 1:]
+
+def get_span_consumers() -> List[Union[SpanConsumer, Callable[[Span], None]]]:
+    """
+    Get the consumers added with ``add_span_consumer()``.
+
+    :return: The consumers, in the order they were added.
+    :rtype: List[Union[SpanConsumer, Callable[[Span], None]]]
+    """
+    with _consumers_lock:
+        return list(_consumer_objects)
+
+def span(name: str, **attributes: Any) -> Union[Span, _NullSpan]:
+    """
+    Get a span to run a scraper call in, as a context manager. Spans started while it runs are its children.
+
+    :param name: The name of the span, e.g. ``MITREAttackCTIGroups.get``.
+    :type name: str
+    :param attributes: The attributes of the span.
+    :type attributes: Any
+    :return: The span, or a span doing nothing if no consumer is added.
+    :rtype: Union[Span, _NullSpan]
+    """
+    if not _consumers:
+        return NULL_SPAN
+    return Span(name, attributes)
+
+def phase(name: str, **attributes: Any) -> Union[Span, _NullSpan]:
+    """
+    Get a span to run a phase of the current scraper call in, as a context manager.
+    Unlike ``span()``, it does nothing outside of a scraper call, e.g. for a direct ``fetch()``.
+
+    :param name: The name of the phase, one of ``PHASES``.
+    :type name: str
+    :param attributes: The attributes of the span.
+    :type attributes: Any
+    :return: The span, or a span doing nothing if no consumer is added or no span is running.
+    :rtype: Union[Span, _NullSpan]
+    """
+    if not _consumers or _current_span.get() is None:
+        return NULL_SPAN
+    return Span(name, attributes)
+
+def current_span() -> Union[Span, _NullSpan]:
+    """
+    Get the span running in the current thread (or task).
+
+    :return: The running span, or a span doing nothing if there is none.
+    :rtype: Union[Span, _NullSpan]
+    """
+    return _current_span.get() or NULL_SPAN
+
+def count(key: str, amount: int = 1) -> None:
+    """
+    Add to a counter of the span running in the current thread (or task), if any.
+
+    :param key: The counter, e.g. ``rows``.
+    :type key: str
+    :param amount: The amount to add.
+    :type amount: int
+    """
+    if _consumers:
+        running = _current_span.get()
+        if running is not None:
+            running.add(key, amount)
+
+def traced_iter(span: Union[Span, _NullSpan], iterator: Iterator[Any]) -> Iterator[Any]:
+    """
+    Run the given span over the whole iteration of an iterator, counting its items as ``rows``.
+    The span is only the current span while an item is produced, not while the caller handles it.
+
+    :param span: The span, e.g. from ``span()``.
+    :type span: Union[Span, _NullSpan]
+    :param iterator: The iterator, e.g. a generator streaming the rows of a list page.
+    :type iterator: Iterator[Any]
+    :return: An iterator of the same items.
+    :rtype: Iterator[Any]
+    """
+    if span is NULL_SPAN:
+        return iterator
+    return _traced_iter(span, iterator)
+
+def _traced_iter(span: Span, iterator: Iterator[Any]) -> Iterator[Any]:
+    span._start()
+    error = None
+    try:
+        while True:
+            token = _current_span.set(span)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                _current_span.reset(token)
+            span.add("rows")
+            yield item
+    except GeneratorExit:
+        # The caller stopped iterating early
+        raise
+    except BaseException as exception:
+        error = exception
+        raise
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+        span._end(error)
+
+def atraced_iter(span: Union[Span, _NullSpan], iterator: AsyncIterator[Any]) -> AsyncIterator[Any]:
+    """
+    Asynchronous counterpart of ``traced_iter()``.
+
+    :param span: The span, e.g. from ``span()``.
+    :type span: Union[Span, _NullSpan]
+    :param iterator: The asynchronous iterator.
+    :type iterator: AsyncIterator[Any]
+    :return: An asynchronous iterator of the same items.
+    :rtype: AsyncIterator[Any]
+    """
+    if span is NULL_SPAN:
+        return iterator
+    return _atraced_iter(span, iterator)
+
+async def _atraced_iter(span: Span, iterator: AsyncIterator[Any]) -> AsyncIterator[Any]:
+    span._start()
+    error = None
+    try:
+        while True:
+            token = _current_span.set(span)
+            try:
+                item = await iterator.__anext__()
+            except StopAsyncIteration:
+                return
+            finally:
+                _current_span.reset(token)
+            span.add("rows")
+            yield item
+    except GeneratorExit:
+        raise
+    except BaseException as exception:
+        error = exception
+        raise
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+        span._end(error)
+
+def _format(span: Span) -> str:
+    """
+    Describe a span on one line, e.g. ``MITREAttackCTIGroups.get G0016 182.3 ms (fetch 120.1 ms, ...) bytes=250112``.
+    """
+    parts = [span.name]
+    if span.attributes.get("id") is not None:
+        parts.append(str(span.attributes["id"]))
+    parts.append(f"{span.duration * 1000:.1f} ms")
+    phases = [f"{name} {span.phases[name] * 1000:.1f} ms" for name in PHASES if name in span.phases]
+    if phases:
+        parts.append(f"({', '.join(phases)})")
+    parts.extend(f"{key}={amount}" for key, amount in span.counters.items())
+    if span.attributes.get("source") is not None:
+        parts.append(f"source={span.attributes['source']}")
+    if span.error is not None:
+        parts.append(f"error={span.error}")
+    return " ".join(parts)
+
+class LoggingSpanConsumer(SpanConsumer):
+    """
+    Log every scraper call, with the time spent in each phase and its counters, e.g.
+    ``MITREAttackCTIGroups.get G0016 182.3 ms (fetch 120.1 ms, decode 1.2 ms, parse 40.0 ms, extract 21.0 ms) bytes=250112 rows=341``.
+
+    :param logger: The logger to log to. Defaults to the ``MITREAttackScrapper`` logger.
+    :type logger: Optional[logging.Logger]
+    :param level: The level of the records.
+    :type level: int
+    :param phases: Whether to also log every phase span, not only the calls.
+    :type phases: bool
+
+    :Example:
+
+    .. code-block:: python
+
+        import logging
+        from MITREAttackScrapper.utils.instrumentation import LoggingSpanConsumer, add_span_consumer
+
+        logging.basicConfig(level=logging.INFO)
+        add_span_consumer(LoggingSpanConsumer())
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.INFO, phases: bool = False) -> None:
+        self.logger = logger or logging.getLogger("MITREAttackScrapper")
+        self.level = level
+        self.phases = phases
+
+    def on_end(self, span: Span) -> None:
+        if span.name in PHASES and not self.phases:
+            return
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, "%s", _format(span))
+
+class SpanCollector(SpanConsumer):
+    """
+    Keep every ended span in memory, e.g. to check in tests which phases a call went through.
+    As a context manager, the collector is added on entry and removed on exit.
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.utils.instrumentation import SpanCollector
+        from MITREAttackScrapper.cti.groups import MITREAttackCTIGroups
+
+        with SpanCollector() as collector:
+            MITREAttackCTIGroups.get("G0016")
+        call = collector.calls()[0]
+        print(call.duration, call.phases, call.counters)
+    """
+
+    def __init__(self) -> None:
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def on_end(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def calls(self) -> List[Span]:
+        """
+        Get the ended call spans (not the phases), in the order they ended.
+
+        :return: The call spans.
+        :rtype: List[Span]
+        """
+        with self._lock:
+            return [span for span in self.spans if span.name not in PHASES]
+
+    def named(self, name: str) -> List[Span]:
+        """
+        Get the ended spans of the given name, e.g. ``fetch``, in the order they ended.
+
+        :param name: The name of the spans.
+        :type name: str
+        :return: The spans.
+        :rtype: List[Span]
+        """
+        with self._lock:
+            return [span for span in self.spans if span.name == name]
+
+    def clear(self) -> None:
+        """
+        Drop the spans collected so far.
+        """
+        with self._lock:
+            self.spans.clear()
+
+    def __enter__(self) -> "SpanCollector":
+        add_span_consumer(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        remove_span_consumer(self)
+
+def _import_opentelemetry():
+    """
+    Import the OpenTelemetry API.
+
+    :raises ImportError: If ``opentelemetry-api`` is not installed.
+    """
+    try:
+        from opentelemetry import trace
+    except ImportError as error:
+        raise ImportError("The OpenTelemetry adapter requires the 'opentelemetry-api' package. "
+                          "Install it with `pip install MITREAttackScrapper[opentelemetry]`") from error
+    return trace
+
+class OpenTelemetrySpanConsumer(SpanConsumer):
+    """
+    Export every span as an OpenTelemetry span, with the same parents. Calls started outside of any span become
+    children of the current OpenTelemetry span of the caller, if any. Attributes, counters and phase durations
+    are exported as ``mitre_attack.*`` attributes, and the spans ended by an exception get an error status.
+
+    :param tracer: The OpenTelemetry tracer. Defaults to the tracer of the global tracer provider.
+    :type tracer: Optional[opentelemetry.trace.Tracer]
+    :raises ImportError: If ``opentelemetry-api`` is not installed.
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.utils.instrumentation import OpenTelemetrySpanConsumer, add_span_consumer
+
+        add_span_consumer(OpenTelemetrySpanConsumer())
+    """
+
+    def __init__(self, tracer: Optional[Any] = None) -> None:
+        self._trace = _import_opentelemetry()
+        self.tracer = tracer or self._trace.get_tracer("MITREAttackScrapper")
+        self._spans: Dict[Span, Any] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _attributes(span: Span) -> Dict[str, Any]:
+        # OpenTelemetry only accepts strings, booleans and numbers
+        attributes = {f"mitre_attack.{key}": value for key, value in span.attributes.items()
+                      if isinstance(value, (str, bool, int, float))}
+        attributes.update((f"mitre_attack.{key}", amount) for key, amount in span.counters.items())
+        attributes.update((f"mitre_attack.phase.{name}_ms", seconds * 1000) for name, seconds in span.phases.items())
+        return attributes
+
+    def on_start(self, span: Span) -> None:
+        with self._lock:
+            parent = self._spans.get(span.parent) if span.parent is not None else None
+        context = self._trace.set_span_in_context(parent) if parent is not None else None
+        exported = self.tracer.start_span(span.name, context=context, start_time=span.start_time_ns,
+                                          attributes=self._attributes(span))
+        with self._lock:
+            self._spans[span] = exported
+
+    def on_end(self, span: Span) -> None:
+        with self._lock:
+            exported = self._spans.pop(span, None)
+        if exported is None:
+            return
+        exported.set_attributes(self._attributes(span))
+        if span.error is not None:
+            exported.set_status(self._trace.Status(self._trace.StatusCode.ERROR, span.error))
+        exported.end(end_time=span.end_time_ns)
@@ -0,0 +1,141 @@
+# MITREAttackScrapper/utils/memo.py
+import time
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple, Optional, Tuple
+
+class MemoStats(NamedTuple):
+    """
+    Counters of a ``MemoCache``.
+
+    :param hits: Number of lookups answered from the cache.
+    :type hits: int
+    :param misses: Number of lookups not found in the cache (or expired).
+    :type misses: int
+    :param evictions: Number of entries dropped to respect ``max_entries`` or ``max_bytes``.
+    :type evictions: int
+    :param entries: Number of entries currently cached.
+    :type entries: int
+    :param size: Total size in bytes of the cached entries.
+    :type size: int
+    """
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+
+class MemoCache:
+    """
+    A bounded, thread-safe, in-memory LRU cache of parsed results.
+
+    Values are stored pickled: the size of each entry is known exactly for ``max_bytes``,
+    and every lookup returns a fresh copy, so callers can modify the returned dictionaries freely.
+
+    :param max_entries: Maximum number of cached entries. ``0`` disables the cache.
+    :type max_entries: int
+    :param max_bytes: Maximum total size in bytes of the cached entries.
+    :type max_bytes: int
+    :param ttl: Seconds an entry stays valid, or ``None`` to keep entries until they are evicted.
+    :type ttl: Optional[float]
+    """
+
+    def __init__(self, max_entries: int = 0, max_bytes: int = 64 * 1024 * 1024, ttl: Optional[float] = None) -> None:
+        self.max_entries: int = max_entries
+        self.max_bytes: int = max_bytes
+        self.ttl: Optional[float] = ttl
+
+        self._entries: "OrderedDict[Hashable, Tuple[bytes, float]]" = OrderedDict()
+        self._size: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether the cache stores anything at all.
+        """
+        return self.max_entries > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a copy of the cached value of the given key, marking it as recently used.
+
+        :param key: The key of the value.
+        :type key: Hashable
+        :return: The cached value, or ``None`` if it is not cached or has expired.
+        :rtype: Optional[Any]
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[1] >= self.ttl:
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return pickle.loads(entry[0])
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Cache the given value, evicting the least recently used entries if the cache grows too large.
+
+        :param key: The key of the value.
+        :type key: Hashable
+        :param value: The value to cache.
+        :type value: Any
+        """
+        if not self.enabled:
+            return
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (data, time.monotonic())
+            self._size += len(data)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Drop the cached value of the given key, or every cached value if no key is given.
+
+        :param key: The key of the value to drop.
+        :type key: Optional[Hashable]
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._size = 0
+            elif key in self._entries:
+                self._remove(key)
+
+    def stats(self) -> MemoStats:
+        """
+        Get the hit/miss/eviction counters and the current occupancy of the cache.
+
+        :return: The counters of the cache.
+        :rtype: MemoStats
+        """
+        with self._lock:
+            return MemoStats(self._hits, self._misses, self._evictions, len(self._entries), self._size)
+
+    def _remove(self, key: Hashable) -> None:
+        """
+        Remove an entry. The lock must be held.
+        """
+        data, _ = self._entries.pop(key)
+        self._size -= len(data)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,7 +1,52 @@
-import re
+import inspect
 from functools import wraps
 from typing import Callable
 
+from .id_registry import ID_FORMATS, ID_PATTERNS, get_id_registry
+
+def _validated(function: Callable, kind: str) -> Callable:
+    """
+    Wrap a function so the IDs of the given kind passed to it are checked: every string positional argument,
+    and every keyword argument named like ``technique_id`` for techniques. The format is checked with
+    the compiled pattern of the kind and, if an ID registry is installed, the ID must also exist.
+    A coroutine function is checked when its coroutine is awaited, like any other error it raises.
+    """
+    pattern = ID_PATTERNS[kind]
+    suffix = f"{kind}_id"
+    message = f"Invalid MITRE ATT&CK {kind} ID, should be in the format of {ID_FORMATS[kind]}"
+
+    def check(value) -> None:
+        if not isinstance(value, str) or not pattern.fullmatch(value):
+            raise ValueError(message)
+        registry = get_id_registry()
+        if registry is not None:
+            registry.check_known(value, kind)
+
+    def check_arguments(args, kwargs) -> None:
+        # Iterate through all arguments and keyword arguments
+        for arg in args:
+            if isinstance(arg, str):
+                check(arg)
+
+        for key, value in kwargs.items():
+            if isinstance(key, str) and key.endswith(suffix):
+                check(value)
+
+    if inspect.iscoroutinefunction(function):
+        @wraps(function)
+        async def async_wrapper(*args, **kwargs):
+            check_arguments(args, kwargs)
+            return await function(*args, **kwargs)
+
+        return async_wrapper
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        check_arguments(args, kwargs)
+        return function(*args, **kwargs)
+
+    return wrapper
+
 def validate_mitre_technique_id(function: Callable) -> Callable:
     """
     A wrapper function to validate the MITRE ATT&CK technique ID.
@@ -22,24 +67,10 @@ def validate_mitre_technique_id(function: Callable) -> Callable:
     :type function: Callable
     :return: The wrapped function that requires the MITRE ATT&CK technique ID with valid format.
     :rtype: Callable
-    :raises ValueError: If the MITRE ATT&CK technique ID is not in the valid format.
+    :raises ValueError: If the MITRE ATT&CK technique ID is not in the valid format,
+                        or unknown or revoked according to the installed ID registry (see ``set_id_registry()``).
     """
-    @wraps(function)
-    def wrapper(*args, **kwargs):
-        pattern = r"^T\d{4}(\.\d{3})?$"
-        # Iterate through all arguments and keyword arguments
-        for arg in args:
-            if isinstance(arg, str) and not re.match(pattern, arg):
-                raise ValueError("Invalid MITRE ATT&CK technique ID, should be in the format of TXXXX[.YYY]")
-        
-        for key, value in kwargs.items():
-            if isinstance(key, str) and key.endswith("technique_id"):
-                if not re.match(pattern, value):
-                    raise ValueError("Invalid MITRE ATT&CK technique ID, should be in the format of TXXXX[.YYY]")
-        
-        return function(*args, **kwargs)
-    
-    return wrapper
+    return _validated(function, "technique")
 
 def validate_mitre_tactic_id(function: Callable) -> Callable:
     """
@@ -59,24 +90,10 @@ def validate_mitre_tactic_id(function: Callable) -> Callable:
     :type function: Callable
     :return: The wrapped function that requires the MITRE ATT&CK tactic ID with valid format.
     :rtype: Callable
-    :raises ValueError: If the MITRE ATT&CK tactic ID is not in the valid format.
+    :raises ValueError: If the MITRE ATT&CK tactic ID is not in the valid format,
+                        or unknown or revoked according to the installed ID registry (see ``set_id_registry()``).
     """
-    @wraps(function)
-    def wrapper(*args, **kwargs):
-        pattern = r"^TA\d{4}$"
-        # Iterate through all arguments and keyword arguments
-        for arg in args:
-            if isinstance(arg, str) and not re.match(pattern, arg):
-                raise ValueError("Invalid MITRE ATT&CK tactic ID, should be in the format of TAXXXX")
-        
-        for key, value in kwargs.items():
-            if isinstance(key, str) and key.endswith("tactic_id"):
-                if not re.match(pattern, value):
-                    raise ValueError("Invalid MITRE ATT&CK tactic ID, should be in the format of TAXXXX")
-        
-        return function(*args, **kwargs)
-    
-    return wrapper
+    return _validated(function, "tactic")
 
 def validate_mitre_mitigation_id(function: Callable) -> Callable:
     """
@@ -96,24 +113,10 @@ def validate_mitre_mitigation_id(function: Callable) -> Callable:
     :type function: Callable
     :return: The wrapped function that requires the MITRE ATT&CK mitigation ID with valid format.
     :rtype: Callable
-    :raises ValueError: If the MITRE ATT&CK mitigation ID is not in the valid format.
+    :raises ValueError: If the MITRE ATT&CK mitigation ID is not in the valid format,
+                        or unknown or revoked according to the installed ID registry (see ``set_id_registry()``).
     """
-    @wraps(function)
-    def wrapper(*args, **kwargs):
-        pattern = r"^M\d{4}$"
-        # Iterate through all arguments and keyword arguments
-        for arg in args:
-            if isinstance(arg, str) and not re.match(pattern, arg):
-                raise ValueError("Invalid MITRE ATT&CK mitigation ID, should be in the format of MXXXX")
-        
-        for key, value in kwargs.items():
-            if isinstance(key, str) and key.endswith("mitigation_id"):
-                if not re.match(pattern, value):
-                    raise ValueError("Invalid MITRE ATT&CK mitigation ID, should be in the format of MXXXX")
-        
-        return function(*args, **kwargs)
-    
-    return wrapper
+    return _validated(function, "mitigation")
 
 def validate_mitre_group_id(function: Callable) -> Callable:
     """
@@ -133,24 +136,10 @@ def validate_mitre_group_id(function: Callable) -> Callable:
     :type function: Callable
     :return: The wrapped function that requires the MITRE ATT&CK group ID with valid format.
     :rtype: Callable
-    :raises ValueError: If the MITRE ATT&CK group ID is not in the valid format.
+    :raises ValueError: If the MITRE ATT&CK group ID is not in the valid format,
+                        or unknown or revoked according to the installed ID registry (see ``set_id_registry()``).
     """
-    @wraps(function)
-    def wrapper(*args, **kwargs):
-        pattern = r"^G\d{4}$"
-        # Iterate through all arguments and keyword arguments
-        for arg in args:
-            if isinstance(arg, str) and not re.match(pattern, arg):
-                raise ValueError("Invalid MITRE ATT&CK group ID, should be in the format of GXXXX")
-        
-        for key, value in kwargs.items():
-            if isinstance(key, str) and key.endswith("group_id"):
-                if not re.match(pattern, value):
-                    raise ValueError("Invalid MITRE ATT&CK group ID, should be in the format of GXXXX")
-        
-        return function(*args, **kwargs)
-    
-    return wrapper
+    return _validated(function, "group")
 
 def validate_mitre_software_id(function: Callable) -> Callable:
     """
@@ -170,24 +159,10 @@ def validate_mitre_software_id(function: Callable) -> Callable:
     :type function: Callable
     :return: The wrapped function that requires the MITRE ATT&CK software ID with valid format.
     :rtype: Callable
-    :raises ValueError: If the MITRE ATT&CK software ID is not in the valid format.
+    :raises ValueError: If the MITRE ATT&CK software ID is not in the valid format,
+                        or unknown or revoked according to the installed ID registry (see ``set_id_registry()``).
     """
-    @wraps(function)
-    def wrapper(*args, **kwargs):
-        pattern = r"^S\d{4}$"
-        # Iterate through all arguments and keyword arguments
-        for arg in args:
-            if isinstance(arg, str) and not re.match(pattern, arg):
-                raise ValueError("Invalid MITRE ATT&CK software ID, should be in the format of SXXXX")
-        
-        for key, value in kwargs.items():
-            if isinstance(key, str) and key.endswith("software_id"):
-                if not re.match(pattern, value):
-                    raise ValueError("Invalid MITRE ATT&CK software ID, should be in the format of SXXXX")
-        
-        return function(*args, **kwargs)
-    
-    return wrapper
+    return _validated(function, "software")
 
 def validate_mitre_campaign_id(function: Callable) -> Callable:
     """
@@ -207,22 +182,7 @@ def validate_mitre_campaign_id(function: Callable) -> Callable:
     :type function: Callable
     :return: The wrapped function that requires the MITRE ATT&CK campaign ID with valid format.
     :rtype: Callable
-    :raises ValueError: If the MITRE ATT&CK campaign ID is not in the valid format.
+    :raises ValueError: If the MITRE ATT&CK campaign ID is not in the valid format,
+                        or unknown or revoked according to the installed ID registry (see ``set_id_registry()``).
     """
-
-    @wraps(function)
-    def wrapper(*args, **kwargs):
-        pattern = r"^C\d{4}$"
-        # Iterate through all arguments and keyword arguments
-        for arg in args:
-            if isinstance(arg, str) and not re.match(pattern, arg):
-                raise ValueError("Invalid MITRE ATT&CK campaign ID, should be in the format of CXXXX")
-        
-        for key, value in kwargs.items():
-            if isinstance(key, str) and key.endswith("campaign_id"):
-                if not re.match(pattern, value):
-                    raise ValueError("Invalid MITRE ATT&CK campaign ID, should be in the format of CXXXX")
-        
-        return function(*args, **kwargs)
-    
-    return wrapper
\ No newline at end of file
+    return _validated(function, "campaign")
@@ -0,0 +1,323 @@
+# MITREAttackScrapper/utils/rate_limit.py
+import time
+import asyncio
+import threading
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Deque, List, NamedTuple, Optional, Tuple
+
+# Status codes with which attack.mitre.org (and the CDN in front of it) asks clients to slow down
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+class RateLimiterStats(NamedTuple):
+    """
+    A snapshot of the state of a ``MITREAttackRateLimiter``.
+
+    :param concurrency: The current limit of requests in flight.
+    :type concurrency: int
+    :param in_flight: The number of requests in flight.
+    :type in_flight: int
+    :param throughput: Responses per second over the last ``window`` seconds.
+    :type throughput: float
+    :param requests: Number of responses received, throttled ones included.
+    :type requests: int
+    :param throttled: Number of ``429``/``503`` responses received.
+    :type throttled: int
+    :param paused_for: Seconds left before requests are sent again, after a ``Retry-After``.
+    :type paused_for: float
+    """
+    concurrency: int
+    in_flight: int
+    throughput: float
+    requests: int
+    throttled: int
+    paused_for: float
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header, given either as seconds or as an HTTP date.
+
+    :param value: The value of the header, if any.
+    :type value: Optional[str]
+    :param now: The current time, as returned by ``time.time()``.
+    :type now: Optional[float]
+    :return: The number of seconds to wait, or ``None`` if the header is missing or invalid.
+    :rtype: Optional[float]
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - (time.time() if now is None else now))
+
+class MITREAttackRateLimiter:
+    """
+    A rate limiter and concurrency controller for the requests of the shared HTTP client.
+
+    Requests are paced by a token bucket (``rate`` requests per second, in bursts of up to ``burst``), and the number
+    of requests in flight is bounded by a limit adjusted with AIMD (additive increase, multiplicative decrease):
+    each successful response raises the limit by ``1 / limit`` (i.e. by one per round of requests), up to
+    ``max_concurrency``, and a throttled response (``429 Too Many Requests`` or ``503 Service Unavailable``) multiplies it
+    by ``decrease``, down to ``min_concurrency``. Only responses to requests sent after the previous decrease can
+    decrease it again, so a burst of throttled responses to concurrent requests counts once.
+    A throttled response also pauses every request for its ``Retry-After`` (or ``default_retry_after`` seconds),
+    and the request is then sent again, up to ``max_retries`` times, so a bulk crawl slows down instead of failing.
+    Under a deadline (``deadline()`` or the one of a ``RetryPolicy``), a request is not delayed past it: the last
+    throttled response is returned, or ``httpx.TimeoutException`` raised.
+
+    The limiter is thread-safe and can be shared by threads and event loops.
+
+    :param rate: Maximum requests per second, or ``None`` to only bound the concurrency.
+    :type rate: Optional[float]
+    :param burst: Number of requests that can be sent at once after an idle period.
+    :type burst: int
+    :param initial_concurrency: Initial limit of requests in flight.
+    :type initial_concurrency: int
+    :param min_concurrency: Lowest limit of requests in flight.
+    :type min_concurrency: int
+    :param max_concurrency: Highest limit of requests in flight.
+    :type max_concurrency: int
+    :param decrease: Factor applied to the limit on a throttled response.
+    :type decrease: float
+    :param default_retry_after: Seconds to pause after a throttled response without ``Retry-After``.
+    :type default_retry_after: float
+    :param max_retry_after: Upper bound of the pause, whatever the ``Retry-After`` asks for.
+    :type max_retry_after: float
+    :param max_retries: Number of times a throttled request is sent again before its response is returned as is.
+    :type max_retries: int
+    :param window: Seconds over which the throughput is measured.
+    :type window: float
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.utils.http_client import configure_http_client
+        from MITREAttackScrapper.utils.rate_limit import MITREAttackRateLimiter
+        from MITREAttackScrapper.cti.software import MITREAttackCTISoftware
+
+        limiter = MITREAttackRateLimiter(rate=20, max_concurrency=32)
+        configure_http_client(max_connections=32, rate_limiter=limiter)
+        ids = [software["id"] for software in MITREAttackCTISoftware.get_list()]
+        for result in MITREAttackCTISoftware.get_many(ids, max_workers=32):
+            ...
+        print(limiter.stats())    # RateLimiterStats(concurrency=..., throughput=..., throttled=...)
+    """
+
+    def __init__(self,
+                 rate: Optional[float] = None,
+                 burst: int = 10,
+                 initial_concurrency: int = 4,
+                 min_concurrency: int = 1,
+                 max_concurrency: int = 64,
+                 decrease: float = 0.5,
+                 default_retry_after: float = 1.0,
+                 max_retry_after: float = 120.0,
+                 max_retries: int = 8,
+                 window: float = 10.0) -> None:
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        if not 1 <= min_concurrency <= initial_concurrency <= max_concurrency:
+            raise ValueError("Expected 1 <= min_concurrency <= initial_concurrency <= max_concurrency")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        self.rate = rate
+        self.burst = burst
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.decrease = decrease
+        self.default_retry_after = default_retry_after
+        self.max_retry_after = max_retry_after
+        self.max_retries = max_retries
+        self.window = window
+
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._limit = float(initial_concurrency)
+        self._in_flight = 0
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._completions: Deque[float] = deque()
+        self._requests = 0
+        self._throttled = 0
+
+    @property
+    def concurrency(self) -> int:
+        """
+        The current limit of requests in flight.
+        """
+        return int(self._limit)
+
+    @property
+    def throughput(self) -> float:
+        """
+        Responses per second over the last ``window`` seconds.
+        """
+        with self._lock:
+            return self._throughput(time.monotonic())
+
+    def stats(self) -> RateLimiterStats:
+        """
+        Get the current concurrency, throughput and counters.
+
+        :return: A snapshot of the state of the limiter.
+        :rtype: RateLimiterStats
+        """
+        with self._lock:
+            now = time.monotonic()
+            return RateLimiterStats(int(self._limit), self._in_flight, self._throughput(now),
+                                    self._requests, self._throttled, max(0.0, self._paused_until - now))
+
+    def _throughput(self, now: float) -> float:
+        while self._completions and self._completions[0] < now - self.window:
+            self._completions.popleft()
+        return len(self._completions) / self.window
+
+    def _unreserve(self) -> None:
+        """
+        Give back the slot and the token taken by ``_reserve()``, for a request that will not be sent.
+        Must be called with the lock held.
+        """
+        self._in_flight -= 1
+        if self.rate is not None:
+            self._tokens += 1.0
+        self._condition.notify_all()
+
+    def _reserve(self) -> float:
+        """
+        Take a token from the bucket (possibly ahead of time), and get the seconds to wait before sending.
+        Must be called with the lock held.
+        """
+        now = time.monotonic()
+        wait = max(0.0, self._paused_until - now)
+        if self.rate is not None:
+            self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens / self.rate)
+        return wait
+
+    def acquire(self, deadline: Optional[float] = None) -> float:
+        """
+        Wait for a free slot and for the token bucket, blocking the calling thread.
+        Every ``acquire()`` must be followed by a ``release()``.
+
+        :param deadline: A ``time.monotonic()`` value by which the request must be sent, or ``None`` to wait as long as needed.
+        :type deadline: Optional[float]
+        :return: A permit to pass to ``release()``.
+        :rtype: float
+        :raises TimeoutError: If the request could not be sent before ``deadline``. No slot is taken in that case.
+        """
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("No request slot was free before the deadline")
+                self._condition.wait(remaining)
+            self._in_flight += 1
+            wait = self._reserve()
+            if deadline is not None and time.monotonic() + wait >= deadline:
+                self._unreserve()
+                raise TimeoutError(f"The rate limit delays the request by {wait:.2f} s, past the deadline")
+        if wait > 0:
+            time.sleep(wait)
+        return time.monotonic()
+
+    async def aacquire(self, deadline: Optional[float] = None) -> float:
+        """
+        Asynchronous counterpart of ``acquire()``.
+
+        :param deadline: A ``time.monotonic()`` value by which the request must be sent, or ``None`` to wait as long as needed.
+        :type deadline: Optional[float]
+        :return: A permit to pass to ``release()``.
+        :rtype: float
+        :raises TimeoutError: If the request could not be sent before ``deadline``. No slot is taken in that case.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._in_flight < int(self._limit):
+                    self._in_flight += 1
+                    wait = self._reserve()
+                    if deadline is not None and time.monotonic() + wait >= deadline:
+                        self._unreserve()
+                        raise TimeoutError(f"The rate limit delays the request by {wait:.2f} s, past the deadline")
+                    break
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            if deadline is None:
+                await waiter
+                continue
+            try:
+                await asyncio.wait_for(waiter, max(0.0, deadline - time.monotonic()))
+            except asyncio.TimeoutError:
+                raise TimeoutError("No request slot was free before the deadline") from None
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except BaseException:
+                self.release(time.monotonic())
+                raise
+        return time.monotonic()
+
+    def release(self, permit: float, status_code: Optional[int] = None, retry_after: Optional[str] = None) -> None:
+        """
+        Free the slot taken by ``acquire()``, and adapt the limits to the response.
+
+        :param permit: The permit returned by ``acquire()``.
+        :type permit: float
+        :param status_code: The status code of the response, or ``None`` if the request failed without one.
+        :type status_code: Optional[int]
+        :param retry_after: The ``Retry-After`` header of the response, if any.
+        :type retry_after: Optional[str]
+        """
+        with self._condition:
+            self._in_flight -= 1
+            now = time.monotonic()
+            if status_code in THROTTLE_STATUS_CODES:
+                self._requests += 1
+                self._throttled += 1
+                pause = parse_retry_after(retry_after)
+                pause = min(self.max_retry_after, self.default_retry_after if pause is None else pause)
+                self._paused_until = max(self._paused_until, now + pause)
+                if permit >= self._last_decrease:
+                    self._limit = max(float(self.min_concurrency), self._limit * self.decrease)
+                    self._last_decrease = now
+            elif status_code is not None:
+                self._requests += 1
+                self._completions.append(now)
+                self._throughput(now)    # drops the completions older than the window
+                self._limit = min(float(self.max_concurrency), self._limit + 1.0 / self._limit)
+            self._condition.notify_all()
+            waiters, self._async_waiters = self._async_waiters, []
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(_wake, waiter)
+
+    def should_retry(self, response_status_code: int, attempt: int) -> bool:
+        """
+        Whether a request should be sent again after the given response.
+
+        :param response_status_code: The status code of the response.
+        :type response_status_code: int
+        :param attempt: The number of times the request was already sent.
+        :type attempt: int
+        :return: ``True`` if the response was throttled and the request has retries left.
+        :rtype: bool
+        """
+        return response_status_code in THROTTLE_STATUS_CODES and attempt <= self.max_retries
+
+def _wake(waiter: asyncio.Future) -> None:
+    """
+    Wake up a coroutine waiting for a free slot, unless it was cancelled meanwhile.
+    """
+    if not waiter.done():
+        waiter.set_result(None)
@@ -0,0 +1,275 @@
+# MITREAttackScrapper/utils/records.py
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, FrozenSet, Iterator, List, Type, Union
+
+class Record(Mapping):
+    """
+    A compact, typed record of scraped MITRE ATT&CK data.
+
+    Records hold the same data as the dictionaries returned by ``get_list()`` and ``get()``, in attributes backed by
+    ``__slots__`` instead of a dictionary per object, with the repeated short strings (IDs, names, URLs, dates,
+    platforms, ...) interned so every occurrence shares one string. A record is also a read-only mapping,
+    so code written for the dictionaries keeps working: ``record["name"]``, ``record.get("references", {})``,
+    ``"procedures" in record`` and iteration behave like on the dictionary it was built from.
+
+    Keys missing from the dictionary are left unset (and missing from the mapping), and keys a record type does not
+    know are kept aside, so ``to_dict()`` gives back a dictionary equal to the original one.
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.techniques.enterprise import MITREAttackEnterpriseTechniques
+
+        technique = MITREAttackEnterpriseTechniques.get_record("T1059.001")
+        print(technique.name, [tactic.name for tactic in technique.tactics])
+        print(technique["references"][1]["url"])    # the same lookups as on get()
+        data = technique.to_dict()                  # a plain dictionary again, e.g. for json.dumps()
+    """
+
+    __slots__ = ("_extra",)
+
+    # Fields holding free text, which is not worth interning
+    _free_text: FrozenSet[str] = frozenset({"description", "use", "text", "detects"})
+
+    # Fields holding a list (or a numbered dictionary) of nested records, mapped to the record type of their items
+    _nested: Dict[str, Type["Record"]] = {}
+
+    def __init__(self, **fields: Any) -> None:
+        for key, value in fields.items():
+            self._set(key, value)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Record":
+        """
+        Build a record from a dictionary returned by ``get_list()`` or ``get()``.
+
+        :param data: The dictionary.
+        :type data: Dict[str, Any]
+        :return: The record.
+        :rtype: Record
+        """
+        record = cls.__new__(cls)
+        for key, value in data.items():
+            record._set(key, value)
+        return record
+
+    def _set(self, key: str, value: Any) -> None:
+        """
+        Convert a value of the dictionary and store it in its slot, or aside if the record type has no such field.
+        """
+        record_type = self._nested.get(key)
+        if record_type is not None:
+            if isinstance(value, list):
+                value = [record_type.from_dict(item) if isinstance(item, dict) else item for item in value]
+            elif isinstance(value, dict):
+                value = {number: record_type.from_dict(item) if isinstance(item, dict) else item for number, item in value.items()}
+        elif key not in self._free_text:
+            if isinstance(value, str):
+                value = sys.intern(value)
+            elif isinstance(value, list):
+                value = [sys.intern(item) if isinstance(item, str) else item for item in value]
+
+        if key in self.__slots__:
+            object.__setattr__(self, key, value)
+        else:
+            try:
+                extra = self._extra
+            except AttributeError:
+                extra = {}
+                object.__setattr__(self, "_extra", extra)
+            extra[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the record, and its nested records, back to plain dictionaries.
+
+        :return: A dictionary equal to the one the record was built from.
+        :rtype: Dict[str, Any]
+        """
+        return {key: _plain(value) for key, value in self.items()}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__slots__:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        try:
+            return self._extra[key]
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.__slots__:
+            if hasattr(self, key):
+                yield key
+        if hasattr(self, "_extra"):
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{key}={value!r}' for key, value in self.items())})"
+
+def _plain(value: Any) -> Any:
+    """
+    Convert records nested in a value back to plain dictionaries.
+    """
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    return value
+
+class Reference(Record):
+    """
+    A reference of a MITRE ATT&CK object, i.e. an item of ``references``.
+    """
+    __slots__ = ("text", "url")
+
+class Link(Record):
+    """
+    A named link to another page, e.g. an item of ``tactics`` or ``sub_techniques`` of a technique.
+    """
+    __slots__ = ("name", "url")
+
+class Summary(Record):
+    """
+    A short description of another MITRE ATT&CK object, e.g. an item of ``procedures`` or ``mitigations`` of a technique,
+    of ``techniques`` of a tactic, or of ``groups`` and ``software`` of a campaign.
+    """
+    __slots__ = ("id", "name", "description", "url")
+
+class Detection(Record):
+    """
+    An item of ``detection`` of a technique.
+    """
+    __slots__ = ("id", "data_source", "data_component", "detects")
+
+class TechniqueUse(Record):
+    """
+    An item of ``techniques_used`` of a group, software or campaign.
+    """
+    __slots__ = ("domain", "main_technique_id", "main_technique_name", "main_technique_url",
+                 "sub_technique_id", "sub_technique_name", "sub_technique_url", "use")
+
+class AddressedTechnique(Record):
+    """
+    An item of ``techniques_addressed_by_mitigation`` of a mitigation.
+    """
+    __slots__ = ("domain", "id", "name", "use", "url")
+
+class AssociatedGroup(Record):
+    """
+    An item of ``associated_group_descriptions`` of a group.
+    """
+    __slots__ = ("name", "description")
+
+class GroupSoftware(Record):
+    """
+    An item of ``software`` of a group.
+    """
+    __slots__ = ("id", "name", "url", "references", "techniques")
+    _nested = {"techniques": Link}
+
+class SoftwareGroup(Record):
+    """
+    An item of ``groups_that_use_this_software`` of a software.
+    """
+    __slots__ = ("id", "name", "reference")
+    _free_text = Record._free_text | {"reference"}
+
+class ListEntry(Record):
+    """
+    An entry of the result of ``get_list()`` of the techniques, tactics, mitigations, groups, software and campaigns.
+    """
+    __slots__ = ("id", "name", "associated_groups", "associated_software", "description", "url", "sub_techniques")
+    _free_text = Record._free_text | {"associated_groups"}
+
+ListEntry._nested = {"sub_techniques": ListEntry}
+
+class MatrixCell(Record):
+    """
+    A cell of the Enterprise Matrix: a technique of a tactic, or one of its sub-techniques.
+    """
+    __slots__ = ("id", "name", "url", "mitre_tactic_uuid4", "mitre_attack_pattern_uuid4", "sub_technique")
+
+MatrixCell._nested = {"sub_technique": MatrixCell}
+
+class MatrixTactic(Record):
+    """
+    A column of the Enterprise Matrix, i.e. a value of the result of ``get_list()`` of the matrix.
+    """
+    __slots__ = ("id", "url", "main_technique")
+    _nested = {"main_technique": MatrixCell}
+
+class Technique(Record):
+    """
+    The details of a technique or sub-technique.
+    """
+    __slots__ = ("id", "main_technique_id", "sub_techniques", "name", "tactics", "platforms", "permission_required",
+                 "version", "created", "last_modified", "procedures", "mitigations", "detection", "description", "references")
+    _nested = {"sub_techniques": Link, "tactics": Link, "procedures": Summary, "mitigations": Summary,
+               "detection": Detection, "references": Reference}
+
+class Tactic(Record):
+    """
+    The details of a tactic.
+    """
+    __slots__ = ("id", "name", "created", "last_modified", "url", "description", "techniques")
+    _nested = {"techniques": Summary}
+
+class Mitigation(Record):
+    """
+    The details of a mitigation.
+    """
+    __slots__ = ("id", "name", "version", "created", "last_modified", "url", "description",
+                 "techniques_addressed_by_mitigation", "references")
+    _nested = {"techniques_addressed_by_mitigation": AddressedTechnique, "references": Reference}
+
+class Group(Record):
+    """
+    The details of a group.
+    """
+    __slots__ = ("id", "name", "contributors", "version", "created", "last_modified", "description", "url",
+                 "associated_group_descriptions", "techniques_used", "software", "references")
+    _nested = {"associated_group_descriptions": AssociatedGroup, "techniques_used": TechniqueUse,
+               "software": GroupSoftware, "references": Reference}
+
+class Software(Record):
+    """
+    The details of a software.
+    """
+    __slots__ = ("id", "name", "type", "platforms", "version", "created", "last_modified", "description",
+                 "techniques_used", "groups_that_use_this_software", "references")
+    _nested = {"techniques_used": TechniqueUse, "groups_that_use_this_software": SoftwareGroup, "references": Reference}
+
+class Campaign(Record):
+    """
+    The details of a campaign.
+    """
+    __slots__ = ("id", "name", "first_seen", "last_seen", "version", "created", "last_modified", "description", "url",
+                 "groups", "techniques_used", "software", "references")
+    _nested = {"groups": Summary, "techniques_used": TechniqueUse, "software": Summary, "references": Reference}
+
+def to_records(record_type: Type[Record],
+               data: Union[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]) -> Union[List[Record], Dict[str, Record]]:
+    """
+    Convert the result of ``get_list()`` to records: a list of dictionaries to a list of records,
+    or a dictionary of dictionaries (like the columns of the matrix) to a dictionary of records.
+
+    :param record_type: The record type of the entries.
+    :type record_type: Type[Record]
+    :param data: The result of ``get_list()``.
+    :type data: Union[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]
+    :return: The entries as records, in the same structure.
+    :rtype: Union[List[Record], Dict[str, Record]]
+    """
+    if isinstance(data, dict):
+        return {key: record_type.from_dict(value) for key, value in data.items()}
+    return [record_type.from_dict(value) for value in data]
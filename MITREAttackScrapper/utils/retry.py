@@ -0,0 +1,519 @@
+# MITREAttackScrapper/utils/retry.py
+import time
+import random
+import asyncio
+import threading
+import contextlib
+import contextvars
+import httpx
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Awaitable, Callable, Deque, FrozenSet, Iterator, List, NamedTuple, Optional, Set
+
+from .rate_limit import parse_retry_after
+
+# Status codes worth sending a request again for: throttling and transient server or gateway errors
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("mitre_attack_deadline", default=None)
+
+@contextlib.contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Bound the time every request sent within the block may take, retries and backoff included.
+    A request still unanswered at the deadline raises ``httpx.TimeoutException``, so the ``get()`` of a scraper class fails
+    instead of waiting for the timeouts of the HTTP client. Nested deadlines keep the earliest one.
+
+    :param seconds: Seconds from now until the deadline.
+    :type seconds: float
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.utils.retry import deadline
+        from MITREAttackScrapper.techniques.enterprise import MITREAttackEnterpriseTechniques
+
+        with deadline(0.5):
+            technique = MITREAttackEnterpriseTechniques.get("T1059.001")
+    """
+    at = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(at if current is None else min(current, at))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+def current_deadline() -> Optional[float]:
+    """
+    Get the deadline set by the innermost ``deadline()`` block, if any.
+
+    :return: The deadline, as a ``time.monotonic()`` value, or ``None``.
+    :rtype: Optional[float]
+    """
+    return _deadline.get()
+
+class Attempt(NamedTuple):
+    """
+    The outcome of one attempt at a request.
+
+    :param url: The requested URL.
+    :type url: str
+    :param attempt: The number of the attempt, starting at 1. A hedged request has the number of the attempt it duplicates.
+    :type attempt: int
+    :param hedged: Whether the attempt is the duplicate sent by hedging.
+    :type hedged: bool
+    :param status_code: The status code of the response, or ``None`` if the attempt failed without one.
+    :type status_code: Optional[int]
+    :param error: The name of the exception the attempt raised, if any.
+    :type error: Optional[str]
+    :param latency: Seconds from sending the request to receiving the response (or the error).
+    :type latency: float
+    """
+    url: str
+    attempt: int
+    hedged: bool
+    status_code: Optional[int]
+    error: Optional[str]
+    latency: float
+
+class RetryStats(NamedTuple):
+    """
+    Counters and latency percentiles of the attempts of a ``RetryPolicy``.
+
+    :param requests: Number of requests.
+    :type requests: int
+    :param attempts: Number of attempts, hedged ones included.
+    :type attempts: int
+    :param retries: Number of attempts sent after a failed one.
+    :type retries: int
+    :param hedges: Number of hedged attempts.
+    :type hedges: int
+    :param hedge_wins: Number of hedged attempts answered before the attempt they duplicate.
+    :type hedge_wins: int
+    :param errors: Number of attempts that failed without a response.
+    :type errors: int
+    :param deadlines_exceeded: Number of requests that ran out of time.
+    :type deadlines_exceeded: int
+    :param p50: Median latency of the recent attempts answered with a response, in seconds.
+    :type p50: float
+    :param p95: 95th percentile of the same latencies.
+    :type p95: float
+    :param p99: 99th percentile of the same latencies.
+    :type p99: float
+    """
+    requests: int
+    attempts: int
+    retries: int
+    hedges: int
+    hedge_wins: int
+    errors: int
+    deadlines_exceeded: int
+    p50: float
+    p95: float
+    p99: float
+
+class RetryPolicy:
+    """
+    Retries, deadlines and hedging for the requests of the shared HTTP client.
+
+    A request failing with a transport error (timeout, connection reset, ...) or answered with a status code in
+    ``retry_status_codes`` is sent again, up to ``max_attempts`` attempts in total, after a jittered exponential backoff:
+    a random delay between 0 and ``min(max_backoff, backoff * 2 ** retries)`` seconds, or the ``Retry-After`` of the
+    response if longer. The last response is returned as is, and the last error raised. When the shared HTTP client
+    has a rate limiter, the throttling status codes (``429``, ``503``) are left to the limiter.
+
+    A request can be bounded in time with ``deadline`` (or with the ``deadline()`` context manager): attempts are
+    abandoned once it is reached, and ``httpx.TimeoutException`` is raised.
+
+    With ``hedge``, an attempt unanswered after the ``hedge_quantile`` (95th percentile by default) of the recent latencies
+    is duplicated, and the first response of the two is used, which cuts the tail latency caused by a slow connection
+    or server for a few percent more requests. Until ``hedge_min_samples`` latencies are known, ``hedge_delay`` is used.
+
+    Every attempt is recorded as an ``Attempt``, passed to ``on_attempt`` if given, and counted in ``stats()``.
+
+    Streamed requests (``stream()``/``astream()`` of the HTTP client, used by ``iter_list()``) do not go through the
+    policy: their body is consumed by the caller while it is downloaded, so they cannot be sent again or hedged
+    transparently. They are sent once, and only the rate limiter, if any, sends a throttled one again before its body is read.
+
+    :param max_attempts: Maximum number of attempts per request, the first one included.
+    :type max_attempts: int
+    :param backoff: Base delay of the exponential backoff, in seconds.
+    :type backoff: float
+    :param max_backoff: Upper bound of the backoff delay, in seconds.
+    :type max_backoff: float
+    :param retry_status_codes: Status codes of the responses worth sending the request again.
+    :type retry_status_codes: FrozenSet[int]
+    :param deadline: Seconds a request may take, retries included, or ``None`` for no deadline.
+    :type deadline: Optional[float]
+    :param hedge: Whether to duplicate slow attempts.
+    :type hedge: bool
+    :param hedge_quantile: The quantile of the recent latencies after which an attempt is duplicated.
+    :type hedge_quantile: float
+    :param hedge_delay: Seconds after which an attempt is duplicated while too few latencies are known.
+    :type hedge_delay: float
+    :param hedge_min_samples: Number of latencies needed to use ``hedge_quantile``.
+    :type hedge_min_samples: int
+    :param history: Number of recent latencies kept for the quantiles.
+    :type history: int
+    :param on_attempt: A function called with every ``Attempt``, e.g. to export metrics.
+    :type on_attempt: Optional[Callable[[Attempt], None]]
+    :param max_workers: Number of threads sending the attempts of synchronous requests, when hedging or under a deadline.
+    :type max_workers: int
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.utils.http_client import configure_http_client
+        from MITREAttackScrapper.utils.retry import RetryPolicy
+        from MITREAttackScrapper.techniques.enterprise import MITREAttackEnterpriseTechniques
+
+        policy = RetryPolicy(max_attempts=3, deadline=2.0, hedge=True)
+        configure_http_client(retry=policy)
+        technique = MITREAttackEnterpriseTechniques.get("T1059.001")
+        print(policy.stats())    # RetryStats(requests=1, attempts=1, ..., p95=...)
+    """
+
+    def __init__(self,
+                 max_attempts: int = 3,
+                 backoff: float = 0.1,
+                 max_backoff: float = 5.0,
+                 retry_status_codes: FrozenSet[int] = RETRY_STATUS_CODES,
+                 deadline: Optional[float] = None,
+                 hedge: bool = False,
+                 hedge_quantile: float = 0.95,
+                 hedge_delay: float = 1.0,
+                 hedge_min_samples: int = 20,
+                 history: int = 1000,
+                 on_attempt: Optional[Callable[[Attempt], None]] = None,
+                 max_workers: int = 64) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if not 0 < hedge_quantile < 1:
+            raise ValueError("hedge_quantile must be between 0 and 1")
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_status_codes = frozenset(retry_status_codes)
+        self.deadline = deadline
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.hedge_delay = hedge_delay
+        self.hedge_min_samples = hedge_min_samples
+        self.on_attempt = on_attempt
+        self.max_workers = max_workers
+
+        self._lock = threading.Lock()
+        self._latencies: Deque[float] = deque(maxlen=history)
+        self._sorted_latencies: Optional[List[float]] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._counters = {"requests": 0, "attempts": 0, "retries": 0, "hedges": 0,
+                          "hedge_wins": 0, "errors": 0, "deadlines_exceeded": 0}
+
+    def backoff_delay(self, retry: int) -> float:
+        """
+        Get a random delay before the given retry ("full jitter"), so clients failing together do not retry together.
+
+        :param retry: The number of the retry, starting at 1.
+        :type retry: int
+        :return: The delay in seconds.
+        :rtype: float
+        """
+        return random.uniform(0.0, min(self.max_backoff, self.backoff * 2 ** (retry - 1)))
+
+    def _quantile(self, quantile: float) -> float:
+        """
+        Get a quantile of the recent latencies (``0.0`` if none is known). Must be called with the lock held.
+        """
+        if self._sorted_latencies is None:
+            self._sorted_latencies = sorted(self._latencies)
+        if not self._sorted_latencies:
+            return 0.0
+        return self._sorted_latencies[min(len(self._sorted_latencies) - 1, int(quantile * len(self._sorted_latencies)))]
+
+    def current_hedge_delay(self) -> float:
+        """
+        Get the seconds after which an attempt is duplicated.
+
+        :return: The ``hedge_quantile`` of the recent latencies, or ``hedge_delay`` while too few are known.
+        :rtype: float
+        """
+        with self._lock:
+            if len(self._latencies) < self.hedge_min_samples:
+                return self.hedge_delay
+            return self._quantile(self.hedge_quantile)
+
+    def stats(self) -> RetryStats:
+        """
+        Get the counters and latency percentiles of the attempts so far.
+
+        :return: The counters and latency percentiles.
+        :rtype: RetryStats
+        """
+        with self._lock:
+            return RetryStats(**self._counters, p50=self._quantile(0.5), p95=self._quantile(0.95), p99=self._quantile(0.99))
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def _record(self, attempt: Attempt) -> None:
+        """
+        Count an attempt, and pass it to ``on_attempt``.
+        """
+        with self._lock:
+            self._counters["attempts"] += 1
+            self._counters["retries"] += attempt.attempt > 1 and not attempt.hedged
+            self._counters["hedges"] += attempt.hedged
+            if attempt.status_code is None:
+                self._counters["errors"] += 1
+            else:
+                self._latencies.append(attempt.latency)
+                self._sorted_latencies = None
+        if self.on_attempt is not None:
+            self.on_attempt(attempt)
+
+    def _deadline(self) -> Optional[float]:
+        """
+        Get the deadline of a request starting now: the earliest of ``deadline`` and of the enclosing ``deadline()`` block.
+        """
+        at = current_deadline()
+        if self.deadline is not None:
+            own = time.monotonic() + self.deadline
+            at = own if at is None else min(at, own)
+        return at
+
+    def _deadline_exceeded(self, url: str) -> httpx.TimeoutException:
+        self._count("deadlines_exceeded")
+        return httpx.TimeoutException(f"Deadline exceeded while fetching {url}", request=httpx.Request("GET", url))
+
+    def _retry_delay(self, retry: int, response: Optional[httpx.Response]) -> float:
+        """
+        Get the delay before the given retry, honouring the ``Retry-After`` of the previous response.
+        """
+        delay = self.backoff_delay(retry)
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, self.max_backoff))
+        return delay
+
+    def _timed(self, send: Callable[[Optional[float]], httpx.Response], url: str, number: int, hedged: bool,
+               timeout: Optional[float]) -> httpx.Response:
+        """
+        Send one attempt, and record it.
+        """
+        started = time.monotonic()
+        try:
+            response = send(timeout)
+        except Exception as error:
+            self._record(Attempt(url, number, hedged, None, type(error).__name__, time.monotonic() - started))
+            raise
+        self._record(Attempt(url, number, hedged, response.status_code, None, time.monotonic() - started))
+        return response
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="MITREAttackRetry")
+        return self._executor
+
+    def _attempt(self, send: Callable[[Optional[float]], httpx.Response], url: str, number: int,
+                 at: Optional[float]) -> httpx.Response:
+        """
+        Send one attempt of a synchronous request, duplicated if hedging, and bounded by the deadline if any.
+        """
+        timeout = None if at is None else at - time.monotonic()
+        if not self.hedge and at is None:
+            return self._timed(send, url, number, False, None)
+
+        futures: Set[Future] = {self._pool().submit(self._timed, send, url, number, False, timeout)}
+        primary = next(iter(futures))
+        if self.hedge:
+            delay = self.current_hedge_delay()
+            if timeout is None or delay < timeout:
+                done, _ = wait(futures, timeout=delay)
+                if not done:
+                    futures.add(self._pool().submit(self._timed, send, url, number, True, None if at is None else at - time.monotonic()))
+
+        error: Optional[BaseException] = None
+        while futures:
+            done, futures = wait(futures, timeout=None if at is None else max(0.0, at - time.monotonic()), return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                if future.exception() is None:
+                    if future is not primary:
+                        self._count("hedge_wins")
+                    # The other attempt may have been answered in the same round too, or be answered later
+                    for other in (done | futures) - {future}:
+                        other.add_done_callback(_close_response)
+                    return future.result()
+                error = future.exception()
+        for other in futures:
+            other.add_done_callback(_close_response)
+        if futures or error is None:
+            raise self._deadline_exceeded(url)
+        raise error
+
+    def call(self,
+             send: Callable[[Optional[float]], httpx.Response],
+             url: str,
+             retry_status_codes: Optional[FrozenSet[int]] = None) -> httpx.Response:
+        """
+        Send a request with retries, deadline and hedging.
+
+        :param send: A function sending one attempt of the request, given the seconds it may take (or ``None``).
+        :type send: Callable[[Optional[float]], httpx.Response]
+        :param url: The requested URL, for the metrics and errors.
+        :type url: str
+        :param retry_status_codes: Status codes to retry instead of ``retry_status_codes`` of the policy,
+                                   e.g. without the throttling ones when a rate limiter already handles them.
+        :type retry_status_codes: Optional[FrozenSet[int]]
+        :return: The first acceptable response, or the last response once the attempts are exhausted.
+        :rtype: httpx.Response
+        :raises httpx.TimeoutException: If the deadline is reached.
+        :raises httpx.TransportError: If the last attempt failed without a response.
+        """
+        if retry_status_codes is None:
+            retry_status_codes = self.retry_status_codes
+        self._count("requests")
+        at = self._deadline()
+        number = 0
+        while True:
+            number += 1
+            if at is not None and time.monotonic() >= at:
+                raise self._deadline_exceeded(url)
+            try:
+                response = self._attempt(send, url, number, at)
+            except httpx.TimeoutException:
+                if number >= self.max_attempts or (at is not None and time.monotonic() >= at):
+                    raise
+                response = None
+            except httpx.TransportError:
+                if number >= self.max_attempts:
+                    raise
+                response = None
+            else:
+                if response.status_code not in retry_status_codes or number >= self.max_attempts:
+                    return response
+            delay = self._retry_delay(number, response)
+            if at is not None and time.monotonic() + delay >= at:
+                if response is not None:
+                    return response
+                raise self._deadline_exceeded(url)
+            if response is not None:
+                response.close()
+            time.sleep(delay)
+
+    async def _atimed(self, send: Callable[[Optional[float]], Awaitable[httpx.Response]], url: str, number: int,
+                      hedged: bool, timeout: Optional[float]) -> httpx.Response:
+        """
+        Asynchronous counterpart of ``_timed()``.
+        """
+        started = time.monotonic()
+        try:
+            response = await send(timeout)
+        except Exception as error:
+            self._record(Attempt(url, number, hedged, None, type(error).__name__, time.monotonic() - started))
+            raise
+        self._record(Attempt(url, number, hedged, response.status_code, None, time.monotonic() - started))
+        return response
+
+    async def _aattempt(self, send: Callable[[Optional[float]], Awaitable[httpx.Response]], url: str, number: int,
+                        at: Optional[float]) -> httpx.Response:
+        """
+        Asynchronous counterpart of ``_attempt()``. The attempts still running are cancelled once one is answered.
+        """
+        timeout = None if at is None else at - time.monotonic()
+        primary = asyncio.ensure_future(self._atimed(send, url, number, False, timeout))
+        tasks = {primary}
+        try:
+            if self.hedge:
+                delay = self.current_hedge_delay()
+                if timeout is None or delay < timeout:
+                    done, _ = await asyncio.wait(tasks, timeout=delay)
+                    if not done:
+                        tasks.add(asyncio.ensure_future(self._atimed(send, url, number, True,
+                                                                      None if at is None else at - time.monotonic())))
+            error: Optional[BaseException] = None
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, timeout=None if at is None else max(0.0, at - time.monotonic()),
+                                                 return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    break
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self._count("hedge_wins")
+                        # The other attempt may have been answered in the same round too
+                        for other in done - {task}:
+                            if other.exception() is None:
+                                await other.result().aclose()
+                        return task.result()
+                    error = task.exception()
+            if tasks or error is None:
+                raise self._deadline_exceeded(url)
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def acall(self,
+                    send: Callable[[Optional[float]], Awaitable[httpx.Response]],
+                    url: str,
+                    retry_status_codes: Optional[FrozenSet[int]] = None) -> httpx.Response:
+        """
+        Asynchronous counterpart of ``call()``.
+
+        :param send: A coroutine function sending one attempt of the request, given the seconds it may take (or ``None``).
+        :type send: Callable[[Optional[float]], Awaitable[httpx.Response]]
+        :param url: The requested URL, for the metrics and errors.
+        :type url: str
+        :param retry_status_codes: Status codes to retry instead of ``retry_status_codes`` of the policy.
+        :type retry_status_codes: Optional[FrozenSet[int]]
+        :return: The first acceptable response, or the last response once the attempts are exhausted.
+        :rtype: httpx.Response
+        :raises httpx.TimeoutException: If the deadline is reached.
+        :raises httpx.TransportError: If the last attempt failed without a response.
+        """
+        if retry_status_codes is None:
+            retry_status_codes = self.retry_status_codes
+        self._count("requests")
+        at = self._deadline()
+        number = 0
+        while True:
+            number += 1
+            if at is not None and time.monotonic() >= at:
+                raise self._deadline_exceeded(url)
+            try:
+                response = await self._aattempt(send, url, number, at)
+            except httpx.TimeoutException:
+                if number >= self.max_attempts or (at is not None and time.monotonic() >= at):
+                    raise
+                response = None
+            except httpx.TransportError:
+                if number >= self.max_attempts:
+                    raise
+                response = None
+            else:
+                if response.status_code not in retry_status_codes or number >= self.max_attempts:
+                    return response
+            delay = self._retry_delay(number, response)
+            if at is not None and time.monotonic() + delay >= at:
+                if response is not None:
+                    return response
+                raise self._deadline_exceeded(url)
+            if response is not None:
+                await response.aclose()
+            await asyncio.sleep(delay)
+
+def _close_response(future: Future) -> None:
+    """
+    Close the response of an attempt nobody waits for anymore.
+    """
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
@@ -1,6 +1,6 @@
 # MITREAttackScrapper/utils/scrapping_helper.py
 from bs4.element import Tag
-from typing import Union, List, Dict
+from typing import Union, List, Dict, Tuple, Optional
 
 def get_text_after_span(card_body: Tag, label: str) -> str:
     """
@@ -62,4 +62,109 @@ def get_links_after_span(card_body: Tag, label: str) -> List[Dict[str, str]]:
                 "name": a.get_text(strip=True),
                 "url": "https://attack.mitre.org" + a["href"]
             })
-    return links
\ No newline at end of file
+    return links
+
+class SectionIndex:
+    """
+    Index of the sections of a page, i.e. the elements following each heading, built while walking the page once.
+
+    Looking up a section with ``soup.find("h2", string=title).find_next("table")`` walks the document from its start
+    every time. The index instead walks the document a single time, lazily: it only goes as far as the furthest
+    section requested so far, and remembers every heading and following element it has passed on the way.
+    A heading is matched the same way as ``soup.find("h2", string=title)``, and the element following it
+    the same way as ``find_next(name)``.
+
+    Parameters
+    ----------
+    soup : Tag
+        The parsed page.
+
+    heading : str
+        The name of the heading tags delimiting the sections.
+
+    following : Tuple[str, ...]
+        The names of the tags that can be looked up after a heading.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        sections = SectionIndex(make_soup(html))
+        procedures_table = sections.following("Procedure Examples", "table")
+        references_div = sections.following("References", "div")
+    """
+
+    def __init__(self, soup: Tag, heading: str = "h2", following: Tuple[str, ...] = ("table", "div")) -> None:
+        self._heading: str = heading
+        self._elements = soup.descendants
+        self._headings: Dict[str, Tag] = {}
+        self._following: Dict[Tuple[str, str], Tag] = {}
+        # Titles of the headings passed so far whose following element of each name has not been reached yet
+        self._pending: Dict[str, List[str]] = {name: [] for name in following}
+
+    def _walk(self) -> bool:
+        """
+        Walk the document until a new heading or following element is indexed.
+        Returns False once the whole document has been walked.
+        """
+        pending = self._pending
+        for element in self._elements:
+            if not isinstance(element, Tag):
+                continue
+            indexed = False
+            waiting = pending.get(element.name)
+            if waiting:
+                for title in waiting:
+                    self._following[(title, element.name)] = element
+                waiting.clear()
+                indexed = True
+            if element.name == self._heading:
+                title = element.string
+                if title is not None and title not in self._headings:
+                    self._headings[str(title)] = element
+                    for titles in pending.values():
+                        titles.append(str(title))
+                    indexed = True
+            if indexed:
+                return True
+        return False
+
+    def heading(self, title: str) -> Optional[Tag]:
+        """
+        Get the first heading whose text is the given title.
+
+        Parameters
+        ----------
+        title : str
+            The text of the heading.
+
+        Returns
+        -------
+        Optional[Tag]
+            The heading, or None if the page has no such heading.
+        """
+        while title not in self._headings and self._walk():
+            pass
+        return self._headings.get(title)
+
+    def following(self, title: str, name: str) -> Optional[Tag]:
+        """
+        Get the first element of the given name after the heading whose text is the given title.
+
+        Parameters
+        ----------
+        title : str
+            The text of the heading.
+
+        name : str
+            The name of the element, one of the names given as ``following``.
+
+        Returns
+        -------
+        Optional[Tag]
+            The element, or None if the page has no such heading or no such element after it.
+        """
+        key = (title, name)
+        while key not in self._following and self._walk():
+            pass
+        return self._following.get(key)
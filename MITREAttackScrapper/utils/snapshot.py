@@ -0,0 +1,302 @@
+# MITREAttackScrapper/utils/snapshot.py
+import os
+import mmap
+import time
+import struct
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+# File layout: header | compression dictionary | record frames | index
+#   header: magic, format version, then (offset, length) of the dictionary and of the index
+#   each record (the result of one get_list()/get() call) is its own zstd frame of msgpack data,
+#   so a record is decompressed only when it is looked up
+SNAPSHOT_MAGIC = b"MATKSNAP"
+SNAPSHOT_VERSION = 1
+_HEADER = struct.Struct("<8sIIQQQQ")
+
+# Records compress poorly one by one, so a shared dictionary is trained on them when there are enough
+_DICTIONARY_SIZE = 112 * 1024
+_DICTIONARY_MIN_RECORDS = 64
+
+def _require() -> Tuple[Any, Any]:
+    """
+    Import the packages needed by snapshots.
+
+    :raises ImportError: If ``msgpack`` or ``zstandard`` is not installed.
+    """
+    try:
+        import msgpack
+        import zstandard
+    except ImportError as error:
+        raise ImportError("Snapshots require the 'msgpack' and 'zstandard' packages. "
+                          "Install them with `pip install MITREAttackScrapper[snapshot]`") from error
+    return msgpack, zstandard
+
+class MITREAttackSnapshot:
+    """
+    A read-only snapshot of scraped MITRE ATT&CK data, written by ``export_snapshot()``.
+
+    The snapshot holds the results of ``get_list()`` and ``get()`` of the scraper classes, keyed by the URL
+    of the page each result was scraped from. The file is memory-mapped and only its index is read when it is opened;
+    each record is decompressed and decoded when it is looked up, so opening even a full corpus is near-instant.
+
+    :param path: Path of the snapshot file.
+    :type path: Union[str, os.PathLike]
+    :param fallback: If ``True``, pages missing from the snapshot are scraped from the website as usual.
+                     If ``False``, ``get()`` raises ``ValueError`` for a missing ID, and ``get_list()`` ``RuntimeError``.
+    :type fallback: bool
+    :raises ValueError: If the file is not a snapshot, or was written by an unsupported version.
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.utils.snapshot import MITREAttackSnapshot
+
+        with MITREAttackSnapshot("attack.snapshot") as snapshot:
+            print(len(snapshot), snapshot.created)
+            print(snapshot.get("https://attack.mitre.org/groups/G0016/")["name"])
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], fallback: bool = True) -> None:
+        msgpack, zstandard = _require()
+        self.path: str = os.path.abspath(os.path.expanduser(os.fspath(path)))
+        self.fallback: bool = fallback
+
+        with open(self.path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError(f"{self.path} is not a MITRE ATT&CK snapshot")
+        magic, version, _, dictionary_offset, dictionary_length, index_offset, index_length = \
+            _HEADER.unpack_from(self._mmap, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"{self.path} is not a MITRE ATT&CK snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"{self.path} is a version {version} snapshot, only version {SNAPSHOT_VERSION} is supported")
+
+        self._dictionary = None
+        if dictionary_length:
+            self._dictionary = zstandard.ZstdCompressionDict(
+                self._mmap[dictionary_offset:dictionary_offset + dictionary_length])
+        self._local = threading.local()
+
+        index = msgpack.unpackb(self._decompress(self._mmap[index_offset:index_offset + index_length]))
+        self.created: str = index["created"]
+        self._records: Dict[str, List[int]] = index["records"]
+        self._msgpack = msgpack
+
+    def _decompress(self, frame: bytes) -> bytes:
+        """
+        Decompress a zstd frame, with a decompressor per thread since they are not thread-safe.
+        """
+        decompressor = getattr(self._local, "decompressor", None)
+        if decompressor is None:
+            _, zstandard = _require()
+            if self._dictionary is not None:
+                decompressor = zstandard.ZstdDecompressor(dict_data=self._dictionary)
+            else:
+                decompressor = zstandard.ZstdDecompressor()
+            self._local.decompressor = decompressor
+        return decompressor.decompress(frame)
+
+    def get(self, url: str) -> Optional[Any]:
+        """
+        Get the result scraped from the given page.
+
+        :param url: The URL of the page, e.g. ``MITREAttackCTIGroups._detail_url("G0016")``.
+        :type url: str
+        :return: The result, or ``None`` if the snapshot does not hold the page.
+        :rtype: Optional[Any]
+        """
+        location = self._records.get(url)
+        if location is None:
+            return None
+        offset, length = location
+        # Integer keys (e.g. the reference numbers) are kept as they are
+        return self._msgpack.unpackb(self._decompress(self._mmap[offset:offset + length]), strict_map_key=False)
+
+    def urls(self) -> List[str]:
+        """
+        Get the URLs of all the pages held by the snapshot.
+
+        :return: The URLs of the pages.
+        :rtype: List[str]
+        """
+        return list(self._records)
+
+    def close(self) -> None:
+        """
+        Unmap the snapshot file.
+        """
+        self._mmap.close()
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __enter__(self) -> "MITREAttackSnapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+def _default_scrapers() -> List[Type]:
+    """
+    Get every scraper class of the package.
+    """
+    # Imported here, since the scraper classes themselves depend on this module
+    from ..techniques.enterprise import MITREAttackEnterpriseTechniques
+    from ..tactics.enterprise import MITREAttackEnterpriseTactics
+    from ..mitigations.enterprise import MITREAttackEnterpriseMitigations
+    from ..matrices.enterprise import MITREAttackEnterpriseMatrix
+    from ..cti.groups import MITREAttackCTIGroups
+    from ..cti.software import MITREAttackCTISoftware
+    from ..cti.campaigns import MITREAttackCampaign
+    return [MITREAttackEnterpriseTechniques, MITREAttackEnterpriseTactics, MITREAttackEnterpriseMitigations,
+            MITREAttackEnterpriseMatrix, MITREAttackCTIGroups, MITREAttackCTISoftware, MITREAttackCampaign]
+
+def _scrape(scrapers: Iterable[Type], max_workers: int, parse_workers: Optional[int]) -> Iterator[Tuple[str, Any]]:
+    """
+    Scrape the list and every detail of the given scraper classes, yielding ``(url, result)`` pairs.
+
+    :raises RuntimeError: If any detail could not be fetched.
+    """
+    failures = []
+    for scraper in scrapers:
+        data = scraper.get_list()
+        yield scraper._list_url, data
+        for result in scraper.get_many(list(scraper._list_entries(data)), max_workers=max_workers, parse_workers=parse_workers):
+            if result.ok:
+                yield scraper._detail_url(result.id), result.data
+            else:
+                failures.append(f"{scraper.__name__} {result.id}: {result.error}")
+    if failures:
+        raise RuntimeError(f"Failed to fetch {len(failures)} page(s) for the snapshot:\n" + "\n".join(failures))
+
+def export_snapshot(path: Union[str, os.PathLike],
+                    scrapers: Optional[Iterable[Type]] = None,
+                    max_workers: int = 8,
+                    parse_workers: Optional[int] = None,
+                    level: int = 19) -> MITREAttackSnapshot:
+    """
+    Scrape the full corpus of the given scraper classes and write it to a snapshot file.
+
+    Every ``get_list()`` result, and the ``get()`` result of every ID it lists, is stored as msgpack data compressed
+    with zstd, using a dictionary trained on the records themselves. The data comes from the configured source:
+    the website (through the HTTP client and its cache), or a STIX bundle if one is in use.
+    The file is written atomically, so a snapshot in use is never left half-written.
+
+    :param path: Path of the snapshot file to write.
+    :type path: Union[str, os.PathLike]
+    :param scrapers: The scraper classes to snapshot. Defaults to every scraper class of the package.
+    :type scrapers: Optional[Iterable[Type[MITREAttackInformation]]]
+    :param max_workers: Number of threads downloading pages concurrently (see ``get_many()``).
+    :type max_workers: int
+    :param parse_workers: Number of processes parsing pages (see ``get_many()``).
+    :type parse_workers: Optional[int]
+    :param level: The zstd compression level.
+    :type level: int
+    :return: The written snapshot, opened.
+    :rtype: MITREAttackSnapshot
+    :raises RuntimeError: If any page could not be fetched. No file is written in that case.
+    :raises ImportError: If ``msgpack`` or ``zstandard`` is not installed.
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.utils.snapshot import export_snapshot
+
+        snapshot = export_snapshot("attack.snapshot", max_workers=16)
+        print(f"{len(snapshot)} pages")
+    """
+    msgpack, zstandard = _require()
+    path = os.path.abspath(os.path.expanduser(os.fspath(path)))
+    records = [(url, msgpack.packb(data)) for url, data in
+               _scrape(scrapers if scrapers is not None else _default_scrapers(), max_workers, parse_workers)]
+
+    dictionary = None
+    if len(records) >= _DICTIONARY_MIN_RECORDS:
+        try:
+            dictionary = zstandard.train_dictionary(_DICTIONARY_SIZE, [packed for _, packed in records], level=level)
+        except zstandard.ZstdError:
+            # Too few or too uniform samples to train on
+            dictionary = None
+    if dictionary is not None:
+        compressor = zstandard.ZstdCompressor(level=level, dict_data=dictionary)
+    else:
+        compressor = zstandard.ZstdCompressor(level=level)
+
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary_path, "wb") as file:
+            file.write(b"\0" * _HEADER.size)
+            dictionary_offset, dictionary_length = file.tell(), 0
+            if dictionary is not None:
+                dictionary_length = file.write(dictionary.as_bytes())
+
+            index = {}
+            for url, packed in records:
+                index[url] = [file.tell(), file.write(compressor.compress(packed))]
+
+            index_offset = file.tell()
+            index_length = file.write(compressor.compress(msgpack.packb({
+                "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "records": index
+            })))
+            file.seek(0)
+            file.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0,
+                                    dictionary_offset, dictionary_length, index_offset, index_length))
+        os.replace(temporary_path, path)
+    finally:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+    return MITREAttackSnapshot(path)
+
+_snapshot: Optional[MITREAttackSnapshot] = None
+_snapshot_lock = threading.Lock()
+
+def set_snapshot(snapshot: Union[None, str, os.PathLike, MITREAttackSnapshot],
+                 fallback: bool = True) -> Optional[MITREAttackSnapshot]:
+    """
+    Answer ``get_list()``/``get()`` calls from a snapshot written by ``export_snapshot()``.
+    Pass ``None`` to stop using the snapshot.
+
+    Pages held by the snapshot are answered without fetching or parsing anything, so a process
+    starts warm from a snapshot file instead of scraping the website again.
+
+    :param snapshot: An opened snapshot, the path of a snapshot file, or ``None``.
+    :type snapshot: Union[None, str, os.PathLike, MITREAttackSnapshot]
+    :param fallback: When a path is given: whether pages missing from the snapshot are scraped from the website,
+                     instead of failing (refer to ``MITREAttackSnapshot``).
+    :type fallback: bool
+    :return: The snapshot now in use, or ``None``.
+    :rtype: Optional[MITREAttackSnapshot]
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.utils.snapshot import set_snapshot
+        from MITREAttackScrapper.cti.groups import MITREAttackCTIGroups
+
+        set_snapshot("attack.snapshot", fallback=False)
+        apt29 = MITREAttackCTIGroups.get("G0016")     # no HTTP request
+    """
+    global _snapshot
+    if snapshot is not None and not isinstance(snapshot, MITREAttackSnapshot):
+        snapshot = MITREAttackSnapshot(snapshot, fallback=fallback)
+    with _snapshot_lock:
+        _snapshot = snapshot
+    return snapshot
+
+def get_snapshot() -> Optional[MITREAttackSnapshot]:
+    """
+    Get the snapshot answering the ``get_list()``/``get()`` calls, if any.
+
+    :return: The snapshot in use, or ``None``.
+    :rtype: Optional[MITREAttackSnapshot]
+    """
+    return _snapshot
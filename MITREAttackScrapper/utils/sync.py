@@ -0,0 +1,329 @@
+# MITREAttackScrapper/utils/sync.py
+import os
+import json
+import time
+import pickle
+import sqlite3
+import hashlib
+import threading
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Type, Union
+
+from .http_client import fetch
+from .snapshot import _default_scrapers
+
+class SyncReport(NamedTuple):
+    """
+    The outcome of a ``sync()`` run. Every dictionary is keyed by the name of the scraper class.
+
+    :param added: IDs that appeared in the lists since the previous run.
+    :type added: Dict[str, List[str]]
+    :param removed: IDs that disappeared from the lists, and were dropped from the store.
+    :type removed: Dict[str, List[str]]
+    :param modified: IDs whose details changed.
+    :type modified: Dict[str, List[str]]
+    :param failed: Error messages of the IDs that could not be fetched. They are retried on the next run.
+    :type failed: Dict[str, Dict[str, str]]
+    :param requests: Number of HTTP requests sent.
+    :type requests: int
+    """
+    added: Dict[str, List[str]]
+    removed: Dict[str, List[str]]
+    modified: Dict[str, List[str]]
+    failed: Dict[str, Dict[str, str]]
+    requests: int
+
+    @property
+    def changed(self) -> bool:
+        """
+        Whether anything was added, removed or modified.
+        """
+        return any(self.added.values()) or any(self.removed.values()) or any(self.modified.values())
+
+def _fingerprint(entry: Any) -> str:
+    """
+    Hash an entry of a list page, to notice when it changes.
+    """
+    return hashlib.sha1(json.dumps(entry, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+def _validators(response: httpx.Response) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Get the ``ETag`` and ``Last-Modified`` headers of a response.
+    """
+    return response.headers.get("ETag"), response.headers.get("Last-Modified")
+
+def _conditional_headers(etag: Optional[str], last_modified: Optional[str]) -> Optional[Dict[str, str]]:
+    """
+    Build the headers of a conditional request from the stored validators of a page.
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers or None
+
+class MITREAttackSyncStore:
+    """
+    A local store of scraped MITRE ATT&CK data, kept up to date by ``sync()``.
+
+    For every scraper class, the store keeps the result of ``get_list()``, and the result of ``get()`` of every listed ID
+    along with what is needed to tell whether it changed: a fingerprint of its entry in the list page,
+    the ``Last Modified`` date of its page, and the ``ETag``/``Last-Modified`` headers the page was served with.
+    Everything lives in a single SQLite database file.
+
+    :param path: Path of the database file. Created if it does not exist.
+    :type path: Union[str, os.PathLike]
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.utils.sync import MITREAttackSyncStore, sync
+        from MITREAttackScrapper.cti.groups import MITREAttackCTIGroups
+
+        store = MITREAttackSyncStore("attack.sqlite3")
+        sync(store)
+        print(store.get(MITREAttackCTIGroups, "G0016")["name"])
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        self.path: str = os.path.abspath(os.path.expanduser(os.fspath(path)))
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS lists (
+                scraper TEXT PRIMARY KEY,
+                data BLOB NOT NULL,
+                etag TEXT,
+                http_last_modified TEXT,
+                synced_at REAL NOT NULL
+            )
+        """)
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS objects (
+                scraper TEXT NOT NULL,
+                id TEXT NOT NULL,
+                data BLOB NOT NULL,
+                fingerprint TEXT NOT NULL,
+                last_modified TEXT,
+                etag TEXT,
+                http_last_modified TEXT,
+                synced_at REAL NOT NULL,
+                PRIMARY KEY (scraper, id)
+            )
+        """)
+
+    def get_list(self, scraper: Type) -> Optional[Any]:
+        """
+        Get the stored result of ``get_list()`` of the given scraper class.
+
+        :param scraper: The scraper class.
+        :type scraper: Type[MITREAttackInformation]
+        :return: The stored list, or ``None`` if the class was never synced.
+        :rtype: Optional[Any]
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT data FROM lists WHERE scraper = ?", (scraper.__name__,)).fetchone()
+        return pickle.loads(row[0]) if row is not None else None
+
+    def get(self, scraper: Type, id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the stored result of ``get(id)`` of the given scraper class.
+
+        :param scraper: The scraper class.
+        :type scraper: Type[MITREAttackInformation]
+        :param id: The ID of the MITRE ATT&CK data.
+        :type id: str
+        :return: The stored details, or ``None`` if the store does not hold the ID.
+        :rtype: Optional[Dict[str, Any]]
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT data FROM objects WHERE scraper = ? AND id = ?",
+                                           (scraper.__name__, id)).fetchone()
+        return pickle.loads(row[0]) if row is not None else None
+
+    def ids(self, scraper: Type) -> List[str]:
+        """
+        Get the stored IDs of the given scraper class.
+
+        :param scraper: The scraper class.
+        :type scraper: Type[MITREAttackInformation]
+        :return: The stored IDs, in ascending order.
+        :rtype: List[str]
+        """
+        with self._lock:
+            rows = self._connection.execute("SELECT id FROM objects WHERE scraper = ? ORDER BY id",
+                                            (scraper.__name__,)).fetchall()
+        return [row[0] for row in rows]
+
+    def _list_state(self, scraper: Type) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Get the stored validators of the list page of the given scraper class.
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT etag, http_last_modified FROM lists WHERE scraper = ?",
+                                           (scraper.__name__,)).fetchone()
+        return (row[0], row[1]) if row is not None else (None, None)
+
+    def _object_states(self, scraper: Type) -> Dict[str, Tuple[str, Optional[str], Optional[str], Optional[str]]]:
+        """
+        Get the fingerprint, ``Last Modified`` date and validators of every stored ID of the given scraper class.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, fingerprint, last_modified, etag, http_last_modified FROM objects WHERE scraper = ?",
+                (scraper.__name__,)).fetchall()
+        return {row[0]: tuple(row[1:]) for row in rows}
+
+    def _put_list(self, scraper: Type, data: Any, etag: Optional[str], http_last_modified: Optional[str]) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO lists (scraper, data, etag, http_last_modified, synced_at) VALUES (?, ?, ?, ?, ?)",
+                (scraper.__name__, pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL),
+                 etag, http_last_modified, time.time()))
+
+    def _put(self, scraper: Type, id: str, data: Dict[str, Any], fingerprint: str,
+             etag: Optional[str], http_last_modified: Optional[str]) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO objects (scraper, id, data, fingerprint, last_modified, etag, "
+                "http_last_modified, synced_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (scraper.__name__, id, pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL), fingerprint,
+                 data.get("last_modified"), etag, http_last_modified, time.time()))
+
+    def _remove(self, scraper: Type, ids: Iterable[str]) -> None:
+        with self._lock:
+            self._connection.executemany("DELETE FROM objects WHERE scraper = ? AND id = ?",
+                                         [(scraper.__name__, id) for id in ids])
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM objects").fetchone()[0]
+
+    def __enter__(self) -> "MITREAttackSyncStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+def sync(store: MITREAttackSyncStore,
+         scrapers: Optional[Iterable[Type]] = None,
+         revalidate: bool = False,
+         max_workers: int = 8) -> SyncReport:
+    """
+    Bring the store up to date with the MITRE ATT&CK website, fetching only the pages that may have changed.
+
+    For every scraper class:
+
+    1. The list page is requested conditionally. If the server answers ``304 Not Modified``,
+       no ID was added, removed or re-described, and no other page is requested unless ``revalidate`` is set.
+    2. Otherwise the list is diffed against the store: IDs no longer listed are removed,
+       and only the details of new IDs, and of IDs whose entry in the list changed (e.g. renamed or re-described),
+       are fetched.
+    3. With ``revalidate``, the details of every other stored ID are also requested conditionally with their stored
+       ``ETag``/``Last-Modified`` headers. A ``304`` costs no download nor parsing.
+
+    A fetched page counts as modified when its ``Last Modified`` date or its data differs from the stored one.
+    IDs that fail are reported and retried on the next run.
+
+    :param store: The store to update.
+    :type store: MITREAttackSyncStore
+    :param scrapers: The scraper classes to sync. Defaults to every scraper class of the package.
+    :type scrapers: Optional[Iterable[Type[MITREAttackInformation]]]
+    :param revalidate: Whether to also revalidate the details of the IDs whose list entry did not change.
+    :type revalidate: bool
+    :param max_workers: Number of threads fetching details concurrently.
+    :type max_workers: int
+    :return: The added, removed and modified IDs of every scraper class.
+    :rtype: SyncReport
+    :raises RuntimeError: If a list page could not be fetched.
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.utils.sync import MITREAttackSyncStore, sync
+
+        with MITREAttackSyncStore("attack.sqlite3") as store:
+            report = sync(store)
+            print(report.requests, "requests")
+            for scraper, ids in report.modified.items():
+                print(scraper, "modified:", ", ".join(ids))
+    """
+    report = SyncReport({}, {}, {}, {}, 0)
+    requests = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for scraper in (scrapers if scrapers is not None else _default_scrapers()):
+            name = scraper.__name__
+            added, removed, modified, failed = [], [], [], {}
+            report.added[name], report.removed[name], report.modified[name], report.failed[name] = \
+                added, removed, modified, failed
+
+            list_state = store._list_state(scraper)
+            list_response = fetch(scraper._list_url, headers=_conditional_headers(*list_state))
+            requests += 1
+            if list_response.status_code == 304:
+                if not revalidate:
+                    continue
+                data = store.get_list(scraper)
+            else:
+                scraper._check_response(list_response, scraper._list_url)
+                data = scraper._parse_list(list_response.text)
+                list_state = _validators(list_response)
+            entries = {id: _fingerprint(entry) for id, entry in scraper._list_entries(data).items()}
+            states = store._object_states(scraper)
+
+            removed.extend(sorted(id for id in states if id not in entries))
+            store._remove(scraper, removed)
+
+            candidates = [id for id, fingerprint in entries.items()
+                          if id not in states or revalidate or states[id][0] != fingerprint]
+
+            def fetch_detail(id: str) -> httpx.Response:
+                url = scraper._detail_url(id)
+                # New and re-listed IDs are downloaded in full; unchanged entries only when the page itself changed
+                headers = None
+                if id in states and states[id][0] == entries[id]:
+                    headers = _conditional_headers(*states[id][2:])
+                response = fetch(url, headers=headers)
+                if response.status_code != 304:
+                    scraper._check_response(response, url, id)
+                return response
+
+            for id, future in [(id, pool.submit(fetch_detail, id)) for id in candidates]:
+                requests += 1
+                try:
+                    response = future.result()
+                    if response.status_code == 304:
+                        continue
+                    detail = scraper._parse_detail(id, response.text)
+                except Exception as error:
+                    failed[id] = str(error)
+                    continue
+
+                if id not in states:
+                    added.append(id)
+                elif detail.get("last_modified") != states[id][1] or detail != store.get(scraper, id):
+                    modified.append(id)
+                    scraper.invalidate(id)
+                store._put(scraper, id, detail, entries[id], *_validators(response))
+
+            for id in removed:
+                scraper.invalidate(id)
+            # Keep the previous validators of the list page while some IDs still have to be retried,
+            # so the next run does not skip them on a 304
+            store._put_list(scraper, data, *(list_state if not failed else (None, None)))
+            scraper.invalidate(scraper._LIST_MEMO_KEY)
+    return report._replace(requests=requests)
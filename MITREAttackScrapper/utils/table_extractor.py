@@ -0,0 +1,211 @@
+# MITREAttackScrapper/utils/table_extractor.py
+from bs4 import Tag
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Union
+
+from .instrumentation import count
+
+BASE_URL = "https://attack.mitre.org"
+
+def _link(cell: Tag, link: int) -> Optional[Tag]:
+    """
+    Get the ``link``-th ``<a>`` element of a cell, or ``None`` if the cell has fewer links.
+    """
+    if link == 0:
+        return cell.find("a")
+    links = cell.find_all("a")
+    return links[link] if len(links) > link else None
+
+def _link_text(cell: Tag, link: int) -> Optional[str]:
+    a_tag = _link(cell, link)
+    return a_tag.get_text(strip=True) if a_tag is not None else None
+
+def _link_raw(cell: Tag, link: int) -> Optional[str]:
+    a_tag = _link(cell, link)
+    return a_tag.text.strip() if a_tag is not None else None
+
+def _href(cell: Tag, link: int) -> Optional[str]:
+    a_tag = _link(cell, link)
+    return a_tag.get("href") if a_tag is not None else None
+
+def _url(cell: Tag, link: int) -> Optional[str]:
+    href = _href(cell, link)
+    return BASE_URL + href if href is not None else None
+
+# How a column reads its value out of a cell, given the index of the link to read for the link-based ones
+EXTRACTORS: Dict[str, Callable[[Tag, int], Any]] = {
+    "text": lambda cell, link: cell.get_text(strip=True),        # the strings of the cell, stripped and joined
+    "spaced": lambda cell, link: cell.get_text(" ", strip=True),  # the same, joined with spaces
+    "raw": lambda cell, link: cell.text.strip(),                  # the text of the cell, stripped at both ends only
+    "link_text": _link_text,                                      # "text" of a link, None without the link
+    "link_raw": _link_raw,                                        # "raw" of a link, None without the link
+    "href": _href,                                                # href of a link, None without the link
+    "url": _url,                                                  # absolute URL of a link, None without the link
+    "link_texts": lambda cell, link: [a_tag.get_text(strip=True) for a_tag in cell.find_all("a")],
+    "hrefs": lambda cell, link: [a_tag["href"] for a_tag in cell.find_all("a")],
+}
+
+class Column(NamedTuple):
+    """
+    A column of a table, read into one field of every row.
+
+    :param field: The key of the value in the row dictionary.
+    :type field: str
+    :param index: The index of the cell (``<td>``) in the row.
+    :type index: int
+    :param extract: How the value is read out of the cell, a key of ``EXTRACTORS``.
+    :type extract: str
+    :param link: For the link-based extractors, the index of the link in the cell.
+    :type link: int
+    :param carry: Whether an empty value is replaced by the last non-empty value of the field in the previous rows,
+                  for the cells ATT&CK leaves empty when they repeat the row above (e.g. the domain, the main technique).
+    :type carry: bool
+    """
+    field: str
+    index: int
+    extract: str = "text"
+    link: int = 0
+    carry: bool = False
+
+class TableSpec:
+    """
+    A declarative description of an ATT&CK table, compiled once and applied to every table of that kind.
+
+    Rows come in one or more layouts, told apart by their number of cells (or by ``layout``), e.g. the rows
+    of a technique and of a sub-technique in a "Techniques Used" table. Each layout lists the columns to read;
+    rows matching no layout (header rows, whose cells are ``<th>``) are skipped. The values read from a row are then
+    handed to ``build``, which turns them into the row dictionary (or ``None`` to skip the row); without ``build``,
+    the row dictionary holds the values as read, in the order of the columns.
+
+    :param layouts: The columns of every layout, keyed by the number of cells of the rows (or the key given by ``layout``).
+    :type layouts: Mapping[Hashable, Sequence[Column]]
+    :param build: A function building the row dictionary from the values read.
+    :type build: Optional[Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]]
+    :param layout: A function giving the layout key of a row from the row and its cells, instead of the number of cells.
+    :type layout: Optional[Callable[[Tag, List[Tag]], Hashable]]
+    :raises ValueError: If a column has an unknown extractor.
+
+    :Example:
+
+    .. code-block:: python
+
+        from MITREAttackScrapper.utils.table_extractor import Column, TableSpec
+
+        MITIGATIONS_TABLE = TableSpec({3: [Column("id", 0), Column("name", 1), Column("description", 2)]})
+        mitigations = MITIGATIONS_TABLE.extract(sections.following("Mitigations", "table"))
+    """
+
+    def __init__(self,
+                 layouts: Mapping[Hashable, Sequence[Column]],
+                 build: Optional[Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]] = None,
+                 layout: Optional[Callable[[Tag, List[Tag]], Hashable]] = None) -> None:
+        self._layouts = {}
+        for key, columns in layouts.items():
+            for column in columns:
+                if column.extract not in EXTRACTORS:
+                    raise ValueError(f"Unknown extractor {column.extract!r} for the column {column.field!r}, "
+                                     f"should be one of {', '.join(EXTRACTORS)}")
+            self._layouts[key] = tuple((column.field, column.index, EXTRACTORS[column.extract], column.link, column.carry)
+                                       for column in columns)
+        self._build = build
+        self._layout = layout
+
+    def extract(self, table: Union[Tag, None]) -> List[Dict[str, Any]]:
+        """
+        Read every row of the body of a table.
+
+        :param table: The ``<table>`` element, or ``None`` if the page has no such table.
+        :type table: Union[Tag, None]
+        :return: The row dictionaries, in the order of the table. Empty if ``table`` is ``None``.
+        :rtype: List[Dict[str, Any]]
+        """
+        if table is None:
+            return []
+        body = table.find("tbody") or table
+        rows = list(self.extract_rows(body.find_all("tr")))
+        count("rows", len(rows))
+        return rows
+
+    def extract_rows(self, rows: Iterable[Tag]) -> Iterator[Dict[str, Any]]:
+        """
+        Read rows of a table, carrying values from one row to the next.
+
+        :param rows: The ``<tr>`` elements.
+        :type rows: Iterable[Tag]
+        :return: An iterator of the row dictionaries, one per row matching a layout.
+        :rtype: Iterator[Dict[str, Any]]
+        """
+        layouts = self._layouts
+        build = self._build
+        layout = self._layout
+        carried: Dict[str, Any] = {}
+        for row in rows:
+            # Only the direct <td> children: cheaper than row.find_all("td"), which walks every descendant
+            cells = [cell for cell in row.contents if cell.name == "td"]
+            columns = layouts.get(len(cells) if layout is None else layout(row, cells))
+            if columns is None:
+                continue
+            values = {}
+            for field, index, extract, link, carry in columns:
+                value = extract(cells[index], link)
+                if carry:
+                    if value:
+                        carried[field] = value
+                    else:
+                        value = carried.get(field)
+                values[field] = value
+            if build is not None:
+                values = build(values)
+                if values is None:
+                    continue
+            yield values
+
+    def extract_row(self, row: Tag) -> Optional[Dict[str, Any]]:
+        """
+        Read a single row, e.g. one row of a list page streamed by ``iter_list()``.
+
+        :param row: The ``<tr>`` element.
+        :type row: Tag
+        :return: The row dictionary, or ``None`` if the row matches no layout.
+        :rtype: Optional[Dict[str, Any]]
+        """
+        return next(self.extract_rows((row,)), None)
+
+def with_url(path: str) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Get a ``build`` function adding the URL of the page of every row's ``id``, e.g. ``/groups/G0016/`` for ``groups``.
+
+    :param path: The path of the pages of the kind of object, e.g. ``groups``.
+    :type path: str
+    :return: The ``build`` function.
+    :rtype: Callable[[Dict[str, Any]], Dict[str, Any]]
+    """
+    def build(values: Dict[str, Any]) -> Dict[str, Any]:
+        values["url"] = f"{BASE_URL}/{path}/{values['id']}/"
+        return values
+    return build
+
+def _technique_use(values: Dict[str, Any]) -> Dict[str, Any]:
+    main_technique_id = values["main_technique_id"]
+    sub_technique_id = values.get("sub_technique_id")
+    if sub_technique_id:
+        sub_technique_id = sub_technique_id.replace(".", "")
+    return {
+        "domain": values["domain"],
+        "main_technique_id": main_technique_id,
+        "main_technique_name": values["main_technique_name"],
+        "main_technique_url": f"{BASE_URL}/techniques/{main_technique_id}/",
+        "sub_technique_id": f"{main_technique_id}.{sub_technique_id}" if sub_technique_id else None,
+        "sub_technique_name": values.get("sub_technique_name"),
+        "sub_technique_url": f"{BASE_URL}/techniques/{main_technique_id}/{sub_technique_id}/" if sub_technique_id else None,
+        "use": values["use"],
+    }
+
+# The "Techniques Used" table of the group and campaign pages: a row of a sub-technique has one more cell,
+# and leaves the domain and the main technique empty when they repeat the row above
+TECHNIQUES_USED_TABLE = TableSpec({
+    4: [Column("domain", 0, carry=True), Column("main_technique_id", 1, "link_text", carry=True),
+        Column("main_technique_name", 2, "link_text"), Column("use", 3, "spaced")],
+    5: [Column("domain", 0, carry=True), Column("main_technique_id", 1, "link_text", carry=True),
+        Column("sub_technique_id", 2, "link_text"), Column("main_technique_name", 3, "link_text"),
+        Column("sub_technique_name", 3, "link_text", link=1), Column("use", 4, "spaced")],
+}, build=_technique_use)
@@ -0,0 +1,345 @@
+# benchmarks/fixtures.py
+"""
+Fixture pages for the benchmarks.
+
+``build_site()`` generates synthetic pages with the same structure as attack.mitre.org (the elements,
+classes and headings the scrapers look for), so benchmarks are reproducible and run offline.
+``scale`` multiplies the number of rows of the large pages (technique index, matrix, procedure tables).
+
+Real pages can be recorded once and used instead of the synthetic ones::
+
+    python benchmarks/fixtures.py record benchmarks/recorded
+
+Both kinds of fixtures are dictionaries mapping a URL path (e.g. ``/groups/G0016/``) to its HTML.
+"""
+import os
+import sys
+import random
+from typing import Dict
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+BASE = "https://attack.mitre.org"
+MONTHS = ["January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December"]
+
+
+def _date(rng):
+    return f"{rng.randint(1, 28)} {rng.choice(MONTHS)} {rng.randint(2017, 2024)}"
+
+
+def _words(rng, n):
+    vocab = ["adversary", "credential", "dump", "process", "memory", "lsass", "registry",
+             "powershell", "script", "execute", "payload", "network", "discovery", "account",
+             "domain", "token", "privilege", "escalation", "persistence", "service", "beacon"]
+    return " ".join(rng.choice(vocab) for _ in range(n))
+
+
+def _sidenav():
+    # Like on attack.mitre.org, every page carries the collapsed navigation tree of all the techniques
+    entries = []
+    for i in range(600):
+        subs = "".join(f'<div class="sidenav-item"><a href="/techniques/T{1000 + i}/{s:03d}">Sub-technique {s}</a></div>' for s in range(1, 1 + i % 4))
+        entries.append(f'<div class="sidenav"><div class="sidenav-head"><a href="/techniques/T{1000 + i}">Technique {i}</a>'
+                       f'<div class="expand-button" role="button"></div></div><div class="sidenav-body collapse">{subs}</div></div>')
+    return f'<div class="sidenav-wrapper"><div class="sidenav-list">{"".join(entries)}</div></div>'
+
+
+_SIDENAV = _sidenav()
+
+
+def _page(body, jumbo=True):
+    if jumbo:
+        body = f"""<div class="tab-pane" id="v-attckmatrix"><div class="row"><div class="col-xl-12"><div class="jumbotron"><div class="container-fluid">{body}</div></div></div></div></div>"""
+    return f"""<!DOCTYPE html><html><head><title>t</title><script>var x = 1;</script></head>
+<body><nav><ul><li><a href="/">Home</a></li></ul></nav>{_SIDENAV}
+<div id="layouts-content">{body}</div><footer><p>ATT&amp;CK v15.1</p></footer></body></html>"""
+
+
+def _refs(rng, n):
+    lis = "".join(f'<li><span id="scite-{i}"><a href="https://example.com/r{i}">Ref {i}. ({_words(rng, 4)}). Retrieved {_date(rng)}.</a></span></li>' for i in range(1, n + 1))
+    return f'<h2 class="pt-3">References</h2><div class="row"><div class="col"><ol>{lis}</ol></div></div>'
+
+
+def _card(rows):
+    return f'<div class="col-md-4"><div class="card"><div class="card-body">{"".join(rows)}</div></div></div>'
+
+
+def _desc(rng, n=3):
+    return f'<div class="col-md-8"><div class="description-body">' + "".join(f"<p>{_words(rng, 20)}<sup>[{i}]</sup></p>" for i in range(n)) + "</div></div>"
+
+
+def technique_list(rng, n=40):
+    rows = []
+    for i in range(n):
+        tid = f"T{1000 + i}"
+        rows.append(f'<tr class="technique"><td><a href="/techniques/{tid}">{tid}</a></td><td><a href="/techniques/{tid}">Tech {i}</a></td><td>{_words(rng, 12)}</td></tr>')
+        for s in range(rng.randint(0, 4)):
+            rows.append(f'<tr class="sub technique"><td></td><td><a href="/techniques/{tid}/{s + 1:03d}">.{s + 1:03d}</a></td><td><a href="/techniques/{tid}/{s + 1:03d}">Sub {s}</a></td><td>{_words(rng, 10)}</td></tr>')
+    return _page(f'<table class="table-techniques"><thead><tr><td>ID</td><td>Name</td><td>Description</td></tr></thead><tbody>{"".join(rows)}</tbody></table>', jumbo=False)
+
+
+def _procedures(rng, n):
+    rows = "".join(f'<tr><td><a href="/software/S{100 + i:04d}">S{100 + i:04d}</a></td><td><a href="/software/S{100 + i:04d}">Soft {i}</a></td><td><p>{_words(rng, 15)}<sup>[1]</sup></p></td></tr>' for i in range(n))
+    return f'<h2 class="pt-3" id="examples">Procedure Examples</h2><table class="table table-bordered table-alternate mt-2"><thead><tr><th>ID</th><th>Name</th><th>Description</th></tr></thead><tbody>{rows}</tbody></table>'
+
+
+def _mitigations(rng, n):
+    rows = "".join(f'<tr><td><a href="/mitigations/M{1000 + i}">M{1000 + i}</a></td><td><a href="/mitigations/M{1000 + i}">Mit {i}</a></td><td><p>{_words(rng, 12)}</p></td></tr>' for i in range(n))
+    return f'<h2 class="pt-3" id="mitigations">Mitigations</h2><table class="table table-bordered table-alternate mt-2"><thead><tr><th>ID</th><th>Mitigation</th><th>Description</th></tr></thead><tbody>{rows}</tbody></table>'
+
+
+def _detection(rng, n):
+    rows = []
+    for i in range(n):
+        for c in range(rng.randint(1, 3)):
+            first = c == 0
+            rows.append(f'<tr class="datasource"><td>{f"<a href=/datasources/DS{i:04d}>DS{i:04d}</a>" if first else ""}</td><td>{f"<a>Source {i}</a>" if first else ""}</td><td><a>Component {c}</a></td><td>{_words(rng, 8)}</td></tr>')
+    return f'<h2 class="pt-3" id="detection">Detection</h2><table class="table datasources-table table-bordered"><thead><tr><th>ID</th><th>Data Source</th><th>Data Component</th><th>Detects</th></tr></thead><tbody>{"".join(rows)}</tbody></table>'
+
+
+def technique_page(rng, tid, sub=None, procedures=10):
+    rows = [f'<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">ID:&nbsp;</span>{tid}{"." + sub if sub else ""}</div></div>']
+    if not sub:
+        links = ", ".join(f'<a href="/techniques/{tid}/{s:03d}">{tid}.{s:03d}</a>' for s in range(1, 4))
+        rows.append(f'<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Sub-techniques:&nbsp;</span>{links}</div></div>')
+    rows.append('<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Tactics:&nbsp;</span><a href="/tactics/TA0004">Privilege Escalation</a>, <a href="/tactics/TA0005">Defense Evasion</a></div></div>')
+    rows.append('<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Platforms:&nbsp;</span>Linux, Windows, macOS</div></div>')
+    rows.append('<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Permissions Required:&nbsp;</span>Administrator, User</div></div>')
+    rows.append('<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Version:&nbsp;</span>1.2</div></div>')
+    rows.append(f'<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Created:&nbsp;</span>{_date(rng)}</div></div>')
+    rows.append(f'<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Last Modified:&nbsp;</span>{_date(rng)}</div></div>')
+    body = f'<h1 id="">{"Main Name: Sub" if sub else "Main Name " + tid}</h1><div class="row">{_desc(rng)}{_card(rows)}</div>'
+    body += _procedures(rng, procedures) + _mitigations(rng, 4) + _detection(rng, 5) + _refs(rng, 8)
+    return _page(body)
+
+
+def simple_list(rng, prefix, path, n, cols=3, link=True):
+    rows = []
+    for i in range(n):
+        oid = f"{prefix}{i + 1:04d}"
+        first = f'<a href="/{path}/{oid}">{oid}</a>' if link else oid
+        cells = [first, f'<a href="/{path}/{oid}">{prefix} Name {i}</a>']
+        if cols == 4:
+            cells.append(", ".join(f"Alias{i}-{j}" for j in range(rng.randint(0, 3))))
+        cells.append(f"<p>{_words(rng, 12)}</p>")
+        rows.append("<tr>" + "".join(f"<td>{c}</td>" for c in cells) + "</tr>")
+    head = "<thead><tr>" + "".join(f"<th>h{i}</th>" for i in range(cols)) + "</tr></thead>"
+    return _page(f'<table class="table table-bordered table-alternate mt-2">{head}<tbody>{"".join(rows)}</tbody></table>', jumbo=False)
+
+
+def tactic_page(rng, taid):
+    rows = []
+    for i in range(20):
+        tid = f"T{1000 + i}"
+        rows.append(f'<tr class="technique"><td><a href="/techniques/{tid}">{tid}</a></td><td><a href="/techniques/{tid}">Tech {i}</a></td><td>{_words(rng, 10)}</td></tr>')
+        for s in range(rng.randint(0, 3)):
+            rows.append(f'<tr class="sub technique"><td></td><td><a href="/techniques/{tid}/{s + 1:03d}">.{s + 1:03d}</a></td><td><a href="/techniques/{tid}/{s + 1:03d}">Sub {s}</a></td><td>{_words(rng, 10)}</td></tr>')
+    card = _card([f'<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">ID:&nbsp;</span>{taid}</div></div>',
+                  f'<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Created:&nbsp;</span>{_date(rng)}</div></div>',
+                  f'<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Last Modified:&nbsp;</span>{_date(rng)}</div></div>'])
+    body = f'<h1 id="">Tactic {taid}</h1><div class="row">{_desc(rng, 1)}{card}</div>'
+    body += f'<h2 class="pt-3">Techniques</h2><table class="table-techniques"><thead><tr><td>ID</td><td>Name</td><td>Description</td></tr></thead><tbody>{"".join(rows)}</tbody></table>'
+    return _page(body)
+
+
+def _techniques_used(rng, n, link_ids=True, css="table techniques-used background table-bordered"):
+    rows = []
+    for i in range(n):
+        tid = f"T{1000 + rng.randint(0, 39)}"
+        if rng.random() < 0.5:
+            tidc = f'<a href="/techniques/{tid}">{tid}</a>' if link_ids else tid
+            rows.append(f'<tr><td>{"Enterprise" if i == 0 or rng.random() < 0.3 else ""}</td><td colspan="2">{tidc}</td><td><a href="/techniques/{tid}">Name {tid}</a></td><td><p>{_words(rng, 14)}</p></td></tr>')
+        else:
+            s = rng.randint(1, 3)
+            tidc = f'<a href="/techniques/{tid}">{tid}</a>' if link_ids else tid
+            subc = f'<a href="/techniques/{tid}/{s:03d}">.{s:03d}</a>' if link_ids else f".{s:03d}"
+            rows.append(f'<tr><td>{"Enterprise" if i == 0 else ""}</td><td>{tidc}</td><td>{subc}</td><td><a href="/techniques/{tid}">Name {tid}</a>: <a href="/techniques/{tid}/{s:03d}">Sub {s}</a></td><td><p>{_words(rng, 14)}</p></td></tr>')
+    return f'<h2 class="pt-3" id="techniques">Techniques Used</h2><table class="{css}"><thead><tr><th>Domain</th><th colspan="2">ID</th><th>Name</th><th>Use</th></tr></thead><tbody>{"".join(rows)}</tbody></table>'
+
+
+def mitigation_page(rng, mid):
+    rows = []
+    for i in range(30):
+        tid = f"T{1000 + i}"
+        dom = "Enterprise" if i == 0 else ""
+        if rng.random() < 0.5:
+            rows.append(f'<tr><td>{dom}</td><td><a href="/techniques/{tid}">{tid}</a></td><td></td><td><a href="/techniques/{tid}">Name {tid}</a></td><td><p>{_words(rng, 12)}</p></td></tr>')
+        else:
+            rows.append(f'<tr><td>{dom}</td><td>{"" if rng.random() < 0.3 else f"<a href=/techniques/{tid}>{tid}</a>"}</td><td><a href="/techniques/{tid}/001">.001</a></td><td><a href="/techniques/{tid}">Name {tid}</a>: <a href="/techniques/{tid}/001">Sub</a></td><td><p>{_words(rng, 12)}</p></td></tr>')
+    card = _card(['<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Version:&nbsp;</span>1.1</div></div>',
+                  f'<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Created:&nbsp;</span>{_date(rng)}</div></div>',
+                  f'<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Last Modified:&nbsp;</span>{_date(rng)}</div></div>'])
+    body = f'<h1 id="">Mitigation {mid}</h1><div class="row">{_desc(rng, 2)}{card}</div>'
+    body += f'<h2 class="pt-3" id="techniques">Techniques Addressed by Mitigation</h2><table class="table table-bordered table-alternate mt-2"><thead><tr><th>Domain</th><th colspan="2">ID</th><th>Name</th><th>Description</th></tr></thead><tbody>{"".join(rows)}</tbody></table>'
+    body += _refs(rng, 5)
+    return _page(body)
+
+
+def group_page(rng, gid, techniques=60):
+    card = _card([f'<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">ID:&nbsp;</span>{gid}</div></div>',
+                  '<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Contributors</span>: Alice; Bob Smith</div></div>',
+                  '<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Version</span>: 3.1</div></div>',
+                  f'<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Created:&nbsp;</span>{_date(rng)}</div></div>',
+                  f'<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Last Modified:&nbsp;</span>{_date(rng)}</div></div>'])
+    desc = f'<div class="col-md-8"><div class="description-body"><p>{_words(rng, 30)}</p></div></div>'
+    body = f'<h1 id="">Group {gid}</h1><div class="row">{desc}{card}</div>'
+    assoc = "".join(f"<tr><td>Alias{j}</td><td><p>{_words(rng, 6)}</p></td></tr>" for j in range(3))
+    body += f'<h2 class="pt-3" id="aliasDescription">Associated Group Descriptions</h2><table class="table table-bordered table-alternate mt-2"><thead><tr><th>Name</th><th>Description</th></tr></thead><tbody>{assoc}</tbody></table>'
+    body += _techniques_used(rng, techniques)
+    sw = "".join(f'<tr><td><a href="/software/S{j:04d}">S{j:04d}</a></td><td><a href="/software/S{j:04d}">Soft {j}</a></td><td><a href="#scite-1">[1]</a><a href="#scite-2">[2]</a></td><td><a href="/techniques/T1001">Name A</a>, <a href="/techniques/T1002/001">Name B: Sub</a></td></tr>' for j in range(8))
+    body += f'<h2 class="pt-3" id="software">Software</h2><table class="table table-bordered table-alternate mt-2"><thead><tr><th>ID</th><th>Name</th><th>References</th><th>Techniques</th></tr></thead><tbody>{sw}</tbody></table>'
+    body += _refs(rng, 12)
+    return _page(body)
+
+
+def software_page(rng, sid):
+    card = _card([f'<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">ID:&nbsp;</span>{sid}</div></div>',
+                  '<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Type</span>: MALWARE</div></div>',
+                  '<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Platforms</span>: Windows, Linux</div></div>',
+                  '<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Version</span>: 1.3</div></div>',
+                  f'<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Created:&nbsp;</span>{_date(rng)}</div></div>',
+                  f'<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Last Modified:&nbsp;</span>{_date(rng)}</div></div>'])
+    desc = f'<div class="col-md-8"><div class="description-body"><p>{_words(rng, 30)}</p></div></div>'
+    body = f'<h1 id="">Software {sid}</h1><div class="row">{desc}{card}</div>'
+    body += _techniques_used(rng, 40, link_ids=False)
+    groups = "".join(f'<tr><td><a href="/groups/G{j:04d}">G{j:04d}</a></td><td><a href="/groups/G{j:04d}">Group {j}</a></td><td><a href="#scite-{j}">[{j}]</a></td></tr>' for j in range(1, 5))
+    body += f'<h2 class="pt-3" id="groups">Groups That Use This Software</h2><table class="table table-bordered table-alternate mt-2"><thead><tr><th>ID</th><th>Name</th><th>References</th></tr></thead><tbody>{groups}</tbody></table>'
+    body += _refs(rng, 6)
+    return _page(body)
+
+
+def campaign_page(rng, cid):
+    card = _card([f'<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">ID:&nbsp;</span>{cid}</div></div>',
+                  '<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">First Seen</span>: <span>September 2015 <a href="#scite-1">[1]</a></span></div></div>',
+                  '<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Last Seen</span>: <span>March 2016 <a href="#scite-1">[1]</a></span></div></div>',
+                  '<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Version</span>: 1.0</div></div>',
+                  f'<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Created:&nbsp;</span>{_date(rng)}</div></div>',
+                  f'<div class="row card-data"><div class="col-md-11 pl-0"><span class="h5 card-title">Last Modified:&nbsp;</span>{_date(rng)}</div></div>'])
+    desc = f'<div class="col-md-8"><div class="description-body"><p>{_words(rng, 30)}</p></div></div>'
+    body = f'<h1 id="">Campaign {cid}</h1><div class="row">{desc}{card}</div>'
+    groups = "".join(f'<tr><td><a href="/groups/G{j:04d}">G{j:04d}</a></td><td><a href="/groups/G{j:04d}">Group {j}</a></td><td><p>{_words(rng, 5)}</p></td></tr>' for j in range(1, 3))
+    body += f'<h2 class="pt-3" id="groups">Groups</h2><table class="table table-bordered table-alternate mt-2"><thead><tr><th>ID</th><th>Name</th><th>References</th></tr></thead><tbody>{groups}</tbody></table>'
+    body += _techniques_used(rng, 25)
+    sw = "".join(f'<tr><td><a href="/software/S{j:04d}">S{j:04d}</a></td><td><a href="/software/S{j:04d}">Soft {j}</a></td><td><p>{_words(rng, 5)}</p></td></tr>' for j in range(1, 4))
+    body += f'<h2 class="pt-3" id="software">Software</h2><table class="table table-bordered table-alternate mt-2"><thead><tr><th>ID</th><th>Name</th><th>Description</th></tr></thead><tbody>{sw}</tbody></table>'
+    body += _refs(rng, 4)
+    return _page(body)
+
+
+def matrix_page(rng, tactics=14, techniques=12):
+    head = "".join(f'<td class="tactic name"><a href="/tactics/TA{i + 1:04d}" title="TA{i + 1:04d}">Tactic {i}</a></td>' for i in range(tactics))
+    cols = []
+    for i in range(tactics):
+        trs = []
+        for j in range(rng.randint(techniques // 2, techniques)):
+            tid = f"T{1000 + (i * 7 + j) % 60}"
+            subs = ""
+            nsub = rng.randint(0, 3)
+            if nsub:
+                subs = '<div class="subtechniques-container">' + "".join(
+                    f'<div class="subtechnique"><div class="technique-cell" id="{tid}-{s}--x-mitre-tactic--{i:08d}-aaaa--attack-pattern--{j:08d}-{s}"><a href="/techniques/{tid}/{s:03d}" title="{tid}.{s:03d}">Sub {s}&nbsp;</a></div></div>' for s in range(1, nsub + 1)) + "</div>"
+            trs.append(f'<tr class="technique-row"><td><table><tr><td><div class="supertechniquecell" id="{tid}--x-mitre-tactic--{i:08d}-bbbb--attack-pattern--{j:08d}-cccc"><a href="/techniques/{tid}" title="{tid}">Tech {tid}&nbsp;({nsub})</a></div></td></tr></table>{subs}</td></tr>')
+        cols.append(f'<td class="tactic"><table class="tactic">{"".join(trs)}</table></td>')
+    table = f'<table class="matrix side"><thead><tr>{head}</tr><tr><td>count</td></tr></thead><tbody><tr>{"".join(cols)}</tr></tbody></table>'
+    body = f'<div class="matrix-type side"><div><div><div class="overflow-x-auto matrix-scroll-box pb-3">{table}</div></div></div></div>'
+    return _page(body, jumbo=False)
+
+
+def build_site(seed=7, scale=1):
+    rng = random.Random(seed)
+    site = {}
+    site["/techniques/enterprise/"] = technique_list(rng, n=40 * scale)
+    site["/tactics/enterprise/"] = simple_list(rng, "TA", "tactics", 14)
+    site["/mitigations/enterprise/"] = simple_list(rng, "M", "mitigations", 20)
+    site["/groups/"] = simple_list(rng, "G", "groups", 20, cols=4)
+    site["/software/"] = simple_list(rng, "S", "software", 20, cols=4)
+    site["/campaigns/"] = simple_list(rng, "C", "campaigns", 8)
+    site["/matrices/enterprise/"] = matrix_page(rng, techniques=12 * scale)
+    for i in range(5):
+        tid = f"T{1000 + i}"
+        site[f"/techniques/{tid}/"] = technique_page(rng, tid, procedures=10 * scale)
+        site[f"/techniques/{tid}/001/"] = technique_page(rng, tid, sub="001")
+    for i in range(1, 4):
+        site[f"/tactics/TA{i:04d}/"] = tactic_page(rng, f"TA{i:04d}")
+        site[f"/mitigations/M{1000 + i}/"] = mitigation_page(rng, f"M{1000 + i}")
+        site[f"/groups/G{i:04d}/"] = group_page(rng, f"G{i:04d}", techniques=60 * scale)
+        site[f"/software/S{i:04d}/"] = software_page(rng, f"S{i:04d}")
+        site[f"/campaigns/C{i:04d}/"] = campaign_page(rng, f"C{i:04d}")
+    return site
+
+
+# A representative page of every page type, as (scraper module, scraper class, ID or None for the list page, URL path)
+PAGE_TYPES = {
+    "technique list": ("MITREAttackScrapper.techniques.enterprise", "MITREAttackEnterpriseTechniques", None, "/techniques/enterprise/"),
+    "technique": ("MITREAttackScrapper.techniques.enterprise", "MITREAttackEnterpriseTechniques", "T1001", "/techniques/T1001/"),
+    "sub-technique": ("MITREAttackScrapper.techniques.enterprise", "MITREAttackEnterpriseTechniques", "T1001.001", "/techniques/T1001/001/"),
+    "matrix": ("MITREAttackScrapper.matrices.enterprise", "MITREAttackEnterpriseMatrix", None, "/matrices/enterprise/"),
+    "tactic": ("MITREAttackScrapper.tactics.enterprise", "MITREAttackEnterpriseTactics", "TA0001", "/tactics/TA0001/"),
+    "mitigation": ("MITREAttackScrapper.mitigations.enterprise", "MITREAttackEnterpriseMitigations", "M1001", "/mitigations/M1001/"),
+    "group list": ("MITREAttackScrapper.cti.groups", "MITREAttackCTIGroups", None, "/groups/"),
+    "group": ("MITREAttackScrapper.cti.groups", "MITREAttackCTIGroups", "G0001", "/groups/G0001/"),
+    "software": ("MITREAttackScrapper.cti.software", "MITREAttackCTISoftware", "S0001", "/software/S0001/"),
+    "campaign": ("MITREAttackScrapper.cti.campaigns", "MITREAttackCampaign", "C0001", "/campaigns/C0001/"),
+}
+
+# Pages of real ATT&CK objects recorded by `record`, mapped onto the fixture paths above
+RECORDED_PAGES = {
+    "/techniques/enterprise/": "/techniques/enterprise/",
+    "/techniques/T1001/": "/techniques/T1059/",
+    "/techniques/T1001/001/": "/techniques/T1059/001/",
+    "/matrices/enterprise/": "/matrices/enterprise/",
+    "/tactics/TA0001/": "/tactics/TA0002/",
+    "/mitigations/M1001/": "/mitigations/M1026/",
+    "/groups/": "/groups/",
+    "/groups/G0001/": "/groups/G0016/",
+    "/software/S0001/": "/software/S0002/",
+    "/campaigns/C0001/": "/campaigns/C0024/",
+}
+
+
+def page_file(path: str) -> str:
+    return path.strip("/").replace("/", "_") + ".html"
+
+
+def record(directory: str) -> None:
+    """Download the real pages listed in RECORDED_PAGES into the given directory."""
+    from MITREAttackScrapper.utils.http_client import ATTACK_BASE_URL, fetch
+
+    os.makedirs(directory, exist_ok=True)
+    for fixture_path, real_path in RECORDED_PAGES.items():
+        response = fetch(ATTACK_BASE_URL + real_path)
+        response.raise_for_status()
+        with open(os.path.join(directory, page_file(fixture_path)), "w", encoding="utf-8") as file:
+            file.write(response.text)
+        print(f"{real_path} -> {page_file(fixture_path)} ({len(response.content)} bytes)")
+
+
+def load_recorded(directory: str) -> Dict[str, str]:
+    """Load the pages recorded by `record`, keyed by their fixture path."""
+    site = {}
+    for fixture_path in RECORDED_PAGES:
+        with open(os.path.join(directory, page_file(fixture_path)), encoding="utf-8") as file:
+            site[fixture_path] = file.read()
+    return site
+
+
+def install_site(site: Dict[str, str]) -> None:
+    """Route every request of the shared HTTP client to the given fixture pages."""
+    from MITREAttackScrapper.utils.http_client import configure_http_client
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        path = request.url.path if request.url.path.endswith("/") else request.url.path + "/"
+        if path not in site:
+            return httpx.Response(404, request=request)
+        return httpx.Response(200, text=site[path], request=request)
+
+    configure_http_client(transport=httpx.MockTransport(respond), async_transport=httpx.MockTransport(respond))
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] != ["record"] or len(sys.argv) != 3:
+        sys.exit("usage: python benchmarks/fixtures.py record <directory>")
+    record(sys.argv[2])
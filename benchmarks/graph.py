@@ -0,0 +1,119 @@
+# benchmarks/graph.py
+"""
+Threat profile of a group: its software, their techniques and the mitigations of those techniques.
+
+A local fixture server stands in for attack.mitre.org. It generates a group, software, technique or mitigation page
+for any ID, after a fixed ``--latency``, and counts the requests. The profile of ``--group`` is then built:
+
+- serial: ``get()`` of the group, then of each of its software, then of each technique used by either,
+  then of each mitigation of those techniques, one after the other, the way callers chained them
+- expand: ``expand([group], depth=3)``, which fetches each level as one concurrent batch and every page once
+
+The memo is disabled, so the pages fetched again by the serial chain are downloaded again.
+
+Usage::
+
+    python benchmarks/graph.py [--group G0001] [--latency 0.05] [--workers 16]
+"""
+import os
+import re
+import sys
+import time
+import random
+import argparse
+import threading
+import http.server
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fixtures import group_page, software_page, technique_page, mitigation_page
+from MITREAttackScrapper.analytics.graph import expand
+from MITREAttackScrapper.analytics.similarity import techniques_used
+from MITREAttackScrapper.cti.groups import MITREAttackCTIGroups
+from MITREAttackScrapper.cti.software import MITREAttackCTISoftware
+from MITREAttackScrapper.techniques.enterprise import MITREAttackEnterpriseTechniques
+from MITREAttackScrapper.mitigations.enterprise import MITREAttackEnterpriseMitigations
+from MITREAttackScrapper.utils.http_client import configure_http_client
+
+PAGES = [
+    (re.compile(r"/groups/(G\d{4})/"), lambda rng, match: group_page(rng, match[1])),
+    (re.compile(r"/software/(S\d{4})/"), lambda rng, match: software_page(rng, match[1])),
+    (re.compile(r"/techniques/(T\d{4})/(?:(\d{3})/)?"), lambda rng, match: technique_page(rng, match[1], sub=match[2])),
+    (re.compile(r"/mitigations/(M\d{4})/"), lambda rng, match: mitigation_page(rng, match[1])),
+]
+
+def start_fixture_server(latency: float) -> tuple:
+    requests = {"count": 0}
+    lock = threading.Lock()
+
+    class FixtureHandler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            with lock:
+                requests["count"] += 1
+            body = None
+            for pattern, page in PAGES:
+                match = pattern.fullmatch(self.path)
+                if match:
+                    body = page(random.Random(self.path), match).encode("utf-8")
+                    break
+            time.sleep(latency)
+            self.send_response(200 if body else 404)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body or b"")))
+            self.end_headers()
+            self.wfile.write(body or b"")
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, requests
+
+def serial_profile(group_id: str) -> dict:
+    group = MITREAttackCTIGroups.get(group_id)
+    software = [MITREAttackCTISoftware.get(item["id"]) for item in group["software"]]
+    techniques = [MITREAttackEnterpriseTechniques.get(technique_id)
+                  for data in [group] + software for technique_id in techniques_used(data)]
+    mitigations = [MITREAttackEnterpriseMitigations.get(mitigation["id"])
+                   for technique in techniques for mitigation in technique["mitigations"]]
+    return {"group": group, "software": software, "techniques": techniques, "mitigations": mitigations}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--group", default="G0001")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds added to every request")
+    parser.add_argument("--workers", type=int, default=16)
+    args = parser.parse_args()
+
+    server, requests = start_fixture_server(args.latency)
+    configure_http_client(base_url=f"http://127.0.0.1:{server.server_address[1]}", max_connections=args.workers)
+    for scraper in (MITREAttackCTIGroups, MITREAttackCTISoftware, MITREAttackEnterpriseTechniques, MITREAttackEnterpriseMitigations):
+        scraper.configure_memo(max_entries=0)
+
+    started = time.perf_counter()
+    profile = serial_profile(args.group)
+    serial_time = time.perf_counter() - started
+    serial_requests, requests["count"] = requests["count"], 0
+    serial_ids = ({profile["group"]["id"]} | {data["id"] for data in profile["software"]}
+                  | {data["main_technique_id"] + "." + data["id"] if data.get("main_technique_id") else data["id"]
+                     for data in profile["techniques"]}
+                  | {data["id"] for data in profile["mitigations"]})
+
+    started = time.perf_counter()
+    graph = expand([args.group], depth=3, max_workers=args.workers)
+    expand_time = time.perf_counter() - started
+    expand_requests = requests["count"]
+    server.shutdown()
+
+    print(f"profile of {args.group}: {len(graph.of_kind('software'))} software, {len(graph.of_kind('technique'))} techniques, "
+          f"{len(graph.of_kind('mitigation'))} mitigations, {len(graph.edges)} relationships, {args.latency * 1000:.0f} ms per request")
+    print(f"serial  {serial_time:>6.2f} s, {serial_requests:>4} requests")
+    print(f"expand  {expand_time:>6.2f} s, {expand_requests:>4} requests ({serial_time / expand_time:.1f}x), "
+          f"{len(graph.errors)} failed, same objects: {serial_ids == set(graph.nodes)}")
+
+if __name__ == "__main__":
+    main()
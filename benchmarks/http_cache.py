@@ -0,0 +1,100 @@
+# benchmarks/http_cache.py
+"""
+Cold-vs-warm benchmark of the on-disk HTTP cache.
+
+A local fixture server stands in for attack.mitre.org. It serves pages of a realistic size with an
+``ETag``/``Last-Modified`` pair, answers conditional requests with ``304 Not Modified``, and adds a fixed
+latency per request plus a transfer delay per byte to mimic a remote host. The same set of pages is
+then fetched three times through the shared fetch path:
+
+- cold: empty cache, every page is downloaded and stored
+- revalidate: every cached page is stale (TTL 0) and revalidated with a conditional request (304)
+- fresh: every cached page is within its TTL and served from disk without a request
+
+Usage::
+
+    python benchmarks/http_cache.py [--pages 200] [--page-size 120000] [--latency 0.02] [--bandwidth 5000000]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import threading
+import http.server
+from email.utils import formatdate
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from MITREAttackScrapper.utils.http_client import ATTACK_BASE_URL, configure_http_client, fetch
+from MITREAttackScrapper.utils.http_cache import MITREAttackHTTPCache
+
+def start_fixture_server(page_size: int, latency: float, bandwidth: float) -> http.server.ThreadingHTTPServer:
+    body = (b"<html><body>" + b"x" * page_size + b"</body></html>")
+    etag = '"fixture-v1"'
+    last_modified = formatdate(time.time() - 86400, usegmt=True)
+
+    class FixtureHandler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            time.sleep(latency)
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            time.sleep(len(body) / bandwidth)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", last_modified)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def run(urls, **client_options) -> float:
+    configure_http_client(**client_options)
+    started = time.perf_counter()
+    for url in urls:
+        response = fetch(url)
+        assert response.status_code == 200, response.status_code
+    return time.perf_counter() - started
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=120_000)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds added to every request")
+    parser.add_argument("--bandwidth", type=float, default=5_000_000, help="bytes per second of a full download")
+    args = parser.parse_args()
+
+    server = start_fixture_server(args.page_size, args.latency, args.bandwidth)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    urls = [f"{ATTACK_BASE_URL}/techniques/T{1000 + i:04d}/" for i in range(args.pages)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = {
+            "no cache": run(urls, base_url=base_url),
+            "cold": run(urls, base_url=base_url, cache=MITREAttackHTTPCache(directory, ttl=0)),
+            "revalidate (304)": run(urls, base_url=base_url, cache=MITREAttackHTTPCache(directory, ttl=0)),
+            "fresh (TTL)": run(urls, base_url=base_url, cache=MITREAttackHTTPCache(directory, ttl=3600)),
+        }
+    server.shutdown()
+
+    print(f"{args.pages} pages of {args.page_size} bytes, {args.latency * 1000:.0f} ms latency, "
+          f"{args.bandwidth / 1e6:.1f} MB/s")
+    for name, elapsed in results.items():
+        print(f"{name:>18}: {elapsed:8.3f} s  ({elapsed / args.pages * 1000:7.2f} ms/page, "
+              f"{results['no cache'] / elapsed:6.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# benchmarks/matrix.py
+"""
+Lookups and coverage computations over the Enterprise Matrix.
+
+- scan: answering "which tactics contain this technique?" for every technique with a linear scan
+  of the nested ``get_list()`` dictionary, as callers had to do
+- index: the same with ``MITREAttackMatrixIndex.tactics_of()``, including the one-off cost of building the index
+- coverage (dicts): the share of techniques of every tactic covered by each of ``--layers`` random layers,
+  walking the nested dictionary per layer
+- coverage (numpy): the same with ``MITREAttackMatrixIncidence.layer_matrix()`` and ``tactic_coverage()``,
+  including the one-off cost of building the incidence matrix
+- parse: the whole ``_parse_list()`` of the matrix page, for scale
+
+Usage::
+
+    python benchmarks/matrix.py [--scale 10] [--repeat 5] [--layers 1000] [--fixtures benchmarks/recorded]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fixtures import build_site, load_recorded
+from MITREAttackScrapper.matrices.enterprise import MITREAttackEnterpriseMatrix
+from MITREAttackScrapper.matrices.index import MITREAttackMatrixIndex
+from MITREAttackScrapper.matrices.incidence import MITREAttackMatrixIncidence
+
+def scan_tactics(matrix_data, technique_id):
+    return tuple(dict.fromkeys(tactic["id"] for tactic in matrix_data.values()
+                               for technique in tactic["main_technique"]
+                               for listed in [technique] + technique["sub_technique"]
+                               if listed["id"] == technique_id))
+
+def walk_coverage(matrix_data, layers):
+    coverage = []
+    for layer in layers:
+        shares = []
+        for tactic in matrix_data.values():
+            listed = dict.fromkeys(listed["id"] for technique in tactic["main_technique"]
+                                   for listed in [technique] + technique["sub_technique"])
+            shares.append(sum(layer.get(technique_id, 0) > 0 for technique_id in listed) / len(listed) if listed else 0.0)
+        coverage.append(shares)
+    return coverage
+
+def vector_coverage(matrix_data, layers):
+    incidence = MITREAttackMatrixIncidence(MITREAttackMatrixIndex(matrix_data))
+    return incidence.tactic_coverage(incidence.layer_matrix(layers))
+
+def median_time(function, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=10, help="size multiplier of the synthetic pages")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--layers", type=int, default=1000, help="number of random coverage layers")
+    parser.add_argument("--fixtures", help="directory of pages recorded with `benchmarks/fixtures.py record`")
+    args = parser.parse_args()
+
+    site = load_recorded(args.fixtures) if args.fixtures else build_site(scale=args.scale)
+    html = site["/matrices/enterprise/"]
+    matrix_data = MITREAttackEnterpriseMatrix._parse_list(html)
+    technique_ids = list(MITREAttackMatrixIndex(matrix_data).techniques)
+
+    def index_lookups():
+        index = MITREAttackMatrixIndex(matrix_data)
+        return [index.tactics_of(technique_id) for technique_id in technique_ids]
+
+    if [scan_tactics(matrix_data, technique_id) for technique_id in technique_ids] != index_lookups():
+        print("MISMATCH: the index found different tactics than the linear scan")
+        sys.exit(1)
+
+    rng = random.Random(0)
+    layers = [{technique_id: rng.randint(1, 5) for technique_id in rng.sample(technique_ids, len(technique_ids) // 5)}
+              for _ in range(args.layers)]
+    if abs(vector_coverage(matrix_data, layers) - walk_coverage(matrix_data, layers)).max() > 1e-6:
+        print("MISMATCH: the incidence matrix computed a different coverage than the dictionary walk")
+        sys.exit(1)
+
+    scan_time = median_time(lambda: [scan_tactics(matrix_data, technique_id) for technique_id in technique_ids], args.repeat)
+    build_time = median_time(lambda: MITREAttackMatrixIndex(matrix_data), args.repeat)
+    index_time = median_time(index_lookups, args.repeat)
+    walk_time = median_time(lambda: walk_coverage(matrix_data, layers), args.repeat)
+    vector_time = median_time(lambda: vector_coverage(matrix_data, layers), args.repeat)
+    parse_time = median_time(lambda: MITREAttackEnterpriseMatrix._parse_list(html), args.repeat)
+    print(f"{len(technique_ids)} techniques and sub-techniques in {len(matrix_data)} tactics")
+    print(f"scan   {scan_time * 1000:>9.1f} ms")
+    print(f"index  {index_time * 1000:>9.1f} ms  (build {build_time * 1000:.1f} ms, {scan_time / index_time:.0f}x)")
+    print(f"coverage of {args.layers} layers: dicts {walk_time * 1000:.1f} ms, "
+          f"numpy {vector_time * 1000:.1f} ms ({walk_time / vector_time:.0f}x)")
+    print(f"parse  {parse_time * 1000:>9.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# benchmarks/parsers.py
+"""
+Parse time and peak memory of every HTML parser backend, per page type.
+
+Every page type (technique index, matrix, group page, ...) is parsed by the scraper's own parsing code
+with each installed backend. The output of every backend is checked against the ``html.parser`` output,
+since all backends must scrape exactly the same data.
+
+- time: median wall-clock time of one parse over ``--repeat`` runs
+- peak: peak Python heap allocated during one parse, measured with ``tracemalloc``
+
+Usage::
+
+    python benchmarks/parsers.py [--scale 10] [--repeat 5] [--fixtures benchmarks/recorded]
+"""
+import os
+import sys
+import time
+import argparse
+import importlib
+import statistics
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fixtures import PAGE_TYPES, build_site, load_recorded
+from MITREAttackScrapper.utils.html_parser import available_parser_backends, set_parser_backend
+
+def parser_of(page_type: str):
+    module, class_name, id, _ = PAGE_TYPES[page_type]
+    scraper = getattr(importlib.import_module(module), class_name)
+    if id is None:
+        return lambda html: scraper._parse_list(html)
+    return lambda html: scraper._parse_detail(id, html)
+
+def measure(parse, html: str, repeat: int):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        data = parse(html)
+        times.append(time.perf_counter() - started)
+    tracemalloc.start()
+    parse(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return data, statistics.median(times), peak
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=10, help="size multiplier of the synthetic pages")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--fixtures", help="directory of pages recorded with `benchmarks/fixtures.py record`")
+    args = parser.parse_args()
+
+    site = load_recorded(args.fixtures) if args.fixtures else build_site(scale=args.scale)
+    backends = available_parser_backends()
+
+    print(f"{'page type':<16}{'size':>9}  " + "".join(f"{backend:>26}" for backend in backends))
+    print(f"{'':<16}{'kB':>9}  " + "".join(f"{'ms':>12}{'peak MB':>10}{'':>4}" for _ in backends))
+    mismatches = []
+    for page_type, (_, _, _, path) in PAGE_TYPES.items():
+        html = site[path]
+        parse = parser_of(page_type)
+        cells = []
+        reference = None
+        for backend in backends:
+            set_parser_backend(backend)
+            data, elapsed, peak = measure(parse, html, args.repeat)
+            if reference is None:
+                reference = data
+            elif data != reference:
+                mismatches.append((page_type, backend))
+            cells.append(f"{elapsed * 1000:>12.1f}{peak / 1e6:>10.1f}{'':>4}")
+        print(f"{page_type:<16}{len(html) / 1000:>9.0f}  " + "".join(cells))
+    set_parser_backend("html.parser")
+
+    if mismatches:
+        for page_type, backend in mismatches:
+            print(f"MISMATCH: {backend} scraped different data than html.parser for the {page_type} page")
+        sys.exit(1)
+    print("All backends scraped identical data.")
+
+if __name__ == "__main__":
+    main()
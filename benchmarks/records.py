@@ -0,0 +1,120 @@
+# benchmarks/records.py
+"""
+Memory held by the full corpus as the dictionaries returned by ``get()``/``get_list()``, and as records.
+
+The corpus is either synthetic, with as many pages of each type as ATT&CK Enterprise (``--scale`` multiplies
+the counts), generated with ``fixtures.py`` and parsed by the scrapers, or the real corpus of a snapshot
+written by ``export_snapshot()`` (``--snapshot``). The memory is measured with ``tracemalloc``:
+
+- dicts: the parsed dictionaries (unpickled copies, so parsing itself is not traced)
+- records: the same data converted with ``Record.from_dict()``, once the dictionaries are dropped
+
+Usage::
+
+    python benchmarks/records.py [--scale 1] [--snapshot attack.snapshot]
+"""
+import os
+import gc
+import sys
+import time
+import pickle
+import random
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fixtures import technique_page, tactic_page, mitigation_page, group_page, software_page, campaign_page, matrix_page, simple_list, technique_list
+from MITREAttackScrapper.utils.records import to_records
+from MITREAttackScrapper.techniques.enterprise import MITREAttackEnterpriseTechniques
+from MITREAttackScrapper.tactics.enterprise import MITREAttackEnterpriseTactics
+from MITREAttackScrapper.mitigations.enterprise import MITREAttackEnterpriseMitigations
+from MITREAttackScrapper.matrices.enterprise import MITREAttackEnterpriseMatrix
+from MITREAttackScrapper.cti.groups import MITREAttackCTIGroups
+from MITREAttackScrapper.cti.software import MITREAttackCTISoftware
+from MITREAttackScrapper.cti.campaigns import MITREAttackCampaign
+
+# Scraper class of the pages of every URL path prefix, most specific first
+SCRAPERS = [("/matrices/", MITREAttackEnterpriseMatrix), ("/techniques/", MITREAttackEnterpriseTechniques),
+            ("/tactics/", MITREAttackEnterpriseTactics), ("/mitigations/", MITREAttackEnterpriseMitigations),
+            ("/groups/", MITREAttackCTIGroups), ("/software/", MITREAttackCTISoftware), ("/campaigns/", MITREAttackCampaign)]
+
+def synthetic_pages(scale: int):
+    """Yield (scraper, ID or None for a list page, HTML), with about as many pages as ATT&CK Enterprise."""
+    rng = random.Random(0)
+    yield MITREAttackEnterpriseTechniques, None, technique_list(rng, n=200 * scale)
+    yield MITREAttackEnterpriseTactics, None, simple_list(rng, "TA", "tactics", 14)
+    yield MITREAttackEnterpriseMitigations, None, simple_list(rng, "M", "mitigations", 44 * scale)
+    yield MITREAttackCTIGroups, None, simple_list(rng, "G", "groups", 150 * scale, cols=4)
+    yield MITREAttackCTISoftware, None, simple_list(rng, "S", "software", 700 * scale, cols=4)
+    yield MITREAttackCampaign, None, simple_list(rng, "C", "campaigns", 30 * scale)
+    yield MITREAttackEnterpriseMatrix, None, matrix_page(rng, techniques=45)
+    for i in range(200 * scale):
+        technique_id = f"T{1000 + i}"
+        yield MITREAttackEnterpriseTechniques, technique_id, technique_page(rng, technique_id, procedures=rng.randint(5, 60))
+        for sub in range(1, 3):
+            yield MITREAttackEnterpriseTechniques, f"{technique_id}.{sub:03d}", technique_page(rng, technique_id, sub=f"{sub:03d}", procedures=rng.randint(5, 40))
+    for i in range(1, 15):
+        yield MITREAttackEnterpriseTactics, f"TA{i:04d}", tactic_page(rng, f"TA{i:04d}")
+    for i in range(44 * scale):
+        yield MITREAttackEnterpriseMitigations, f"M{1000 + i}", mitigation_page(rng, f"M{1000 + i}")
+    for i in range(150 * scale):
+        yield MITREAttackCTIGroups, f"G{i:04d}", group_page(rng, f"G{i:04d}", techniques=rng.randint(5, 120))
+    for i in range(700 * scale):
+        yield MITREAttackCTISoftware, f"S{i:04d}", software_page(rng, f"S{i:04d}")
+    for i in range(30 * scale):
+        yield MITREAttackCampaign, f"C{i:04d}", campaign_page(rng, f"C{i:04d}")
+
+def parse_synthetic(scale: int) -> list:
+    return [(scraper, id, scraper._parse_detail(id, html) if id else scraper._parse_list(html))
+            for scraper, id, html in synthetic_pages(scale)]
+
+def load_snapshot(path: str) -> list:
+    from MITREAttackScrapper.utils.snapshot import MITREAttackSnapshot
+
+    corpus = []
+    with MITREAttackSnapshot(path) as snapshot:
+        for url in snapshot.urls():
+            scraper = next(scraper for prefix, scraper in SCRAPERS if url.split("attack.mitre.org", 1)[-1].startswith(prefix))
+            corpus.append((scraper, None if url == scraper._list_url else url, snapshot.get(url)))
+    return corpus
+
+def to_record(scraper, id, data):
+    return scraper._record_type.from_dict(data) if id else to_records(scraper._list_record_type, data)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=1, help="multiplier of the number of synthetic pages")
+    parser.add_argument("--snapshot", help="measure the corpus of this snapshot instead of synthetic pages")
+    args = parser.parse_args()
+
+    corpus = load_snapshot(args.snapshot) if args.snapshot else parse_synthetic(args.scale)
+    for scraper, id, data in corpus:
+        if to_record(scraper, id, data) != data:
+            print(f"MISMATCH: the record of {scraper.__name__} {id} differs from the dictionary")
+            sys.exit(1)
+    started = time.perf_counter()
+    [to_record(scraper, id, data) for scraper, id, data in corpus]
+    convert_time = time.perf_counter() - started
+    pickled = [(scraper, id, pickle.dumps(data)) for scraper, id, data in corpus]
+    del corpus
+    gc.collect()
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    corpus = [(scraper, id, pickle.loads(data)) for scraper, id, data in pickled]
+    gc.collect()
+    dict_size = tracemalloc.get_traced_memory()[0] - baseline
+    records = [to_record(scraper, id, data) for scraper, id, data in corpus]
+    del corpus
+    gc.collect()
+    record_size = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    print(f"{len(records)} objects ({'snapshot' if args.snapshot else 'synthetic'})")
+    print(f"dicts    {dict_size / 1e6:>8.1f} MB")
+    print(f"records  {record_size / 1e6:>8.1f} MB ({record_size / dict_size:.0%}, converted in {convert_time * 1000:.0f} ms)")
+
+if __name__ == "__main__":
+    main()
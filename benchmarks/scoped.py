@@ -0,0 +1,94 @@
+# benchmarks/scoped.py
+"""
+Parse time and peak RSS of every page type, parsing whole pages versus only the region each parser reads.
+
+Each measurement runs in a fresh process, so the peak resident set size of one parse is not hidden
+by the memory of a previous one:
+
+- time: median wall-clock time of one parse (``_parse_list()``/``_parse_detail()``) over ``--repeat`` runs
+- peak RSS: growth of the peak resident set size of the process during the first parse
+
+Usage::
+
+    python benchmarks/scoped.py [--scale 10] [--repeat 5] [--backend html.parser] [--fixtures benchmarks/recorded]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import tempfile
+import importlib
+import statistics
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+def peak_rss() -> int:
+    # Kilobytes on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+def child(page_type: str, page_file: str, scoped: bool, backend: str, repeat: int) -> None:
+    from fixtures import PAGE_TYPES
+    from MITREAttackScrapper.utils.html_parser import set_parser_backend, set_scoped_parsing
+
+    set_parser_backend(backend)
+    set_scoped_parsing(scoped)
+    module, class_name, id, _ = PAGE_TYPES[page_type]
+    scraper = getattr(importlib.import_module(module), class_name)
+    with open(page_file, "r", encoding="utf-8") as file:
+        html = file.read()
+    parse = (lambda: scraper._parse_list(html)) if id is None else (lambda: scraper._parse_detail(id, html))
+
+    before = peak_rss()
+    parse()
+    rss = peak_rss() - before
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        parse()
+        times.append(time.perf_counter() - started)
+    print(json.dumps({"time": statistics.median(times), "rss": rss}))
+
+def measure(page_type: str, page_file: str, scoped: bool, backend: str, repeat: int) -> dict:
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", page_type, page_file,
+                             "scoped" if scoped else "whole", "--backend", backend, "--repeat", str(repeat)],
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=10, help="size multiplier of the synthetic pages")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--backend", default="html.parser")
+    parser.add_argument("--fixtures", help="directory of pages recorded with `benchmarks/fixtures.py record`")
+    parser.add_argument("--child", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        page_type, page_file, mode = args.child
+        child(page_type, page_file, mode == "scoped", args.backend, args.repeat)
+        return
+
+    from fixtures import PAGE_TYPES, build_site, load_recorded
+    site = load_recorded(args.fixtures) if args.fixtures else build_site(scale=args.scale)
+
+    print(f"backend: {args.backend}")
+    print(f"{'page type':<16}{'size kB':>9}{'whole ms':>10}{'scoped ms':>11}{'speedup':>9}"
+          f"{'whole MB':>10}{'scoped MB':>11}")
+    with tempfile.TemporaryDirectory() as directory:
+        for page_type, (_, _, _, path) in PAGE_TYPES.items():
+            page_file = os.path.join(directory, "page.html")
+            with open(page_file, "w", encoding="utf-8") as file:
+                file.write(site[path])
+            whole = measure(page_type, page_file, False, args.backend, args.repeat)
+            scoped = measure(page_type, page_file, True, args.backend, args.repeat)
+            print(f"{page_type:<16}{len(site[path]) / 1000:>9.0f}{whole['time'] * 1000:>10.1f}"
+                  f"{scoped['time'] * 1000:>11.1f}{whole['time'] / scoped['time']:>8.1f}x"
+                  f"{whole['rss'] / 1e6:>10.1f}{scoped['rss'] / 1e6:>11.1f}")
+
+if __name__ == "__main__":
+    main()
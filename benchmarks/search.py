@@ -0,0 +1,102 @@
+# benchmarks/search.py
+"""
+Full-text search over the descriptions, procedure examples and references of ATT&CK Enterprise.
+
+The corpus is synthetic, sized like ATT&CK Enterprise (``--entities`` objects with a description,
+procedure examples and references, about 35,000 texts by default, over a Zipfian vocabulary), so no page is fetched.
+
+- scan: a case-insensitive substring scan of every text for every query term, as callers had to do
+  (which does not rank the matches)
+- index: ``MITREAttackSearchIndex.search()``, BM25-ranked top ``--k``
+- build: indexing the whole corpus and committing it to one segment on disk
+
+Usage::
+
+    python benchmarks/search.py [--entities 1400] [--queries 200] [--k 10]
+"""
+import os
+import sys
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import statistics
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from MITREAttackScrapper.analytics.search import MITREAttackSearchIndex, documents
+
+def build_corpus(rng: random.Random, args: argparse.Namespace) -> dict:
+    vocabulary = [f"term{i}" for i in range(args.vocabulary)]
+    weights = [1.0 / (rank + 1) for rank in range(len(vocabulary))]
+
+    def text(low: int, high: int) -> str:
+        return " ".join(rng.choices(vocabulary, weights, k=rng.randint(low, high)))
+
+    corpus = {}
+    for i in range(args.entities):
+        corpus[f"T{1000 + i}"] = {
+            "description": text(40, 250),
+            "procedures": [{"id": f"S{rng.randint(0, 999):04d}", "name": "", "description": text(8, 40)}
+                           for _ in range(rng.randint(0, 30))],
+            "references": {number: {"text": text(6, 20), "url": ""} for number in range(1, rng.randint(2, 16))},
+        }
+    return corpus
+
+def scan(texts: list, query: str, k: int) -> list:
+    terms = query.lower().split()
+    return [document for document, text in texts if all(term in text for term in terms)][:k]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entities", type=int, default=1400)
+    parser.add_argument("--vocabulary", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    corpus = build_corpus(rng, args)
+    texts = [((id, field, context), text.lower()) for id, data in corpus.items() for field, context, text in documents(data)]
+    raw_size = sum(len(text.encode("utf-8")) for _, text in texts)
+    # Queries of 1 to 3 terms, mostly mid-frequency, like "lsass memory dump"
+    queries = [" ".join(f"term{min(int(rng.paretovariate(0.6)) * 10, args.vocabulary - 1)}" for _ in range(rng.randint(1, 3)))
+               for _ in range(args.queries)]
+
+    directory = tempfile.mkdtemp()
+    try:
+        started = time.perf_counter()
+        with MITREAttackSearchIndex(directory) as index:
+            for id, data in corpus.items():
+                index.add(id, data)
+        build_time = time.perf_counter() - started
+        disk_size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+        started = time.perf_counter()
+        index = MITREAttackSearchIndex(directory)
+        open_time = time.perf_counter() - started
+
+        scan_times = []
+        index_times = []
+        for query in queries:
+            started = time.perf_counter()
+            scan(texts, query, args.k)
+            scan_times.append(time.perf_counter() - started)
+            started = time.perf_counter()
+            index.search(query, args.k)
+            index_times.append(time.perf_counter() - started)
+    finally:
+        shutil.rmtree(directory)
+
+    index_times.sort()
+    print(f"{len(texts)} texts of {len(corpus)} objects, {raw_size / 1e6:.1f} MB of text")
+    print(f"build {build_time:.2f} s, open {open_time * 1000:.0f} ms, "
+          f"{disk_size / 1e6:.1f} MB on disk ({disk_size / raw_size:.0%} of the text)")
+    print(f"scan   median {statistics.median(scan_times) * 1000:>8.3f} ms")
+    print(f"index  median {statistics.median(index_times) * 1000:>8.3f} ms, "
+          f"p99 {index_times[int(len(index_times) * 0.99) - 1] * 1000:.3f} ms "
+          f"({statistics.median(scan_times) / statistics.median(index_times):.0f}x)")
+
+if __name__ == "__main__":
+    main()
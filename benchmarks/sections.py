@@ -0,0 +1,96 @@
+# benchmarks/sections.py
+"""
+Time spent locating the sections (Procedure Examples, Techniques Used, References, ...) of every detail page type.
+
+- find: the former lookups, one ``soup.find("h2", string=title)`` document walk per section,
+  done twice where the parsers checked the heading before using it
+- index: the same lookups through ``SectionIndex``, which walks the document once
+- parse: the whole ``_parse_detail()`` of the page type, for scale
+
+Usage::
+
+    python benchmarks/sections.py [--scale 10] [--repeat 20] [--fixtures benchmarks/recorded]
+"""
+import os
+import sys
+import time
+import argparse
+import importlib
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fixtures import PAGE_TYPES, build_site, load_recorded
+from MITREAttackScrapper.utils.html_parser import make_soup
+from MITREAttackScrapper.utils.scrapping_helper import SectionIndex
+
+# The sections looked up by the parser of every page type, as (heading, following tag, looked up twice before)
+LOOKUPS = {
+    "technique": [("Mitigations", "table", False), ("Detection", "table", False), ("References", None, False)],
+    "sub-technique": [("Procedure Examples", "table", False), ("Mitigations", "table", False),
+                      ("Detection", "table", False), ("References", None, False)],
+    "tactic": [("Techniques", "table", False)],
+    "mitigation": [("Techniques Addressed by Mitigation", "table", False), ("References", "div", True)],
+    "group": [("Techniques Used", "table", True), ("Software", "table", True), ("References", "div", True)],
+    "software": [("References", "div", True)],
+    "campaign": [("Groups", "table", True), ("Techniques Used", "table", True),
+                 ("Software", "table", True), ("References", "div", True)],
+}
+
+def find_sections(soup, lookups):
+    found = []
+    for title, name, twice in lookups:
+        if twice and not soup.find("h2", string=title):
+            found.append(None)
+            continue
+        heading = soup.find("h2", string=title)
+        found.append(heading.find_next(name) if name else heading.find_next_sibling("div"))
+    return found
+
+def index_sections(soup, lookups):
+    sections = SectionIndex(soup)
+    found = []
+    for title, name, _ in lookups:
+        if name:
+            found.append(sections.following(title, name))
+        else:
+            heading = sections.heading(title)
+            found.append(heading.find_next_sibling("div") if heading else None)
+    return found
+
+def median_time(function, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=10, help="size multiplier of the synthetic pages")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--fixtures", help="directory of pages recorded with `benchmarks/fixtures.py record`")
+    args = parser.parse_args()
+
+    site = load_recorded(args.fixtures) if args.fixtures else build_site(scale=args.scale)
+
+    print(f"{'page type':<16}{'find ms':>10}{'index ms':>10}{'speedup':>9}{'parse ms':>10}{'saved':>8}")
+    for page_type, lookups in LOOKUPS.items():
+        module, class_name, id, path = PAGE_TYPES[page_type]
+        scraper = getattr(importlib.import_module(module), class_name)
+        html = site[path]
+        soup = make_soup(html)
+        if find_sections(soup, lookups) != index_sections(soup, lookups):
+            print(f"MISMATCH: the section index found different sections than soup.find() on the {page_type} page")
+            sys.exit(1)
+
+        find_time = median_time(lambda: find_sections(soup, lookups), args.repeat)
+        index_time = median_time(lambda: index_sections(soup, lookups), args.repeat)
+        parse_time = median_time(lambda: scraper._parse_detail(id, html), max(args.repeat // 4, 1))
+        print(f"{page_type:<16}{find_time * 1000:>10.2f}{index_time * 1000:>10.2f}{find_time / index_time:>8.1f}x"
+              f"{parse_time * 1000:>10.1f}{(find_time - index_time) / (parse_time + find_time - index_time):>8.1%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# benchmarks/similarity.py
+"""
+Attribution of observed technique sets against the technique sets of groups, software and campaigns.
+
+The technique sets are synthetic, sized like ATT&CK Enterprise (``--groups``, ``--software`` and ``--campaigns``
+sets over ``--techniques`` techniques), so no page is fetched.
+
+- loops: Jaccard top-k with Python sets, comparing every query with every set
+- vectorized: ``MITREAttackTechniqueSets.top_k_batch()`` / ``nearest_neighbors()``
+
+Usage::
+
+    python benchmarks/similarity.py [--queries 1000] [--repeat 3] [--sparse]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from MITREAttackScrapper.analytics.similarity import MITREAttackTechniqueSets
+
+def build_sets(rng: random.Random, args: argparse.Namespace) -> tuple:
+    technique_ids = [f"T{1000 + i}" for i in range(args.techniques // 3)]
+    technique_ids += [f"{technique_id}.{j:03d}" for technique_id in technique_ids[:len(technique_ids) // 2] for j in range(1, 5)]
+    # A few techniques are used by most groups, like on ATT&CK
+    weights = [1.0 / (rank + 1) ** 0.7 for rank in range(len(technique_ids))]
+
+    def technique_set(size: int) -> list:
+        return list(dict.fromkeys(rng.choices(technique_ids, weights, k=size)))
+
+    sets = {}
+    for prefix, count, size in (("G", args.groups, 60), ("S", args.software, 20), ("C", args.campaigns, 40)):
+        for i in range(count):
+            sets[f"{prefix}{i:04d}"] = technique_set(rng.randint(1, 2 * size))
+    return sets, technique_set
+
+def loop_top_k(sets: dict, query: list, k: int) -> list:
+    query = set(query)
+    scores = []
+    for id, technique_ids in sets.items():
+        union = len(query | technique_ids)
+        scores.append((id, len(query & technique_ids) / union if union else 0.0))
+    return sorted(scores, key=lambda score: -score[1])[:k]
+
+def median_time(function, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--groups", type=int, default=160)
+    parser.add_argument("--software", type=int, default=750)
+    parser.add_argument("--campaigns", type=int, default=40)
+    parser.add_argument("--techniques", type=int, default=800)
+    parser.add_argument("--queries", type=int, default=1000, help="number of observed technique sets")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--sparse", action="store_true", help="encode the sets as a scipy.sparse matrix")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    sets, technique_set = build_sets(rng, args)
+    queries = [technique_set(rng.randint(5, 25)) for _ in range(args.queries)]
+    python_sets = {id: set(technique_ids) for id, technique_ids in sets.items()}
+
+    build_time = median_time(lambda: MITREAttackTechniqueSets(sets, sparse=args.sparse), args.repeat)
+    technique_sets = MITREAttackTechniqueSets(sets, sparse=args.sparse)
+    for query in queries[:20]:
+        expected = [score for _, score in loop_top_k(python_sets, query, args.k)]
+        found = [score for _, score in technique_sets.top_k(query, args.k)]
+        if max(abs(a - b) for a, b in zip(expected, found)) > 1e-6:
+            print("MISMATCH: the vectorized top-k differs from the Python loops")
+            sys.exit(1)
+
+    one_loop = median_time(lambda: loop_top_k(python_sets, queries[0], args.k), args.repeat)
+    one_vector = median_time(lambda: technique_sets.top_k(queries[0], args.k), args.repeat)
+    many_loop = median_time(lambda: [loop_top_k(python_sets, query, args.k) for query in queries], args.repeat)
+    many_vector = median_time(lambda: technique_sets.top_k_batch(queries, args.k), args.repeat)
+    pairs_loop = median_time(lambda: [loop_top_k(python_sets, technique_ids, args.k + 1) for technique_ids in python_sets.values()], 1)
+    pairs_vector = median_time(lambda: technique_sets.nearest_neighbors(args.k), args.repeat)
+
+    print(f"{len(sets)} technique sets over {len(technique_sets.technique_ids)} techniques "
+          f"({'sparse' if args.sparse else 'dense'}, built in {build_time * 1000:.1f} ms)")
+    print(f"{'':<28}{'loops ms':>10}{'vectorized ms':>15}{'speedup':>9}")
+    for label, loop_time, vector_time in (("1 observed set", one_loop, one_vector),
+                                          (f"{args.queries} observed sets", many_loop, many_vector),
+                                          ("all-pairs nearest neighbors", pairs_loop, pairs_vector)):
+        print(f"{label:<28}{loop_time * 1000:>10.2f}{vector_time * 1000:>15.2f}{loop_time / vector_time:>8.0f}x")
+
+if __name__ == "__main__":
+    main()
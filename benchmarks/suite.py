@@ -0,0 +1,214 @@
+# benchmarks/suite.py
+"""
+Regression benchmarks of the public parse paths, against a stored baseline.
+
+Every case calls a public ``get()``/``get_list()`` end to end, with the network replaced by the fixture pages
+(``install_site``) and the in-memory results disabled, so each call fetches, parses and extracts its page again:
+
+- matrix: ``MITREAttackEnterpriseMatrix.get_list()``
+- technique list: ``MITREAttackEnterpriseTechniques.get_list()``
+- technique: ``get()`` of a technique with many procedures
+- group: ``get()`` of a group using many techniques
+- software, campaign: ``get()`` of a software and of a campaign
+
+For every case:
+
+- ops/s: calls per second, the median of ``--rounds`` rounds
+- relative: ops/s divided by the ops/s of a calibration workload (a fixed page parsed by the pure-Python
+  ``html.parser.HTMLParser`` of the standard library), i.e. the speed relative to the machine. Every round of a case
+  directly follows a round of the calibration workload, and the relative speed is the median of the ratios of
+  these pairs of rounds, so a slowdown of the machine during the run affects both sides of a ratio alike
+- peak kB: peak Python heap allocated during one call, measured with ``tracemalloc``
+- blocks: memory blocks still allocated by ``tracemalloc`` at the end of that call, i.e. what the result keeps alive
+
+``--save`` stores the results as the baseline. Otherwise the results are compared with the baseline, and the script
+exits with status 1 if a case is more than ``--threshold`` slower (relative speed) or larger (peak kB) than its baseline.
+Comparing relative speeds lets a baseline saved on one machine be used on another, but the calibration only
+cancels out the raw speed of the machine: with another Python version, or on another CPU architecture,
+save the baseline again before comparing. The baseline records a fingerprint of the fixture pages and the parser backend,
+and is only compared on the same ones.
+
+The synthetic pages of ``fixtures.py`` are used by default. No real pages are shipped: record them once with
+``python benchmarks/fixtures.py record benchmarks/recorded`` (real ATT&CK objects: T1059, G0016, S0002, C0024, ...),
+then use them with ``--fixtures benchmarks/recorded``, and save a baseline of their own.
+
+Usage::
+
+    python benchmarks/suite.py --save [--fixtures benchmarks/recorded] [--backend lxml]
+    python benchmarks/suite.py [--threshold 0.25] [--fixtures benchmarks/recorded] [--backend lxml]
+"""
+import os
+import gc
+import sys
+import json
+import time
+import statistics
+import hashlib
+import argparse
+import platform
+import tracemalloc
+from html.parser import HTMLParser
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fixtures import build_site, install_site, load_recorded
+from MITREAttackScrapper.cti.groups import MITREAttackCTIGroups
+from MITREAttackScrapper.cti.software import MITREAttackCTISoftware
+from MITREAttackScrapper.cti.campaigns import MITREAttackCampaign
+from MITREAttackScrapper.matrices.enterprise import MITREAttackEnterpriseMatrix
+from MITREAttackScrapper.techniques.enterprise import MITREAttackEnterpriseTechniques
+from MITREAttackScrapper.utils.html_parser import set_parser_backend
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+BASELINE_VERSION = 3
+
+# The page of the calibration workload: fixed, and parsed by the standard library only,
+# so that it measures the machine and the interpreter, not this package or the fixture pages
+CALIBRATION_PAGE = "".join(f'<tr><td><a href="/techniques/T{number:04d}/">T{number:04d}</a></td>'
+                           f'<td class="description">Technique {number}</td></tr>' for number in range(2000))
+
+# (case, scraper, call, fixture path of the page the call downloads)
+CASES = [
+    ("matrix", MITREAttackEnterpriseMatrix, lambda: MITREAttackEnterpriseMatrix.get_list(), "/matrices/enterprise/"),
+    ("technique list", MITREAttackEnterpriseTechniques, lambda: MITREAttackEnterpriseTechniques.get_list(), "/techniques/enterprise/"),
+    ("technique", MITREAttackEnterpriseTechniques, lambda: MITREAttackEnterpriseTechniques.get("T1001"), "/techniques/T1001/"),
+    ("group", MITREAttackCTIGroups, lambda: MITREAttackCTIGroups.get("G0001"), "/groups/G0001/"),
+    ("software", MITREAttackCTISoftware, lambda: MITREAttackCTISoftware.get("S0001"), "/software/S0001/"),
+    ("campaign", MITREAttackCampaign, lambda: MITREAttackCampaign.get("C0001"), "/campaigns/C0001/"),
+]
+
+def fingerprint(site: dict) -> str:
+    digest = hashlib.sha256()
+    for _, _, _, path in CASES:
+        digest.update(path.encode("utf-8"))
+        digest.update(site[path].encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+def calibrate() -> None:
+    parser = HTMLParser()
+    parser.feed(CALIBRATION_PAGE)
+    parser.close()
+
+def calls_per_round(call, round_time: float) -> int:
+    call()    # warm-up: imports, compiled specs, connection pool
+    started = time.perf_counter()
+    call()
+    return max(1, int(round_time / max(time.perf_counter() - started, 1e-6)))
+
+def round_time_per_call(call, number: int) -> float:
+    gc.collect()
+    started = time.perf_counter()
+    for _ in range(number):
+        call()
+    return (time.perf_counter() - started) / number
+
+def measure_speeds(calls: dict, rounds: int, round_time: float) -> tuple:
+    """
+    Time the calls in rounds, each round of a call right after a round of the calibration workload.
+    Return the median ops/s of the calibration workload, and per call its median ops/s and relative speed.
+    """
+    calibration_number = calls_per_round(calibrate, round_time)
+    numbers = {name: calls_per_round(call, round_time) for name, call in calls.items()}
+    calibration_times, times, ratios = [], {name: [] for name in calls}, {name: [] for name in calls}
+    for _ in range(rounds):
+        for name, call in calls.items():
+            calibration_time = round_time_per_call(calibrate, calibration_number)
+            call_time = round_time_per_call(call, numbers[name])
+            calibration_times.append(calibration_time)
+            times[name].append(call_time)
+            ratios[name].append(calibration_time / call_time)
+    speeds = {name: {"ops_per_sec": round(1 / statistics.median(times[name]), 2),
+                     "relative": round(statistics.median(ratios[name]), 5)} for name in calls}
+    return 1 / statistics.median(calibration_times), speeds
+
+def measure_memory(call) -> dict:
+    gc.collect()
+    tracemalloc.start()
+    result = call()
+    _, peak = tracemalloc.get_traced_memory()
+    blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    tracemalloc.stop()
+    del result
+    return {"peak_kb": round(peak / 1000, 1), "blocks": blocks}
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    regressions = []
+    for case, result in results.items():
+        if case not in baseline["results"]:
+            continue
+        expected = baseline["results"][case]
+        if result["relative"] < expected["relative"] * (1 - threshold):
+            regressions.append(f"{case}: relative speed {result['relative']:.4f}, "
+                               f"{1 - result['relative'] / expected['relative']:.0%} slower than {expected['relative']:.4f}")
+        if result["peak_kb"] > expected["peak_kb"] * (1 + threshold):
+            regressions.append(f"{case}: {result['peak_kb']:.0f} peak kB, "
+                               f"{result['peak_kb'] / expected['peak_kb'] - 1:.0%} larger than {expected['peak_kb']:.0f}")
+    return regressions
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", help="directory of pages recorded with `benchmarks/fixtures.py record`")
+    parser.add_argument("--scale", type=int, default=3, help="size multiplier of the synthetic pages")
+    parser.add_argument("--backend", default="html.parser", help="HTML parser backend")
+    parser.add_argument("--rounds", type=int, default=7)
+    parser.add_argument("--round-time", type=float, default=0.2, help="seconds of calls per round")
+    parser.add_argument("--threshold", type=float, default=0.25, help="tolerated fraction of slowdown or growth")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--save", action="store_true", help="store the results as the baseline")
+    args = parser.parse_args()
+
+    site = load_recorded(args.fixtures) if args.fixtures else build_site(scale=args.scale)
+    install_site(site)
+    set_parser_backend(args.backend)
+    for _, scraper, _, _ in CASES:
+        scraper.configure_memo(max_entries=0)
+    corpus = fingerprint(site)
+
+    baseline = None
+    if not args.save and os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        if (baseline.get("version") != BASELINE_VERSION or baseline["corpus"] != corpus
+                or baseline["backend"] != args.backend):
+            print(f"The baseline {args.baseline} was measured on other fixture pages, with another backend or by an older "
+                  f"version of this script ({baseline.get('corpus')}, {baseline.get('backend')}), not comparing")
+            baseline = None
+        elif baseline["python"] != platform.python_version():
+            print(f"The baseline {args.baseline} was measured with Python {baseline['python']}, "
+                  f"relative speeds may differ with {platform.python_version()}")
+
+    calibration, speeds = measure_speeds({case: call for case, _, call, _ in CASES}, args.rounds, args.round_time)
+    results = {case: {**speeds[case], **measure_memory(call)} for case, _, call, _ in CASES}
+    set_parser_backend("html.parser")
+
+    print(f"calibration: {calibration:.1f} ops/s" + (f" (baseline {baseline['calibration']:.1f})" if baseline else ""))
+    print(f"{'case':<16}{'kB':>7}{'ops/s':>10}{'relative':>10}{'peak kB':>10}{'blocks':>9}"
+          + (f"{'baseline relative':>20}" if baseline else ""))
+    for case, _, _, path in CASES:
+        result = results[case]
+        line = (f"{case:<16}{len(site[path]) / 1000:>7.0f}{result['ops_per_sec']:>10.1f}{result['relative']:>10.4f}"
+                f"{result['peak_kb']:>10.0f}{result['blocks']:>9}")
+        if baseline and case in baseline["results"]:
+            expected = baseline["results"][case]["relative"]
+            line += f"{expected:>14.4f} ({result['relative'] / expected - 1:+.0%})"
+        print(line)
+
+    if args.save:
+        data = {"version": BASELINE_VERSION, "corpus": corpus, "backend": args.backend,
+                "python": platform.python_version(), "calibration": round(calibration, 2), "results": results}
+        temporary_path = f"{args.baseline}.{os.getpid()}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=2)
+        os.replace(temporary_path, args.baseline)
+        print(f"Saved the baseline to {args.baseline}")
+    elif baseline:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            for regression in regressions:
+                print(f"REGRESSION: {regression}")
+            sys.exit(1)
+        print(f"No case regressed by more than {args.threshold:.0%}.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# benchmarks/tail_latency.py
+"""
+Tail latency of ``get()`` against a slow and flaky server, with and without retries and hedged requests.
+
+A local fixture server stands in for attack.mitre.org. It serves a technique page for any ``/techniques/<ID>/`` path
+after a random latency (log-normal around ``--latency``), except that ``--stall`` of the requests take
+``--stall-latency`` seconds, and ``--error`` of them are answered with ``503 Service Unavailable``.
+``--requests`` techniques are then fetched one by one with ``MITREAttackEnterpriseTechniques.get()``:
+
+- plain: the shared HTTP client as is; failed responses raise
+- retry: a ``RetryPolicy`` with jittered exponential backoff
+- retry + hedge: the same, also duplicating the attempts slower than the 95th percentile of the recent latencies
+
+Usage::
+
+    python benchmarks/tail_latency.py [--requests 400] [--stall 0.02] [--error 0.02]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import threading
+import statistics
+import http.server
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fixtures import technique_page
+from MITREAttackScrapper.techniques.enterprise import MITREAttackEnterpriseTechniques
+from MITREAttackScrapper.utils.http_client import configure_http_client
+from MITREAttackScrapper.utils.retry import RetryPolicy
+
+def start_flaky_server(latency: float, stall: float, stall_latency: float, error: float) -> http.server.ThreadingHTTPServer:
+    body = technique_page(random.Random(0), "T1000", procedures=20).encode("utf-8")
+    rng = random.Random(1)
+    lock = threading.Lock()
+
+    class FlakyHandler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            with lock:
+                draw = rng.random()
+                delay = stall_latency if draw < stall else rng.lognormvariate(0, 0.3) * latency
+            time.sleep(delay)
+            if stall <= draw < stall + error:
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            try:
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                pass    # the client gave up, e.g. a hedged request answered first
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def run(ids: list) -> tuple:
+    latencies = []
+    failed = 0
+    for id in ids:
+        started = time.perf_counter()
+        try:
+            MITREAttackEnterpriseTechniques.get(id)
+        except Exception:
+            failed += 1
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    return latencies, failed
+
+def percentile(latencies: list, quantile: float) -> float:
+    return latencies[min(len(latencies) - 1, int(quantile * len(latencies)))]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--latency", type=float, default=0.02, help="median seconds of a normal request")
+    parser.add_argument("--stall", type=float, default=0.02, help="share of requests that stall")
+    parser.add_argument("--stall-latency", type=float, default=1.0, help="seconds a stalled request takes")
+    parser.add_argument("--error", type=float, default=0.02, help="share of requests answered with 503")
+    args = parser.parse_args()
+
+    server = start_flaky_server(args.latency, args.stall, args.stall_latency, args.error)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    ids = [f"T{1000 + i}" for i in range(args.requests)]
+    MITREAttackEnterpriseTechniques.configure_memo(max_entries=0)
+
+    print(f"{args.requests} requests, {args.stall:.0%} stalled for {args.stall_latency:.1f} s, {args.error:.0%} answered with 503")
+    print(f"{'':<16}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}{'failed':>8}{'attempts':>10}{'hedges':>8}")
+    for label, policy in (("plain", None),
+                          ("retry", RetryPolicy(max_attempts=3, backoff=0.02)),
+                          ("retry + hedge", RetryPolicy(max_attempts=3, backoff=0.02, hedge=True, hedge_delay=0.1))):
+        configure_http_client(base_url=base_url, retry=policy)
+        latencies, failed = run(ids)
+        stats = policy.stats() if policy is not None else None
+        print(f"{label:<16}{statistics.median(latencies) * 1000:>9.1f}{percentile(latencies, 0.95) * 1000:>9.1f}"
+              f"{percentile(latencies, 0.99) * 1000:>9.1f}{latencies[-1] * 1000:>9.1f}{failed:>8}"
+              f"{stats.attempts if stats else len(ids):>10}{stats.hedges if stats else 0:>8}")
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# benchmarks/throttling.py
+"""
+Bulk crawl against a throttling server, with and without the adaptive rate limiter.
+
+A local fixture server stands in for attack.mitre.org. It serves a software page for any ``/software/<ID>/`` path
+after a fixed latency, but admits at most ``--server-rate`` requests per second and ``--server-concurrency``
+requests at once, and answers the others with ``429 Too Many Requests`` and a ``Retry-After``, like a CDN would.
+``--software`` pages are then fetched with ``get_many()``:
+
+- unlimited: the shared HTTP client as is; throttled pages fail
+- limited: with a ``MITREAttackRateLimiter``, which backs off on throttling and sends throttled requests again
+
+Usage::
+
+    python benchmarks/throttling.py [--software 300] [--workers 32] [--server-rate 40] [--server-concurrency 8]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import threading
+import http.server
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fixtures import software_page
+from MITREAttackScrapper.cti.software import MITREAttackCTISoftware
+from MITREAttackScrapper.utils.http_client import configure_http_client
+from MITREAttackScrapper.utils.rate_limit import MITREAttackRateLimiter
+
+def start_throttling_server(rate: float, concurrency: int, latency: float, retry_after: int) -> http.server.ThreadingHTTPServer:
+    body = software_page(random.Random(0), "S0001").encode("utf-8")
+    lock = threading.Lock()
+    state = {"tokens": rate, "updated": time.monotonic(), "in_flight": 0}
+
+    def admit() -> bool:
+        with lock:
+            now = time.monotonic()
+            state["tokens"] = min(rate, state["tokens"] + (now - state["updated"]) * rate)
+            state["updated"] = now
+            if state["tokens"] < 1 or state["in_flight"] >= concurrency:
+                return False
+            state["tokens"] -= 1
+            state["in_flight"] += 1
+            return True
+
+    class ThrottlingHandler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            if not admit():
+                self.send_response(429)
+                self.send_header("Retry-After", str(retry_after))
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            try:
+                time.sleep(latency)
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            finally:
+                with lock:
+                    state["in_flight"] -= 1
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), ThrottlingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def crawl(ids: list, workers: int) -> tuple:
+    started = time.perf_counter()
+    failed = sum(not result.ok for result in MITREAttackCTISoftware.get_many(ids, max_workers=workers, parse_workers=0))
+    return time.perf_counter() - started, failed
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--software", type=int, default=300, help="number of pages to fetch")
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--server-rate", type=float, default=40.0, help="requests per second admitted by the server")
+    parser.add_argument("--server-concurrency", type=int, default=8, help="requests in flight admitted by the server")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds added to every admitted request")
+    parser.add_argument("--retry-after", type=int, default=1)
+    args = parser.parse_args()
+
+    server = start_throttling_server(args.server_rate, args.server_concurrency, args.latency, args.retry_after)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    ids = [f"S{i:04d}" for i in range(args.software)]
+    MITREAttackCTISoftware.configure_memo(max_entries=0)
+
+    configure_http_client(base_url=base_url, max_connections=args.workers)
+    unlimited_time, unlimited_failed = crawl(ids, args.workers)
+
+    limiter = MITREAttackRateLimiter(max_concurrency=args.workers)
+    configure_http_client(base_url=base_url, max_connections=args.workers, rate_limiter=limiter)
+    limited_time, limited_failed = crawl(ids, args.workers)
+    stats = limiter.stats()
+    server.shutdown()
+
+    ideal_time = args.software / min(args.server_rate, args.server_concurrency / args.latency)
+    print(f"{args.software} pages, server admits {args.server_rate:.0f} requests/s and {args.server_concurrency} at once "
+          f"(at best {ideal_time:.1f} s)")
+    print(f"unlimited  {unlimited_time:>6.1f} s, {unlimited_failed} failed")
+    print(f"limited    {limited_time:>6.1f} s, {limited_failed} failed, {stats.throttled} throttled responses retried, "
+          f"final concurrency {stats.concurrency}")
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,15 @@ setuptools.setup(
         'httpx',
         'pandas',
     ],
+    extras_require={
+        'http2': ['httpx[http2]'],
+        'lxml': ['lxml'],
+        'numpy': ['numpy'],
+        'opentelemetry': ['opentelemetry-api'],
+        'selectolax': ['selectolax'],
+        'snapshot': ['msgpack', 'zstandard'],
+        'sparse': ['scipy'],
+    },
     url="https://github.com/KnightChaser/MITREAttackScrapper",
     packages=setuptools.find_packages(include=['MITREAttackScrapper', 
                                                'MITREAttackScrapper.*']),
@@ -25,5 +34,5 @@ setuptools.setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.9',
 )
\ No newline at end of file
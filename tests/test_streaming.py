@@ -0,0 +1,78 @@
+# tests/test_streaming.py
+"""
+``iter_list()`` must yield the same entries as ``get_list()``, however the list page is cut into chunks.
+The pages are the synthetic fixture pages of the benchmarks, served in chunks of a fixed number of bytes.
+"""
+import os
+import sys
+
+import httpx
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks"))
+
+from fixtures import build_site
+from MITREAttackScrapper.cti.campaigns import MITREAttackCampaign
+from MITREAttackScrapper.cti.groups import MITREAttackCTIGroups
+from MITREAttackScrapper.cti.software import MITREAttackCTISoftware
+from MITREAttackScrapper.mitigations.enterprise import MITREAttackEnterpriseMitigations
+from MITREAttackScrapper.tactics.enterprise import MITREAttackEnterpriseTactics
+from MITREAttackScrapper.techniques.enterprise import MITREAttackEnterpriseTechniques
+from MITREAttackScrapper.utils.html_parser import iter_table_rows
+from MITREAttackScrapper.utils.http_client import configure_http_client
+
+SCRAPERS = [
+    MITREAttackEnterpriseTechniques,
+    MITREAttackEnterpriseTactics,
+    MITREAttackEnterpriseMitigations,
+    MITREAttackCTIGroups,
+    MITREAttackCTISoftware,
+    MITREAttackCampaign,
+]
+
+CHUNK_SIZES = [1, 7, 64]
+
+
+def _install_chunked_site(chunk_size):
+    site = build_site(scale=1)
+
+    def respond(request):
+        path = request.url.path if request.url.path.endswith("/") else request.url.path + "/"
+        if path not in site:
+            return httpx.Response(404, request=request)
+        content = site[path].encode("utf-8")
+        chunks = [content[start:start + chunk_size] for start in range(0, len(content), chunk_size)]
+        return httpx.Response(200, content=iter(chunks), headers={"Content-Type": "text/html; charset=utf-8"},
+                              request=request)
+
+    configure_http_client(transport=httpx.MockTransport(respond))
+
+
+@pytest.fixture(autouse=True)
+def no_memo():
+    for scraper in SCRAPERS:
+        scraper.configure_memo(max_entries=0)
+    yield
+    for scraper in SCRAPERS:
+        scraper.configure_memo()
+    configure_http_client()
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+@pytest.mark.parametrize("scraper", SCRAPERS, ids=lambda scraper: scraper.__name__)
+def test_iter_list_matches_get_list(scraper, chunk_size):
+    _install_chunked_site(chunk_size)
+    expected = scraper.get_list()
+    assert expected
+    assert list(scraper.iter_list()) == expected
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_iter_table_rows_skips_non_markup(chunk_size):
+    page = ('<script>var s = "<table><tr>";</script><!-- <table><tr><td>0</td></tr> -->'
+            '<table><tr title="<tr>"><td>1</td></tr><!-- </table> -->'
+            '<tr><td>2<script>"</tr>"</script></td><tr><td><table><tr><td>3</td></tr></table></td></tr>'
+            '</table><table><tr><td>4</td></tr></table>')
+    chunks = [page[start:start + chunk_size] for start in range(0, len(page), chunk_size)]
+    rows = list(iter_table_rows(chunks))
+    assert [row.find("td").get_text() for row in rows] == ["1", "2", "3"]